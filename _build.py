@@ -31,7 +31,7 @@ class build_py(_build_py):
         extensions = []
 
         # Cython utilities
-        extensions += make_extension(["_utils"], ["boost"])
+        extensions += make_extension(["_utils"], ["boost", "quadrature", "kernels"])
 
         # Gamma-Ray Helper
         extensions += make_extension(
@@ -0,0 +1,107 @@
+"""
+Helpers for writing spectra into preallocated arrays.
+
+The spectrum functions accept an output array `out`, a `weight` multiplying
+the spectrum and an `accumulate` flag. When `accumulate` is True, the weighted
+spectrum is added to `out` rather than overwriting it, so that weighted sums of
+spectra are built in place.
+"""
+
+# pylint: disable=invalid-name
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from hazma.utils import RealArray
+
+
+def check_out(out, shape: Tuple[int, ...]) -> RealArray:
+    """
+    Check that `out` can hold a spectrum with the given shape.
+
+    Parameters
+    ----------
+    out: np.ndarray
+        Output array.
+    shape: tuple[int]
+        Shape of the spectrum.
+
+    Returns
+    -------
+    out: np.ndarray
+        The output array.
+
+    Raises
+    ------
+    ValueError
+        If `out` is not a writeable float64 array with the given shape.
+    """
+    if not isinstance(out, np.ndarray) or out.dtype != np.float64:
+        raise ValueError(
+            f"Expected out to be a float64 numpy array. Found {type(out)}"
+            + (f" with dtype {out.dtype}." if isinstance(out, np.ndarray) else ".")
+        )
+    if out.shape != tuple(shape):
+        raise ValueError(f"Expected out with shape {tuple(shape)}, found {out.shape}.")
+    if not out.flags.writeable:
+        raise ValueError("The output array is read-only.")
+    return out
+
+
+def check_accumulate(out, accumulate: bool) -> None:
+    """Raise a ValueError if `accumulate` is requested without an output."""
+    if accumulate and out is None:
+        raise ValueError("An output array is required to accumulate the spectrum.")
+
+
+def store(
+    spectrum,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
+):
+    """
+    Store a weighted spectrum.
+
+    Parameters
+    ----------
+    spectrum: float or np.ndarray
+        The spectrum.
+    out: np.ndarray, optional
+        Array the weighted spectrum is written into. If None, the weighted
+        spectrum is returned.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
+
+    Returns
+    -------
+    out: float or np.ndarray
+        The weighted spectrum, or `out` if it was given.
+    """
+    check_accumulate(out, accumulate)
+    if out is None:
+        return spectrum if weight == 1.0 else weight * spectrum
+
+    check_out(out, np.shape(spectrum))
+    if accumulate:
+        out += spectrum if weight == 1.0 else weight * np.asarray(spectrum)
+    else:
+        np.multiply(spectrum, weight, out=out)
+    return out
+
+
+def trapezoid_weights(x: RealArray) -> RealArray:
+    """
+    Return the weights of the trapezoid rule on the grid `x`, such that
+    ``trapezoid_weights(x) @ y == np.trapz(y, x)``.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    weights = np.zeros_like(x)
+    if len(x) > 1:
+        dx = 0.5 * np.diff(x)
+        weights[:-1] += dx
+        weights[1:] += dx
+    return weights
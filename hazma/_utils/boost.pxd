@@ -1,4 +1,4 @@
-import cython
+cimport cython
 from libc.math cimport sqrt
 import numpy as np
 cimport numpy as np
@@ -6,7 +6,7 @@ cimport numpy as np
 ctypedef double(*boost_integrand)(double, void*)
 
 @cython.cdivision(True)
-cdef inline double boost_gamma(double energy, double mass):
+cdef inline double boost_gamma(double energy, double mass) noexcept nogil:
     """
     Compute the gamma boost factor.
 
@@ -20,7 +20,7 @@ cdef inline double boost_gamma(double energy, double mass):
     return energy / mass
 
 @cython.cdivision(True)
-cdef inline double boost_beta(double energy, double mass): 
+cdef inline double boost_beta(double energy, double mass) noexcept nogil:
     """
     Compute the velocity of a particle given its energy and mass.
 
@@ -33,11 +33,11 @@ cdef inline double boost_beta(double energy, double mass):
     """
     return sqrt(1.0 - (mass / energy) ** 2)
 
-cdef double boost_jac(double, double, double, double, double)
+cdef double boost_jac(double, double, double, double, double) noexcept nogil
 
-cdef double boost_eng(double, double, double, double, double)
+cdef double boost_eng(double, double, double, double, double) noexcept nogil
 
-cdef double boost_delta_function(double, double, double, double)
+cdef double boost_delta_function(double, double, double, double) noexcept nogil
 
-cdef double boost_integrate_linear_interp(double, double, np.ndarray[np.float64_t, ndim=1], np.ndarray[np.float64_t, ndim=1])
+cdef double boost_integrate_linear_interp(double, double, const double[:], const double[:]) noexcept nogil
 
@@ -2,11 +2,12 @@ import cython
 from libc.math cimport sqrt, fabs, fmin, fmax
 from libc.float cimport DBL_EPSILON
 from .boost cimport boost_gamma, boost_beta
+from .interp cimport bisect_left
 import numpy as np
 cimport numpy as np
 
 @cython.cdivision(True)
-cdef double boost_jac(double ep, double mp, double ed, double md, double zl):
+cdef double boost_jac(double ep, double mp, double ed, double md, double zl) noexcept nogil:
     """
     Returns the Jacobian for boost integrals when boosting from the lab frame
     to the parent particle's rest frame.
@@ -48,7 +49,7 @@ cdef double boost_jac(double ep, double mp, double ed, double md, double zl):
 
 
 @cython.cdivision(True)
-cdef double boost_eng(double ep, double mp, double ed, double md, double zl):
+cdef double boost_eng(double ep, double mp, double ed, double md, double zl) noexcept nogil:
     """
     Compute the boosted energy of a daugther particle when boosted from the
     lab-frame to the rest-frame of the parent particle.
@@ -73,7 +74,7 @@ cdef double boost_eng(double ep, double mp, double ed, double md, double zl):
 
 
 @cython.cdivision(True)
-cdef double boost_delta_function(double e0, double e, double m, double beta):
+cdef double boost_delta_function(double e0, double e, double m, double beta) noexcept nogil:
     """
     Boost a delta function of the form δ(e - e0) of a particle of mass `m`
     with a boost parameter `beta`.
@@ -179,8 +180,9 @@ cdef (double, double) integration_bounds(double energy, double mass, double beta
 
 
 @cython.cdivision(True)
+@cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double boost_integrate_linear_interp(double photon_energy, double beta, np.ndarray[np.float64_t, ndim=1] x, np.ndarray[np.float64_t, ndim=1] y):
+cdef double boost_integrate_linear_interp(double photon_energy, double beta, const double[:] x, const double[:] y) noexcept nogil:
     """
     Perform the boost integral given rest-frame spectrum data.
 
@@ -189,11 +191,12 @@ cdef double boost_integrate_linear_interp(double photon_energy, double beta, np.
     photon_energy:
         Energy to evaluate boosted spectrum at.
     beta:
-        Boost velocity.
-    x: np.ndarray
+        Boost velocity. Must be between 0 and 1, otherwise 0 is returned.
+    x: double[:]
         Energies of the rest-frame spectrum.
-    y: np.ndarray
-        Spectrum values of the rest-frame spectrum.
+    y: double[:]
+        Spectrum values of the rest-frame spectrum. Must have the same length
+        as `x`.
 
     Returns
     -------
@@ -201,7 +204,7 @@ cdef double boost_integrate_linear_interp(double photon_energy, double beta, np.
         The boosted spectrum evaluated at `photon_energy`.
     """
     cdef:
-        int npts
+        Py_ssize_t npts
         double xmax
         double gamma
         double lb
@@ -215,14 +218,14 @@ cdef double boost_integrate_linear_interp(double photon_energy, double beta, np.
         double m
         double b
         double rat
-        int ilow
-        int ihigh
-        double[:] yy
+        Py_ssize_t ilow
+        Py_ssize_t ihigh
+        Py_ssize_t k
         double integral
-    
-    assert 0.0 < beta < 1.0
-    npts = len(x)
-    assert npts == len(y)
+
+    if not 0.0 < beta < 1.0:
+        return 0.0
+    npts = x.shape[0]
 
     xmax = x[npts - 1]
     x0 = x[0]
@@ -253,24 +256,23 @@ cdef double boost_integrate_linear_interp(double photon_energy, double beta, np.
         lb = x0
         ilow = 0
 
-    yy = y / x
-
     if ilow == -1:
-        ilow = np.flatnonzero(lb <= x)[0]
+        ilow = bisect_left(lb, x)
     if ihigh == -1:
-        ihigh = np.flatnonzero(ub <= x)[0]
+        ihigh = bisect_left(ub, x)
         if fabs(x[ihigh] - ub) > 1e-6:
             ihigh = ihigh - 1
 
-    if ilow < ihigh:
-        integral += np.trapz(yy[ilow:ihigh], x=x[ilow:ihigh])
+    # Trapezoidal rule for y / x on the nodes ilow, ..., ihigh - 1.
+    for k in range(ilow, ihigh - 1):
+        integral += 0.5 * (y[k] / x[k] + y[k + 1] / x[k + 1]) * (x[k + 1] - x[k])
 
     # Handle edges
     if ilow > 0 and fabs(x[ilow] - lb) > 1e-6:
         x2 = x[ilow]
         x1 = x[ilow-1]
-        y2 = yy[ilow]
-        y1 = yy[ilow-1]
+        y2 = y[ilow] / x2
+        y1 = y[ilow-1] / x1
 
         m = (y2 - y1) / (x2 - x1)
         b = y1 - m * x1
@@ -280,8 +282,8 @@ cdef double boost_integrate_linear_interp(double photon_energy, double beta, np.
     if ihigh < npts - 1 and fabs(ub - x[ihigh]) > 1e-6:
         x2 = x[ihigh+1]
         x1 = x[ihigh]
-        y2 = yy[ihigh+1]
-        y1 = yy[ihigh]
+        y2 = y[ihigh+1] / x2
+        y1 = y[ihigh] / x1
 
         m = (y2 - y1) / (x2 - x1)
         b = y1 - m * x1
@@ -0,0 +1,39 @@
+cimport cython
+
+cdef inline Py_ssize_t bisect_left(double x, const double[:] xs) noexcept nogil:
+    """
+    Return the index of the first element of the sorted array `xs` greater
+    than or equal to `x`, or len(xs) if there is none.
+    """
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = xs.shape[0]
+    cdef Py_ssize_t mid
+
+    with cython.boundscheck(False), cython.wraparound(False):
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if xs[mid] < x:
+                lo = mid + 1
+            else:
+                hi = mid
+    return lo
+
+
+cdef inline double interp_linear(double x, const double[:] xs, const double[:] ys) noexcept nogil:
+    """
+    Linearly interpolate the data (xs, ys) at `x`. Like `np.interp`, values
+    outside of the range of `xs` are given by the endpoints.
+    """
+    cdef Py_ssize_t n = xs.shape[0]
+    cdef Py_ssize_t i
+
+    with cython.boundscheck(False), cython.wraparound(False), cython.cdivision(True):
+        if x <= xs[0]:
+            return ys[0]
+        if x >= xs[n - 1]:
+            return ys[n - 1]
+
+        i = bisect_left(x, xs)
+        if xs[i] == x:
+            return ys[i]
+        return ys[i - 1] + (ys[i] - ys[i - 1]) * (x - xs[i - 1]) / (xs[i] - xs[i - 1])
@@ -0,0 +1,55 @@
+cimport cython
+
+# Spectrum dN/dE(energy, parent_energy) of a product of a decaying particle.
+ctypedef double (*dnde_kernel)(double, double) noexcept nogil
+
+
+cdef inline void dnde_fill_array(
+    dnde_kernel dnde,
+    const double[:] energies,
+    double parent_energy,
+    double[:] out,
+) noexcept nogil:
+    """
+    Write the spectrum evaluated at `energies` into `out`, which must have the
+    same length as `energies`.
+    """
+    cdef Py_ssize_t i
+    with cython.boundscheck(False), cython.wraparound(False):
+        for i in range(energies.shape[0]):
+            out[i] = dnde(energies[i], parent_energy)
+
+
+cdef inline void dnde_fill_grid(
+    dnde_kernel dnde,
+    const double[:] energies,
+    const double[:] parent_energies,
+    double weight,
+    bint accumulate,
+    double[:, :] out,
+) noexcept nogil:
+    """
+    Write the spectrum for every pair of energies and parent energies,
+    multiplied by `weight`, into `out`, which must have shape
+    (len(parent_energies), len(energies)). If `accumulate` is True, the
+    weighted spectrum is added to `out` instead.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    with cython.boundscheck(False), cython.wraparound(False):
+        for i in range(parent_energies.shape[0]):
+            for j in range(energies.shape[0]):
+                if accumulate:
+                    out[i, j] += weight * dnde(energies[j], parent_energies[i])
+                else:
+                    out[i, j] = weight * dnde(energies[j], parent_energies[i])
+
+
+cdef object evaluate_dnde(
+    dnde_kernel dnde,
+    energies,
+    parent_energies,
+    out,
+    double weight,
+    bint accumulate,
+)
@@ -0,0 +1,58 @@
+import numpy as np
+
+from hazma._utils.accumulate import check_accumulate, check_out
+
+
+def _grid_view(out, bint parents, bint energies):
+    """
+    Return a view of `out` with shape (len(parent_energies), len(energies)),
+    inserting unit axes for scalar energies.
+    """
+    return out[
+        slice(None) if parents else np.newaxis,
+        slice(None) if energies else np.newaxis,
+    ]
+
+
+cdef object evaluate_dnde(
+    dnde_kernel dnde,
+    energies,
+    parent_energies,
+    out,
+    double weight,
+    bint accumulate,
+):
+    """
+    Evaluate a spectrum for scalar or 1-dimensional energies and parent
+    energies. The result has shape ``np.shape(parent_energies) +
+    np.shape(energies)``.
+
+    The weighted spectrum is written into `out` if it is given, or added to it
+    if `accumulate` is True, and `out` is returned. Otherwise a new array is
+    returned, or a float if both energies are scalars.
+    """
+    cdef const double[:] es
+    cdef const double[:] ps
+    cdef double[:, :] grid
+
+    check_accumulate(out, accumulate)
+    if out is None and np.ndim(energies) == 0 and np.ndim(parent_energies) == 0:
+        return weight * dnde(energies, parent_energies)
+
+    earr = np.atleast_1d(np.asarray(energies, dtype=np.float64))
+    parr = np.atleast_1d(np.asarray(parent_energies, dtype=np.float64))
+    if earr.ndim != 1 or parr.ndim != 1:
+        raise ValueError("Energies must be 0 or 1-dimensional.")
+
+    shape = np.shape(parent_energies) + np.shape(energies)
+    if out is None:
+        out = np.empty(shape, dtype=np.float64)
+    else:
+        check_out(out, shape)
+
+    es = earr
+    ps = parr
+    grid = _grid_view(out, np.ndim(parent_energies) > 0, np.ndim(energies) > 0)
+    with nogil:
+        dnde_fill_grid(dnde, es, ps, weight, accumulate, grid)
+    return out
@@ -0,0 +1,5 @@
+# Integrand of the form f(x, args), where `args` points to the parameters of
+# the integrand.
+ctypedef double (*integrand_fn)(double, void*) noexcept nogil
+
+cdef double gauss_legendre(integrand_fn, void*, double, double, const double*, int, double) noexcept nogil
@@ -0,0 +1,79 @@
+"""
+Fixed-order quadrature usable without the GIL.
+"""
+import cython
+from libc.math cimport ceil
+import numpy as np
+
+# Gauss-Legendre nodes and weights on [-1, 1].
+DEF N_GL = 12
+cdef double GL_NODES[N_GL]
+cdef double GL_WEIGHTS[N_GL]
+GL_NODES[:], GL_WEIGHTS[:] = np.polynomial.legendre.leggauss(N_GL)
+
+
+@cython.cdivision(True)
+cdef double gauss_legendre(
+    integrand_fn f,
+    void* args,
+    double a,
+    double b,
+    const double* breaks,
+    int nbreaks,
+    double max_width,
+) noexcept nogil:
+    """
+    Integrate f(x, args) from a to b.
+
+    Parameters
+    ----------
+    f: integrand_fn
+        Integrand.
+    args: void*
+        Pointer to the parameters passed to the integrand.
+    a, b: double
+        Lower and upper integration bounds.
+    breaks: double*
+        Sorted points where the integrand is not smooth. The interval is split
+        at the breaks lying between `a` and `b`.
+    nbreaks: int
+        Number of breaks.
+    max_width: double
+        Maximum width of the panels each smooth piece is divided into.
+
+    Returns
+    -------
+    integral: double
+        The integral estimated with a 12-point Gauss-Legendre rule on each
+        panel.
+    """
+    cdef double lo = a
+    cdef double hi
+    cdef double h
+    cdef double c
+    cdef double result = 0.0
+    cdef int npanels
+    cdef int i
+    cdef int j
+    cdef int k
+
+    if not a < b:
+        return 0.0
+
+    for i in range(nbreaks + 1):
+        if i < nbreaks:
+            if not (lo < breaks[i] < b):
+                continue
+            hi = breaks[i]
+        else:
+            hi = b
+
+        npanels = max(<int>ceil((hi - lo) / max_width), 1)
+        h = (hi - lo) / npanels
+        for j in range(npanels):
+            c = lo + (j + 0.5) * h
+            for k in range(N_GL):
+                result += 0.5 * h * GL_WEIGHTS[k] * f(c + 0.5 * h * GL_NODES[k], args)
+        lo = hi
+
+    return result
@@ -0,0 +1,148 @@
+"""
+Access to the data tables bundled with hazma.
+
+The tables are shipped as text files. The first time a table is requested it
+is parsed and a binary copy is written to the cache directory. Later requests,
+including those from other processes, memory-map the binary copy, so that the
+text is only parsed when the cache is cold.
+"""
+
+# pylint: disable=invalid-name
+
+import functools
+import hashlib
+import os
+import pathlib
+from typing import Callable, Optional, Union
+
+import numpy as np
+from scipy import interpolate
+
+PathLike = Union[str, os.PathLike]
+
+
+def cache_dir() -> pathlib.Path:
+    """
+    Return the root directory of the on-disk caches of hazma.
+
+    The directory is given by the environment variable ``HAZMA_CACHE_DIR`` if
+    it is set and is ``$XDG_CACHE_HOME/hazma`` (``~/.cache/hazma`` by default)
+    otherwise.
+    """
+    root = os.environ.get("HAZMA_CACHE_DIR")
+    if root:
+        return pathlib.Path(root)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = pathlib.Path(xdg) if xdg else pathlib.Path.home().joinpath(".cache")
+    return base.joinpath("hazma")
+
+
+def _cache_path(path: pathlib.Path, parser: str, kwargs) -> pathlib.Path:
+    """Return the path of the binary copy of a table."""
+    stat = path.stat()
+    h = hashlib.sha1()
+    h.update(repr((str(path), stat.st_size, stat.st_mtime_ns, parser, kwargs)).encode())
+    return cache_dir().joinpath("tables", f"{path.stem}-{h.hexdigest()[:16]}.npy")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_table(path: pathlib.Path, parser: Callable, kwargs) -> np.ndarray:
+    name = f"{parser.__module__}.{parser.__qualname__}"
+    cached = _cache_path(path, name, kwargs)
+    try:
+        return np.asarray(np.load(cached, mmap_mode="r"))
+    except (OSError, ValueError):
+        # Cold or unreadable cache.
+        pass
+
+    data = np.asarray(parser(path, **dict(kwargs)), dtype=np.float64)
+
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp, cached)
+    except OSError:
+        # The cache is not writable: the table is parsed on every start.
+        pass
+
+    data.setflags(write=False)
+    return data
+
+
+def load_table(
+    path: PathLike,
+    *,
+    genfromtxt: bool = False,
+    parser: Optional[Callable[..., np.ndarray]] = None,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Load a numerical table stored as text.
+
+    Parameters
+    ----------
+    path: str or path-like
+        Path to the text file.
+    genfromtxt: bool, optional
+        If True, the file is parsed using `np.genfromtxt` instead of
+        `np.loadtxt`. Default is False.
+    parser: callable, optional
+        Function parsing files that are not plain delimited tables. It is
+        called with the path and `kwargs` and must return a single array.
+        Overrides `genfromtxt`.
+    kwargs: dict
+        Keyword arguments passed to the parser, e.g. the delimiter. The
+        values must be hashable.
+
+    Returns
+    -------
+    data: np.ndarray
+        Read-only array holding the table. Copy it before modifying it.
+    """
+    if parser is None:
+        parser = np.genfromtxt if genfromtxt else np.loadtxt
+    path = pathlib.Path(path).absolute()
+    return _load_table(path, parser, tuple(sorted(kwargs.items())))
+
+
+class LazyInterp1d:
+    """
+    Linear interpolation of a two-column table that is only loaded when first
+    used.
+
+    The object is called like the `scipy.interpolate.interp1d` it wraps and
+    exposes the grid of the table through `x` and `y`.
+
+    Parameters
+    ----------
+    path: str or path-like
+        Path to the comma-separated file holding the table.
+    kwargs: dict
+        Keyword arguments passed to `scipy.interpolate.interp1d`.
+    """
+
+    def __init__(self, path: PathLike, **kwargs):
+        self.path = pathlib.Path(path)
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"LazyInterp1d({str(self.path)!r})"
+
+    @functools.cached_property
+    def interp(self) -> interpolate.interp1d:
+        """The underlying interpolating function."""
+        data = load_table(self.path, genfromtxt=True, delimiter=",").T
+        return interpolate.interp1d(data[0], data[1], **self._kwargs)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.interp.x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.interp.y
+
+    def __call__(self, x):
+        return self.interp(x)
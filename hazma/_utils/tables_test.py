@@ -0,0 +1,106 @@
+"""Tests for the binary cache of the bundled data tables."""
+
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from hazma import cmb
+from hazma import gamma_ray_parameters as grp
+from hazma._utils import tables
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("HAZMA_CACHE_DIR", str(tmp_path.joinpath("cache")))
+    tables._load_table.cache_clear()
+    yield tmp_path.joinpath("cache", "tables")
+    tables._load_table.cache_clear()
+
+
+def write_table(path, data):
+    np.savetxt(path, data, delimiter=",")
+
+
+def test_load_table_cold_and_warm(cache, tmp_path):
+    path = tmp_path.joinpath("table.csv")
+    data = np.random.default_rng(1).random((20, 3))
+    write_table(path, data)
+
+    cold = tables.load_table(path, delimiter=",")
+    np.testing.assert_allclose(cold, data)
+    assert not cold.flags.writeable
+    assert len(list(cache.glob("table-*.npy"))) == 1
+
+    # A new process only reads the binary copy.
+    tables._load_table.cache_clear()
+    warm = tables.load_table(path, delimiter=",")
+    np.testing.assert_array_equal(warm, cold)
+    assert not warm.flags.writeable
+
+    # Modifying the text invalidates the binary copy.
+    write_table(path, 2 * data)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    tables._load_table.cache_clear()
+    np.testing.assert_allclose(tables.load_table(path, delimiter=","), 2 * data)
+
+
+def test_load_table_unwritable_cache(tmp_path, monkeypatch):
+    # A file in place of the cache directory cannot hold the binary copies.
+    blocker = tmp_path.joinpath("blocker")
+    blocker.write_text("")
+    monkeypatch.setenv("HAZMA_CACHE_DIR", str(blocker))
+    tables._load_table.cache_clear()
+
+    path = tmp_path.joinpath("table.csv")
+    data = np.arange(12.0).reshape(4, 3)
+    write_table(path, data)
+    np.testing.assert_allclose(tables.load_table(path, delimiter=","), data)
+    tables._load_table.cache_clear()
+
+
+def test_lazy_interp(cache, tmp_path):
+    path = tmp_path.joinpath("interp.csv")
+    write_table(path, np.array([[1.0, 2.0], [2.0, 4.0], [3.0, 8.0]]))
+
+    interp = tables.LazyInterp1d(path, bounds_error=False, fill_value=0.0)
+    assert "interp" not in vars(interp)
+    assert interp(1.5) == pytest.approx(3.0)
+    assert interp(5.0) == 0.0
+    np.testing.assert_array_equal(interp.x, [1.0, 2.0, 3.0])
+
+
+@pytest.mark.parametrize(
+    "module,names",
+    [
+        (
+            grp,
+            [
+                "comptel_diffuse",
+                "egret_diffuse",
+                "fermi_diffuse",
+                "integral_diffuse",
+                "gc_bg_model",
+                "effective_area_fermi",
+            ],
+        ),
+        (cmb, ["f_eff_g", "f_eff_ep", "f_eff_g_data", "f_eff_ep_data"]),
+    ],
+)
+def test_lazy_module_attributes(module, names):
+    ns = {}
+    exec(f"from {module.__name__} import *", ns)  # pylint: disable=exec-used
+    for name in names:
+        assert name in dir(module)
+        assert ns[name] is getattr(module, name)
+
+
+def test_pickle_effective_area():
+    fn = grp.effective_area_fermi
+    assert pickle.loads(pickle.dumps(fn)) is fn
+    np.testing.assert_array_equal(fn.x, grp.A_eff_fermi.x)
+
+    interp = pickle.loads(pickle.dumps(grp.A_eff_fermi))
+    assert interp(100.0) == grp.A_eff_fermi(100.0)
@@ -1,23 +1,44 @@
+import functools
+import pathlib
+
 from scipy.interpolate import interp1d
 import numpy as np
-from pkg_resources import resource_filename
+
+from hazma._utils.tables import load_table
 from hazma.parameters import temp_cmb_formation
 
 """
 Functions required for computing CMB limits and related quantities.
 """
 
-# Get paths to files inside the module
-f_eff_ep_rf = resource_filename(__name__, "cmb_data/f_eff_ep.dat")
-f_eff_g_rf = resource_filename(__name__, "cmb_data/f_eff_g.dat")
+_cmb_data_dir = pathlib.Path(__file__).absolute().parent.joinpath("cmb_data")
+f_eff_ep_rf = str(_cmb_data_dir.joinpath("f_eff_ep.dat"))
+f_eff_g_rf = str(_cmb_data_dir.joinpath("f_eff_g.dat"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_f_eff(name):
+    """Load the table of f_eff for photons ('g') or electrons ('ep')."""
+    data = load_table(_cmb_data_dir.joinpath(f"f_eff_{name}.dat"), delimiter=",").T
+    return data, interp1d(data[0] / 1.0e6, data[1])  # eV -> MeV
+
+
+_LAZY_ATTRS = ("f_eff_ep", "f_eff_g", "f_eff_ep_data", "f_eff_g_data")
 
-# Load f_eff^{e+ e-}
-f_eff_ep_data = np.loadtxt(f_eff_ep_rf, delimiter=",").T
-f_eff_ep = interp1d(f_eff_ep_data[0] / 1.0e6, f_eff_ep_data[1])  # eV -> MeV
 
-# Load f_eff^{e+ e-}
-f_eff_g_data = np.loadtxt(f_eff_g_rf, delimiter=",").T
-f_eff_g = interp1d(f_eff_g_data[0] / 1.0e6, f_eff_g_data[1])  # eV -> MeV
+def __getattr__(name):
+    # The f_eff^{e+ e-} and f_eff^{gamma gamma} tables are only loaded when
+    # first used.
+    if name in ("f_eff_ep", "f_eff_g"):
+        return _load_f_eff(name[len("f_eff_") :])[1]
+    if name in ("f_eff_ep_data", "f_eff_g_data"):
+        return _load_f_eff(name[len("f_eff_") : -len("_data")])[0]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_ATTRS])
+
 
 #: Planck 2018 95% upper limit on p_ann from temperature + polarization
 #: measurements, in cm^3 s^-1 MeV^-1
@@ -48,3 +69,8 @@ def vx_cmb(mx, x_kd):
         The DM relative velocity at the time of CMB formation.
     """
     return 2.0e-4 * 10e6 * temp_cmb_formation / mx * np.sqrt(1.0e-4 / x_kd)
+
+
+# A star import exports the same names as before the tables became lazy.
+__all__ = [name for name in globals() if not name.startswith("_")]
+__all__ += _LAZY_ATTRS
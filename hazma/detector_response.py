@@ -0,0 +1,81 @@
+import numpy as np
+
+from hazma.parameters import _MatrixCache
+
+
+class DetectorResponse:
+    r"""
+    Container for the response of a gamma-ray telescope.
+
+    Bundles the effective area and energy resolution of a telescope together
+    with the matrices used to convolve spectra with its spectral resolution
+    function. The matrices are computed the first time they are needed for a
+    given energy grid and reused afterwards, so a single instance should be
+    shared by all the models evaluated with the same telescope. The least
+    recently used matrices are discarded once they take more than
+    ``max_cache_bytes`` bytes.
+
+    A ``DetectorResponse`` can be used wherever an energy resolution function
+    is expected: calling it returns the energy resolution.
+
+    Attributes
+    ----------
+    effective_area : callable
+        Effective area of the telescope in cm^2 as a function of photon energy
+        in MeV. Usually one of the ``A_eff_*`` interpolators from
+        ``hazma.gamma_ray_parameters``.
+    energy_res : callable
+        The telescope's (vectorized) energy resolution
+        (:math:`\Delta E / E`) as a function of photon energy in MeV.
+    max_cache_bytes : int
+        Maximum number of bytes taken by the memoized resolution matrices.
+        The default holds eight 1000x1000 matrices.
+    """
+
+    def __init__(self, effective_area, energy_res, max_cache_bytes: int = 1 << 26):
+        self.effective_area = effective_area
+        self.energy_res = energy_res
+        self._matrices = _MatrixCache(max_cache_bytes)
+
+    def __call__(self, energy):
+        return self.energy_res(energy)
+
+    def __repr__(self):
+        return (
+            f"DetectorResponse(effective_area={self.effective_area}, "
+            f"energy_res={self.energy_res})"
+        )
+
+    @property
+    def e_min(self) -> float:
+        """Lower bound of the energy range covered by the effective area."""
+        return self.effective_area.x[0]
+
+    @property
+    def e_max(self) -> float:
+        """Upper bound of the energy range covered by the effective area."""
+        return self.effective_area.x[-1]
+
+    def resolution_matrix(self, e_min, e_max, n_pts) -> np.ndarray:
+        """
+        Return the matrix convolving a spectrum tabulated on the padded grid
+        ``geomspace(0.1 * e_min, 10 * e_max, n_pts)`` with the spectral
+        resolution function, evaluated on ``geomspace(e_min, e_max, n_pts)``.
+
+        Parameters
+        ----------
+        e_min, e_max : float
+            Bounds of the energy grid.
+        n_pts : int
+            Number of points in the energy grid.
+
+        Returns
+        -------
+        matrix : np.ndarray
+            Read-only array with shape (n_pts, n_pts).
+        """
+        return self._matrices.get(self.energy_res, e_min, e_max, n_pts)
+
+    def clear_cache(self):
+        """Discard the memoized resolution matrices."""
+        self._matrices.clear()
@@ -0,0 +1,61 @@
+"""Tests for the memoized resolution matrices of DetectorResponse."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma.detector_response import DetectorResponse
+from hazma.gamma_ray_parameters import (
+    A_eff_comptel,
+    A_eff_e_astrogam,
+    energy_res_comptel,
+    energy_res_e_astrogam,
+)
+from hazma.parameters import convolved_spectrum_fn
+
+
+def dnde(es):
+    return np.exp(-es / 50.0) / es
+
+
+@pytest.mark.parametrize(
+    "effective_area,energy_res",
+    [(A_eff_comptel, energy_res_comptel), (A_eff_e_astrogam, energy_res_e_astrogam)],
+)
+def test_convolution_matches_energy_res(effective_area, energy_res):
+    response = DetectorResponse(effective_area, energy_res)
+    lines = {"g g": {"energy": 100.0, "bf": 1e-2}}
+    es = np.geomspace(1.0, 300.0, 200)
+
+    ref = convolved_spectrum_fn(
+        1.0, 300.0, energy_res, dnde, lines, n_pts=500, method="reference"
+    )
+    plain = convolved_spectrum_fn(1.0, 300.0, energy_res, dnde, lines, n_pts=500)
+
+    # Twice, to also use the memoized matrix
+    for _ in range(2):
+        conv = convolved_spectrum_fn(1.0, 300.0, response, dnde, lines, n_pts=500)
+        assert_allclose(conv(es), ref(es), rtol=1e-10, atol=0.0)
+        assert_allclose(conv(es), plain(es), rtol=1e-14, atol=0.0)
+
+
+def test_resolution_matrix_cache_bounded():
+    n_pts = 100
+    nbytes = 8 * n_pts**2
+    response = DetectorResponse(
+        A_eff_comptel, energy_res_comptel, max_cache_bytes=2 * nbytes
+    )
+
+    m1 = response.resolution_matrix(1.0, 1e2, n_pts)
+    m2 = response.resolution_matrix(1.0, 2e2, n_pts)
+    assert response.resolution_matrix(1.0, 1e2, n_pts) is m1
+
+    # Only the two most recently used matrices are kept.
+    response.resolution_matrix(1.0, 3e2, n_pts)
+    assert len(response._matrices) == 2
+    assert response.resolution_matrix(1.0, 1e2, n_pts) is m1
+    assert response.resolution_matrix(1.0, 2e2, n_pts) is not m2
+    assert_allclose(response.resolution_matrix(1.0, 2e2, n_pts), m2)
+
+    response.clear_cache()
+    assert len(response._matrices) == 0
@@ -1,5 +1,7 @@
 import numpy as np
 
+from hazma._utils.tables import load_table
+
 
 class FluxMeasurement:
     r"""
@@ -94,7 +96,7 @@ class FluxMeasurement:
             fluxes,
             upper_errors,
             lower_errors,
-        ) = np.loadtxt(fname, delimiter=",").T
+        ) = np.array(load_table(fname, delimiter=",")).T
         return cls(
             e_lows,
             e_highs,
@@ -45,6 +45,7 @@ from ._pi_pi_etap import VectorFormFactorPiPiEtaPrime
 from ._pi_pi_omega import VectorFormFactorPiPiOmega, VectorFormFactorPi0Pi0Omega
 from ._pi_pi_pi0 import VectorFormFactorPiPiPi0
 from ._pi_pi_pi_pi import VectorFormFactorPiPiPi0Pi0, VectorFormFactorPiPiPiPi
+from ._factorized import FactorizedWidth
 
 __all__ = [
     "VectorFormFactorPiPi",
@@ -68,4 +69,5 @@ __all__ = [
     "VectorFormFactorPiPiPi0Pi0",
     "VectorFormFactorPiPiPiPi",
     "VectorFormFactorCouplings",
+    "FactorizedWidth",
 ]
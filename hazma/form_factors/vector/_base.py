@@ -188,7 +188,7 @@ class VectorFormFactor(abc.ABC):
         single = np.isscalar(q)
         qq = np.atleast_1d(q).astype(np.float64)
 
-        mask = qq > sum(self.fsp_masses)
+        mask = (qq > sum(self.fsp_masses)) & (qq > 2.0 * mx)
         cs = np.zeros_like(qq)
 
         if np.any(mask):
@@ -0,0 +1,246 @@
+"""Partial widths of vector form factors factorized into a quadratic form in
+the quark couplings."""
+
+# pylint: disable=invalid-name
+
+import os
+import pathlib
+from typing import Sequence
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from hazma.utils import RealArray, RealOrRealArray
+
+# Couplings used to extract the quadratic form: the three unit vectors
+# followed by the sums of pairs of them.
+_BASIS_COUPLINGS = [
+    (1.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0),
+    (0.0, 0.0, 1.0),
+    (1.0, 1.0, 0.0),
+    (1.0, 0.0, 1.0),
+    (0.0, 1.0, 1.0),
+]
+_OFF_DIAGONAL = [(0, 1), (0, 2), (1, 2)]
+
+
+class FactorizedWidth:
+    r"""
+    Partial width of a massive vector decaying through a form factor,
+    tabulated as a quadratic form in the quark couplings.
+
+    The amplitudes of the vector form factors are linear in the couplings
+    :math:`g = (g_{Vuu}, g_{Vdd}, g_{Vss})`, so the partial widths are
+    :math:`\Gamma(m_V) = g^{T} M(m_V) g` with a symmetric
+    :math:`3\times3` matrix :math:`M` that only depends on the mass of the
+    vector. The matrix is computed from the widths of six coupling choices
+    and interpolated in :math:`m_V`, so that the width for any couplings is
+    an interpolation followed by a small matrix product. Since the
+    annihilation cross section of dark matter through an s-channel vector is
+    proportional to the width of an off-shell vector with mass equal to the
+    center-of-mass energy, the same table gives the cross sections.
+
+    Near threshold, the widths vanish like a power of
+    :math:`m_V - m_{\mathrm{th}}` that depends on the final state. The trace
+    of :math:`M` is therefore interpolated with a cubic spline in
+    :math:`\log(m_V - m_{\mathrm{th}})` after taking its logarithm, where
+    the threshold behavior is linear, and :math:`M` divided by its trace is
+    interpolated with a cubic spline in the same variable. Below the first
+    mass of the grid, the widths are extrapolated as a power law.
+
+    Tables of form factors integrated with Monte-Carlo carry the Monte-Carlo
+    error of the six widths they are computed from.
+
+    Attributes
+    ----------
+    threshold: float
+        Sum of the masses of the final state particles. The width vanishes
+        below it.
+    masses: array
+        Masses of the vector of the grid.
+    matrices: array
+        Quadratic forms with shape ``(len(masses), 3, 3)``.
+    """
+
+    def __init__(self, threshold: float, masses: RealArray, matrices: RealArray):
+        self.threshold = float(threshold)
+        self.masses = np.asarray(masses, dtype=np.float64)
+        self.matrices = np.asarray(matrices, dtype=np.float64)
+        if self.matrices.shape != (len(self.masses), 3, 3):
+            raise ValueError(
+                "Matrices must have shape (len(masses), 3, 3), "
+                + f"found {self.matrices.shape}."
+            )
+
+        # Only masses where the width is open can be used for interpolating
+        # in log(mv - threshold).
+        trace = np.trace(self.matrices, axis1=1, axis2=2)
+        above = (self.masses > self.threshold) & (trace > 0.0)
+        self._log_q = np.log(self.masses[above] - self.threshold)
+        self._log_trace = CubicSpline(self._log_q, np.log(trace[above]))
+        self._shape = CubicSpline(
+            self._log_q,
+            self.matrices[above].reshape(-1, 9) / trace[above, np.newaxis],
+            axis=0,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"FactorizedWidth(threshold={self.threshold}, "
+            f"mv=[{self.masses[0]}, {self.masses[-1]}], n_mv={len(self.masses)})"
+        )
+
+    @classmethod
+    def compute(cls, form_factor, masses: RealArray, **kwargs):
+        """
+        Tabulate the partial width of a form factor.
+
+        Parameters
+        ----------
+        form_factor: VectorFormFactor
+            Form factor to tabulate.
+        masses: array
+            Masses of the vector of the grid. Must be increasing.
+        kwargs: dict
+            Keyword arguments passed to the `width` method of the form
+            factor, e.g. the integration method or number of points.
+        """
+        masses = np.asarray(masses, dtype=np.float64)
+        widths = [
+            np.asarray(form_factor.width(mv=masses, couplings=g, **kwargs))
+            for g in _BASIS_COUPLINGS
+        ]
+
+        matrices = np.zeros((len(masses), 3, 3), dtype=np.float64)
+        for i in range(3):
+            matrices[:, i, i] = widths[i]
+        for (i, j), w in zip(_OFF_DIAGONAL, widths[3:]):
+            matrices[:, i, j] = 0.5 * (w - widths[i] - widths[j])
+            matrices[:, j, i] = matrices[:, i, j]
+
+        threshold = sum(form_factor.fsp_masses)
+        return cls(threshold, masses, np.nan_to_num(matrices))
+
+    @classmethod
+    def load(cls, path):
+        """Load a table saved with `save`."""
+        with np.load(path) as data:
+            return cls(float(data["threshold"]), data["masses"], data["matrices"])
+
+    def save(self, path):
+        """Atomically write the table to `path`."""
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                threshold=np.array(self.threshold),
+                masses=self.masses,
+                matrices=self.matrices,
+            )
+        os.replace(tmp, path)
+
+    def covers(self, mv) -> bool:
+        """
+        Return True if the width can be computed from the table for all the
+        masses `mv`.
+        """
+        return bool(np.max(mv, initial=-np.inf) <= self.masses[-1])
+
+    def matrix(self, mv) -> RealArray:
+        """
+        Interpolate the quadratic form at the mass(es) of the vector. The
+        result has shape ``np.shape(mv) + (3, 3)`` and vanishes below
+        threshold. Above the largest mass of the table, the quadratic form at
+        the largest mass is returned.
+        """
+        mv = np.asarray(mv, dtype=np.float64)
+        flat = mv.ravel()
+        ms = np.zeros((len(flat), 9), dtype=np.float64)
+
+        mask = flat > self.threshold
+        if np.any(mask):
+            log_q = np.minimum(np.log(flat[mask] - self.threshold), self._log_q[-1])
+            ms[mask] = np.exp(self._log_trace(log_q))[:, np.newaxis] * self._shape(
+                log_q
+            )
+        return ms.reshape(mv.shape + (3, 3))
+
+    def width(self, mv: RealOrRealArray, couplings: Sequence[float]):
+        """
+        Compute the partial width of a vector.
+
+        Parameters
+        ----------
+        mv: float or array-like
+            Mass(es) of the vector.
+        couplings: (float, float, float)
+            Couplings of the vector to the up, down and strange quarks.
+
+        Returns
+        -------
+        width: float or array-like
+            Partial width with the same shape as `mv`.
+        """
+        g = np.asarray(couplings, dtype=np.float64)
+        w = np.einsum("i,...ij,j->...", g, self.matrix(mv), g)
+        if np.ndim(mv) == 0:
+            return float(w)
+        return w
+
+    def __call__(self, mv: RealOrRealArray, couplings: Sequence[float]):
+        return self.width(mv, couplings)
+
+    def cross_section(
+        self,
+        *,
+        q: RealOrRealArray,
+        mx: float,
+        mv: float,
+        gvxx: float,
+        wv: float,
+        couplings: Sequence[float],
+    ):
+        """
+        Compute the dark matter annihilation cross section.
+
+        Parameters
+        ----------
+        q: float or array-like
+            Center-of-mass energy.
+        mx: float
+            Mass of the dark matter.
+        mv: float
+            Mass of the vector mediator.
+        gvxx: float
+            Coupling of dark matter to vector mediator.
+        wv: float
+            Width of the vector mediator.
+        couplings: (float, float, float)
+            Couplings of the vector to the up, down and strange quarks.
+
+        Returns
+        -------
+        sigma: float or array-like
+            Dark matter annihilation cross-section. Has same shape as `q`.
+        """
+        single = np.isscalar(q)
+        qq = np.atleast_1d(q).astype(np.float64)
+
+        mask = (qq > self.threshold) & (qq > 2.0 * mx)
+        cs = np.zeros_like(qq)
+
+        if np.any(mask):
+            s = qq[mask] ** 2
+            pre = (
+                gvxx**2
+                * (s + 2 * mx**2)
+                / (np.sqrt(s - 4 * mx**2) * ((s - mv**2) ** 2 + (mv * wv) ** 2))
+            )
+            cs[mask] = pre * self.width(qq[mask], couplings)
+
+        if single:
+            return cs[0]
+        return cs
@@ -0,0 +1,76 @@
+"""Tests for the partial widths factorized into quadratic forms in the
+couplings."""
+
+# pylint: disable=invalid-name
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from hazma.form_factors.vector import FactorizedWidth, VectorFormFactorPiPiEta
+
+
+def test_factorized_width_matches_direct():
+    """
+    Test that the factorized width reproduces the width of the form factor on
+    the grid for arbitrary couplings.
+    """
+    ff = VectorFormFactorPiPiEta()
+    masses = np.linspace(800.0, 2000.0, 7)
+    table = FactorizedWidth.compute(ff, masses)
+
+    rng = np.random.default_rng(1234)
+    for couplings in rng.uniform(-1.0, 1.0, size=(3, 3)):
+        direct = ff.width(mv=masses, couplings=couplings)
+        assert_allclose(table.width(masses, couplings), direct, rtol=1e-8)
+
+    # Below threshold, the width vanishes.
+    assert table.width(700.0, (1.0, -1.0, 0.0)) == 0.0
+
+
+def test_factorized_cross_section_matches_direct():
+    """Test that the cross section from the factorized width is correct."""
+    ff = VectorFormFactorPiPiEta()
+    qs = np.array([900.0, 1300.0, 1700.0])
+    table = FactorizedWidth.compute(ff, qs)
+    kwargs = dict(mx=300.0, mv=1000.0, gvxx=1.0, wv=10.0, couplings=(1.0, -0.5, 0.2))
+
+    direct = ff.cross_section(q=qs, **kwargs)
+    assert_allclose(table.cross_section(q=qs, **kwargs), direct, rtol=1e-8)
+
+
+def test_factorized_width_save_load(tmp_path):
+    """Test that tables are restored from disk."""
+    table = FactorizedWidth.compute(VectorFormFactorPiPiEta(), [900.0, 1500.0])
+    path = tmp_path.joinpath("table.npz")
+    table.save(path)
+
+    loaded = FactorizedWidth.load(path)
+    assert loaded.threshold == table.threshold
+    assert_allclose(loaded.masses, table.masses)
+    assert_allclose(loaded.matrices, table.matrices)
+
+
+def test_factorized_width_off_grid():
+    """
+    Test that the factorized width is accurate between the masses of the grid,
+    including just above threshold where the width vanishes like a power of
+    mv - threshold.
+    """
+    ff = VectorFormFactorPiPiEta()
+    threshold = sum(ff.fsp_masses)
+    qs = np.concatenate(
+        [
+            np.geomspace(1e-4, 10.0, 15),
+            10.0 + 300.0 * np.linspace(0.0, 1.0, 30)[1:] ** 2,
+        ]
+    )
+    table = FactorizedWidth.compute(ff, threshold + qs)
+
+    # Geometric and arithmetic midpoints between the masses of the grid, as
+    # well as a mass below the first one.
+    mvs = threshold + np.concatenate(
+        [[1e-5], np.sqrt(qs[:-1] * qs[1:])[:14], 0.5 * (qs[14:-1] + qs[15:])]
+    )
+    for couplings in [(1.0, -0.5, 0.2), (0.3, 1.0, -1.0)]:
+        direct = ff.width(mv=mvs, couplings=couplings)
+        assert_allclose(table.width(mvs, couplings), direct, rtol=1e-4)
@@ -267,7 +267,8 @@ class _VectorFormFactorPiKKBase(VectorFormFactorPPP):
         Other Parameters
         ----------------
         method: str, optional
-            Method used to integrate. Default is 'quad'. Options are 'quad' or
+            Method used to integrate. Default is 'quad'. Options are 'quad',
+            'gauss' (Gauss-Legendre quadrature on a cached Dalitz grid) or
             'rambo'.
         npts: int, optional
             Number of phase-space points to use in integration. Ignored is
@@ -364,7 +364,8 @@ class VectorFormFactorPiPiPi0(VectorFormFactorPPP):
         Other Parameters
         ----------------
         method: str, optional
-            Method used to integrate. Default is 'quad'. Options are 'quad' or
+            Method used to integrate. Default is 'quad'. Options are 'quad',
+            'gauss' (Gauss-Legendre quadrature on a cached Dalitz grid) or
             'rambo'.
         npts: int, optional
             Number of phase-space points to use in integration. Ignored is
@@ -434,7 +435,8 @@ class VectorFormFactorPiPiPi0(VectorFormFactorPPP):
         Other Parameters
         ----------------
         method: str, optional
-            Method used to integrate. Default is 'quad'. Options are 'quad' or
+            Method used to integrate. Default is 'quad'. Options are 'quad',
+            'gauss' (Gauss-Legendre quadrature on a cached Dalitz grid) or
             'rambo'.
         npts: int, optional
             Number of phase-space points to use in integration. Ignored is
@@ -524,7 +526,8 @@ class VectorFormFactorPiPiPi0(VectorFormFactorPPP):
         Other Parameters
         ----------------
         method: str, optional
-            Method used to integrate. Default is 'quad'. Options are 'quad' or
+            Method used to integrate. Default is 'quad'. Options are 'quad',
+            'gauss' (Gauss-Legendre quadrature on a cached Dalitz grid) or
             'rambo'.
         npts: int, optional
             Number of phase-space points to use in integration. Ignored is
@@ -577,7 +580,8 @@ class VectorFormFactorPiPiPi0(VectorFormFactorPPP):
         Other Parameters
         ----------------
         method: str, optional
-            Method used to integrate. Default is 'quad'. Options are 'quad' or
+            Method used to integrate. Default is 'quad'. Options are 'quad',
+            'gauss' (Gauss-Legendre quadrature on a cached Dalitz grid) or
             'rambo'.
         npts: int, optional
             Number of phase-space points to use in integration. Ignored is
@@ -628,7 +632,8 @@ class VectorFormFactorPiPiPi0(VectorFormFactorPPP):
         Other Parameters
         ----------------
         method: str, optional
-            Method used to integrate. Default is 'quad'. Options are 'quad' or
+            Method used to integrate. Default is 'quad'. Options are 'quad',
+            'gauss' (Gauss-Legendre quadrature on a cached Dalitz grid) or
             'rambo'.
         npts: int, optional
             Number of phase-space points to use in integration. Ignored is
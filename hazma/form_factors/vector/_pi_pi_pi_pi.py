@@ -857,14 +857,20 @@ class _VectorFormFactorPiPiPiPiBase(VectorFormFactorPPPP):
         single = np.isscalar(q)
         qq = np.atleast_1d(q).astype(np.float64)
 
-        s = qq**2
-        pre = (
-            gvxx**2
-            * (s + 2 * mx**2)
-            / (np.sqrt(s - 4 * mx**2) * ((s - mv**2) ** 2 + (mv * wv) ** 2))
-        )
-        pre = pre * 0.5 * qq
-        cs = pre * self.integrated_form_factor(q=qq, couplings=couplings, npts=npts)
+        mask = (qq > sum(self.fsp_masses)) & (qq > 2.0 * mx)
+        cs = np.zeros_like(qq)
+
+        if np.any(mask):
+            s = qq[mask] ** 2
+            pre = (
+                gvxx**2
+                * (s + 2 * mx**2)
+                / (np.sqrt(s - 4 * mx**2) * ((s - mv**2) ** 2 + (mv * wv) ** 2))
+            )
+            pre = pre * 0.5 * qq[mask]
+            cs[mask] = pre * self.integrated_form_factor(
+                q=qq[mask], couplings=couplings, npts=npts
+            )
 
         if single:
             return cs[0]
@@ -217,7 +217,8 @@ class VectorFormFactorPPP(VectorFormFactorThreeBody):
         q: float or array-like
             Center of mass energy.
         method: str, optional
-            Method used to integrate. Default is 'quad'. Options are 'quad' or
+            Method used to integrate. Default is 'quad'. Options are 'quad',
+            'gauss' (Gauss-Legendre quadrature on a cached Dalitz grid) or
             'rambo'.
         npts: int, optional
             Number of phase-space points to use in integration. Ignored is
@@ -275,8 +276,8 @@ class VectorFormFactorPPP(VectorFormFactorThreeBody):
         q: float
             Center-of-mass energy in MeV.
         method: str
-            Method used to generate energy distributions. Can be 'quad' or
-            'rambo'. Default is 'quad'.
+            Method used to generate energy distributions. Can be 'quad',
+            'gauss' or 'rambo'. Default is 'quad'.
         nbins: int
             Number of bins for the distributions.
         npts: int
@@ -322,8 +323,8 @@ class VectorFormFactorPPP(VectorFormFactorThreeBody):
         q: float
             Center-of-mass energy in MeV.
         method: str
-            Method used to generate energy distributions. Can be 'quad' or
-            'rambo'. Default is 'quad'.
+            Method used to generate energy distributions. Can be 'quad',
+            'gauss' or 'rambo'. Default is 'quad'.
         nbins: int
             Number of bins for the distributions.
         npts: int
@@ -4,14 +4,16 @@ Parameters relevant to computing constraints from gamma ray experiments.
 
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Tuple, Dict, Any
 
 import numpy as np
-from scipy import interpolate
 
+from hazma._utils.tables import LazyInterp1d
 from hazma.background_model import BackgroundModel, ParametricBackgroundModel
+from hazma.detector_response import DetectorResponse
 from hazma.flux_measurement import FluxMeasurement
 from hazma.target_params import TargetParams
 
@@ -22,9 +24,31 @@ grd_dir = os.path.join(_dir, "gamma_ray_data")
 
 
 def _generate_interp(subdir, filename, fill_value=np.nan, bounds_error=True):
+    # The tables are only loaded when first used.
     path = os.path.join(grd_dir, subdir, filename)
-    data = np.genfromtxt(path, delimiter=",", unpack=True)
-    return interpolate.interp1d(*data, bounds_error=bounds_error, fill_value=fill_value)
+    return LazyInterp1d(path, bounds_error=bounds_error, fill_value=fill_value)
+
+
+class _TabulatedFunction:
+    """
+    Function computed from a lazily loaded table, exposing the grid of the
+    table as `x`.
+    """
+
+    def __init__(self, fn, interp: LazyInterp1d):
+        functools.update_wrapper(self, fn)
+        self._interp = interp
+
+    @property
+    def x(self):
+        return self._interp.x
+
+    def __call__(self, *args, **kwargs):
+        return self.__wrapped__(*args, **kwargs)  # type: ignore
+
+    def __reduce__(self):
+        # Pickle by reference to the module attribute, like a plain function.
+        return self.__name__
 
 
 # From Alex Moiseev's slides. Ref: G. Weidenspointner et al, AIP 510, 467, 2000.
@@ -529,18 +553,26 @@ def effective_area_pangu(energy):
 
 
 # These are for backwards compatability
-effective_area_adept.x = __effective_area_adept.x
-effective_area_amego.x = __effective_area_amego.x
-effective_area_comptel.x = __effective_area_comptel.x
-effective_area_all_sky_astrogam.x = __effective_area_all_sky_astrogam.x
-effective_area_e_astrogam.x = __effective_area_e_astrogam.x
-effective_area_egret.x = __effective_area_egret.x
-effective_area_fermi.x = __effective_area_fermi.x
-effective_area_gecco.x = __effective_area_gecco.x
-effective_area_grams.x = __effective_area_grams.x
-effective_area_grams_upgrade.x = __effective_area_grams_upgrade.x
-effective_area_mast.x = __effective_area_mast.x
-effective_area_pangu.x = __effective_area_pangu.x
+effective_area_adept = _TabulatedFunction(effective_area_adept, __effective_area_adept)
+effective_area_amego = _TabulatedFunction(effective_area_amego, __effective_area_amego)
+effective_area_comptel = _TabulatedFunction(
+    effective_area_comptel, __effective_area_comptel
+)
+effective_area_all_sky_astrogam = _TabulatedFunction(
+    effective_area_all_sky_astrogam, __effective_area_all_sky_astrogam
+)
+effective_area_e_astrogam = _TabulatedFunction(
+    effective_area_e_astrogam, __effective_area_e_astrogam
+)
+effective_area_egret = _TabulatedFunction(effective_area_egret, __effective_area_egret)
+effective_area_fermi = _TabulatedFunction(effective_area_fermi, __effective_area_fermi)
+effective_area_gecco = _TabulatedFunction(effective_area_gecco, __effective_area_gecco)
+effective_area_grams = _TabulatedFunction(effective_area_grams, __effective_area_grams)
+effective_area_grams_upgrade = _TabulatedFunction(
+    effective_area_grams_upgrade, __effective_area_grams_upgrade
+)
+effective_area_mast = _TabulatedFunction(effective_area_mast, __effective_area_mast)
+effective_area_pangu = _TabulatedFunction(effective_area_pangu, __effective_area_pangu)
 
 
 # These are for backwards compatability
@@ -962,6 +994,31 @@ def energy_res_pangu(energy):
     return np.vectorize(lambda _: 0.4)(energy)
 
 
+# ============================
+# ---- Detector Responses ----
+# ============================
+
+#: Responses of the telescopes, keyed by telescope name. These memoize the
+#: resolution matrices used to convolve spectra and should be reused across
+#: models.
+detector_responses: Dict[str, DetectorResponse] = {
+    "adept": DetectorResponse(A_eff_adept, energy_res_adept),
+    "amego": DetectorResponse(A_eff_amego, energy_res_amego),
+    "comptel": DetectorResponse(A_eff_comptel, energy_res_comptel),
+    "all_sky_astrogam": DetectorResponse(
+        A_eff_all_sky_astrogam, energy_res_all_sky_astrogam
+    ),
+    "e_astrogam": DetectorResponse(A_eff_e_astrogam, energy_res_e_astrogam),
+    "egret": DetectorResponse(A_eff_egret, energy_res_egret),
+    "fermi": DetectorResponse(A_eff_fermi, energy_res_fermi),
+    "gecco": DetectorResponse(A_eff_gecco, energy_res_gecco),
+    "grams": DetectorResponse(A_eff_grams, energy_res_grams),
+    "grams_upgrade": DetectorResponse(A_eff_grams_upgrade, energy_res_grams_upgrade),
+    "mast": DetectorResponse(A_eff_mast, energy_res_mast),
+    "pangu": DetectorResponse(A_eff_pangu, energy_res_pangu),
+}
+
+
 # ==========================
 # ---- Flux Measurments ----
 # ==========================
@@ -972,21 +1029,20 @@ def _generate_flux_measurement(subdir, filename, energy_res, target):
     return FluxMeasurement.from_file(path, energy_res, target)
 
 
-comptel_diffuse = _generate_flux_measurement(
-    "obs",
-    "comptel_diffuse.dat",
-    energy_res_comptel,
-    comptel_diffuse_target,
-)
-egret_diffuse = _generate_flux_measurement(
-    "obs", "egret_diffuse.dat", energy_res_egret, egret_diffuse_target
-)
-fermi_diffuse = _generate_flux_measurement(
-    "obs", "fermi_diffuse.dat", energy_res_fermi, fermi_diffuse_target
-)
-integral_diffuse = _generate_flux_measurement(
-    "obs", "integral_diffuse.dat", energy_res_integral, integral_diffuse_target
-)
+_FLUX_MEASUREMENTS = {
+    "comptel_diffuse": (
+        "comptel_diffuse.dat",
+        energy_res_comptel,
+        comptel_diffuse_target,
+    ),
+    "egret_diffuse": ("egret_diffuse.dat", energy_res_egret, egret_diffuse_target),
+    "fermi_diffuse": ("fermi_diffuse.dat", energy_res_fermi, fermi_diffuse_target),
+    "integral_diffuse": (
+        "integral_diffuse.dat",
+        energy_res_integral,
+        integral_diffuse_target,
+    ),
+}
 
 # ===========================
 # ---- Background Models ----
@@ -998,9 +1054,30 @@ def _generate_background_model(subdir, filename):
     return BackgroundModel.from_interp(interp)
 
 
-#: This is the more complex background model from arXiv:1703.02546. Note that it
-#: is only applicable to the inner 10deg x 10deg region of the Milky Way.
-gc_bg_model = _generate_background_model("bg_model", "gc.dat")
+@functools.lru_cache(maxsize=None)
+def _lazy_attr(name):
+    if name in _FLUX_MEASUREMENTS:
+        filename, energy_res, target = _FLUX_MEASUREMENTS[name]
+        return _generate_flux_measurement("obs", filename, energy_res, target)
+    if name == "gc_bg_model":
+        # This is the more complex background model from arXiv:1703.02546. Note
+        # that it is only applicable to the inner 10deg x 10deg region of the
+        # Milky Way.
+        return _generate_background_model("bg_model", "gc.dat")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_LAZY_ATTRS = (*_FLUX_MEASUREMENTS, "gc_bg_model")
+
+
+def __getattr__(name):
+    # The flux measurements and the GC background model are built from data
+    # tables the first time they are accessed.
+    return _lazy_attr(name)
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_ATTRS])
 
 
 class GalacticCenterBackgroundModel(ParametricBackgroundModel):
@@ -1327,3 +1404,8 @@ class GeccoBackgroundModel:
         da = amp * energy ** (-alpha) * np.log(energy)
 
         return {"amplitude": dn, "power_law_index": da}
+
+
+# A star import exports the same names as before the data tables became lazy.
+__all__ = [name for name in globals() if not name.startswith("_")]
+__all__ += _LAZY_ATTRS
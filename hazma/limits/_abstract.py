@@ -1,9 +1,116 @@
 import abc
+import copy
+import multiprocessing as mp
 import warnings
 
 import numpy as np
 
 
+class SharedQuantities:
+    """
+    Store for the quantities of a single model that are shared by all the
+    limits evaluated on it.
+
+    Each quantity is computed the first time it is requested and reused
+    afterwards. Quantities are identified by a hashable key, which must
+    include every argument the quantity depends on.
+    """
+
+    def __init__(self):
+        self._values = {}
+
+    def __contains__(self, key) -> bool:
+        return key in self._values
+
+    def get(self, key, fn, *args, **kwargs):
+        """
+        Return the quantity associated with `key`, computing it using
+        ``fn(*args, **kwargs)`` if it is not yet available.
+        """
+        if key not in self._values:
+            self._values[key] = fn(*args, **kwargs)
+        return self._values[key]
+
+
+def _constrain_models(limits, models):
+    """
+    Compute the constraints from each limit on each model, sharing quantities
+    between the limits evaluated on the same model.
+
+    Returns
+    -------
+    constraints: array-like
+        Numpy array with shape (len(limits), len(models)).
+    """
+    constraints = np.zeros((len(limits), len(models)), dtype=float)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i, model in enumerate(models):
+            shared = SharedQuantities()
+            for j, limit in enumerate(limits):
+                constraints[j, i] = limit._constrain_shared(model, shared)
+    return constraints
+
+
+def _constrain_models_star(args):
+    return _constrain_models(*args)
+
+
+def constrain_batch(limits, model_iterator, num_cpus: int = 1, chunk_size=None):
+    """
+    Compute the constraints from several limits on many models in a single
+    pass over the models.
+
+    Quantities needed by more than one limit (such as the convolved spectra or
+    f_eff) are computed once per model.
+
+    Parameters
+    ----------
+    limits: list
+        The limits (``AbstractLimit`` instances) to evaluate.
+    model_iterator: iter
+        Iterator over the dark matter models.
+    num_cpus: int, optional
+        Number of worker processes the models are distributed over. Default is
+        1, which evaluates the models in this process.
+    chunk_size: int, optional
+        Number of models sent to a worker at a time. By default, the models are
+        split evenly into four chunks per worker.
+
+    Returns
+    -------
+    constraints: array-like
+        Numpy array with shape (len(limits), len(models)) containing the
+        constraints from each limit on each model.
+    """
+    if num_cpus == 1:
+        return _constrain_models(limits, model_iterator)
+
+    if num_cpus > mp.cpu_count():
+        warnings.warn(
+            f"You only have {mp.cpu_count()} cpus. "
+            f"Using {mp.cpu_count()} cpus instead."
+        )
+        num_cpus = mp.cpu_count()
+
+    # Iterators commonly yield the same instance with updated parameters, so
+    # each model is copied before being sent to the workers.
+    models = [copy.deepcopy(model) for model in model_iterator]
+
+    if chunk_size is None:
+        chunk_size = max(1, int(np.ceil(len(models) / (4 * num_cpus))))
+    chunks = [
+        (limits, models[i : i + chunk_size]) for i in range(0, len(models), chunk_size)
+    ]
+
+    with mp.Pool(num_cpus) as pool:
+        results = pool.map(_constrain_models_star, chunks)
+
+    if len(results) == 0:
+        return np.zeros((len(limits), 0), dtype=float)
+    return np.concatenate(results, axis=1)
+
+
 class AbstractLimit(abc.ABC):
     def __init__(self):
         pass
@@ -22,7 +129,14 @@ class AbstractLimit(abc.ABC):
     def _constrain(self, model):
         pass
 
-    def constrain(self, model_iterator):
+    def _constrain_shared(self, model, shared: SharedQuantities):
+        """
+        Compute the constraint on the model, using `shared` to store or reuse
+        quantities shared with other limits. Defaults to `_constrain`.
+        """
+        return self._constrain(model)
+
+    def constrain(self, model_iterator, num_cpus: int = 1):
         """
         Compute the constraints on the models.
 
@@ -30,18 +144,16 @@ class AbstractLimit(abc.ABC):
         ----------
         model_iterator: iter
             Iterator over the dark matter models.
+        num_cpus: int, optional
+            Number of worker processes the models are distributed over. Default
+            is 1.
 
         Returns
         -------
         constraints: array-like
             Numpy array containing the constraints for each model.
         """
-        constraints = np.zeros((len(model_iterator),), dtype=float)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            for i, model in enumerate(model_iterator):
-                constraints[i] = self._constrain(model)
-        return constraints
+        return constrain_batch([self], model_iterator, num_cpus=num_cpus)[0]
 
 
 class CompositeConstrainer(abc.ABC):
@@ -62,10 +174,11 @@ class CompositeConstrainer(abc.ABC):
     def __len__(self):
         return len(self._constrainers)
 
-    def _constrain(self, model_iterator):
-        constraints = {}
-        for constrainer in self._constrainers:
-            name = constrainer.name
-            constraints[name] = constrainer.constrain(model_iterator)
-
-        return constraints
+    def _constrain(self, model_iterator, num_cpus: int = 1):
+        constraints = constrain_batch(
+            self._constrainers, model_iterator, num_cpus=num_cpus
+        )
+        return {
+            constrainer.name: constraints[i]
+            for i, constrainer in enumerate(self._constrainers)
+        }
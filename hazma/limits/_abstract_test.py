@@ -0,0 +1,76 @@
+"""Tests for the batched evaluation of limits."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma.limits import CMBLimit, ComptelLimit, EgretLimit, FermiLimit
+from hazma.limits._abstract import constrain_batch
+from hazma.scalar_mediator import HiggsPortal
+
+MXS = [50.0, 150.0, 300.0]
+
+
+def make_limits():
+    # Pairs of limits sharing the convolved spectrum and f_eff
+    return [
+        ComptelLimit(),
+        ComptelLimit(sigma=5.0),
+        EgretLimit(),
+        FermiLimit(),
+        CMBLimit(),
+        CMBLimit(p_ann=1e-30),
+    ]
+
+
+class ModelIterator:
+    """Yields the same instance with updated parameters, as scans usually do."""
+
+    def __len__(self):
+        return len(MXS)
+
+    def __iter__(self):
+        model = HiggsPortal(mx=MXS[0], ms=1e3, gsxx=1.0, stheta=1e-3)
+        for mx in MXS:
+            model.mx = mx
+            yield model
+
+
+def expected_constraints(limits):
+    models = [HiggsPortal(mx=mx, ms=1e3, gsxx=1.0, stheta=1e-3) for mx in MXS]
+    return np.array([[limit._constrain(model) for model in models] for limit in limits])
+
+
+@pytest.mark.filterwarnings("ignore:You only have")
+@pytest.mark.parametrize("num_cpus", [1, 2])
+def test_constrain_batch(num_cpus):
+    limits = make_limits()
+    constraints = constrain_batch(limits, ModelIterator(), num_cpus=num_cpus)
+
+    assert constraints.shape == (len(limits), len(MXS))
+    assert_allclose(constraints, expected_constraints(limits), rtol=1e-12)
+
+
+def test_constrain_batch_shares_f_eff(monkeypatch):
+    n_calls = 0
+    f_eff = CMBLimit.f_eff
+
+    def counting_f_eff(self, model):
+        nonlocal n_calls
+        n_calls += 1
+        return f_eff(self, model)
+
+    monkeypatch.setattr(CMBLimit, "f_eff", counting_f_eff)
+    limits = [CMBLimit(), CMBLimit(p_ann=1e-30), CMBLimit(x_kd=1e-3)]
+    constrain_batch(limits, ModelIterator())
+    # Once per model for each distinct x_kd
+    assert n_calls == 2 * len(MXS)
+
+
+def test_constrain_matches_constrain_batch():
+    limit = ComptelLimit()
+    assert_allclose(
+        limit.constrain(ModelIterator()),
+        expected_constraints([limit])[0],
+        rtol=1e-12,
+    )
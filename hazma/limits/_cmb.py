@@ -1,9 +1,12 @@
+import functools
+
 import importlib_resources
 
 from scipy.interpolate import interp1d
 import numpy as np
 from scipy.integrate import quad
 
+from hazma._utils.tables import load_table
 from hazma.parameters import temp_cmb_formation
 
 from ._abstract import AbstractLimit
@@ -13,19 +16,24 @@ from ._abstract import AbstractLimit
 Functions required for computing CMB limits and related quantities.
 """
 
-# Get paths to files inside the module
-_f_eff_ep_ref = importlib_resources.files("hazma.limits.data") / "f_eff_ep.dat"
-_f_eff_g_ref = importlib_resources.files("hazma.limits.data") / "f_eff_g.dat"
 
-# Load f_eff^{e+ e-}
-with importlib_resources.as_file(_f_eff_ep_ref) as path:
-    f_eff_ep_data = np.loadtxt(path, delimiter=",").T
-    f_eff_ep = interp1d(f_eff_ep_data[0] / 1.0e6, f_eff_ep_data[1])  # eV -> MeV
+@functools.lru_cache(maxsize=None)
+def _load_f_eff(name):
+    """Load the table of f_eff for photons ('g') or electrons ('ep')."""
+    ref = importlib_resources.files("hazma.limits.data") / f"f_eff_{name}.dat"
+    with importlib_resources.as_file(ref) as path:
+        data = load_table(path, delimiter=",").T
+    return data, interp1d(data[0] / 1.0e6, data[1])  # eV -> MeV
+
 
-# Load f_eff^{e+ e-}
-with importlib_resources.as_file(_f_eff_g_ref) as path:
-    f_eff_g_data = np.loadtxt(path, delimiter=",").T
-    f_eff_g = interp1d(f_eff_g_data[0] / 1.0e6, f_eff_g_data[1])  # eV -> MeV
+def __getattr__(name):
+    # The f_eff^{e+ e-} and f_eff^{gamma gamma} tables are only loaded when
+    # first used.
+    if name in ("f_eff_ep", "f_eff_g"):
+        return _load_f_eff(name[len("f_eff_") :])[1]
+    if name in ("f_eff_ep_data", "f_eff_g_data"):
+        return _load_f_eff(name[len("f_eff_") : -len("_data")])[0]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 #: Planck 2018 95% upper limit on p_ann from temperature + polarization
@@ -109,7 +117,11 @@ class CMBLimit(AbstractLimit):
         <sigma v> : float
             Upper bound on <sigma v>, in cm^3 s^-1.
         """
-        return self.p_ann * model.mx / self.f_eff(self.x_kd)  # type: ignore
+        return self.p_ann * model.mx / self.f_eff(model)  # type: ignore
+
+    def _constrain_shared(self, model, shared):
+        f_eff = shared.get(("f_eff", self.x_kd), self.f_eff, model)
+        return self.p_ann * model.mx / f_eff
 
     def _f_eff_helper(self, model, fs, mode="quad"):
         """Computes f_eff^gg or f_eff^ep for DM annihilation.
@@ -132,18 +144,18 @@ class CMBLimit(AbstractLimit):
             f_eff for photons or electrons and positrons.
         """
         # Center of mass energy
-        vx = self.vx_cmb(model.mx, self.x_kd) ** 2
+        vx = self.vx_cmb(model.mx, self.x_kd)
         e_cm = 2.0 * model.mx * (1.0 + 0.5 * vx**2)
 
         if fs == "g g":
-            f_eff_base = f_eff_g
+            f_eff_base = _load_f_eff("g")[1]
             lines = model.gamma_ray_lines(e_cm)
 
             def spec_fn(es, e_cm):
                 return model.total_spectrum(es, e_cm)
 
         elif fs == "e e":
-            f_eff_base = f_eff_ep
+            f_eff_base = _load_f_eff("ep")[1]
             lines = model.positron_lines(e_cm)
 
             def spec_fn(es, e_cm):
@@ -22,6 +22,16 @@ class ExistingTelescopeLimit(AbstractLimit):
         )
         return model.binned_limit(self.measurement, self.sigma, self.method)
 
+    def _constrain_shared(self, model, shared):
+        # Limits using the same measurement share the convolved spectrum
+        def conv_spectrum_fn(*args):
+            key = ("total_conv_spectrum_fn", *args)
+            return shared.get(key, model.total_conv_spectrum_fn, *args)
+
+        return model.binned_limit(
+            self.measurement, self.sigma, self.method, conv_spectrum_fn
+        )
+
 
 class ComptelLimit(ExistingTelescopeLimit):
     def __init__(self, sigma=2.0, method="chi2"):
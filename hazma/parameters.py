@@ -1,9 +1,12 @@
+from collections import OrderedDict
 from typing import Dict, List
 
 import numpy as np
 from scipy.integrate import trapezoid
 from scipy.interpolate import InterpolatedUnivariateSpline, interp1d
 
+from hazma._utils.tables import load_table
+
 """
 Physics constants and utility functions.
 """
@@ -391,7 +394,7 @@ def load_interp(rf_name, bounds_error=False, fill_value=0.0):
         values and second as the y values. interp will not raise a bounds error
         and uses a fill values of 0.0.
     """
-    xs, ys = np.loadtxt(rf_name, delimiter=",").T
+    xs, ys = load_table(rf_name, delimiter=",").T
     return interp1d(xs, ys, bounds_error=bounds_error, fill_value=fill_value)
 
 
@@ -412,8 +415,121 @@ def spec_res_fn(ep, e, energy_res):
         )
 
 
+def _energy_res_values(energy_res, es):
+    """
+    Evaluate the energy resolution on an array of energies. Functions that do
+    not support arrays, or give different results for arrays and scalars, are
+    evaluated at each energy separately.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            vals = np.broadcast_to(
+                np.asarray(energy_res(es), dtype=np.float64), es.shape
+            )
+        idxs = [0, len(es) // 2, len(es) - 1]
+        scalar_vals = [float(energy_res(e)) for e in es[idxs]]
+        if np.allclose(vals[idxs], scalar_vals, rtol=1e-12, atol=0.0, equal_nan=True):
+            return vals
+    except (TypeError, ValueError):
+        # Not array-safe.
+        pass
+    return np.array([energy_res(e) for e in es], dtype=np.float64)
+
+
+def _resolution_matrix(energy_res, e_min, e_max, n_pts):
+    """
+    Compute the matrix mapping a spectrum tabulated on the padded energy grid
+    used by ``convolved_spectrum_fn`` to its convolution with the detector's
+    spectral resolution function.
+
+    Each row contains the normalized resolution function centered on one of
+    the output energies multiplied by the trapezoid-rule weights of the padded
+    grid, so the matrix-vector product reproduces the reference integration.
+    The matrices are cached since they only depend on the detector and the
+    grid.
+
+    Parameters
+    ----------
+    energy_res : float -> float
+        The detector's energy resolution. It is evaluated on the whole grid at
+        once if it supports arrays.
+    e_min, e_max : float
+        Bounds of the output energy grid.
+    n_pts : int
+        Number of points in the output and padded energy grids.
+
+    Returns
+    -------
+    matrix : np.ndarray
+        Read-only array with shape (n_pts, n_pts).
+    """
+    es = np.geomspace(e_min, e_max, n_pts)
+    es_padded = np.geomspace(0.1 * e_min, 10 * e_max, n_pts)
+    sigmas = es * _energy_res_values(energy_res, es)
+
+    # Trapezoid-rule weights on the padded grid
+    des = np.diff(es_padded)
+    weights = np.zeros_like(es_padded)
+    weights[1:] += 0.5 * des
+    weights[:-1] += 0.5 * des
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        kernel = np.exp(
+            -((es_padded[np.newaxis, :] - es[:, np.newaxis]) ** 2)
+            / (2.0 * sigmas[:, np.newaxis] ** 2)
+        ) / np.sqrt(2.0 * np.pi * sigmas[:, np.newaxis] ** 2)
+        # Matches `spec_res_fn`, which vanishes for zero resolution
+        kernel[sigmas == 0] = 0.0
+        matrix = kernel * weights / (kernel @ weights)[:, np.newaxis]
+
+    matrix.flags.writeable = False
+    return matrix
+
+
+class _MatrixCache:
+    """
+    Least-recently-used cache of resolution matrices holding at most
+    `max_bytes` bytes of matrices.
+    """
+
+    def __init__(self, max_bytes: int = 1 << 26):
+        self.max_bytes = max_bytes
+        self._matrices = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._matrices)
+
+    def get(self, energy_res, e_min, e_max, n_pts) -> np.ndarray:
+        """Return the resolution matrix, computing it if it is not cached."""
+        key = (energy_res, float(e_min), float(e_max), int(n_pts))
+        matrix = self._matrices.get(key)
+        if matrix is not None:
+            self._matrices.move_to_end(key)
+            return matrix
+
+        matrix = _resolution_matrix(energy_res, *key[1:])
+        self._matrices[key] = matrix
+        self._nbytes += matrix.nbytes
+        # Always keep the newest matrix, even if it exceeds the limit alone.
+        while self._nbytes > self.max_bytes and len(self._matrices) > 1:
+            _, old = self._matrices.popitem(last=False)
+            self._nbytes -= old.nbytes
+        return matrix
+
+    def clear(self) -> None:
+        """Discard all the matrices."""
+        self._matrices.clear()
+        self._nbytes = 0
+
+
+# The matrices only depend on the detector and the grid. A 1000x1000 matrix
+# takes 8 MB, so at most 8 such matrices are kept.
+_convolution_matrices = _MatrixCache()
+
+
 def convolved_spectrum_fn(
-    e_min, e_max, energy_res, spec_fn=None, lines=None, n_pts=1000
+    e_min, e_max, energy_res, spec_fn=None, lines=None, n_pts=1000, method="matrix"
 ):
     r"""
     Convolves a continuum and line spectrum with a detector's spectral
@@ -425,15 +541,23 @@ def convolved_spectrum_fn(
         Lower bound of energy range over which to perform convolution.
     e_max : float
         Upper bound of energy range over which to perform convolution.
-    energy_res : float -> float
+    energy_res : float -> float or DetectorResponse
         The detector's energy resolution (Delta E / E) as a function of
-        photon energy in MeV.
+        photon energy in MeV. If a ``DetectorResponse`` is given, its memoized
+        resolution matrices are used.
     spec_fn : np.array -> np.array
         Continuum spectrum function.
     lines : dict
         Information about spectral lines.
     n_pts : float
         Number of points to use to create resulting interpolating function.
+    method : str, optional
+        Method used to convolve the continuum spectrum. If "matrix" (default),
+        the convolution is a single product with a precomputed matrix, which
+        is cached for each ``(energy_res, e_min, e_max, n_pts)``. The energy
+        resolution is evaluated on the whole grid at once if it supports
+        arrays and at each energy otherwise. If "reference", the convolution
+        integral is performed separately at each energy.
 
     Returns
     -------
@@ -442,6 +566,9 @@ def convolved_spectrum_fn(
         detector. Using photon energies outside the range [e_min, e_max] will
         produce a ``bounds_errors``.
     """
+    if method not in ["matrix", "reference"]:
+        raise ValueError(f"Invalid method {method}. Use 'matrix' or 'reference'.")
+
     es = np.geomspace(e_min, e_max, n_pts)
     dnde_conv = np.zeros(es.shape)
 
@@ -450,19 +577,28 @@ def convolved_spectrum_fn(
     if spec_fn is not None:
         dnde_src = spec_fn(es_padded)
         if not np.all(dnde_src == 0):
-
-            def integral(e):
-                """
-                Performs the integration at given photon energy.
-                """
-                spec_res_fn_vals = spec_res_fn(es_padded, e, energy_res)
-                integrand_vals = (
-                    dnde_src * spec_res_fn_vals / trapezoid(spec_res_fn_vals, es_padded)
-                )
-
-                return trapezoid(integrand_vals, es_padded)
-
-            dnde_conv += np.vectorize(integral)(es)
+            if method == "matrix":
+                if hasattr(energy_res, "resolution_matrix"):
+                    matrix = energy_res.resolution_matrix(e_min, e_max, n_pts)
+                else:
+                    matrix = _convolution_matrices.get(energy_res, e_min, e_max, n_pts)
+                dnde_conv += matrix @ dnde_src
+            else:
+
+                def integral(e):
+                    """
+                    Performs the integration at given photon energy.
+                    """
+                    spec_res_fn_vals = spec_res_fn(es_padded, e, energy_res)
+                    integrand_vals = (
+                        dnde_src
+                        * spec_res_fn_vals
+                        / trapezoid(spec_res_fn_vals, es_padded)
+                    )
+
+                    return trapezoid(integrand_vals, es_padded)
+
+                dnde_conv += np.vectorize(integral)(es)
 
     # Line contribution
     if lines is not None:
@@ -0,0 +1,70 @@
+"""Tests for the detector-resolution convolution."""
+
+import math
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma.gamma_ray_parameters import energy_res_comptel, energy_res_e_astrogam
+from hazma.parameters import _MatrixCache, convolved_spectrum_fn
+
+
+def dnde(es):
+    return np.exp(-es / 50.0) / es
+
+
+@pytest.mark.parametrize("energy_res", [energy_res_comptel, energy_res_e_astrogam])
+def test_matrix_matches_reference(energy_res):
+    lines = {"g g": {"energy": 100.0, "bf": 1e-2}}
+    es = np.geomspace(1.0, 300.0, 200)
+
+    ref = convolved_spectrum_fn(
+        1.0, 300.0, energy_res, dnde, lines, n_pts=500, method="reference"
+    )
+    fast = convolved_spectrum_fn(1.0, 300.0, energy_res, dnde, lines, n_pts=500)
+
+    assert_allclose(fast(es), ref(es), rtol=1e-10, atol=0.0)
+
+
+def test_invalid_method():
+    with pytest.raises(ValueError, match="Invalid method"):
+        convolved_spectrum_fn(1.0, 300.0, energy_res_comptel, dnde, method="fft")
+
+
+def energy_res_scalar(e):
+    """Energy resolution that only supports scalars."""
+    return 0.05 if e < 10.0 else 0.02 * math.log10(e) + 0.03
+
+
+def energy_res_not_elementwise(e):
+    """Energy resolution giving wrong results for arrays, without errors."""
+    return 0.05 if np.all(np.asarray(e) < 10.0) else 0.02 * np.log10(np.max(e)) + 0.03
+
+
+@pytest.mark.parametrize("energy_res", [energy_res_scalar, energy_res_not_elementwise])
+def test_matrix_scalar_energy_res(energy_res):
+    es = np.geomspace(1.0, 300.0, 200)
+    ref = convolved_spectrum_fn(
+        1.0, 300.0, energy_res, dnde, n_pts=500, method="reference"
+    )
+    fast = convolved_spectrum_fn(1.0, 300.0, energy_res, dnde, n_pts=500)
+    assert_allclose(fast(es), ref(es), rtol=1e-10, atol=0.0)
+
+
+def test_matrix_cache_bounded():
+    n_pts = 100
+    nbytes = 8 * n_pts**2
+    cache = _MatrixCache(max_bytes=3 * nbytes)
+
+    matrices = [
+        cache.get(energy_res_comptel, 1.0, e_max, n_pts) for e_max in [1e2, 2e2, 3e2]
+    ]
+    assert len(cache) == 3
+    assert cache.get(energy_res_comptel, 1.0, 1e2, n_pts) is matrices[0]
+
+    # The least recently used matrix is discarded.
+    cache.get(energy_res_comptel, 1.0, 4e2, n_pts)
+    assert len(cache) == 3
+    assert cache.get(energy_res_comptel, 1.0, 1e2, n_pts) is matrices[0]
+    assert cache.get(energy_res_comptel, 1.0, 2e2, n_pts) is not matrices[1]
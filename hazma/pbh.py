@@ -1,10 +1,162 @@
+import functools
+import pathlib
+
 import numpy as np
-from pkg_resources import resource_filename
-from scipy.interpolate import interp1d
 
+from hazma._utils.tables import load_table
 from hazma.parameters import g_to_MeV, MeV_to_g
 from hazma.theory import TheoryDec
 
+_PBH_DATA_DIR = pathlib.Path(__file__).absolute().parent.joinpath("pbh_data")
+
+
+def _parse_float(s: str) -> float:
+    try:
+        return float(s)
+    except ValueError:
+        sig, exponent = s.split("e")
+        return float(sig) * 10 ** float(exponent)
+
+
+def _parse_spectra(path) -> np.ndarray:
+    """
+    Parse a table of PBH spectra. The result has shape (1 + n_e, 1 + n_m): the
+    first row holds the PBH masses in g, the first column the photon energies
+    in GeV and the rest the spectra in 1/GeV.
+    """
+
+    def parse_line(line: str):
+        # Skip first value (it's the row index)
+        return list(map(float, line.split(",")[1:]))
+
+    with open(path, "r") as f:
+        # Header has the format: ,photon_energies,1e15.0,1e15.05,1e15.1,...
+        # We don't need the first to entries after split on ',', then we
+        # need to parser the weird floats.
+        masses = list(map(_parse_float, f.readline().split(",")[2:]))
+        # Read the remaining lines, which have format: i,e1,e2,e3,... where
+        # 'i' is the row index and the rest are the values we want.
+        data = np.array(list(map(parse_line, f.readlines())))
+
+    return np.vstack([[np.nan] + masses, data])
+
+
+class PBHSpectra:
+    r"""
+    Photon spectra from evaporating PBHs tabulated over PBH masses and photon
+    energies.
+
+    The tables are parsed once, cached in binary form and memory-mapped, so
+    that all instances built from the same file share the data. Spectra for
+    masses between the tabulated ones are interpolated linearly in the
+    logarithm of the mass.
+
+    Attributes
+    ----------
+    masses: np.ndarray
+        Tabulated PBH masses in MeV.
+    photon_energies: np.ndarray
+        Tabulated photon energies in MeV.
+    """
+
+    def __init__(self, path):
+        data = load_table(path, parser=_parse_spectra)
+        self.masses = data[0, 1:] * g_to_MeV
+        # GeV -> MeV
+        self.photon_energies = data[1:, 0] * 1e3
+        # Spectra in 1/GeV. Not rescaled to avoid copying the table.
+        self._spectra = data[1:, 1:]
+        self._log_masses = np.log(self.masses)
+
+    def __repr__(self) -> str:
+        return (
+            f"PBHSpectra(m=[{self.masses[0] * MeV_to_g}, "
+            f"{self.masses[-1] * MeV_to_g}] g, n_m={len(self.masses)}, "
+            f"n_e={len(self.photon_energies)})"
+        )
+
+    def _mass_weights(self, mx):
+        """
+        Return the indices of the tabulated masses below `mx` and the weights
+        of the masses above them.
+        """
+        mx = np.asarray(mx, dtype=np.float64)
+        if np.any(mx < self.masses[0]) or np.any(mx > self.masses[-1]):
+            raise ValueError(
+                f"PBH mass must be between {self.masses[0]} and "
+                f"{self.masses[-1]} MeV."
+            )
+        x = np.log(mx)
+        xs = self._log_masses
+        i = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, len(xs) - 2)
+        t = (x - xs[i]) / (xs[i + 1] - xs[i])
+        return i, t
+
+    def spectrum(self, mx: float):
+        """
+        Return the spectrum d^2N/dE/dt in 1/MeV/s of a PBH with mass `mx` (in
+        MeV) as a function of the photon energy. The spectrum vanishes outside
+        of the tabulated photon energies.
+        """
+        i, t = self._mass_weights(mx)
+        column = 1e-3 * ((1.0 - t) * self._spectra[:, i] + t * self._spectra[:, i + 1])
+
+        def fn(e_gam):
+            return np.interp(e_gam, self.photon_energies, column, left=0.0, right=0.0)
+
+        return fn
+
+    def __call__(self, mx, e_gam):
+        """
+        Compute the spectrum d^2N/dE/dt in 1/MeV/s for PBH masses `mx` and
+        photon energies `e_gam` (both in MeV), which are broadcast against
+        each other. The spectrum is interpolated bilinearly in the logarithm
+        of the mass and in the energy.
+        """
+        mx, e_gam = np.broadcast_arrays(
+            np.asarray(mx, dtype=np.float64), np.asarray(e_gam, dtype=np.float64)
+        )
+        i, t = self._mass_weights(mx)
+
+        es = self.photon_energies
+        j = np.clip(np.searchsorted(es, e_gam, side="right") - 1, 0, len(es) - 2)
+        u = (e_gam - es[j]) / (es[j + 1] - es[j])
+
+        d = self._spectra
+        lo = (1.0 - u) * d[j, i] + u * d[j + 1, i]
+        hi = (1.0 - u) * d[j, i + 1] + u * d[j + 1, i + 1]
+        dnde = 1e-3 * ((1.0 - t) * lo + t * hi)
+        return np.where((e_gam < es[0]) | (e_gam > es[-1]), 0.0, dnde)
+
+
+@functools.lru_cache(maxsize=None)
+def pbh_spectra(spectrum_kind: str = "secondary", bh_secondary: bool = False):
+    """
+    Return the tabulated PBH spectra, shared by all callers in the process.
+
+    Parameters
+    ----------
+    spectrum_kind: str
+        Type of radiation spectrum used for PBH evaporation. Options are
+        'primary' or 'secondary'.
+    bh_secondary: bool
+        If true, BlackHawk v1 secondary is used.
+
+    Returns
+    -------
+    spectra: PBHSpectra
+        Spectra tabulated over PBH masses and photon energies.
+    """
+    if spectrum_kind == "primary":
+        fname = "pbh_primary_spectra_bh.csv"
+    elif spectrum_kind == "secondary" and bh_secondary:
+        fname = "pbh_secondary_spectra_bh.csv"
+    elif spectrum_kind == "secondary":
+        fname = "pbh_secondary_spectra.csv"
+    else:
+        raise ValueError("invalid spectrum_kind")
+    return PBHSpectra(_PBH_DATA_DIR.joinpath(fname))
+
 
 class PBH(TheoryDec):
     """
@@ -48,40 +200,9 @@ class PBH(TheoryDec):
         """
         Load spectrum data tables
         """
-        if self.spectrum_kind == "primary":
-            fname = resource_filename(__name__, "pbh_data/pbh_primary_spectra_bh.csv")
-        elif self.spectrum_kind == "secondary" and self.bh_secondary:
-            fname = resource_filename(__name__, "pbh_data/pbh_secondary_spectra_bh.csv")
-        elif self.spectrum_kind == "secondary":
-            fname = resource_filename(__name__, "pbh_data/pbh_secondary_spectra.csv")
-        else:
-            raise ValueError("invalid spectrum_kind")
-
-        def parse_float(s):
-            try:
-                return float(s)
-            except ValueError:
-                sig, exponent = s.split("e")
-                return float(sig) * 10 ** float(exponent)
-
-        def parse_line(line: str):
-            # Skip first value (it's the row index)
-            return list(map(float, line.split(",")[1:]))
-
-        with open(fname, "r") as f:
-            # Header has the format: ,photon_energies,1e15.0,1e15.05,1e15.1,...
-            # We don't need the first to entries after split on ',', then we
-            # need to parser the weird floats.
-            masses = np.array(list(map(parse_float, f.readline().split(",")[2:])))
-            # Read the remaining lines, which have format: i,e1,e2,e3,... where
-            # 'i' is the row index and the rest are the values we want.
-            data = np.array(list(map(parse_line, f.readlines())))
-
-        self._mxs = masses * g_to_MeV
-        # GeV -> MeV
-        self._e_gams = data[:, 0] * 1e3
-        # 1/GeV -> 1/MeV
-        self._d2n_dedt = data[:, 1:] * 1e-3  # type:ignore
+        self._spectra = pbh_spectra(self.spectrum_kind, self.bh_secondary)
+        self._mxs = self._spectra.masses
+        self._e_gams = self._spectra.photon_energies
 
     @property
     def bh_secondary(self):
@@ -105,13 +226,9 @@ class PBH(TheoryDec):
 
     @mx.setter
     def mx(self, mx):
+        # Masses between the tabulated ones are interpolated.
+        fn = self._spectra.spectrum(mx)
         self._mx = mx
-
-        idx = np.where(self._mxs == mx)[0][0]
-        fn = interp1d(
-            self._e_gams, self._d2n_dedt[:, idx], bounds_error=False, fill_value=0
-        )
-
         self._spectrum_funcs = lambda: {"all": fn}
 
     @staticmethod
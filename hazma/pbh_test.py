@@ -0,0 +1,58 @@
+"""Tests for the tabulated spectra of evaporating PBHs."""
+
+import numpy as np
+import pytest
+
+from hazma import pbh
+from hazma.parameters import g_to_MeV
+
+
+def read_columns(fname):
+    """Parse a table of spectra without going through the cache."""
+    return pbh._parse_spectra(pbh._PBH_DATA_DIR.joinpath(fname))
+
+
+def test_tabulated_masses():
+    data = read_columns("pbh_secondary_spectra.csv")
+    spectra = pbh.pbh_spectra("secondary")
+    e_gams = data[1:, 0] * 1e3
+
+    for idx in [0, 7, len(spectra.masses) - 1]:
+        mx = data[0, 1 + idx] * g_to_MeV
+        expected = data[1:, 1 + idx] * 1e-3
+        np.testing.assert_allclose(spectra.spectrum(mx)(e_gams), expected)
+        np.testing.assert_allclose(spectra(mx, e_gams), expected)
+
+
+def test_interpolated_masses():
+    spectra = pbh.pbh_spectra("primary")
+    e_gams = spectra.photon_energies[::5]
+    m1, m2 = spectra.masses[10:12]
+    mx = np.sqrt(m1 * m2)
+
+    lo = spectra(m1, e_gams)
+    hi = spectra(m2, e_gams)
+    mid = spectra(mx, e_gams)
+    assert np.all(mid >= np.minimum(lo, hi))
+    assert np.all(mid <= np.maximum(lo, hi))
+    np.testing.assert_allclose(mid, 0.5 * (lo + hi))
+
+    # Masses and energies broadcast against each other.
+    grid = spectra(np.array([m1, mx, m2])[:, None], e_gams)
+    np.testing.assert_allclose(grid, [lo, mid, hi])
+
+    with pytest.raises(ValueError):
+        spectra(0.5 * spectra.masses[0], e_gams)
+
+
+def test_shared_tables():
+    mxs = pbh.pbh_spectra("secondary").masses
+    pbh1 = pbh.PBH(mxs[3])
+    pbh2 = pbh.PBH(np.sqrt(mxs[3] * mxs[4]))
+    assert pbh1._spectra is pbh2._spectra
+
+    e_gams = np.geomspace(1.0, 1e3, 10)
+    np.testing.assert_allclose(
+        pbh2.total_spectrum(e_gams), pbh1._spectra(pbh2.mx, e_gams)
+    )
+    assert pbh1.total_spectrum(np.array([1e8]))[0] == 0.0
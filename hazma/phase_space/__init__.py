@@ -1,9 +1,15 @@
 from ._rambo import Rambo
 from ._three_body import ThreeBody
-from ._dist import PhaseSpaceDistribution1D
+from ._dalitz import DalitzGrid, dalitz_grid
+from ._vegas import Vegas
+from ._dist import PhaseSpaceDistribution1D, WeightedHistogram
 
 __all__ = [
     "ThreeBody",
+    "DalitzGrid",
+    "dalitz_grid",
     "Rambo",
+    "Vegas",
     "PhaseSpaceDistribution1D",
+    "WeightedHistogram",
 ]
@@ -0,0 +1,330 @@
+"""
+Gauss-Legendre grids over the Dalitz region of three-body final states.
+"""
+
+# pylint: disable=invalid-name
+
+import functools
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from hazma.utils import RealArray, kallen_lambda
+
+from ._dist import PhaseSpaceDistribution1D
+from ._utils import energy_limits, invariant_mass_limits
+
+DalitzMsqrd = Callable[[RealArray, RealArray], RealArray]
+
+# Orderings of the masses placing the particle whose energy is fixed first.
+_SWAPS = [(0, 1, 2), (1, 0, 2), (2, 1, 0)]
+
+
+def _bounds_x(mu1: float, mu2: float, mu3: float) -> Tuple[float, float]:
+    r"""Bounds on the scaled energy of particle 1: x = 2 E1 / q."""
+    return 2 * mu1, mu1**2 + (1 - (mu2 + mu3) ** 2)
+
+
+def _bounds_y(x, mu1: float, mu2: float, mu3: float):
+    r"""Bounds on the scaled energy of particle 2, y = 2 E2 / q, given the
+    scaled energy of particle 1."""
+    pfac = (2 - x) * (1 - x + mu1**2 + mu2**2 - mu3**2)
+    with np.errstate(invalid="ignore"):
+        sfac = np.sqrt(
+            kallen_lambda(1, mu1**2, 1 - x + mu1**2)
+            * kallen_lambda(1 - x + mu1**2, mu2**2, mu3**2)
+        )
+    lb = 0.5 * (pfac - sfac) / (1 - x + mu1**2)
+    ub = 0.5 * (pfac + sfac) / (1 - x + mu1**2)
+    return lb, ub
+
+
+class DalitzGrid:
+    r"""Gauss-Legendre nodes and weights covering the Dalitz region of a
+    three-body final state with fixed masses and center-of-mass energy.
+
+    The positions of the nodes in terms of the invariant masses
+    :math:`s=(p_2+p_3)^2` and :math:`t=(p_1+p_3)^2`, the Jacobians and the
+    kinematic bounds are computed once. Integrating a squared matrix element
+    then reduces to evaluating it on the nodes and contracting with the
+    weights, which is cheap when only the normalization or couplings of the
+    squared matrix element change. Use `dalitz_grid` to obtain a shared,
+    cached instance.
+
+    The total integral uses a tensor-product rule in the scaled energies
+    :math:`x=2E_1/q` and :math:`y=2E_2/q`, with
+    :math:`x = x_{\mathrm{min}} + (x_{\mathrm{max}}-x_{\mathrm{min}})(1 -
+    \cos\pi u)/2` to smooth the square-root behavior of the integrand at the
+    edges of the Dalitz region.
+    """
+
+    def __init__(self, cme: float, masses: Sequence[float], order: int = 64):
+        """
+        Parameters
+        ----------
+        cme: float
+            Center-of-mass energy.
+        masses: sequence float
+            The three final state particle masses.
+        order: int, optional
+            Number of Gauss-Legendre nodes in each dimension. Default is 64.
+        """
+        assert (
+            len(masses) == 3
+        ), f"Expected 'masses' to have length 3, found {len(masses)}."
+        if cme < sum(masses):
+            raise ValueError(
+                "Center of mass energy is less than the sum of"
+                " final-state particle masses."
+            )
+
+        self.__cme = float(cme)
+        self.__masses = (float(masses[0]), float(masses[1]), float(masses[2]))
+        self.__order = int(order)
+        self.__nodes, self.__gl_weights = np.polynomial.legendre.leggauss(order)
+        self.__s, self.__t, self.__weights = self.__integration_nodes()
+        self.__partial_nodes: Dict[Tuple[str, int], Tuple] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"DalitzGrid(cme={self.__cme}, masses={self.__masses}, "
+            f"order={self.__order})"
+        )
+
+    @property
+    def cme(self) -> float:
+        r"""Center-of-mass energy."""
+        return self.__cme
+
+    @property
+    def masses(self) -> Tuple[float, float, float]:
+        r"""Masses of the final state particles."""
+        return self.__masses
+
+    @property
+    def order(self) -> int:
+        r"""Number of Gauss-Legendre nodes in each dimension."""
+        return self.__order
+
+    @property
+    def s(self) -> RealArray:
+        r"""Values of s = (p2 + p3)^2 at the nodes of the integration rule."""
+        return self.__s
+
+    @property
+    def t(self) -> RealArray:
+        r"""Values of t = (p1 + p3)^2 at the nodes of the integration rule."""
+        return self.__t
+
+    @property
+    def weights(self) -> RealArray:
+        r"""Weights of the integration rule, including the Jacobian and the
+        phase-space prefactor."""
+        return self.__weights
+
+    def __to_mandelstam(self, x1, x2):
+        q = self.__cme
+        m1, m2, _ = self.__masses
+        s = q**2 * (1.0 - x1 + (m1 / q) ** 2)
+        t = q**2 * (1.0 - x2 + (m2 / q) ** 2)
+        return s, t
+
+    def __integration_nodes(self):
+        q = self.__cme
+        mu1, mu2, mu3 = [m / q for m in self.__masses]
+        nodes, gl_weights = self.__nodes, self.__gl_weights
+
+        xmin, xmax = _bounds_x(mu1, mu2, mu3)
+        u = 0.5 * (nodes + 1.0)
+        x = xmin + 0.5 * (xmax - xmin) * (1.0 - np.cos(np.pi * u))
+        jac = 0.25 * np.pi * (xmax - xmin) * np.sin(np.pi * u)
+
+        lb, ub = _bounds_y(x, mu1, mu2, mu3)
+        half = 0.5 * (ub - lb)
+        y = lb[:, np.newaxis] + half[:, np.newaxis] * (nodes + 1.0)
+
+        pre = q**2 / (128.0 * np.pi**3)
+        weights = pre * np.outer(gl_weights * jac * half, gl_weights)
+        weights = np.nan_to_num(weights)
+
+        s, t = self.__to_mandelstam(x[:, np.newaxis], np.nan_to_num(y))
+        s = np.broadcast_to(s, y.shape)
+        return s.ravel(), t.ravel(), weights.ravel()
+
+    def _partial_nodes(self, energies: RealArray, i: int):
+        r"""Compute the nodes and weights used to integrate the squared matrix
+        element over the energy of a second particle at fixed energies of
+        particle `i`.
+
+        Returns
+        -------
+        s, t: array
+            Invariant masses at the nodes with shape (len(energies), order).
+        weights: array
+            Weights with the same shape as `s` such that the sum over the last
+            axis of the weights times the squared matrix element is
+            :math:`d\Phi/dE_i`. Energies outside of the kinematic bounds have
+            zero weights.
+        """
+        assert 0 <= i <= 2, f"Invalid argument i = {i}. Must be 0,1 or 2."
+        q = self.__cme
+        masses = [self.__masses[k] for k in _SWAPS[i]]
+        mu1, mu2, mu3 = [m / q for m in masses]
+        nodes, gl_weights = self.__nodes, self.__gl_weights
+
+        xmin, xmax = _bounds_x(mu1, mu2, mu3)
+        xs = 2.0 * np.atleast_1d(energies).astype(np.float64) / q
+        inside = (xmin <= xs) & (xs <= xmax)
+        x = np.where(inside, xs, 0.5 * (xmin + xmax))[:, np.newaxis]
+
+        lb, ub = _bounds_y(x, mu1, mu2, mu3)
+        half = 0.5 * (ub - lb)
+        y = lb + half * (nodes + 1.0)
+
+        # Map the integration variables back to the scaled energies of
+        # particles 1 and 2.
+        if i == 0:
+            x1, x2 = x, y
+        elif i == 1:
+            x1, x2 = y, x
+        else:
+            x1, x2 = 2.0 - (x + y), y
+
+        x1, x2 = np.broadcast_arrays(x1, x2)
+        s, t = self.__to_mandelstam(x1, x2)
+
+        pre = q / (64.0 * np.pi**3)
+        weights = pre * half * gl_weights
+        weights = np.where(inside[:, np.newaxis], np.nan_to_num(weights), 0.0)
+        return s, t, weights
+
+    def __cached_partial_nodes(self, kind: str, nbins: int):
+        key = (kind, nbins)
+        if key not in self.__partial_nodes:
+            q = self.__cme
+            masses = self.__masses
+            requests = []
+            if kind == "energy":
+                for i, (emin, emax) in enumerate(energy_limits(q, masses)):
+                    bins = np.linspace(emin, emax, nbins)
+                    es = 0.5 * (bins[1:] + bins[:-1])
+                    requests.append((i, bins, es, np.ones_like(es)))
+            else:
+                for (j, k), (mmin, mmax) in invariant_mass_limits(q, masses).items():
+                    i = tuple({0, 1, 2}.symmetric_difference({j, k}))[0]
+                    bins = np.linspace(mmin, mmax, nbins)
+                    ms = 0.5 * (bins[1:] + bins[:-1])
+                    es = (q**2 - ms**2 + masses[i] ** 2) / (2 * q)
+                    # dE/dm = m / q
+                    requests.append(((j, k), bins, es, ms / q))
+
+            keys, bins, ss, ts, ws = [], [], [], [], []
+            for key_, bins_, es, jac in requests:
+                i = key_ if kind == "energy" else 3 - sum(key_)
+                s, t, w = self._partial_nodes(es, i)
+                keys.append(key_)
+                bins.append(bins_)
+                ss.append(s)
+                ts.append(t)
+                ws.append(w * jac[:, np.newaxis])
+
+            self.__partial_nodes[key] = (
+                keys,
+                bins,
+                np.concatenate(ss, axis=0),
+                np.concatenate(ts, axis=0),
+                np.concatenate(ws, axis=0),
+            )
+        return self.__partial_nodes[key]
+
+    def integrate(self, msqrd: DalitzMsqrd) -> RealArray:
+        r"""Integrate a squared matrix element over the Dalitz region.
+
+        Parameters
+        ----------
+        msqrd: callable
+            Function of arrays of s=(p2+p3)^2 and t=(p1+p3)^2. It is called
+            once with all the nodes. Its output may have extra leading
+            dimensions, for example one for each independent coupling
+            structure, which are kept in the result.
+
+        Returns
+        -------
+        integral: float or array
+            Integral of the squared matrix element over three-body phase
+            space.
+        """
+        fs = np.asarray(msqrd(self.__s, self.__t), dtype=np.float64)
+        fs = np.broadcast_to(fs, fs.shape[:-1] + self.__s.shape)
+        return np.nan_to_num(fs) @ self.__weights
+
+    def __distributions(self, msqrd: DalitzMsqrd, kind: str, nbins: int):
+        keys, bins, s, t, w = self.__cached_partial_nodes(kind, nbins)
+        fs = np.asarray(msqrd(s.ravel(), t.ravel()), dtype=np.float64)
+        fs = np.broadcast_to(fs, (s.size,)).reshape(s.shape)
+        dens = np.sum(np.nan_to_num(fs) * w, axis=-1).reshape(len(keys), nbins - 1)
+        return keys, [PhaseSpaceDistribution1D(b, d) for b, d in zip(bins, dens)]
+
+    def energy_distributions(
+        self, msqrd: DalitzMsqrd, nbins: int
+    ) -> List[PhaseSpaceDistribution1D]:
+        r"""Compute the energy distributions of the three final-state
+        particles.
+
+        Parameters
+        ----------
+        msqrd: callable
+            Function of arrays of s=(p2+p3)^2 and t=(p1+p3)^2. It is called
+            once with the nodes of all the bins.
+        nbins: int
+            Number of bin edges of the distributions, as in `ThreeBody`.
+
+        Returns
+        -------
+        dists: list[PhaseSpaceDistribution1D]
+            Energy distributions of the final-state particles.
+        """
+        return self.__distributions(msqrd, "energy", nbins)[1]
+
+    def invariant_mass_distributions(
+        self, msqrd: DalitzMsqrd, nbins: int
+    ) -> Dict[Tuple[int, int], PhaseSpaceDistribution1D]:
+        r"""Compute the invariant-mass distributions of the three pairs of
+        final-state particles.
+
+        Parameters
+        ----------
+        msqrd: callable
+            Function of arrays of s=(p2+p3)^2 and t=(p1+p3)^2. It is called
+            once with the nodes of all the bins.
+        nbins: int
+            Number of bin edges of the distributions, as in `ThreeBody`.
+
+        Returns
+        -------
+        dists: dict[(int,int), PhaseSpaceDistribution1D]
+            Invariant-mass distributions keyed by the pair of particles.
+        """
+        keys, dists = self.__distributions(msqrd, "invariant_mass", nbins)
+        return dict(zip(keys, dists))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_dalitz_grid(cme: float, masses: Tuple[float, ...], order: int):
+    return DalitzGrid(cme, masses, order)
+
+
+def dalitz_grid(cme: float, masses: Sequence[float], order: int = 64) -> DalitzGrid:
+    r"""Return a `DalitzGrid`, reusing previously constructed grids with the
+    same center-of-mass energy, masses and order.
+
+    Parameters
+    ----------
+    cme: float
+        Center-of-mass energy.
+    masses: sequence float
+        The three final state particle masses.
+    order: int, optional
+        Number of Gauss-Legendre nodes in each dimension. Default is 64.
+    """
+    return _cached_dalitz_grid(float(cme), tuple(float(m) for m in masses), int(order))
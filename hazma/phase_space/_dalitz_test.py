@@ -0,0 +1,63 @@
+"""Tests for the Dalitz grids."""
+
+# pylint: disable=invalid-name
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma import parameters
+from hazma.phase_space import DalitzGrid, ThreeBody, dalitz_grid
+
+MPI = parameters.charged_pion_mass
+MPI0 = parameters.neutral_pion_mass
+CME = 800.0
+MASSES = (MPI, MPI, MPI0)
+
+
+def msqrd(s, t):
+    """Squared matrix element with a peak in t."""
+    return 1.0 + (s / 1e5) ** 2 + np.exp(-(((t - 2e5) / 3e4) ** 2))
+
+
+def test_integrate():
+    """Test the integral over the grid against quad."""
+    grid = DalitzGrid(CME, MASSES)
+    expected = ThreeBody(CME, MASSES, msqrd=msqrd).integrate()[0]
+    assert grid.integrate(msqrd) == pytest.approx(expected, rel=1e-8)
+
+
+def test_integrate_structures():
+    """Test that independent structures are integrated in a single call."""
+    grid = dalitz_grid(CME, MASSES)
+
+    def structures(s, t):
+        return np.array([np.ones_like(s), s, msqrd(s, t)])
+
+    integrals = grid.integrate(structures)
+    assert integrals.shape == (3,)
+    assert integrals[0] == pytest.approx(grid.integrate(lambda s, t: 1.0 + 0 * s))
+    assert integrals[2] == pytest.approx(grid.integrate(msqrd))
+
+
+def test_cached_grid():
+    """Test that grids are reused for the same kinematics."""
+    assert dalitz_grid(CME, MASSES) is dalitz_grid(CME, list(MASSES))
+    assert dalitz_grid(CME, MASSES) is not dalitz_grid(CME, MASSES, order=32)
+
+
+def test_distributions():
+    """Test the distributions against quad."""
+    grid = dalitz_grid(CME, MASSES)
+    tb = ThreeBody(CME, MASSES, msqrd=msqrd)
+
+    for dg, dq in zip(
+        grid.energy_distributions(msqrd, 20), tb.energy_distributions(20)
+    ):
+        assert_allclose(dg.bins, dq.bins)
+        assert_allclose(dg.probabilities, dq.probabilities, rtol=1e-6)
+
+    mq = tb.invariant_mass_distributions(20)
+    for key, dg in grid.invariant_mass_distributions(msqrd, 20).items():
+        assert_allclose(dg.bins, mq[key].bins)
+        assert_allclose(dg.probabilities, mq[key].probabilities, rtol=1e-6)
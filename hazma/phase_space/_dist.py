@@ -5,11 +5,12 @@ Implementation of phase-space distribution objects.
 # pylint: disable=invalid-name
 
 import logging
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 from scipy import integrate
 
+from hazma._utils.accumulate import check_accumulate, store, trapezoid_weights
 from hazma.utils import RealArray
 
 from ._base import AbstractPhaseSpaceDistribution
@@ -42,7 +43,7 @@ def normalize_distribution(probabilities, edges):
 class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
     r"""Class for storing 1D probability distributions."""
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, errors=None):
         """
         Parameters
         ----------
@@ -50,6 +51,9 @@ class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
             Independent variables.
         y: array-like
             The values of the distribution.
+        errors: array-like, optional
+            Uncertainties on the values of the distribution. They are
+            normalized with the same factor as `y`.
         """
         shape_x = np.shape(x)
         shape_y = np.shape(y)
@@ -69,6 +73,13 @@ class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
         self._bin_centers = 0.5 * (x[1:] + x[:-1])
         self._probabilities = np.array(normalize_distribution(y, x))
 
+        if errors is None:
+            self._errors = None
+        else:
+            norm = np.sum(np.asarray(y) * np.diff(x))
+            errors = np.array(errors, dtype=np.float64)
+            self._errors = errors / norm if norm > 0.0 else errors
+
     def limits(self) -> Tuple[float, float]:
         r"""Return the limits on the independent variables."""
         return np.min(self._bins), np.max(self._bins)
@@ -91,18 +102,49 @@ class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
         """Return the probabilities at each bin.."""
         return self._probabilities
 
-    def _expect_fixed(self, fn, method) -> RealArray:
+    @property
+    def errors(self) -> Optional[RealArray]:
+        """Return the uncertainties on the probabilities at each bin, or None
+        if they are unknown."""
+        return self._errors
+
+    def _expect_fixed(
+        self,
+        fn,
+        method: str,
+        vectorized: bool = False,
+        *,
+        out: Optional[RealArray] = None,
+        weight: float = 1.0,
+        accumulate: bool = False,
+    ) -> RealArray:
         xs = self._bin_centers
         ps = self._probabilities
-        fs = np.array([fn(x) for x in xs])
+        check_accumulate(out, accumulate)
+
+        if method == "trapz":
+            # The trapezoid rule is a weighted sum of the values of the
+            # function, with the probabilities folded into the weights.
+            weights = weight * ps * trapezoid_weights(xs)
+            if vectorized:
+                fs = np.asarray(fn(xs))
+                expvals = np.tensordot(weights, fs, axes=(0, 0))[()]
+            else:
+                expvals = sum(w * np.asarray(fn(x)) for x, w in zip(xs, weights))
+            return store(expvals, out, accumulate=accumulate)
+
+        if vectorized:
+            fs = np.asarray(fn(xs))
+        else:
+            fs = np.array([fn(x) for x in xs])
 
         if len(fs.shape) > 1:
             integrands = np.expand_dims(ps, 1) * fs
         else:
             integrands = ps * fs
 
-        expvals = method(integrands, xs, axis=0)
-        return expvals
+        expvals = integrate.simps(integrands, xs, axis=0)
+        return store(expvals, out, weight, accumulate)
 
     def _expect_quad(self, fn) -> RealArray:
         def integrand(x):
@@ -113,7 +155,15 @@ class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
         return expvals
 
     def expect(
-        self, fn: Callable, method: str = "trapz", args: Tuple = tuple()
+        self,
+        fn: Callable,
+        method: str = "trapz",
+        args: Tuple = tuple(),
+        vectorized: bool = False,
+        *,
+        out: Optional[RealArray] = None,
+        weight: float = 1.0,
+        accumulate: bool = False,
     ) -> RealArray:
         r"""Compute the expectation value of function.
 
@@ -126,6 +176,18 @@ class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
             'quad'. Default is 'trapz'.
         args: tuple, optional
             Additional arguments to pass to function.
+        vectorized: bool, optional
+            If True, `fn` is called once with the array of bin centers and
+            must return an array whose leading axis runs over the bin
+            centers. Ignored for 'quad'. Default is False.
+        out: ndarray, optional
+            Array the expectation value is written into. It must have the
+            shape of the result. Default is None.
+        weight: float, optional
+            Factor multiplying the expectation value. Default is 1.
+        accumulate: bool, optional
+            If True, the weighted expectation value is added to `out` instead
+            of overwriting it. Default is False.
 
         Returns
         -------
@@ -133,10 +195,11 @@ class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
             Expectation value of the function.
         """
 
+        kwargs = {"out": out, "weight": weight, "accumulate": accumulate}
         methods = {
-            "trapz": lambda f: self._expect_fixed(f, np.trapz),
-            "simps": lambda f: self._expect_fixed(f, integrate.simps),
-            "quad": self._expect_quad,
+            "trapz": lambda f: self._expect_fixed(f, "trapz", vectorized, **kwargs),
+            "simps": lambda f: self._expect_fixed(f, "simps", vectorized, **kwargs),
+            "quad": lambda f: store(self._expect_quad(f), **kwargs),
         }
 
         meth = methods.get(method)
@@ -161,3 +224,90 @@ class PhaseSpaceDistribution1D(AbstractPhaseSpaceDistribution):
     def __call__(self, x):
         """Return the probability at the input value."""
         return np.interp(x, self._bin_centers, self._probabilities, 0.0, 0.0)
+
+
+class WeightedHistogram:
+    r"""Mergeable histogram of weighted events.
+
+    The sum of the weights and the sum of the squared weights are accumulated
+    in each bin. Histograms with the same bins filled from independent samples
+    can be merged by adding them, which is used to combine the histograms
+    filled by parallel workers.
+    """
+
+    def __init__(self, edges):
+        """
+        Parameters
+        ----------
+        edges: array-like
+            Edges of the bins. Must be increasing.
+        """
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.sum_w = np.zeros(len(self.edges) - 1, dtype=np.float64)
+        self.sum_w2 = np.zeros(len(self.edges) - 1, dtype=np.float64)
+
+        widths = np.diff(self.edges)
+        self._uniform = len(widths) > 0 and np.allclose(widths, widths[0])
+
+    def __len__(self) -> int:
+        return len(self.sum_w)
+
+    def __repr__(self) -> str:
+        return (
+            f"WeightedHistogram(edges=[{self.edges[0]}, {self.edges[-1]}], "
+            f"nbins={len(self)})"
+        )
+
+    def bin_indices(self, values) -> np.ndarray:
+        """Return the bin index of each value, or -1 if it is outside of the
+        bins. As with `np.histogram`, the last bin includes its right edge."""
+        values = np.asarray(values)
+        nbins = len(self)
+        lo, hi = self.edges[0], self.edges[-1]
+        if self._uniform:
+            with np.errstate(invalid="ignore"):
+                scaled = (values - lo) * (nbins / (hi - lo))
+            idx = np.floor(np.nan_to_num(scaled, nan=-1.0)).astype(np.intp)
+        else:
+            idx = np.searchsorted(self.edges, values, side="right") - 1
+        idx[values == hi] = nbins - 1
+        idx[(idx < 0) | (idx >= nbins) | (values < lo) | (values > hi)] = -1
+        return idx
+
+    def fill_indices(self, indices, weights):
+        """Add the weights to the bins given by `indices`, as returned by
+        `bin_indices`. Events with non-finite weights are skipped."""
+        weights = np.asarray(weights, dtype=np.float64)
+        mask = (indices >= 0) & np.isfinite(weights)
+        idx = indices[mask]
+        ws = weights[mask]
+        self.sum_w += np.bincount(idx, weights=ws, minlength=len(self))
+        self.sum_w2 += np.bincount(idx, weights=ws**2, minlength=len(self))
+        return self
+
+    def fill(self, values, weights):
+        """Add weighted events to the histogram."""
+        return self.fill_indices(self.bin_indices(values), weights)
+
+    def merge(self, other: "WeightedHistogram"):
+        """Add the contents of a histogram with the same bins."""
+        if len(other.edges) != len(self.edges) or not np.allclose(
+            other.edges, self.edges
+        ):
+            raise ValueError("Cannot merge histograms with different bins.")
+        self.sum_w += other.sum_w
+        self.sum_w2 += other.sum_w2
+        return self
+
+    def __iadd__(self, other: "WeightedHistogram"):
+        return self.merge(other)
+
+    def __add__(self, other: "WeightedHistogram"):
+        result = WeightedHistogram(self.edges)
+        return result.merge(self).merge(other)
+
+    def distribution(self) -> PhaseSpaceDistribution1D:
+        """Return the normalized distribution with its statistical errors."""
+        return PhaseSpaceDistribution1D(
+            self.edges, self.sum_w, errors=np.sqrt(self.sum_w2)
+        )
@@ -11,6 +11,8 @@
 
 
 import math
+import multiprocessing as mp
+import warnings
 from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
@@ -20,12 +22,15 @@ from scipy import integrate
 from hazma.utils import RealArray, cross_section_prefactor, kallen_lambda, lnorm_sqr
 
 from ._base import AbstractPhaseSpaceGenerator, AbstractPhaseSpaceIntegrator
-from ._dist import PhaseSpaceDistribution1D
+from ._dist import PhaseSpaceDistribution1D, WeightedHistogram
 from ._utils import energy_limits, invariant_mass_limits
 
 MassList = Union[List[float], RealArray]
 SquaredMatrixElement = Callable[[RealArray], float]
 
+# Default number of points generated at once by each worker process.
+_PARALLEL_BATCH_SIZE = 1 << 16
+
 
 def __flat_squared_matrix_element(_: RealArray) -> float:
     return 1.0
@@ -41,6 +46,9 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
         cme: float,
         masses: Union[np.ndarray, Sequence[float]],
         msqrd: Optional[SquaredMatrixElement] = None,
+        *,
+        qmc: Optional[str] = None,
+        replicas: int = 8,
     ) -> None:
         """
         Parameters
@@ -51,7 +59,21 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
             Array of the final state particle masses.
         msqrd: Callable[[ndarray], float], optional
             Squared matrix element of the process.
-        """
+        qmc: str, optional
+            If 'sobol' or 'halton', phase space points are generated from
+            scrambled low-discrepancy sequences instead of pseudo-random
+            numbers (randomized quasi-Monte-Carlo). Errors then decrease
+            faster than 1/sqrt(n). Default is None.
+        replicas: int, optional
+            Number of independently scrambled sequences the points are split
+            into when `qmc` is used. Error estimates are computed from the
+            spread of the estimates of each replica. Default is 8.
+        """
+        if qmc not in (None, "sobol", "halton"):
+            raise ValueError(f"Invalid qmc {qmc}. Use 'sobol', 'halton' or None.")
+        if qmc is not None and replicas < 2:
+            raise ValueError("At least 2 replicas are needed to estimate errors.")
+
         ms = np.array(masses)
         n = len(ms)
 
@@ -64,6 +86,8 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
         self.__base_wgt = self._compute_base_weight()
 
         self.__rng = np.random.default_rng()
+        self.__qmc = qmc
+        self.__replicas = replicas
 
         self.__eps = 2 ** (-52)
 
@@ -92,6 +116,14 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
         self.__masses = np.array(masses).reshape((self.__n, 1))
         self.__base_wgt = self._compute_base_weight()
 
+    @property
+    def qmc(self) -> Optional[str]:
+        """
+        Type of low-discrepancy sequence used to generate points, or None if
+        pseudo-random numbers are used.
+        """
+        return self.__qmc
+
     @property
     def msqrd(self) -> Optional[SquaredMatrixElement]:
         """
@@ -137,10 +169,11 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
         """
         n = self.__n
 
-        rho1 = self.__rng.random(size=(n, batch_size), dtype=dtype)
-        rho2 = self.__rng.random(size=(n, batch_size), dtype=dtype)
-        rho3 = self.__rng.random(size=(n, batch_size), dtype=dtype)
-        rho4 = self.__rng.random(size=(n, batch_size), dtype=dtype)
+        if self.__qmc is None:
+            rhos = self.__rng.random(size=(4, n, batch_size), dtype=dtype)
+        else:
+            rhos = self._low_discrepancy_numbers(batch_size).astype(dtype)
+        rho1, rho2, rho3, rho4 = rhos
 
         ctheta = 2 * rho1 - 1.0
         stheta = np.sqrt(1.0 - ctheta**2)
@@ -151,6 +184,55 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
             [e, e * stheta * np.cos(phi), e * stheta * np.sin(phi), e * ctheta]
         )
 
+    def _low_discrepancy_numbers(self, batch_size: int) -> np.ndarray:
+        """
+        Draw points from `replicas` independently scrambled low-discrepancy
+        sequences. The points of each replica are contiguous.
+
+        Returns
+        -------
+        rhos: ndarray
+            Numbers in [0, 1) with shape (4, # final state particles,
+            batch_size).
+        """
+        # Importing scipy.stats is slow, so it is only done when needed.
+        from scipy.stats import qmc as scipy_qmc
+
+        ndim = 4 * self.__n
+        engine = scipy_qmc.Sobol if self.__qmc == "sobol" else scipy_qmc.Halton
+
+        sizes = [
+            len(idx) for idx in np.array_split(np.arange(batch_size), self.__replicas)
+        ]
+        samples = []
+        for size in sizes:
+            sampler = engine(d=ndim, scramble=True, seed=self.__rng)
+            with warnings.catch_warnings():
+                # Sobol sequences are only balanced for powers of 2.
+                warnings.simplefilter("ignore", UserWarning)
+                samples.append(sampler.random(size))
+
+        rhos = np.concatenate(samples, axis=0).T
+        return rhos.reshape((4, self.__n, batch_size))
+
+    def _estimate(self, weights: np.ndarray) -> Tuple[float, float]:
+        """
+        Estimate the integral and its error from the weights of a sample.
+        """
+        if self.__qmc is None:
+            integral = np.nanmean(weights, dtype=float)
+            error = np.nanstd(weights, dtype=float, ddof=1) / np.sqrt(len(weights))
+            return integral, error
+
+        means = [
+            np.nanmean(ws, dtype=float)
+            for ws in np.array_split(weights, self.__replicas)
+            if len(ws) > 0
+        ]
+        integral = np.mean(means, dtype=float)
+        error = np.std(means, dtype=float, ddof=1) / np.sqrt(len(means))
+        return integral, error
+
     def _boost(self, ps: np.ndarray) -> np.ndarray:
         """
         Boost momenta into the center-of-mass frame. Input should be the
@@ -448,8 +530,7 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
             integrals = []
             errors = []
             for _, ws in self.generator(n, batch_size, seed, dtype):
-                avg = np.nanmean(ws, dtype=np.float64)
-                std = np.nanstd(ws, dtype=np.float64, ddof=1) / np.sqrt(batch_size)
+                avg, std = self._estimate(ws)
                 integrals.append(avg)
                 errors.append(std)
 
@@ -461,10 +542,7 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
             return integral, error
 
         _, weights = self.generate(n, seed=seed, dtype=dtype)
-        integral = np.nanmean(weights, dtype=float)
-        error = np.nanstd(weights, dtype=float, ddof=1) / np.sqrt(n)
-
-        return integral, error
+        return self._estimate(weights)
 
     def decay_width(
         self,
@@ -540,6 +618,195 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
 
         return cross_section, error
 
+    def _energy_observables(self, nbins: int):
+        """
+        Return the keys, bin edges and functions of the momenta of the energy
+        distributions.
+        """
+        ebounds = energy_limits(self.cme, self.masses)  # type: ignore
+        return [
+            (i, np.linspace(emin, emax, nbins + 1), _EnergyObservable(i))
+            for i, (emin, emax) in enumerate(ebounds)
+        ]
+
+    def _invariant_mass_observables(self, nbins: int):
+        """
+        Return the keys, bin edges and functions of the momenta of the
+        invariant mass distributions.
+        """
+        bounds = invariant_mass_limits(self.cme, self.masses)  # type: ignore
+        return [
+            (pair, np.linspace(mmin, mmax, nbins + 1), _InvariantMassObservable(pair))
+            for pair, (mmin, mmax) in bounds.items()
+        ]
+
+    def _fill_histograms(
+        self, observables, n: int, batch_size: Optional[int], seed, dtype
+    ) -> List[WeightedHistogram]:
+        """
+        Generate phase space points and fill a histogram for each observable.
+
+        All the histograms are filled in a single pass: the bin indices of
+        every observable are offset into one flat array of bins, which is
+        filled with one `bincount` for the weights and one for the squared
+        weights.
+        """
+        hists = [WeightedHistogram(edges) for _, edges, _ in observables]
+        offsets = np.cumsum([0] + [len(hist) for hist in hists])
+        sum_w = np.zeros(offsets[-1], dtype=np.float64)
+        sum_w2 = np.zeros(offsets[-1], dtype=np.float64)
+
+        if batch_size is not None and not batch_size == n:
+            batches = self.generator(n, batch_size, seed, dtype)
+        else:
+            batches = [self.generate(n, seed=seed, dtype=dtype)]
+
+        for ps, ws in batches:
+            ws = np.asarray(ws, dtype=np.float64)
+            finite = np.isfinite(ws)
+
+            idxs = []
+            for hist, offset, (_, _, fn) in zip(hists, offsets, observables):
+                idx = hist.bin_indices(fn(ps))
+                idxs.append(np.where((idx >= 0) & finite, idx + offset, -1))
+            idx = np.concatenate(idxs)
+            mask = idx >= 0
+
+            wtile = np.tile(ws, len(hists))[mask]
+            sum_w += np.bincount(idx[mask], weights=wtile, minlength=len(sum_w))
+            sum_w2 += np.bincount(idx[mask], weights=wtile**2, minlength=len(sum_w))
+
+        for hist, lo, hi in zip(hists, offsets[:-1], offsets[1:]):
+            hist.sum_w = sum_w[lo:hi]
+            hist.sum_w2 = sum_w2[lo:hi]
+
+        return hists
+
+    def _histograms(
+        self,
+        observables,
+        n: int,
+        batch_size: Optional[int],
+        seed: Optional[int],
+        dtype,
+        num_cpus: int,
+    ) -> List[WeightedHistogram]:
+        """
+        Fill the histograms of the observables, splitting the events between
+        `num_cpus` worker processes.
+        """
+        if num_cpus == 1:
+            return self._fill_histograms(observables, n, batch_size, seed, dtype)
+
+        if num_cpus > mp.cpu_count():
+            warnings.warn(
+                f"You only have {mp.cpu_count()} cpus. "
+                f"Using {mp.cpu_count()} cpus instead."
+            )
+            num_cpus = mp.cpu_count()
+
+        # Each worker gets an independent random stream spawned from the seed.
+        seeds = np.random.SeedSequence(seed).spawn(num_cpus)
+        sizes = [len(idx) for idx in np.array_split(np.arange(n), num_cpus)]
+        if batch_size is None:
+            batch_size = min(max(sizes), _PARALLEL_BATCH_SIZE)
+
+        tasks = [
+            (self, observables, size, min(batch_size, size), sd, dtype)
+            for size, sd in zip(sizes, seeds)
+            if size > 0
+        ]
+        with mp.Pool(min(num_cpus, len(tasks))) as pool:
+            results = pool.map(_histogram_worker, tasks)
+
+        hists = results[0]
+        for result in results[1:]:
+            for hist, other in zip(hists, result):
+                hist.merge(other)
+
+        return hists
+
+    def distributions(
+        self,
+        n: int,
+        nbins: int,
+        observables: Optional[Dict[str, Tuple[Callable, Tuple[float, float]]]] = None,
+        *,
+        energies: bool = True,
+        invariant_masses: bool = True,
+        batch_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        dtype=np.float64,
+        num_cpus: int = 1,
+    ) -> Tuple[
+        List[PhaseSpaceDistribution1D],
+        Dict[Tuple[int, int], PhaseSpaceDistribution1D],
+        Dict[str, PhaseSpaceDistribution1D],
+    ]:
+        """
+        Generate the energy distributions, the invariant mass distributions
+        and the distributions of custom observables from a single set of
+        phase space points.
+
+        Parameters
+        ----------
+        n: int
+            Number of phase space points used in generating the distributions.
+        nbins: int
+            Number of bins to use for the distributions.
+        observables: dict, optional
+            Additional observables. The keys are names and the values are
+            pairs `(fn, (xmin, xmax))`, where `fn` computes the observable from
+            momenta with shape (4, # final state particles, # points) and
+            `(xmin, xmax)` are the limits of its distribution.
+        energies: bool, optional
+            If False, the energy distributions are not computed. Default is
+            True.
+        invariant_masses: bool, optional
+            If False, the invariant mass distributions are not computed.
+            Default is True.
+        batch_size: int, optional
+            If not None, the points will be generated in batches of
+            `batch_size` points. Default is None.
+        seed: int, optional
+            Seed used for numpy random number generator.
+        dtype: DTypeLike, optional
+            Type used for generation of momenta and weights.
+        num_cpus: int, optional
+            Number of worker processes used to generate the points. See
+            `energy_distributions`. Default is 1.
+
+        Returns
+        -------
+        energy_distributions: List[PhaseSpaceDistribution1D]
+            The energy distributions (see `energy_distributions`). Empty if
+            `energies` is False.
+        invariant_mass_distributions: Dict[Tuple[int,int], PhaseSpaceDistribution1D]
+            The invariant mass distributions (see
+            `invariant_mass_distributions`). Empty if `invariant_masses` is
+            False.
+        observable_distributions: Dict[str, PhaseSpaceDistribution1D]
+            The distributions of the additional observables.
+        """
+        eobs = self._energy_observables(nbins) if energies else []
+        mobs = self._invariant_mass_observables(nbins) if invariant_masses else []
+        cobs = [
+            (name, np.linspace(xmin, xmax, nbins + 1), fn)
+            for name, (fn, (xmin, xmax)) in (observables or {}).items()
+        ]
+
+        hists = self._histograms(
+            eobs + mobs + cobs, n, batch_size, seed, dtype, num_cpus
+        )
+        dists = [hist.distribution() for hist in hists]
+
+        ne, nm = len(eobs), len(mobs)
+        return (
+            dists[:ne],
+            {key: d for (key, _, _), d in zip(mobs, dists[ne : ne + nm])},
+            {key: d for (key, _, _), d in zip(cobs, dists[ne + nm :])},
+        )
+
     def energy_distributions(
         self,
         n: int,
@@ -547,6 +814,7 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
         batch_size: Optional[int] = None,
         seed: Optional[int] = None,
         dtype=np.float64,
+        num_cpus: int = 1,
     ) -> List[PhaseSpaceDistribution1D]:
         """
         Generate energy distributions of the final state particles.
@@ -564,36 +832,28 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
             Seed used for numpy random number generator.
         dtype: DTypeLike, optional
             Type used for generation of momenta and weights.
+        num_cpus: int, optional
+            Number of worker processes used to generate the points. Each
+            worker uses an independent random stream spawned from `seed` and
+            processes its points in batches. The squared matrix element must
+            be picklable. Default is 1.
 
         Returns
         -------
         distributions: List[PhaseSpaceDistribution1D]
             List of the energy distributions. The order is the same as the
-            masses used to instantiate the class.
-        """
-        nfsp = len(self.masses)
-
-        ebounds = energy_limits(self.cme, self.masses)  # type: ignore
-        bins = [np.linspace(emin, emax, nbins + 1) for emin, emax in ebounds]
-
-        distributions = [
-            np.histogram(np.zeros(nbins, dtype=np.float64), bins=b)[0] for b in bins
-        ]
-
-        if batch_size is not None and not batch_size == n:
-            # Build up the distributions from batches
-            for ps, ws in self.generator(n, batch_size, seed, dtype):
-                for i in range(len(self.masses)):
-                    d = np.histogram(ps[0, i], bins=bins[i], weights=ws)[0]
-                    distributions[i] += d
-        else:
-            ps, ws = self.generate(n, seed=seed, dtype=dtype)
-            for i in range(len(self.masses)):
-                distributions[i] = np.histogram(ps[0, i], bins=bins[i], weights=ws)[0]
-
-        dists = [
-            PhaseSpaceDistribution1D(bins[i], distributions[i]) for i in range(nfsp)
-        ]
+            masses used to instantiate the class. The distributions include
+            the statistical errors of each bin.
+        """
+        dists, _, _ = self.distributions(
+            n,
+            nbins,
+            invariant_masses=False,
+            batch_size=batch_size,
+            seed=seed,
+            dtype=dtype,
+            num_cpus=num_cpus,
+        )
         return dists
 
     def invariant_mass_distributions(
@@ -603,6 +863,7 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
         batch_size: Optional[int] = None,
         seed: Optional[int] = None,
         dtype=np.float64,
+        num_cpus: int = 1,
     ) -> Dict[Tuple[int, int], PhaseSpaceDistribution1D]:
         """
         Generate invariant mass distributions of the final state particles.
@@ -623,48 +884,50 @@ class Rambo(AbstractPhaseSpaceIntegrator, AbstractPhaseSpaceGenerator):
             Seed used for numpy random number generator.
         dtype: DTypeLike, optional
             Type used for generation of momenta and weights.
+        num_cpus: int, optional
+            Number of worker processes used to generate the points. See
+            `energy_distributions`. Default is 1.
 
         Returns
         -------
         distributions: Dict[Tuple[int,int], PhaseSpaceDistribution1D]
             The invariant mass distributions. The keys are pairs of integers
-            specifying the pair of particles.
-        """
-        masses = self.masses
-        nfsp = len(masses)
-        bounds = invariant_mass_limits(self.cme, masses)  # type: ignore
-        pairs = bounds.keys()
+            specifying the pair of particles. The distributions include the
+            statistical errors of each bin.
+        """
+        _, dists, _ = self.distributions(
+            n,
+            nbins,
+            energies=False,
+            batch_size=batch_size,
+            seed=seed,
+            dtype=dtype,
+            num_cpus=num_cpus,
+        )
+        return dists
 
-        def make_bins(pair):
-            mmin, mmax = bounds[pair]
-            return np.linspace(mmin, mmax, nbins + 1)
 
-        def inv_mass(ps, pair):
-            i, j = pair
-            return np.sqrt(np.abs(lnorm_sqr(ps[:, i] + ps[:, j])))
+class _EnergyObservable:
+    """Energy of a final state particle."""
 
-        bins = [make_bins(pair) for pair in pairs]
+    def __init__(self, i: int):
+        self.i = i
 
-        distributions = [
-            np.histogram(np.zeros(nbins, dtype=np.float64), bins=b)[0] for b in bins
-        ]
+    def __call__(self, ps: np.ndarray) -> np.ndarray:
+        return ps[0, self.i]
 
-        if batch_size is not None and not batch_size == n:
-            # Build up the distributions from batches
-            for ps, ws in self.generator(n, batch_size, seed, dtype):
-                for i, pair in enumerate(pairs):
-                    d = np.histogram(inv_mass(ps, pair), bins=bins[i], weights=ws)[0]
-                    distributions[i] += d
-        else:
-            ps, ws = self.generate(n, seed=seed, dtype=dtype)
-            for i, pair in enumerate(pairs):
-                distributions[i] = np.histogram(
-                    inv_mass(ps, pair), bins=bins[i], weights=ws
-                )[0]
-
-        dists = {
-            key: PhaseSpaceDistribution1D(bins[i], distributions[i])
-            for i in range(nfsp)
-            for i, key in enumerate(pairs)
-        }
-        return dists
+
+class _InvariantMassObservable:
+    """Invariant mass of a pair of final state particles."""
+
+    def __init__(self, pair: Tuple[int, int]):
+        self.pair = pair
+
+    def __call__(self, ps: np.ndarray) -> np.ndarray:
+        i, j = self.pair
+        return np.sqrt(np.abs(lnorm_sqr(ps[:, i] + ps[:, j])))
+
+
+def _histogram_worker(args) -> List[WeightedHistogram]:
+    rambo, observables, n, batch_size, seed, dtype = args
+    return rambo._fill_histograms(observables, n, batch_size, seed, dtype)
@@ -3,13 +3,14 @@
 # pylint: disable=invalid-name
 
 import unittest
+import warnings
 
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
 from hazma import parameters
-from hazma.phase_space import Rambo
+from hazma.phase_space import Rambo, WeightedHistogram
 from hazma.utils import ldot, lnorm_sqr
 
 MW = parameters.wboson_mass
@@ -177,3 +178,88 @@ def test_width_z_to_f_f(mf, ncf, t3f, qf):
     width = phase_space.decay_width(10_000, seed=SEED)[0]
 
     assert width == pytest.approx(analytic)
+
+
+@pytest.mark.parametrize("qmc", ["sobol", "halton"])
+def test_qmc_integrate(qmc):
+    """Test that quasi-Monte-Carlo integration is reproducible and matches
+    the pseudo-random estimate."""
+    masses = [ME, MMU, 2 * MMU]
+
+    def msqrd(momenta):
+        return ldot(momenta[:, 0], momenta[:, 1]) / MMU**2
+
+    phase_space = Rambo(1e3, masses, msqrd=msqrd, qmc=qmc)
+    integral, error = phase_space.integrate(1 << 14, seed=SEED)
+    integral_repeat, _ = phase_space.integrate(1 << 14, seed=SEED)
+    reference, ref_error = Rambo(1e3, masses, msqrd=msqrd).integrate(1 << 16, seed=SEED)
+
+    assert integral == integral_repeat
+    assert error < ref_error * 4
+    assert integral == pytest.approx(reference, abs=5 * (error + ref_error))
+
+
+def test_invalid_qmc():
+    """Test that invalid quasi-Monte-Carlo options are rejected."""
+    with pytest.raises(ValueError):
+        Rambo(1.0, [0.0, 0.0, 0.0], qmc="lattice")
+    with pytest.raises(ValueError):
+        Rambo(1.0, [0.0, 0.0, 0.0], qmc="sobol", replicas=1)
+
+
+def test_weighted_histogram_merge():
+    """Test that merging histograms is equivalent to filling a single one."""
+    rng = np.random.default_rng(SEED)
+    values = rng.random(1000)
+    weights = rng.random(1000)
+    edges = np.linspace(0.0, 1.0, 11)
+
+    full = WeightedHistogram(edges).fill(values, weights)
+    merged = WeightedHistogram(edges).fill(values[:300], weights[:300])
+    merged += WeightedHistogram(edges).fill(values[300:], weights[300:])
+
+    assert_allclose(merged.sum_w, full.sum_w)
+    assert_allclose(merged.sum_w2, full.sum_w2)
+    assert_allclose(full.sum_w, np.histogram(values, edges, weights=weights)[0])
+
+
+def test_parallel_energy_distributions():
+    """Test that distributions generated by several workers agree with the
+    serial ones within their errors."""
+    masses = [1.0, 2.0, 3.0, 4.0]
+    phase_space = Rambo(cme=20.0, masses=masses)
+
+    with warnings.catch_warnings():
+        # Machines with a single cpu warn about the number of workers.
+        warnings.simplefilter("ignore", UserWarning)
+        parallel = phase_space.energy_distributions(1 << 15, 10, seed=SEED, num_cpus=2)
+    serial = phase_space.energy_distributions(1 << 15, 10, seed=SEED)
+
+    for dp, ds in zip(parallel, serial):
+        err = np.hypot(dp.errors, ds.errors)
+        assert np.all(np.abs(dp.probabilities - ds.probabilities) < 5 * err + 1e-12)
+
+
+def test_fused_distributions():
+    """Test that the fused distributions match the separately generated ones
+    and that custom observables are histogrammed."""
+    masses = [1.0, 2.0, 3.0, 4.0]
+    cme = 20.0
+    phase_space = Rambo(cme=cme, masses=masses)
+
+    def energy_sum(momenta):
+        return momenta[0, 0] + momenta[0, 1]
+
+    edists, mdists, odists = phase_space.distributions(
+        1 << 12, 10, {"e01": (energy_sum, (3.0, cme))}, seed=SEED
+    )
+    edists_ref = phase_space.energy_distributions(1 << 12, 10, seed=SEED)
+    mdists_ref = phase_space.invariant_mass_distributions(1 << 12, 10, seed=SEED)
+
+    for d, dref in zip(edists, edists_ref):
+        assert_allclose(d.probabilities, dref.probabilities)
+    for key, dref in mdists_ref.items():
+        assert_allclose(mdists[key].probabilities, dref.probabilities)
+
+    assert_allclose(odists["e01"].bins, np.linspace(3.0, cme, 11))
+    assert np.all(np.isfinite(odists["e01"].errors))
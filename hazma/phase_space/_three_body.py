@@ -10,6 +10,7 @@ from scipy import integrate
 
 from hazma.utils import RealArray, kallen_lambda, lnorm_sqr
 
+from ._dalitz import dalitz_grid
 from ._rambo import Rambo
 from ._utils import energy_limits, invariant_mass_limits
 from ._dist import PhaseSpaceDistribution1D
@@ -35,9 +36,9 @@ def _msqrd_flat(s, t):
         return 1.0
 
     if scalar_s:
-        return np.zeros_like(t)
+        return np.ones_like(t)
 
-    return np.zeros_like(s)
+    return np.ones_like(s)
 
 
 def _mandelstam_to_momenta(s, t, q: float, masses: Tuple[float, float, float]):
@@ -424,6 +425,26 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
             return res[0]
         return res
 
+    def _integrate_gauss(self, order: int) -> Tuple[float, float]:
+        r"""Compute the integral of the squared matrix element over three-body
+        phase space using Gauss-Legendre quadrature on a `DalitzGrid`. The
+        error is estimated from a rule with half as many nodes.
+
+        Returns
+        -------
+        integral: float
+            Integral of the squared matrix element.
+        error: float
+            Error estimate of the integral.
+        """
+        q = self.__cme
+        masses = self.__masses
+        integral = float(dalitz_grid(q, masses, order).integrate(self.__msqrd))
+        coarse = float(
+            dalitz_grid(q, masses, max(order // 2, 1)).integrate(self.__msqrd)
+        )
+        return integral, abs(integral - coarse)
+
     def _integrate_quad(
         self, *, epsabs: Optional[float] = None, epsrel: Optional[float] = None
     ) -> Tuple[float, float]:
@@ -497,6 +518,7 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         npts: int = 10000,
         epsrel: Optional[float] = None,
         epsabs: Optional[float] = None,
+        order: int = 64,
     ) -> Tuple[float, float]:
         r"""Compute the integral of the squared matrix element over the squared
         invariant mass of particles 2 and 3.
@@ -506,6 +528,9 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         method: str, optional
             Method used to integrate over phase space. Can be:
                 * 'quad': Numerical quadrature using scipy's 'dblquad',
+                * 'gauss': Gauss-Legendre quadrature. The squared matrix
+                  element is evaluated on all the nodes with a single call
+                  and must therefore accept arrays,
                 * 'rambo': Monte-Carlo integration.
             Default is 'quad'.
         npts: int, optional
@@ -517,6 +542,9 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         epsabs: float, optional
             Absolute error tolerance. If None, then the `scipy` default is used.
             Default is None.
+        order: int, optional
+            Number of Gauss-Legendre nodes in each dimension. Ignored unless
+            method is 'gauss'. Default is 64.
 
         Returns
         -------
@@ -530,6 +558,7 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
 
         methods = {
             "quad": lambda: self._integrate_quad(epsabs=epsabs, epsrel=epsrel),
+            "gauss": lambda: self._integrate_gauss(order=order),
             "rambo": lambda: self._integrate_rambo(n=npts),
         }
 
@@ -569,6 +598,11 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
 
         return dists
 
+    def _energy_distributions_gauss(self, nbins: int, order: int):
+        """Compute energy distributions using Gauss-Legendre quadrature."""
+        grid = dalitz_grid(self.__cme, self.__masses, order)
+        return grid.energy_distributions(self.__msqrd, nbins)
+
     def _energy_distributions_rambo(self, nbins: int, npts: int = 10000):
         """Compute energy distributions using Monte-Carlo integration."""
         phase_space = Rambo(
@@ -585,6 +619,7 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         npts: int = 10000,
         epsabs: Optional[float] = None,
         epsrel: Optional[float] = None,
+        order: int = 32,
     ) -> List[PhaseSpaceDistribution1D]:
         r"""Compute the energy distributions of the three final-state particles.
 
@@ -593,6 +628,9 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         method: str
             Method used to integrate over phase space. Can be:
                 * 'quad': Numerical quadrature using scipy's 'quad',
+                * 'gauss': Gauss-Legendre quadrature. The squared matrix
+                  element of all bins is evaluated with a single call and
+                  must therefore accept arrays,
                 * 'rambo': Monte-Carlo integration.
         npts: int
             Number of phase-space points to use to integrate squared matrix
@@ -603,6 +641,9 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         epsabs: float, optional
             Absolute error tolerance. If None, then the `scipy` default is used.
             Default is None.
+        order: int, optional
+            Number of Gauss-Legendre nodes used for each bin. Ignored unless
+            method is 'gauss'. Default is 32.
 
         Returns
         -------
@@ -613,6 +654,7 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
             "quad": lambda: self._energy_distributions_quad(
                 nbins=nbins, epsrel=epsrel, epsabs=epsabs
             ),
+            "gauss": lambda: self._energy_distributions_gauss(nbins, order),
             "rambo": lambda: self._energy_distributions_rambo(nbins=nbins, npts=npts),
         }
 
@@ -654,6 +696,14 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
 
         return dists
 
+    def _invariant_mass_distributions_gauss(
+        self, nbins: int, order: int
+    ) -> InvariantMassDists:
+        """Compute invariant-mass distributions using Gauss-Legendre
+        quadrature."""
+        grid = dalitz_grid(self.__cme, self.__masses, order)
+        return grid.invariant_mass_distributions(self.__msqrd, nbins)
+
     def _invariant_mass_distributions_rambo(
         self, nbins: int, npts: int = 10000
     ) -> InvariantMassDists:
@@ -672,6 +722,7 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         npts: int = 10000,
         epsabs: Optional[float] = None,
         epsrel: Optional[float] = None,
+        order: int = 32,
     ) -> InvariantMassDists:
         r"""Compute the invariant-mass distributions of the three pairs of
         final-state particles.
@@ -682,6 +733,9 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
             Method used to integrate over phase space. Can be:
 
                 * 'quad': Numerical quadrature using scipy's 'quad',
+                * 'gauss': Gauss-Legendre quadrature. The squared matrix
+                  element of all bins is evaluated with a single call and
+                  must therefore accept arrays,
                 * 'trapz': Trapiziod rule using scipy's 'trapz',
                 * 'simps': Simpson's rule using scipy's 'simps',
                 * 'rambo': Monte-Carlo integration.
@@ -694,6 +748,9 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
         epsabs: float, optional
             Absolute error tolerance. If None, then the `scipy` default is used.
             Default is None.
+        order: int, optional
+            Number of Gauss-Legendre nodes used for each bin. Ignored unless
+            method is 'gauss'. Default is 32.
 
         Returns
         -------
@@ -713,6 +770,7 @@ class ThreeBody(AbstractPhaseSpaceIntegrator):
             "quad": lambda: self._invariant_mass_distributions_quad(
                 nbins=nbins, epsabs=epsabs, epsrel=epsrel
             ),
+            "gauss": lambda: self._invariant_mass_distributions_gauss(nbins, order),
             "rambo": lambda: self._invariant_mass_distributions_rambo(
                 nbins=nbins, npts=npts
             ),
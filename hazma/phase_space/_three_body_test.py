@@ -0,0 +1,58 @@
+"""Tests for the three-body phase space integrator."""
+
+# pylint: disable=invalid-name
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma import parameters
+from hazma.phase_space import ThreeBody
+
+MPI = parameters.charged_pion_mass
+MPI0 = parameters.neutral_pion_mass
+MMU = parameters.muon_mass
+ME = parameters.electron_mass
+GF = parameters.GF
+
+
+def msqrd_muon(s, t):
+    """Squared matrix element for muon decay with a massless electron."""
+    return 16.0 * GF**2 * t * (MMU**2 - t)
+
+
+def msqrd_peaked(s, t):
+    """Squared matrix element with a peak in t."""
+    return 1.0 + (s / 1e5) ** 2 + np.exp(-(((t - 2e5) / 3e4) ** 2))
+
+
+def test_integrate_gauss_muon():
+    """Test the Gauss-Legendre integral against the muon decay width."""
+    tb = ThreeBody(MMU, [ME, 0.0, 0.0], msqrd=msqrd_muon)
+    integral, error = tb.integrate(method="gauss")
+    expected, _ = tb.integrate(method="quad", epsabs=0.0, epsrel=1e-12)
+
+    assert integral == pytest.approx(expected, rel=1e-10)
+    assert error < 1e-8 * integral
+
+
+@pytest.mark.parametrize("kind", ["energy", "invariant_mass"])
+def test_distributions_gauss(kind):
+    """Test that the Gauss-Legendre distributions agree with quad."""
+    tb = ThreeBody(800.0, [MPI, MPI, MPI0], msqrd=msqrd_peaked)
+
+    if kind == "energy":
+        gauss = tb.energy_distributions(20, method="gauss")
+        quad = tb.energy_distributions(20, method="quad")
+    else:
+        gauss = list(tb.invariant_mass_distributions(20, method="gauss").values())
+        quad = list(tb.invariant_mass_distributions(20, method="quad").values())
+
+    for dg, dq in zip(gauss, quad):
+        assert_allclose(dg.probabilities, dq.probabilities, rtol=1e-6)
+
+
+def test_gauss_flat_msqrd():
+    """Test that a flat squared matrix element is handled with arrays."""
+    tb = ThreeBody(800.0, [MPI, MPI, MPI0])
+    assert tb.integrate(method="gauss")[0] == pytest.approx(tb.integrate()[0])
@@ -0,0 +1,378 @@
+"""Module for integrating over phase space using VEGAS adaptive importance
+sampling."""
+
+# pylint: disable=invalid-name,too-many-arguments,too-many-locals
+
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from hazma.utils import kallen_lambda
+
+from ._rambo import Rambo, SquaredMatrixElement
+
+
+def _boost_from_rest_frame(ps: np.ndarray, parent: np.ndarray) -> np.ndarray:
+    """
+    Boost four-momenta from the rest frame of `parent` into the frame where
+    the parent has four-momentum `parent`. Both arrays have shape (4, n).
+    """
+    mass = np.sqrt(np.maximum(parent[0] ** 2 - np.sum(parent[1:] ** 2, axis=0), 0.0))
+    beta = parent[1:] / parent[0]
+    gamma = parent[0] / mass
+    bdotp = np.sum(beta * ps[1:], axis=0)
+
+    e = gamma * (ps[0] + bdotp)
+    p = ps[1:] + beta * (gamma**2 / (gamma + 1.0) * bdotp + gamma * ps[0])
+    return np.concatenate((e[np.newaxis], p), axis=0)
+
+
+def _smooth_importance(d: np.ndarray) -> np.ndarray:
+    """
+    Smooth and compress the importance of the bins of a VEGAS grid as
+    described in G. P. Lepage, J. Comput. Phys. 27 (1978) 192.
+    """
+    ds = np.empty_like(d)
+    ds[0] = (7.0 * d[0] + d[1]) / 8.0
+    ds[-1] = (d[-2] + 7.0 * d[-1]) / 8.0
+    ds[1:-1] = (d[:-2] + 6.0 * d[1:-1] + d[2:]) / 8.0
+
+    total = np.sum(ds)
+    if not (total > 0.0 and np.isfinite(total)):
+        return np.ones_like(d)
+    ds = ds / total
+
+    res = np.ones_like(ds)
+    mask = ds < 1.0
+    res[mask] = (1.0 - ds[mask]) / np.log(1.0 / ds[mask])
+    return res
+
+
+class Vegas(Rambo):
+    """
+    Phase space generator and integrator using VEGAS adaptive importance
+    sampling.
+
+    Phase space points are built from a chain of two-body decays: the
+    process decays into the first particle and a subsystem made of the
+    others, which decays into the second particle and a subsystem, and so on.
+    A point is thus parametrized by the invariant masses of the subsystems
+    and the decay angles, i.e. by ``3n-4`` numbers in the unit hypercube.
+    These are drawn from a separable, piecewise-constant density which is
+    adapted iteratively so that more points are placed where the weights,
+    including the squared matrix element, are large. Resonances in the
+    invariant mass of the last particles are thus mapped to a single
+    dimension and sampled efficiently.
+
+    `Vegas` has the same interface as `Rambo` and can be used in its place.
+    The grid is adapted the first time points are generated and reused
+    afterwards, until the center-of-mass energy or the masses change.
+    """
+
+    def __init__(
+        self,
+        cme: float,
+        masses: Union[np.ndarray, Sequence[float]],
+        msqrd: Optional[SquaredMatrixElement] = None,
+        *,
+        grid_bins: int = 64,
+        alpha: float = 1.5,
+        n_adapt: int = 1 << 12,
+        iterations: int = 6,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        cme: float
+            Center-of-mass energy of the process.
+        masses: array-like
+            Array of the final state particle masses.
+        msqrd: Callable[[ndarray], float], optional
+            Squared matrix element of the process.
+        grid_bins: int, optional
+            Number of bins of the grid along each dimension. Default is 64.
+        alpha: float, optional
+            Damping parameter of the grid refinement. Smaller values adapt
+            the grid more slowly. Default is 1.5.
+        n_adapt: int, optional
+            Number of points used in each iteration of the grid adaptation.
+            Default is 2^12.
+        iterations: int, optional
+            Number of iterations used to adapt the grid. Default is 6.
+        """
+        self._grid_bins = grid_bins
+        self._alpha = alpha
+        self._n_adapt = n_adapt
+        self._iterations = iterations
+        super().__init__(cme, masses, msqrd)
+        self.reset()
+
+    @property
+    def cme(self) -> float:
+        """
+        Center-of-mass energy of the process.
+        """
+        return Rambo.cme.fget(self)  # type: ignore
+
+    @cme.setter
+    def cme(self, val) -> None:
+        Rambo.cme.fset(self, val)  # type: ignore
+        self.reset()
+
+    @property
+    def masses(self) -> np.ndarray:
+        """
+        Masses of the final state particles.
+        """
+        return Rambo.masses.fget(self)  # type: ignore
+
+    @masses.setter
+    def masses(self, masses) -> None:
+        Rambo.masses.fset(self, masses)  # type: ignore
+        self.reset()
+
+    @property
+    def grid(self) -> np.ndarray:
+        """
+        Edges of the grid bins along each dimension of the hypercube. The
+        shape is (3 * # final state particles - 4, grid_bins + 1).
+        """
+        return self._edges
+
+    @property
+    def adapted(self) -> bool:
+        """
+        True if the grid has been adapted.
+        """
+        return self._adapted
+
+    def reset(self) -> None:
+        """
+        Reset the grid to the uniform distribution.
+        """
+        ndim = 3 * len(np.atleast_1d(self.masses)) - 4
+        edges = np.linspace(0.0, 1.0, self._grid_bins + 1)
+        self._edges = np.tile(edges, (ndim, 1))
+        self._adapted = False
+
+    def _phase_space_points(self, us: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Map points of the unit hypercube to four-momenta and weights. The
+        weights include the squared matrix element.
+
+        Parameters
+        ----------
+        us: ndarray
+            Points of the hypercube with shape (3 * # final state particles - 4,
+            batch_size).
+
+        Returns
+        -------
+        momenta: ndarray
+            Four-momenta with shape (4, # final state particles, batch_size).
+        weights: ndarray
+            Weights of the phase space points with shape (batch_size,).
+        """
+        ms = np.atleast_1d(self.masses)
+        nfsp = len(ms)
+        npts = us.shape[-1]
+        # Lightest possible invariant mass of the subsystem of particles k,...
+        thresholds = np.cumsum(ms[::-1])[::-1]
+
+        momenta = np.zeros((4, nfsp, npts), dtype=np.float64)
+        weights = np.ones(npts, dtype=np.float64)
+        parent = np.zeros((4, npts), dtype=np.float64)
+        parent[0] = self.cme
+        mparent = np.full(npts, self.cme, dtype=np.float64)
+
+        iu = 0
+        for k in range(nfsp - 1):
+            if k < nfsp - 2:
+                mmin = thresholds[k + 1]
+                mmax = mparent - ms[k]
+                msub = mmin + us[iu] * (mmax - mmin)
+                weights *= (mmax - mmin) * msub / np.pi
+                iu += 1
+            else:
+                msub = np.full(npts, ms[-1], dtype=np.float64)
+
+            lam = kallen_lambda(mparent**2, ms[k] ** 2, msub**2)
+            p = np.sqrt(np.maximum(lam, 0.0)) / (2.0 * mparent)
+            weights *= p / (4.0 * np.pi * mparent)
+
+            ctheta = 2.0 * us[iu] - 1.0
+            stheta = np.sqrt(1.0 - ctheta**2)
+            phi = 2.0 * np.pi * us[iu + 1]
+            iu += 2
+
+            pvec = p * np.array([stheta * np.cos(phi), stheta * np.sin(phi), ctheta])
+            pk = np.concatenate((np.hypot(ms[k], p)[np.newaxis], pvec), axis=0)
+            psub = np.concatenate((np.hypot(msub, p)[np.newaxis], -pvec), axis=0)
+
+            momenta[:, k] = _boost_from_rest_frame(pk, parent)
+            parent = _boost_from_rest_frame(psub, parent)
+            mparent = msub
+
+        momenta[:, -1] = parent
+
+        if self.msqrd is not None:
+            weights *= self.msqrd(momenta)
+        return momenta, weights
+
+    def _sample(self, n: int, rng: np.random.Generator):
+        """
+        Draw points in the hypercube from the grid density.
+
+        Returns
+        -------
+        us: ndarray
+            Points with shape (ndim, n).
+        jac: ndarray
+            Inverse of the density at each point. Shape is (n,).
+        idxs: ndarray
+            Bin of each point along each dimension. Shape is (ndim, n).
+        """
+        ndim, nedges = self._edges.shape
+        nbins = nedges - 1
+
+        ys = rng.random(size=(ndim, n)) * nbins
+        idxs = np.minimum(ys.astype(np.int64), nbins - 1)
+
+        lo = np.take_along_axis(self._edges, idxs, axis=1)
+        widths = np.take_along_axis(np.diff(self._edges, axis=1), idxs, axis=1)
+        us = lo + (ys - idxs) * widths
+        jac = np.prod(nbins * widths, axis=0)
+
+        return us, jac, idxs
+
+    def _refine(self, idxs: np.ndarray, fs: np.ndarray) -> None:
+        """
+        Refine the grid given the bins and integrands of a sample.
+        """
+        ndim, nedges = self._edges.shape
+        nbins = nedges - 1
+        f2 = np.nan_to_num(fs**2, nan=0.0, posinf=0.0)
+        targets = np.linspace(0.0, 1.0, nedges)
+
+        for i in range(ndim):
+            d = np.bincount(idxs[i], weights=f2, minlength=nbins)
+            r = _smooth_importance(d) ** self._alpha
+            cum = np.concatenate(([0.0], np.cumsum(r)))
+            self._edges[i] = np.interp(targets, cum / cum[-1], self._edges[i])
+
+    def _adapt(self, n: int, iterations: int, rng: np.random.Generator) -> None:
+        for _ in range(iterations):
+            us, jac, idxs = self._sample(n, rng)
+            _, ws = self._phase_space_points(us)
+            self._refine(idxs, ws * jac)
+        self._adapted = True
+
+    def adapt(
+        self,
+        n: Optional[int] = None,
+        iterations: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> "Vegas":
+        """
+        Adapt the grid to the squared matrix element.
+
+        Parameters
+        ----------
+        n: int, optional
+            Number of points used in each iteration. Default is the value
+            given at construction.
+        iterations: int, optional
+            Number of iterations. Default is the value given at construction.
+        seed: int, optional
+            Seed used for numpy random number generator.
+
+        Returns
+        -------
+        self: Vegas
+            The integrator, with the adapted grid.
+        """
+        n = self._n_adapt if n is None else n
+        iterations = self._iterations if iterations is None else iterations
+        self._adapt(n, iterations, np.random.default_rng(seed))
+        return self
+
+    def _generate(self, n: int, rng: np.random.Generator, dtype):
+        if not self._adapted:
+            self._adapt(self._n_adapt, self._iterations, rng)
+        us, jac, _ = self._sample(n, rng)
+        ps, ws = self._phase_space_points(us)
+        return ps.astype(dtype, copy=False), (ws * jac).astype(dtype, copy=False)
+
+    def generator(
+        self, n, batch_size: int, seed: Optional[int] = None, dtype=np.float64
+    ) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Create a generator the yields four-momenta and weights distributed
+        according to Lorentz-invariant phase space. The weights include the
+        squared matrix element and the Jacobian of the importance sampling.
+
+        Parameters
+        ----------
+        n: int
+            Number of phase space points to generate.
+        batch_size: int
+            Number of phase space points to generate each step.
+        seed: int, optional
+            Seed used for numpy random number generator.
+        dtype: DTypeLike, optional
+            Type used for generation of momenta and weights.
+
+        Yields
+        -------
+        momenta: ndarray
+            Batch of momenta with shape (4, # final state particles,
+            batch_size).
+        weights: ndarray
+            Batch of weights of the phase space points. Shape is (batch_size,).
+        """
+        rng = np.random.default_rng(seed)
+
+        niters = n // batch_size
+        niters += 0 if batch_size * niters == n else 1
+
+        for _ in range(niters):
+            yield self._generate(batch_size, rng, dtype)
+
+    def generate(
+        self, n: int, seed: Optional[int] = None, dtype=np.float64
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate four-momenta and weights distributed according to
+        Lorentz-invariant phase space. The weights include the squared matrix
+        element and the Jacobian of the importance sampling.
+
+        Parameters
+        ----------
+        n: int
+            Number of phase space points to generate.
+        seed: int, optional
+            Seed used for numpy random number generator.
+        dtype: DTypeLike, optional
+            Type used for generation of momenta and weights.
+
+        Returns
+        -------
+        momenta: ndarray
+            Array containing the four momenta with shape
+            (4, # final state particles, n).
+        weights: ndarray
+            Array containing weights of the phase space points. Shape is
+            (n,).
+
+        Examples
+        --------
+        Integrating a narrow resonance in the invariant mass of the last two
+        particles:
+
+        >>> def msqrd(momenta):
+        ...     s = lnorm_sqr(momenta[:, 1] + momenta[:, 2])
+        ...     return 1.0 / ((s - 0.5**2) ** 2 + (0.5 * 1e-3) ** 2)
+        >>> phase_space = Vegas(cme=1.0, masses=[0.1, 0.1, 0.1], msqrd=msqrd)
+        >>> momenta, weights = phase_space.generate(n=10_000, seed=1234)
+        """
+        return self._generate(n, np.random.default_rng(seed), dtype)
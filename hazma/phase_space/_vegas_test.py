@@ -0,0 +1,65 @@
+"""Tests for the VEGAS phase space integrator."""
+
+# pylint: disable=invalid-name
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma.phase_space import Rambo, ThreeBody, Vegas
+from hazma.utils import lnorm_sqr
+
+SEED = 1234
+
+
+@pytest.mark.parametrize("masses", [[1.0, 2.0], [1.0, 2.0, 3.0], [1.0, 2.0, 3.0, 0.5]])
+def test_momenta(masses):
+    """Test the momentum conservation and the masses of the generated points."""
+    cme = 2.0 * sum(masses)
+    momenta, _ = Vegas(cme, masses).generate(100, seed=SEED)
+
+    assert_allclose(np.sum(momenta, axis=1)[0], cme)
+    assert_allclose(np.sum(momenta, axis=1)[1:], 0.0, atol=1e-12)
+    for i, m in enumerate(masses):
+        assert_allclose(lnorm_sqr(momenta[:, i]), m**2, rtol=1e-8, atol=1e-10)
+
+
+@pytest.mark.parametrize("masses", [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0, 0.5]])
+def test_flat_phase_space(masses):
+    """Test that the phase space volume agrees with Rambo."""
+    cme = 2.0 * sum(masses)
+    expected, err1 = Rambo(cme, masses).integrate(1 << 16, seed=SEED)
+    integral, err2 = Vegas(cme, masses).integrate(1 << 14, seed=SEED)
+
+    assert err2 < err1
+    assert integral == pytest.approx(expected, abs=5 * np.hypot(err1, err2))
+
+
+def test_narrow_resonance():
+    """Test the integral of a narrow resonance against quadrature."""
+    masses = [0.1, 0.1, 0.1]
+    mres, wres = 0.5, 5e-3
+
+    def msqrd_st(s, _):
+        return 1.0 / ((s - mres**2) ** 2 + (mres * wres) ** 2)
+
+    def msqrd(momenta):
+        s = lnorm_sqr(momenta[:, 1] + momenta[:, 2])
+        return msqrd_st(s, None)
+
+    expected = ThreeBody(1.0, masses, msqrd=msqrd_st).integrate()[0]
+    integral, error = Vegas(1.0, masses, msqrd=msqrd).integrate(1 << 14, seed=SEED)
+    _, error_rambo = Rambo(1.0, masses, msqrd=msqrd).integrate(1 << 14, seed=SEED)
+
+    assert integral == pytest.approx(expected, abs=5 * error)
+    assert error < error_rambo / 10
+
+
+def test_grid_reset():
+    """Test that the grid is reset when the kinematics change."""
+    vegas = Vegas(10.0, [1.0, 2.0, 3.0]).adapt(n=1000, iterations=2, seed=SEED)
+    assert vegas.adapted
+
+    vegas.cme = 12.0
+    assert not vegas.adapted
+    assert_allclose(vegas.grid, np.tile(np.linspace(0.0, 1.0, 65), (5, 1)))
@@ -1,3 +1,4 @@
 from ._rd import relic_density
+from ._thermal_functions import ThermalCrossSectionTable
 
-__all__ = ["relic_density"]
+__all__ = ["relic_density", "ThermalCrossSectionTable"]
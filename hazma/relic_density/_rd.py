@@ -5,7 +5,7 @@ import numpy as np
 
 from hazma.parameters import rho_crit, sm_entropy_density_today
 
-from ._thermal_functions import yeq
+from ._thermal_functions import yeq, ThermalCrossSectionTable
 from ._diffeq import solve_boltzmann
 from ._approx import compute_xstar, compute_alpha
 
@@ -19,6 +19,7 @@ def relic_density(
     method: str = "Radau",
     rtol: float = 1e-5,
     atol: float = 1e-3,
+    tabulate: bool = False,
 ) -> float:
     """
     Solves the Boltzmann equation and returns the relic density
@@ -64,6 +65,10 @@ def relic_density(
         Absolute tolerance used to solve the Boltzmann equation.
         Default is `1e-6`.
         Ignored if 'semi_analytic' is True.
+    tabulate: bool, optional
+        If `True`, the thermally averaged cross section is tabulated once
+        (see `ThermalCrossSectionTable`) and the solver evaluates a spline
+        instead of performing an integral at each step. Default is `False`.
 
     Returns
     -------
@@ -71,6 +76,9 @@ def relic_density(
         Dark matter relic density.
 
     """
+    if tabulate and not isinstance(model, ThermalCrossSectionTable):
+        model = ThermalCrossSectionTable.from_model(model)
+
     if semi_analytic:
         # TODO: track down where these warnings are stemming from.
         with warnings.catch_warnings():
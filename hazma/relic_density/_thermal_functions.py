@@ -1,16 +1,17 @@
 import os
-from typing import overload
+from typing import Callable, Optional, Sequence, overload
 
 import numpy as np
-from scipy.special import kn, k1
-from scipy.integrate import quad
+from scipy.special import kn, k1, k1e, kve
+from scipy.integrate import quad, trapezoid
 from scipy.interpolate import UnivariateSpline
 
+from hazma._utils.tables import load_table
 from hazma.utils import RealArray, RealOrRealArray
 
 _this_dir, _ = os.path.split(__file__)
 _fname_sm_data = os.path.join(_this_dir, "smdof.dat")
-_sm_data = np.genfromtxt(_fname_sm_data, delimiter=",", skip_header=1).T
+_sm_data = load_table(_fname_sm_data, genfromtxt=True, delimiter=",", skip_header=1).T
 _sm_tempetatures = _sm_data[0] * 1e3  # convert to MeV
 _sm_sqrt_gstars = _sm_data[1]
 _sm_heff = _sm_data[2]
@@ -438,6 +439,32 @@ def thermal_cross_section_integrand(z: float, x: float, model) -> float:
     return sig * kernal
 
 
+def _thermal_cross_section_quad(x: float, mx: float, cross_section: Callable) -> float:
+    """
+    Compute the thermally average cross section from the annihilation cross
+    section `cross_section(cme)` using adaptive quadrature.
+    """
+    # If x is really large, we will get divide by zero errors
+    if x > 300:
+        return 0.0
+
+    pf = x / (2.0 * kn(2, x)) ** 2
+
+    def integrand(z):
+        return cross_section(mx * z) * z**2 * (z**2 - 4.0) * k1(x * z)
+
+    # Commented out code does not seem to work. It give about a two
+    # orders-of-magnitude larger value that `quad`. I've tried `simps`,
+    # `trapz`, `romb` and `lagguass` (after factoring out e^(-x)). All of them
+    # seem to fail?
+    # ss = np.linspace(2.0, 150, 500)
+    # return simps(integrand(ss), ss) * numpf / den
+
+    # The Bessel function suppresses the integrand by e^(-x (z - 2)) relative
+    # to threshold, so it is negligible past z = 2 + 50 / x.
+    return pf * quad(integrand, 2.0, 2.0 + 50.0 / x, points=[2.0])[0]
+
+
 def thermal_cross_section(x: float, model) -> float:
     """
     Compute the thermally average cross section for the dark
@@ -460,26 +487,201 @@ def thermal_cross_section(x: float, model) -> float:
     if hasattr(model, "thermal_cross_section"):
         return model.thermal_cross_section(x)
 
-    # If x is really large, we will get divide by zero errors
-    if x > 300:
-        return 0.0
+    def cross_section(cme):
+        return model.annihilation_cross_sections(cme)["total"]
 
-    pf = x / (2.0 * kn(2, x)) ** 2
+    return _thermal_cross_section_quad(x, model.mx, cross_section)
 
-    # Commented out code does not seem to work. It give about a two
-    # orders-of-magnitude larger value that `quad`. I've tried `simps`,
-    # `trapz`, `romb` and `lagguass` (after factoring out e^(-x)). All of them
-    # seem to fail?
-    # ss = np.linspace(2.0, 150, 500)
-    # return simps(integrand(ss), ss) * numpf / den
 
-    return (
-        pf
-        * quad(
-            thermal_cross_section_integrand,
-            2.0,
-            50.0 / x,
-            args=(x, model),
-            points=[2.0],
-        )[0]
-    )
+class ThermalCrossSectionTable:
+    r"""
+    Tabulated thermally averaged annihilation cross section.
+
+    The annihilation cross section is sampled once on an adaptive grid in the
+    center-of-mass energy and the thermal average is computed for all `x`
+    values of the table at once. Evaluating the thermal cross section then
+    only requires evaluating a spline.
+
+    Instances have `mx` and `thermal_cross_section` attributes, so they can
+    be passed to `relic_density` in place of the model.
+
+    Parameters
+    ----------
+    mx: float
+        Mass of the dark matter.
+    cross_section: callable, optional
+        Function returning the total annihilation cross section given the
+        center-of-mass energy.
+    vectorized: bool, optional
+        If True, `cross_section` is called with arrays of center-of-mass
+        energies. Default is False.
+    thermal_cross_section: callable, optional
+        Function returning the thermally averaged cross section given `x`.
+        If given, it is tabulated directly instead of `cross_section`.
+    x_min, x_max: float, optional
+        Range of `x = mx / T` covered by the table. Below `x_min`, the thermal
+        cross section is computed directly. Above `x_max`, it is taken to be
+        zero. Defaults are 1e-2 and 300.
+    n_x: int, optional
+        Number of `x` values in the table. Default is 256.
+    n_z: int, optional
+        Initial number of points at which the cross section is sampled.
+        Default is 1024.
+    points: sequence of float, optional
+        Values of `z = cme / mx` at which the cross section has features
+        (resonances, thresholds) that should be included in the grid.
+    rtol: float, optional
+        Relative tolerance used to refine the grid of the cross section.
+        Default is 1e-3.
+    max_refinements: int, optional
+        Maximum number of refinements of the grid. Default is 10.
+    """
+
+    def __init__(
+        self,
+        mx: float,
+        cross_section: Optional[Callable] = None,
+        thermal_cross_section: Optional[Callable] = None,
+        vectorized: bool = False,
+        x_min: float = 1e-2,
+        x_max: float = 300.0,
+        n_x: int = 256,
+        n_z: int = 1024,
+        points: Optional[Sequence[float]] = None,
+        rtol: float = 1e-3,
+        max_refinements: int = 10,
+    ):
+        if cross_section is None and thermal_cross_section is None:
+            raise ValueError(
+                "Either `cross_section` or `thermal_cross_section` is required."
+            )
+
+        self.mx = mx
+        self.x_min = x_min
+        self.x_max = x_max
+        self._cross_section = cross_section
+        self._vectorized = vectorized
+        self._thermal_cross_section = thermal_cross_section
+
+        self.xs = np.geomspace(x_min, x_max, n_x)
+        if thermal_cross_section is not None:
+            self.tcs = np.array([thermal_cross_section(x) for x in self.xs])
+        else:
+            zs, sigmas = self._sample_cross_section(n_z, points, rtol, max_refinements)
+            self.tcs = self._thermal_average(zs, sigmas)
+
+        # The thermal cross section spans many orders of magnitude, so we
+        # interpolate its logarithm when possible.
+        self._log_tcs = bool(np.all(self.tcs > 0.0))
+        ys = np.log(self.tcs) if self._log_tcs else self.tcs
+        self._spline = UnivariateSpline(np.log(self.xs), ys, s=0, ext=3)
+
+    @classmethod
+    def from_model(cls, model, **kwargs) -> "ThermalCrossSectionTable":
+        """
+        Create a table for the given model. If the model implements
+        `thermal_cross_section`, it is tabulated directly. Otherwise, the
+        total cross section from `annihilation_cross_sections_array` (or
+        `annihilation_cross_sections`) is used. Keyword arguments are passed
+        to the constructor.
+        """
+        if hasattr(model, "thermal_cross_section"):
+            return cls(
+                model.mx, thermal_cross_section=model.thermal_cross_section, **kwargs
+            )
+
+        if hasattr(model, "annihilation_cross_sections_array"):
+
+            def cross_section_array(cmes):
+                return model.annihilation_cross_sections_array(cmes)["total"]
+
+            return cls(
+                model.mx, cross_section=cross_section_array, vectorized=True, **kwargs
+            )
+
+        def cross_section(cme):
+            return model.annihilation_cross_sections(cme)["total"]
+
+        return cls(model.mx, cross_section=cross_section, **kwargs)
+
+    def _sample_cross_section(self, n_z, points, rtol, max_refinements):
+        """
+        Sample the cross section on a grid in `u = z - 2`, logarithmic in `u`
+        and refined where linear interpolation in `log(u)` is inaccurate.
+        """
+
+        def sigma(us):
+            if self._vectorized:
+                return np.asarray(self._cross_section(self.mx * (2.0 + us)))
+            return np.array([self._cross_section(self.mx * (2.0 + u)) for u in us])
+
+        # At x_max the kernel extends to u ~ 1 / x_max. At x_min it extends to
+        # u ~ 50 / x_min.
+        us = np.geomspace(1e-8, 2.0 + 50.0 / self.x_min, n_z)
+        if points is not None:
+            extra = np.array([z - 2.0 for z in points if z > 2.0])
+            us = np.unique(np.concatenate([us, extra]))
+        sigmas = sigma(us)
+
+        active = np.ones(len(us) - 1, dtype=bool)
+        for _ in range(max_refinements):
+            idxs = np.flatnonzero(active)
+            if len(idxs) == 0:
+                break
+            us_mid = np.sqrt(us[idxs] * us[idxs + 1])
+            sigmas_mid = sigma(us_mid)
+            sigmas_interp = 0.5 * (sigmas[idxs] + sigmas[idxs + 1])
+            atol = rtol * 1e-6 * np.max(np.abs(sigmas))
+            bad = np.abs(sigmas_mid - sigmas_interp) > rtol * np.abs(sigmas_mid) + atol
+
+            # Keep all the new samples but only refine further around the
+            # inaccurate ones.
+            new = np.zeros(len(us) + len(us_mid), dtype=bool)
+            new[len(us) :] = bad
+            us = np.concatenate([us, us_mid])
+            sigmas = np.concatenate([sigmas, sigmas_mid])
+            order = np.argsort(us)
+            us, sigmas, new = us[order], sigmas[order], new[order]
+            active = new[:-1] | new[1:]
+
+        return 2.0 + us, sigmas
+
+    def _thermal_average(self, zs, sigmas):
+        """Compute the thermal averages for all the `x` values of the table."""
+        xs = self.xs[:, np.newaxis]
+        us = zs - 2.0
+        # Use the exponentially scaled Bessel functions to avoid underflows:
+        # K1(xz) / K2(x)^2 = k1e(xz) e^(-x(z-2)) / kve(2, x)^2
+        kernel = (
+            xs
+            / (4.0 * kve(2, xs) ** 2)
+            * k1e(xs * zs)
+            * np.exp(-xs * us)
+            * zs**2
+            * (zs**2 - 4.0)
+        )
+        integrand = sigmas * kernel * us
+        return trapezoid(integrand, np.log(us), axis=1)
+
+    def thermal_cross_section(self, x: float) -> float:
+        """
+        Compute the thermally average cross section.
+
+        Parameters
+        ----------
+        x: float
+            Mass of the dark matter divided by its temperature.
+
+        Returns
+        -------
+        tcs: float
+            Thermally average cross section.
+        """
+        if x > self.x_max:
+            return 0.0
+        if x < self.x_min:
+            if self._thermal_cross_section is not None:
+                return self._thermal_cross_section(x)
+            return _thermal_cross_section_quad(x, self.mx, self._cross_section)
+        tcs = float(self._spline(np.log(x)))
+        return np.exp(tcs) if self._log_tcs else tcs
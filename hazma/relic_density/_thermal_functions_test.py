@@ -0,0 +1,81 @@
+"""Tests for the tabulated thermally averaged cross section."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy.integrate import quad
+from scipy.special import k1e, kve
+
+from hazma.relic_density import ThermalCrossSectionTable
+from hazma.relic_density._thermal_functions import thermal_cross_section
+
+XS = [0.05, 1.0, 10.0, 20.0, 30.0, 50.0, 100.0, 250.0]
+
+
+class ToyModel:
+    """Model with s- and p-wave annihilation cross sections."""
+
+    def __init__(self, mx, a, b):
+        self.mx = mx
+        self.a = a
+        self.b = b
+
+    def annihilation_cross_sections(self, cme):
+        if cme <= 2.0 * self.mx:
+            return {"total": 0.0}
+        v = np.sqrt(1.0 - 4.0 * self.mx**2 / cme**2)
+        return {"total": self.a / v + self.b * v}
+
+
+def reference_thermal_cross_section(x, model):
+    """Thermal cross section from tight quadrature in z - 2."""
+
+    def integrand(u):
+        z = 2.0 + u
+        sigma = model.annihilation_cross_sections(model.mx * z)["total"]
+        return sigma * z**2 * (z**2 - 4.0) * k1e(x * z) * np.exp(-x * u)
+
+    bounds = [0.0, 1e-6, 1e-3, 1.0, np.inf]
+    integral = sum(
+        quad(integrand, lo, hi, epsrel=1e-10, epsabs=0.0, limit=500)[0]
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    )
+    return x / (4.0 * kve(2, x) ** 2) * integral
+
+
+@pytest.mark.parametrize("a,b", [(1e-9, 0.0), (0.0, 1e-8), (1e-9, 1e-8)])
+def test_table_matches_reference(a, b):
+    model = ToyModel(100.0, a, b)
+    table = ThermalCrossSectionTable.from_model(model)
+
+    for x in XS:
+        expected = reference_thermal_cross_section(x, model)
+        assert_allclose(table.thermal_cross_section(x), expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("a,b", [(1e-9, 0.0), (0.0, 1e-8)])
+def test_table_matches_quad(a, b):
+    """
+    Test that the table agrees with `thermal_cross_section`, which integrates
+    with `quad` up to z = 2 + 50 / x. For x > 25, the integration range used
+    to end below threshold, where the thermal cross section vanished.
+    """
+    model = ToyModel(100.0, a, b)
+    table = ThermalCrossSectionTable.from_model(model)
+
+    for x in XS:
+        tcs = thermal_cross_section(x, model)
+        assert tcs > 0.0
+        assert_allclose(table.thermal_cross_section(x), tcs, rtol=5e-3)
+
+
+def test_table_outside_range():
+    model = ToyModel(100.0, 1e-9, 1e-8)
+    table = ThermalCrossSectionTable.from_model(model, x_min=1.0, x_max=100.0)
+
+    assert table.thermal_cross_section(200.0) == 0.0
+    assert_allclose(
+        table.thermal_cross_section(0.5),
+        reference_thermal_cross_section(0.5, model),
+        rtol=1e-3,
+    )
@@ -48,6 +48,8 @@ class ScalarMediator(TheoryAnn):
         Mass scale in scalar's interactions with photons and gluons.
     """
 
+    _vectorized_cross_sections = True
+
     from ._scalar_mediator_spectra import (
         dnde_ee,  # pylint: disable
         dnde_mumu,
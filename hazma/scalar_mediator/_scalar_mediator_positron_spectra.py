@@ -63,7 +63,7 @@ def dnde_pos_ss(self, positron_energies, cme, fs="total"):
         Positron spectrum evaluated at the `positron_energies`.
     """
     scalar_energy = cme / 2.0
-    pws = self.partial_widths()
+    pws = self._cached_partial_widths()
 
     if pws["total"] != 0:
         pw_array = np.array([pws["e e"], pws["mu mu"], pws["pi pi"]])
@@ -87,7 +87,7 @@ def dnde_ss(self, e_gams, e_cm, modes=SM_DECAY_MODES):
     e_s = e_cm / 2.0
 
     ms = self.ms
-    pws = self.partial_widths()
+    pws = self._cached_partial_widths()
     if pws["total"] != 0:
         pw_array = np.array(
             [pws["e e"], pws["mu mu"], pws["pi0 pi0"], pws["pi pi"], pws["g g"]],
@@ -32,6 +32,8 @@ Boost
     dnde_boost_array            -- Boost spectrum specified as an array.
     dnde_boost                  -- Boost spectrum specified as function.
     make_boost_function         -- Construct a boost function.
+    SpectrumBooster             -- Boost spectra given as arrays to many
+                                   frames at once.
 
 Photon
 ------
@@ -108,6 +110,7 @@ from .boost import (
     dnde_boost_array,
     make_boost_function,
     dnde_boost,
+    SpectrumBooster,
 )
 
 from ._photon import (
@@ -204,4 +207,5 @@ __all__ = [
     "dnde_boost_array",
     "make_boost_function",
     "dnde_boost",
+    "SpectrumBooster",
 ]
@@ -0,0 +1,73 @@
+"""Tests for writing spectra into preallocated arrays."""
+
+import numpy as np
+import pytest
+
+from hazma import spectra
+from hazma._utils.accumulate import trapezoid_weights
+
+ENERGIES = np.geomspace(1.0, 800.0, 23)
+
+
+@pytest.mark.parametrize(
+    "dnde_fn,parent",
+    [
+        (spectra.dnde_photon_muon, 300.0),
+        (spectra.dnde_photon_charged_pion, 400.0),
+        (spectra.dnde_photon_eta, 700.0),
+        (spectra.dnde_positron_muon, 300.0),
+        (spectra.dnde_positron_charged_kaon, 600.0),
+    ],
+)
+def test_out_weight_accumulate(dnde_fn, parent):
+    expected = dnde_fn(ENERGIES, parent)
+
+    out = np.empty_like(ENERGIES)
+    result = dnde_fn(ENERGIES, parent, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, expected)
+
+    dnde_fn(ENERGIES, parent, out=out, weight=2.0, accumulate=True)
+    np.testing.assert_allclose(out, 3.0 * expected)
+
+    np.testing.assert_allclose(dnde_fn(ENERGIES, parent, weight=0.5), 0.5 * expected)
+
+
+def test_out_neutrino_flavor():
+    parent = 400.0
+    expected = spectra.dnde_neutrino_charged_pion(ENERGIES, parent)
+    out = np.zeros_like(expected)
+    spectra.dnde_neutrino_charged_pion(ENERGIES, parent, out=out, accumulate=True)
+    np.testing.assert_allclose(out, expected)
+
+    out = np.zeros_like(ENERGIES)
+    for flavor in ["e", "mu", "tau"]:
+        spectra.dnde_neutrino_charged_pion(
+            ENERGIES, parent, flavor=flavor, out=out, accumulate=True
+        )
+    np.testing.assert_allclose(out, np.sum(expected, axis=0))
+
+
+def test_out_shape_mismatch():
+    with pytest.raises(ValueError):
+        spectra.dnde_photon_muon(ENERGIES, 300.0, out=np.empty(3))
+    with pytest.raises(ValueError):
+        spectra.dnde_photon_muon(ENERGIES, 300.0, accumulate=True)
+
+
+def test_nbody_accumulate():
+    final_states = ["pi", "pi", "pi0"]
+    cme = 1000.0
+    expected = spectra.dnde_photon(ENERGIES, cme, final_states, seed=1)
+
+    out = np.ones_like(ENERGIES)
+    spectra.dnde_photon(
+        ENERGIES, cme, final_states, seed=1, out=out, weight=2.0, accumulate=True
+    )
+    np.testing.assert_allclose(out, 1.0 + 2.0 * expected, rtol=1e-10)
+
+
+def test_trapezoid_weights():
+    x = np.sort(np.random.default_rng(2).random(31))
+    y = np.sin(3 * x)
+    assert trapezoid_weights(x) @ y == pytest.approx(np.trapezoid(y, x))
@@ -9,6 +9,12 @@ from collections import defaultdict
 import numpy as np
 import numpy.typing as npt
 
+from hazma._utils.accumulate import (
+    check_accumulate,
+    check_out,
+    store,
+    trapezoid_weights,
+)
 from hazma.utils import RealArray, RealOrRealArray
 from hazma.phase_space import Rambo, ThreeBody, PhaseSpaceDistribution1D
 from hazma.parameters import standard_model_masses as sm_masses
@@ -24,7 +30,7 @@ from .altarelli_parisi import (
 MSqrd = Union[Callable[[Any], Any], Callable[[Any, Any], Any]]
 
 # Currently implemented backend integrators
-_INTEGRATORS = ["quad", "trapz", "simps", "rambo"]
+_INTEGRATORS = ["quad", "trapz", "simps", "gauss", "rambo"]
 
 
 def _check_integrator(integrator: str):
@@ -34,14 +40,38 @@ def _check_integrator(integrator: str):
     )
 
 
-def _dnde_zero(product_energies, _):
-    return np.zeros_like(product_energies)
+def _zeros(shape, out, accumulate: bool):
+    check_accumulate(out, accumulate)
+    if out is None:
+        return np.zeros(shape)
+    check_out(out, shape)
+    if not accumulate:
+        out.fill(0.0)
+    return out
+
 
+# pylint: disable=unused-argument
+def _dnde_zero(
+    product_energies, parent_energies, *, out=None, weight=1.0, accumulate=False
+):
+    shape = np.shape(parent_energies) + np.shape(product_energies)
+    return _zeros(shape, out, accumulate)
 
-def _dnde_zero_nu(product_energies, _, flavor: Optional[str] = None):
+
+# pylint: disable=unused-argument
+def _dnde_zero_nu(
+    product_energies,
+    parent_energies,
+    flavor: Optional[str] = None,
+    *,
+    out=None,
+    weight=1.0,
+    accumulate=False,
+):
+    shape = np.shape(parent_energies) + np.shape(product_energies)
     if flavor is None:
-        return np.zeros((3, *product_energies.shape), dtype=product_energies.dtype)
-    return np.zeros_like(product_energies)
+        shape = (3, *shape)
+    return _zeros(shape, out, accumulate)
 
 
 def _make_fsr(mass, charge, scalar):
@@ -49,8 +79,19 @@ def _make_fsr(mass, charge, scalar):
 
     # Our invariant mass distributions are distributions in sqrt(s) rather than
     # s. The AP functions take in `s`, so we wrap the function to convert.
-    def fsr(energies, sqrts):
-        return ap(energies, sqrts**2, mass=mass, charge=charge)
+    def fsr(energies, sqrts, *, out=None, weight=1.0, accumulate=False):
+        if np.ndim(sqrts) > 0:
+            # Spectra for all the invariant masses with shape (m, n).
+            sqrts = np.expand_dims(sqrts, -1)
+        return ap(
+            energies,
+            sqrts**2,
+            mass=mass,
+            charge=charge,
+            out=out,
+            weight=weight,
+            accumulate=accumulate,
+        )
 
     return fsr
 
@@ -168,7 +209,7 @@ def _get_masses(final_states: Sequence[str]) -> List[float]:
     return masses
 
 
-def _make_energy_distributions(
+def _make_distributions(
     cme: float,
     final_states: Sequence[str],
     msqrd,
@@ -176,50 +217,16 @@ def _make_energy_distributions(
     nbins: int,
     three_body_integrator: str,
     msqrd_signature: Optional[str],
+    invariant_masses: bool,
+    qmc: Optional[str] = None,
+    seed: Optional[int] = None,
 ):
-    r"""Use Monte-Carlo to generate energy distributions for each final-state particle.
+    r"""Generate the energy distributions of each final-state particle and,
+    optionally, the invariant-mass distributions of each pair of final-state
+    particles.
 
-    Parameters
-    ----------
-    cme: float
-        Center-of-mass energies.
-    final_states: list[str]
-        List of strings representing the final state particles.
-    msqrd: callable
-        Function to compute the squared matrix element. Must except a numpy
-        array of the momenta of the final state particles.
-    npts: int
-        Number of Monte-Carlo phase-space points used to generate distributions.
-    nbins: int
-        Number of energy bins used to construct distributions.
-
-    Returns
-    -------
-    dists: List[PhaseSpaceDistribution1D]
-        List containing the energy distributions of the final-state particles.
-    """
-    _check_integrator(three_body_integrator)
-
-    masses = _get_masses(final_states)
-    if len(final_states) == 3 and three_body_integrator in ["quad", "trapz", "simps"]:
-        return ThreeBody(
-            cme, masses, msqrd=msqrd, msqrd_signature=msqrd_signature
-        ).energy_distributions(nbins=nbins)
-
-    return Rambo(cme, masses, msqrd=msqrd).energy_distributions(n=npts, nbins=nbins)
-
-
-def _make_invariant_mass_distributions(
-    cme: float,
-    final_states: Sequence[str],
-    msqrd,
-    npts: int,
-    nbins: int,
-    three_body_integrator: str,
-    msqrd_signature: Optional[str],
-):
-    r"""Use Monte-Carlo to generate invariant-mass distributions for each pair
-    of final-state particles.
+    When Monte-Carlo is used, both sets of distributions are filled from the
+    same phase-space points.
 
     Parameters
     ----------
@@ -234,25 +241,41 @@ def _make_invariant_mass_distributions(
         Number of Monte-Carlo phase-space points used to generate distributions.
     nbins: int
         Number of bins used to construct distributions.
+    invariant_masses: bool
+        If True, the invariant-mass distributions are also computed.
+    qmc: str, optional
+        Type of low-discrepancy sequence used by `Rambo`. See
+        `hazma.phase_space.Rambo`.
+    seed: int, optional
+        Seed used to generate the phase-space points.
 
     Returns
     -------
-    dists: dict[(int,int), PhaseSpaceDistribution1D]
-        Dictionary containing the distributions. They keys represent the pair
-        the distribution corresponds to.
+    edists: List[PhaseSpaceDistribution1D]
+        List containing the energy distributions of the final-state particles.
+    mdists: dict[(int,int), PhaseSpaceDistribution1D]
+        Dictionary containing the invariant-mass distributions. They keys
+        represent the pair the distribution corresponds to. Empty if
+        `invariant_masses` is False.
     """
     _check_integrator(three_body_integrator)
 
     masses = _get_masses(final_states)
+    if len(final_states) == 3 and three_body_integrator != "rambo":
+        method = "gauss" if three_body_integrator == "gauss" else "quad"
+        tb = ThreeBody(cme, masses, msqrd=msqrd, msqrd_signature=msqrd_signature)
+        edists = tb.energy_distributions(nbins=nbins, method=method)
+        mdists = (
+            tb.invariant_mass_distributions(nbins=nbins, method=method)
+            if invariant_masses
+            else {}
+        )
+        return edists, mdists
 
-    if len(final_states) == 3 and three_body_integrator in ["quad", "trapz", "simps"]:
-        return ThreeBody(
-            cme, masses, msqrd=msqrd, msqrd_signature=msqrd_signature
-        ).invariant_mass_distributions(nbins=nbins)
-
-    return Rambo(cme, masses, msqrd=msqrd).invariant_mass_distributions(
-        n=npts, nbins=nbins
+    edists, mdists, _ = Rambo(cme, masses, msqrd=msqrd, qmc=qmc).distributions(
+        n=npts, nbins=nbins, invariant_masses=invariant_masses, seed=seed
     )
+    return edists, mdists
 
 
 def _conv_dnde_dist(
@@ -260,6 +283,10 @@ def _conv_dnde_dist(
     dist: PhaseSpaceDistribution1D,
     state: str,
     product: str,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealArray:
     r"""Convolve the spectrum with an energy distribution.
 
@@ -273,46 +300,39 @@ def _conv_dnde_dist(
         State that will decay into the product.
     product: str
         The product produced. Should be 'photon' or 'positron' (neutrino is handeled)
+    out: np.ndarray, optional
+        Array the convolved spectrum is written into.
+    weight: float, optional
+        Factor multiplying the convolved spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted convolved spectrum is added to `out`. Default is
+        False.
 
     Returns
     -------
     dnde: np.ndarray
         The convolved spectrum.
     """
-    # For the neutrino spectra, the 'dnde_neutrino_*' functions return an array
-    # with shape (3,n). To accomidate this shape, we reshape the probabilities.
-    # The result of generating the spectra for all parent energies will be of
-    # shape (m, 3, n) with m = number energies, n=number neutrino energies.
-    # We then reshape the probabilities to have shape (m, 1, 1), then integrate
-    # over axis=0.
-    # For the other cases, we just expand the probabilities to be shape (m, 1).
-
     assert product in _spectra_dict, f"Invalid product: {product}."
     assert state in _spectra_dict[product], f"Invalid final state: {state}."
 
     dnde_fn = _spectra_dict[product][state]
 
-    # This will have shape (m, 3, n) for neutrinos and (m,n) otherwise.
-    dndes = np.array([dnde_fn(product_energies, e) for e in dist.bin_centers])
-    # Transform probs to (m, 1, 1) for neutrino, else (m, 1)
-    expand = (1, 2) if product == "neutrino" else (1,)
-    dndes = np.expand_dims(dist.probabilities, expand) * dndes
-    # Integrate over leading axis. Result has shape (3, n) for neutrinos and
+    # The spectra for all the parent energies are computed at once. The result
+    # has shape (3, m, n) for neutrinos and (m, n) otherwise, with m = number
+    # of parent energies and n = number of product energies.
+    dndes = dnde_fn(product_energies, dist.bin_centers)
+    # Integrate over the parent energies using the trapezoid rule, folding the
+    # probabilities into the weights. Result has shape (3, n) for neutrinos and
     # (n,) otherwise.
-    dnde = np.trapz(dndes, dist.bin_centers, axis=0)
-
-    return dnde
+    weights = weight * dist.probabilities * trapezoid_weights(dist.bin_centers)
+    return store(weights @ dndes, out, accumulate=accumulate)
 
 
 def _dnde_photon_fsr(
     photon_energies: RealArray,
-    cme: float,
     final_states: Sequence[str],
-    msqrd: Optional[MSqrd],
-    three_body_integrator: str,
-    msqrd_signature: Optional[str],
-    npts: int,
-    nbins: int,
+    dists: Dict[Tuple[int, int], PhaseSpaceDistribution1D],
     average_fsr: bool,
 ) -> RealArray:
     r"""Convolve the FSR spectra with the invariant-mass distributions.
@@ -321,17 +341,10 @@ def _dnde_photon_fsr(
     ----------
     photon_energies: np.ndarray
         Array of the photon energies.
-    cme: float
-        Center-of-mass energy.
     final_states: list[str]
         List of strings representing the final state particles.
-    msqrd: callable
-        Function to compute the squared matrix element. Must except a numpy
-        array of the momenta of the final state particles.
-    npts: int
-        Number of Monte-Carlo phase-space points used to generate distributions.
-    nbins: int
-        Number of bins used to construct distributions.
+    dists: dict[(int,int), PhaseSpaceDistribution1D]
+        Invariant-mass distributions of each pair of final-state particles.
     average_fsr: bool
         If True, the FSR is averaged over each pair. For example, if we have
         pairs (0, 1), (0, 2) and (1, 3), then the spectrum is computed twice for
@@ -348,17 +361,6 @@ def _dnde_photon_fsr(
 
     has_fsr = any(s in dnde_fns for s in final_states)
     if has_fsr:
-        # Compute FSR convolved with invariant-mass distributions
-        dists = _make_invariant_mass_distributions(
-            cme=cme,
-            final_states=final_states,
-            msqrd=msqrd,
-            npts=npts,
-            nbins=nbins,
-            three_body_integrator=three_body_integrator,
-            msqrd_signature=msqrd_signature,
-        )
-
         # Use a counter to determine how many times a spectrum has been
         # computed. We will average over spectra computed multiple times to
         # obtain a more accurate result. Since we're loop over all pairs or
@@ -367,28 +369,31 @@ def _dnde_photon_fsr(
         # spectra. If 'average_fsr' is False, the we will skip terms computing
         # the same spectrum.
         counts = defaultdict(int)
-        dndes = {
-            key: np.zeros_like(photon_energies)
-            for key in final_states
-            if key in dnde_fns
-        }
+        terms = []
 
         for pair, dist in dists.items():
             for s in [final_states[p] for p in pair]:
                 # Skip neutral particles
-                if s not in dndes:
+                if s not in dnde_fns:
                     continue
 
                 # If average_fsr is False and we've already encountered this
                 # particle, skip it.
                 if average_fsr or counts[s] == 0:
                     counts[s] += 1
-                    dndes[s] = dndes[s] + _conv_dnde_dist(
-                        photon_energies, dist, s, "fsr"
-                    )
-
-        for key in dndes.keys():
-            dnde += dndes[key] / counts[key]
+                    terms.append((s, dist))
+
+        # The spectra are averaged by weighting them with the inverse counts.
+        for s, dist in terms:
+            _conv_dnde_dist(
+                photon_energies,
+                dist,
+                s,
+                "fsr",
+                out=dnde,
+                weight=1.0 / counts[s],
+                accumulate=True,
+            )
 
     return dnde
 
@@ -432,16 +437,16 @@ def _dnde_two_body(
     dnde = np.zeros(shape, dtype=product_energies.dtype)
 
     if s1 in dnde_fn:
-        dnde += dnde_fn[s1](product_energies, e1)
+        dnde_fn[s1](product_energies, e1, out=dnde, accumulate=True)
 
     if s2 in dnde_fn:
-        dnde += dnde_fn[s2](product_energies, e2)
+        dnde_fn[s2](product_energies, e2, out=dnde, accumulate=True)
 
     if product == "photon" and include_fsr:
         if s1 in dnde_fsr:
-            dnde += dnde_fsr[s1](product_energies, cme)
+            dnde_fsr[s1](product_energies, cme, out=dnde, accumulate=True)
         if s2 in dnde_fsr:
-            dnde += dnde_fsr[s2](product_energies, cme)
+            dnde_fsr[s2](product_energies, cme, out=dnde, accumulate=True)
 
     return dnde
 
@@ -459,6 +464,8 @@ def _dnde_multi_particle(
     nbins: int,
     include_fsr: bool,
     average_fsr: bool,
+    qmc: Optional[str] = None,
+    seed: Optional[int] = None,
 ) -> RealArray:
     r"""Compute the differential energy spectrum of a product from the decays and FSR
     of a n-body final state for n >= 3.
@@ -481,7 +488,10 @@ def _dnde_multi_particle(
     """
     tbi = "quad" if three_body_integrator is None else three_body_integrator
 
-    edists = _make_energy_distributions(
+    with_fsr = product == "photon" and include_fsr
+    with_fsr = with_fsr and any(s in _spectra_dict["fsr"] for s in final_states)
+
+    edists, mdists = _make_distributions(
         cme=cme,
         final_states=final_states,
         msqrd=msqrd,
@@ -489,12 +499,18 @@ def _dnde_multi_particle(
         msqrd_signature=msqrd_signature,
         npts=npts,
         nbins=nbins,
+        invariant_masses=with_fsr,
+        qmc=qmc,
+        seed=seed,
     )
 
-    dnde = np.zeros_like(product_energies)
+    shape = ((3,) if product == "neutrino" else tuple()) + product_energies.shape
+    dnde = np.zeros(shape, dtype=product_energies.dtype)
 
     for dist, state in zip(edists, final_states):
-        dnde = dnde + _conv_dnde_dist(product_energies, dist, state, product)
+        _conv_dnde_dist(
+            product_energies, dist, state, product, out=dnde, accumulate=True
+        )
 
         # if product is in final state, add it to spectrum
         cond = state == product
@@ -509,16 +525,11 @@ def _dnde_multi_particle(
                 left=0.0,
             )
 
-    if product == "photon" and include_fsr:
-        dnde = dnde + _dnde_photon_fsr(
+    if with_fsr:
+        dnde += _dnde_photon_fsr(
             photon_energies=product_energies,
-            cme=cme,
             final_states=final_states,
-            three_body_integrator=tbi,
-            msqrd_signature=msqrd_signature,
-            msqrd=msqrd,
-            npts=npts,
-            nbins=nbins,
+            dists=mdists,
             average_fsr=average_fsr,
         )
 
@@ -538,6 +549,11 @@ def _dnde_nbody(
     nbins: int,
     include_fsr: bool,
     average_fsr: bool,
+    qmc: Optional[str] = None,
+    seed: Optional[int] = None,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
 
     # Check cme is large enough before we get into the weeds:
@@ -583,11 +599,13 @@ def _dnde_nbody(
                 nbins=nbins,
                 include_fsr=include_fsr,
                 average_fsr=average_fsr,
+                qmc=qmc,
+                seed=seed,
             )
 
     if scalar:
-        return np.take(dnde, 0, axis=-1)
-    return dnde
+        dnde = np.take(dnde, 0, axis=-1)
+    return store(dnde, out, weight, accumulate)
 
 
 def dnde_photon(
@@ -602,6 +620,11 @@ def dnde_photon(
     nbins: int = 25,
     include_fsr: bool = True,
     average_fsr: bool = True,
+    qmc: Optional[str] = None,
+    seed: Optional[int] = None,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ):
     r"""Compute the differential photon energy spectrum from the decays and FSR
     of final state particles.
@@ -626,6 +649,8 @@ def dnde_photon(
             * 'quad': for `scipy.integrate.quad`,
             * 'trapz': for `scipy.integrate.trapz`,
             * 'simps': for `scipy.integrate.simps`,
+            * 'gauss': for vectorized Gauss-Legendre quadrature (`msqrd` must
+              accept arrays),
             * 'rambo': for `hazma.phase_space.Rambo`.
 
         Default is 'quad'.
@@ -650,6 +675,20 @@ def dnde_photon(
         each particle, then is divided by 2. If False, then duplicates are
         skipped and the spectrum is computed once for each unique final-state.
         Only used if at least one of the final states is charged.
+    qmc: str, optional
+        If 'sobol' or 'halton', randomized quasi-Monte-Carlo points are used
+        to generate the energy/invariant mass distributions. See
+        `hazma.phase_space.Rambo`. Default is None (pseudo-random points).
+    seed: int, optional
+        Seed used to generate the phase-space points. Default is None.
+    out: np.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. Default is None.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -692,6 +731,11 @@ def dnde_photon(
         nbins=nbins,
         include_fsr=include_fsr,
         average_fsr=average_fsr,
+        qmc=qmc,
+        seed=seed,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
@@ -708,6 +752,11 @@ def dnde_positron(
     msqrd_signature: Optional[str] = None,
     npts: int = 1 << 14,
     nbins: int = 25,
+    qmc: Optional[str] = None,
+    seed: Optional[int] = None,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ):
     r"""Compute the differential positron energy spectrum from the decays of
     final state particles.
@@ -732,6 +781,8 @@ def dnde_positron(
             * 'quad': for `scipy.integrate.quad`,
             * 'trapz': for `scipy.integrate.trapz`,
             * 'simps': for `scipy.integrate.simps`,
+            * 'gauss': for vectorized Gauss-Legendre quadrature (`msqrd` must
+              accept arrays),
             * 'rambo': for `hazma.phase_space.Rambo`.
 
         Default is 'quad'.
@@ -747,6 +798,20 @@ def dnde_positron(
         Number of bins used to construct energy/invariant-mass distributions of
         the final-state particles. Only used if the number of final-state
         particles is greater than 2. Default is 25.
+    qmc: str, optional
+        If 'sobol' or 'halton', randomized quasi-Monte-Carlo points are used
+        to generate the energy/invariant mass distributions. See
+        `hazma.phase_space.Rambo`. Default is None (pseudo-random points).
+    seed: int, optional
+        Seed used to generate the phase-space points. Default is None.
+    out: np.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. Default is None.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -779,6 +844,11 @@ def dnde_positron(
         nbins=nbins,
         include_fsr=False,
         average_fsr=False,
+        qmc=qmc,
+        seed=seed,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
@@ -796,6 +866,11 @@ def dnde_neutrino(
     npts: int = 1 << 14,
     nbins: int = 25,
     flavor: Optional[str] = None,
+    qmc: Optional[str] = None,
+    seed: Optional[int] = None,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ):
     r"""Compute the differential neutrino energy spectrum from the decays of
     final state particles.
@@ -820,6 +895,8 @@ def dnde_neutrino(
             * 'quad': for `scipy.integrate.quad`,
             * 'trapz': for `scipy.integrate.trapz`,
             * 'simps': for `scipy.integrate.simps`,
+            * 'gauss': for vectorized Gauss-Legendre quadrature (`msqrd` must
+              accept arrays),
             * 'rambo': for `hazma.phase_space.Rambo`.
 
         Default is 'quad'.
@@ -837,6 +914,20 @@ def dnde_neutrino(
         particles is greater than 2. Default is 25.
     flavor: str, optional
         Flavor of neutrino. If None, all flavors are returned.
+    qmc: str, optional
+        If 'sobol' or 'halton', randomized quasi-Monte-Carlo points are used
+        to generate the energy/invariant mass distributions. See
+        `hazma.phase_space.Rambo`. Default is None (pseudo-random points).
+    seed: int, optional
+        Seed used to generate the phase-space points. Default is None.
+    out: np.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. Default is None.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -882,6 +973,11 @@ def dnde_neutrino(
         nbins=nbins,
         include_fsr=False,
         average_fsr=False,
+        qmc=qmc,
+        seed=seed,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
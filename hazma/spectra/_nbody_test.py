@@ -0,0 +1,30 @@
+"""Tests for the spectra of decaying particles evaluated for many parent
+energies at once."""
+
+import numpy as np
+import pytest
+
+from hazma.spectra import _nbody
+
+PARENTS = ["mu", "pi", "pi0", "k", "kl", "ks", "eta", "etap", "rho", "omega", "phi"]
+
+
+@pytest.mark.parametrize("product", ["photon", "positron", "neutrino", "ve"])
+@pytest.mark.parametrize("state", PARENTS)
+def test_parent_energy_grid(product, state):
+    dnde_fn = _nbody._spectra_dict[product][state]
+    mass = _nbody.sm_masses[state]
+    energies = np.geomspace(1.0, 800.0, 17)
+    parents = mass * np.array([0.5, 1.0, 1.2, 2.0, 5.0])
+
+    expected = np.array([dnde_fn(energies, e) for e in parents])
+    if product == "neutrino":
+        expected = np.moveaxis(expected, 1, 0)
+
+    actual = dnde_fn(energies, parents)
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-12)
+
+    # A single product energy drops the last axis.
+    actual = dnde_fn(energies[3], parents)
+    np.testing.assert_allclose(actual, expected[..., 3], rtol=1e-4, atol=1e-12)
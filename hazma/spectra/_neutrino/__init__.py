@@ -1,5 +1,11 @@
 """
 Module for computing neutrino spectra.
+
+All spectra accept an array of parent energies, in which case the spectra for
+all pairs of parent and neutrino energies are computed at once. The result has
+shape (3, len(parent_energies), len(neutrino_energies)), or
+(len(parent_energies), len(neutrino_energies)) if a flavor is specified.
+
 @author: Logan Morrison and Adam Coogan
 """
 
@@ -40,18 +46,36 @@ _neutral_rho_integrand_interp_mu = _load_interp("neutral_rho_neutrino_mu.csv")
 
 @overload
 def dnde_neutrino_muon(
-    neutrino_energies: float, muon_energy: float, flavor: Optional[str] = ...
+    neutrino_energies: float,
+    muon_energy: float,
+    flavor: Optional[str] = ...,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_muon(
-    neutrino_energies: RealArray, muon_energy: float, flavor: Optional[str] = ...
+    neutrino_energies: RealArray,
+    muon_energy: float,
+    flavor: Optional[str] = ...,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_muon(
-    neutrino_energies: RealOrRealArray, muon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealOrRealArray,
+    muon_energy: RealOrRealArray,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the neutrino spectrum from muon decay.
@@ -60,11 +84,19 @@ def dnde_neutrino_muon(
     ----------
     neutrino_energies : float or numpy.ndarray
         Energy(ies) of the neutrinos.
-    muon_energy : float
+    muon_energy : float or numpy.ndarray
         Energy of the muon.
     flavor : str, optional
         Flavor of neutrino to compute spectrum for. If None, spectrum for all
         flavors are return. Options are "e", "mu" or "tau".
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -72,33 +104,48 @@ def dnde_neutrino_muon(
         The neutrino spectrum. If flavor is None, the result has the shape
         (3, len(neutrino_energies)). Otherwise, has the shape (len(neutrino_energies),).
     """
-    dnde = _muon.dnde_neutrino_muon(neutrino_energies, muon_energy)
-    if flavor is None:
-        return dnde
-    elif flavor == "e":
-        return dnde[0]
-    elif flavor == "mu":
-        return dnde[1]
-    elif flavor == "tau":
-        return dnde[2]
-    else:
-        raise ValueError(f"Invalid flavor {flavor}. Use 'e', 'mu' or 'tau'.")
+    return _muon.dnde_neutrino_muon(
+        neutrino_energies,
+        muon_energy,
+        flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
+    )
 
 
 @overload
 def dnde_neutrino_charged_pion(
-    neutrino_energies: float, pion_energy: float, flavor: Optional[str] = ...
+    neutrino_energies: float,
+    pion_energy: float,
+    flavor: Optional[str] = ...,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_charged_pion(
-    neutrino_energies: RealArray, pion_energy: float, flavor: Optional[str] = ...
+    neutrino_energies: RealArray,
+    pion_energy: float,
+    flavor: Optional[str] = ...,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_charged_pion(
-    neutrino_energies: RealOrRealArray, pion_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealOrRealArray,
+    pion_energy: RealOrRealArray,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the neutrino spectrum from the decay of a charged pion.
@@ -107,11 +154,19 @@ def dnde_neutrino_charged_pion(
     ----------
     neutrino_energies : float or numpy.ndarray
         Energy(ies) of the neutrinos.
-    pion_energy : float
+    pion_energy : float or numpy.ndarray
         Energy of the charged pion.
     flavor : str, optional
         Flavor of neutrino to compute spectrum for. If None, spectrum for all
         flavors are return. Options are "e", "mu" or "tau".
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -119,33 +174,48 @@ def dnde_neutrino_charged_pion(
         The neutrino spectrum. If flavor is None, the result has the shape
         (3, len(neutrino_energies)). Otherwise, has the shape (len(neutrino_energies),).
     """
-    dnde = _pion.dnde_neutrino_charged_pion(neutrino_energies, pion_energy)
-    if flavor is None:
-        return dnde
-    elif flavor == "e":
-        return dnde[0]
-    elif flavor == "mu":
-        return dnde[1]
-    elif flavor == "tau":
-        return dnde[2]
-    else:
-        raise ValueError(f"Invalid flavor {flavor}. Use 'e', 'mu' or 'tau'.")
+    return _pion.dnde_neutrino_charged_pion(
+        neutrino_energies,
+        pion_energy,
+        flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
+    )
 
 
 @overload
 def dnde_neutrino_charged_kaon(
-    neutrino_energies: float, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: float,
+    kaon_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_charged_kaon(
-    neutrino_energies: RealArray, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealArray,
+    kaon_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_charged_kaon(
-    neutrino_energies: RealOrRealArray, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the neutrino spectrum from the decay of a charged kaon.
@@ -159,6 +229,14 @@ def dnde_neutrino_charged_kaon(
     flavor : str, optional
         Flavor of neutrino to compute spectrum for. If None, spectrum for all
         flavors are return. Options are "e", "mu" or "tau".
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -178,23 +256,44 @@ def dnde_neutrino_charged_kaon(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_long_kaon(
-    neutrino_energies: float, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: float,
+    kaon_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_long_kaon(
-    neutrino_energies: RealArray, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealArray,
+    kaon_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_long_kaon(
-    neutrino_energies: RealOrRealArray, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the neutrino spectrum from the decay of a long kaon.
@@ -208,6 +307,14 @@ def dnde_neutrino_long_kaon(
     flavor : str, optional
         Flavor of neutrino to compute spectrum for. If None, spectrum for all
         flavors are return. Options are "e", "mu" or "tau".
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -227,23 +334,44 @@ def dnde_neutrino_long_kaon(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_short_kaon(
-    neutrino_energies: float, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: float,
+    kaon_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_short_kaon(
-    neutrino_energies: RealArray, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealArray,
+    kaon_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_short_kaon(
-    neutrino_energies: RealOrRealArray, kaon_energy: float, flavor: Optional[str] = None
+    neutrino_energies: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the neutrino spectrum from the decay of a short kaon.
@@ -257,6 +385,14 @@ def dnde_neutrino_short_kaon(
     flavor : str, optional
         Flavor of neutrino to compute spectrum for. If None, spectrum for all
         flavors are return. Options are "e", "mu" or "tau".
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -276,25 +412,44 @@ def dnde_neutrino_short_kaon(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_eta(
-    neutrino_energy: float, eta_energy: float, flavor: Optional[str] = None
+    neutrino_energy: float,
+    eta_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_eta(
-    neutrino_energy: RealArray, eta_energy: float, flavor: Optional[str] = None
+    neutrino_energy: RealArray,
+    eta_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_eta(
     neutrino_energy: Union[RealArray, float],
-    eta_energy: float,
+    eta_energy: RealOrRealArray,
     flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp_e = _eta_interp_e
     interp_mu = _eta_interp_mu
@@ -308,25 +463,44 @@ def dnde_neutrino_eta(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_omega(
-    neutrino_energy: float, omega_energy: float, flavor: Optional[str] = None
+    neutrino_energy: float,
+    omega_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_omega(
-    neutrino_energy: RealArray, omega_energy: float, flavor: Optional[str] = None
+    neutrino_energy: RealArray,
+    omega_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_omega(
     neutrino_energy: Union[RealArray, float],
-    omega_energy: float,
+    omega_energy: RealOrRealArray,
     flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp_e = _omega_integrand_interp_e
     interp_mu = _omega_integrand_interp_mu
@@ -340,25 +514,44 @@ def dnde_neutrino_omega(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_neutral_rho(
-    neutrino_energy: float, rho_energy: float, flavor: Optional[str] = None
+    neutrino_energy: float,
+    rho_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_neutral_rho(
-    neutrino_energy: RealArray, rho_energy: float, flavor: Optional[str] = None
+    neutrino_energy: RealArray,
+    rho_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_neutral_rho(
     neutrino_energy: Union[RealArray, float],
-    rho_energy: float,
+    rho_energy: RealOrRealArray,
     flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp_e = _neutral_rho_integrand_interp_e
     interp_mu = _neutral_rho_integrand_interp_mu
@@ -372,25 +565,44 @@ def dnde_neutrino_neutral_rho(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_charged_rho(
-    neutrino_energy: float, rho_energy: float, flavor: Optional[str] = None
+    neutrino_energy: float,
+    rho_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_charged_rho(
-    neutrino_energy: RealArray, rho_energy: float, flavor: Optional[str] = None
+    neutrino_energy: RealArray,
+    rho_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_charged_rho(
     neutrino_energy: Union[RealArray, float],
-    rho_energy: float,
+    rho_energy: RealOrRealArray,
     flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp_e = _charged_rho_integrand_interp_e
     interp_mu = _charged_rho_integrand_interp_mu
@@ -404,25 +616,44 @@ def dnde_neutrino_charged_rho(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_eta_prime(
-    neutrino_energy: float, eta_prime_energy: float, flavor: Optional[str] = None
+    neutrino_energy: float,
+    eta_prime_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_eta_prime(
-    neutrino_energy: RealArray, eta_prime_energy: float, flavor: Optional[str] = None
+    neutrino_energy: RealArray,
+    eta_prime_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_eta_prime(
     neutrino_energy: Union[RealArray, float],
-    eta_prime_energy: float,
+    eta_prime_energy: RealOrRealArray,
     flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp_e = _eta_prime_integrand_interp_e
     interp_mu = _eta_prime_integrand_interp_mu
@@ -436,25 +667,44 @@ def dnde_neutrino_eta_prime(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
 def dnde_neutrino_phi(
-    neutrino_energy: float, phi_energy: float, flavor: Optional[str] = None
+    neutrino_energy: float,
+    phi_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_neutrino_phi(
-    neutrino_energy: RealArray, phi_energy: float, flavor: Optional[str] = None
+    neutrino_energy: RealArray,
+    phi_energy: float,
+    flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_neutrino_phi(
     neutrino_energy: Union[RealArray, float],
-    phi_energy: float,
+    phi_energy: RealOrRealArray,
     flavor: Optional[str] = None,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp_e = _phi_integrand_interp_e
     interp_mu = _phi_integrand_interp_mu
@@ -468,6 +718,9 @@ def dnde_neutrino_phi(
         interp_e=interp_e,
         interp_mu=interp_mu,
         flavor=flavor,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
@@ -2,5 +2,5 @@ import numpy as np
 cimport numpy as np
 from hazma.spectra._neutrino._neutrino cimport NeutrinoSpectrumPoint
 
-cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point(double, double)
-cdef np.ndarray[np.float64_t,ndim=2] c_muon_decay_spectrum_array(double[:], double)
+cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point(double, double) noexcept nogil
+cdef np.ndarray c_muon_decay_spectrum_array(const double[:], double)
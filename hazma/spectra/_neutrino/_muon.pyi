@@ -1 +1 @@
-def dnde_neutrino_muon(egam, emu: float): ...
+def dnde_neutrino_muon(egam, emu: float, flavor=None, out=None, weight=1.0, accumulate=False): ...
@@ -8,6 +8,8 @@ import cython
 from libc.math cimport log, sqrt, fmin
 from libc.float cimport DBL_EPSILON
 from hazma.spectra._neutrino._neutrino cimport NeutrinoSpectrumPoint, new_neutrino_spectrum_point
+from hazma.spectra._neutrino._neutrino cimport neutrino_fill_array
+from hazma.spectra._neutrino._neutrino cimport evaluate_neutrino_dnde
 
 include "../../_utils/constants.pxd"
 
@@ -25,7 +27,7 @@ DEF R_FACTOR = 1.0001870858234163
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point_rest(double enu):
+cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point_rest(double enu) noexcept nogil:
     """
     Compute the muon decay spectrum into a single neutrino (either an
     electron or muon neutrino) from a muon at rest.
@@ -69,7 +71,7 @@ cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point_rest(double enu):
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point(double enu, double emu):
+cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point(double enu, double emu) noexcept nogil:
     """
     Compute the boosted muon decay spectrum into a single neutrino (either an
     electron or muon neutrino) given the neutrino energy and muon energy.
@@ -150,7 +152,7 @@ cdef NeutrinoSpectrumPoint c_muon_decay_spectrum_point(double enu, double emu):
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef np.ndarray[np.float64_t,ndim=2] c_muon_decay_spectrum_array(double[:] energies, double emu):
+cdef np.ndarray c_muon_decay_spectrum_array(const double[:] energies, double emu):
     """
     Compute the boosted muon decay spectrum into a single neutrino (either an
     electron or muon neutrino) given array of neutrino energies and muon energy.
@@ -168,17 +170,10 @@ cdef np.ndarray[np.float64_t,ndim=2] c_muon_decay_spectrum_array(double[:] energ
         Spectrum given a boosted muon with energy `emu` and neutrino with
         energies `energies`.
     """
-    cdef int npts = energies.shape[0]
-    spec = np.zeros((3, npts), dtype=np.float64)
-    cdef double[:,:] spec_view = spec
-    cdef NeutrinoSpectrumPoint res
-
-    for i in range(npts):
-        res = c_muon_decay_spectrum_point(energies[i], emu)
-        spec_view[0][i] = res.electron
-        spec_view[1][i] = res.muon
-        spec_view[2][i] = res.tau
-
+    spec = np.empty((3, energies.shape[0]), dtype=np.float64)
+    cdef double[:, :] out = spec
+    with nogil:
+        neutrino_fill_array(c_muon_decay_spectrum_point, energies, emu, out)
     return spec
 
 
@@ -186,7 +181,7 @@ cdef np.ndarray[np.float64_t,ndim=2] c_muon_decay_spectrum_array(double[:] energ
 # ---- Python API ---------------------------------------------------
 # ===================================================================
 
-def dnde_neutrino_muon(egam, double emu):
+def dnde_neutrino_muon(egam, emu, flavor=None, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the neutrino spectrum dN/dE from the decay of a muon into an electron,
     and two neutrinos.
@@ -195,15 +190,16 @@ def dnde_neutrino_muon(egam, double emu):
     ----------
     egam: float or array-like
         Photon energy.
-    emu: float 
+    emu: float or array-like
         Energy of the muon.
+    flavor: str, optional
+        Flavor of the neutrinos, 'e', 'mu' or 'tau'. If None, the spectra of
+        all the flavors are returned.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    cdef NeutrinoSpectrumPoint res
-
-    if hasattr(egam, '__len__'):
-        energies = np.array(egam)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return c_muon_decay_spectrum_array(energies, emu)
-    else:
-        res = c_muon_decay_spectrum_point(egam, emu)
-        return (res.electron, res.muon, res.tau)
+    return evaluate_neutrino_dnde(c_muon_decay_spectrum_point, egam, emu, flavor, out, weight, accumulate)
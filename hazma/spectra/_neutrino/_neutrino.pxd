@@ -1,3 +1,5 @@
+cimport cython
+
 # Structure to hold the spectrum decomposed into neutrino flavors
 cdef struct NeutrinoSpectrumPoint:
     double electron
@@ -5,4 +7,83 @@ cdef struct NeutrinoSpectrumPoint:
     double tau
 
 
-cdef NeutrinoSpectrumPoint new_neutrino_spectrum_point()
+cdef NeutrinoSpectrumPoint new_neutrino_spectrum_point() noexcept nogil
+
+# Spectra dN/dE(energy, parent_energy) of the neutrinos from a decaying
+# particle.
+ctypedef NeutrinoSpectrumPoint (*neutrino_kernel)(double, double) noexcept nogil
+
+
+cdef inline void neutrino_fill_array(
+    neutrino_kernel dnde,
+    const double[:] energies,
+    double parent_energy,
+    double[:, :] out,
+) noexcept nogil:
+    """
+    Write the spectra evaluated at `energies` into `out`, which must have
+    shape (3, len(energies)).
+    """
+    cdef NeutrinoSpectrumPoint res
+    cdef Py_ssize_t i
+    with cython.boundscheck(False), cython.wraparound(False):
+        for i in range(energies.shape[0]):
+            res = dnde(energies[i], parent_energy)
+            out[0, i] = res.electron
+            out[1, i] = res.muon
+            out[2, i] = res.tau
+
+
+cdef inline double neutrino_component(NeutrinoSpectrumPoint res, int flavor) noexcept nogil:
+    """Return the spectrum of the flavor with index 0 (e), 1 (mu) or 2 (tau)."""
+    if flavor == 0:
+        return res.electron
+    if flavor == 1:
+        return res.muon
+    return res.tau
+
+
+cdef inline void neutrino_fill_grid(
+    neutrino_kernel dnde,
+    const double[:] energies,
+    const double[:] parent_energies,
+    int flavor,
+    double weight,
+    bint accumulate,
+    double[:, :, :] out,
+) noexcept nogil:
+    """
+    Write the spectra for every pair of energies and parent energies,
+    multiplied by `weight`, into `out`. If `flavor` is negative, `out` must
+    have shape (3, len(parent_energies), len(energies)) and receives all the
+    flavors. Otherwise, it must have shape (1, len(parent_energies),
+    len(energies)) and receives the spectrum of the flavor with index
+    `flavor`. If `accumulate` is True, the weighted spectra are added to `out`
+    instead.
+    """
+    cdef NeutrinoSpectrumPoint res
+    cdef double val
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j
+    cdef int k
+    with cython.boundscheck(False), cython.wraparound(False):
+        for i in range(parent_energies.shape[0]):
+            for j in range(energies.shape[0]):
+                res = dnde(energies[j], parent_energies[i])
+                for k in range(out.shape[0]):
+                    val = weight * neutrino_component(res, k if flavor < 0 else flavor)
+                    if accumulate:
+                        out[k, i, j] += val
+                    else:
+                        out[k, i, j] = val
+
+
+cdef object evaluate_neutrino_dnde(
+    neutrino_kernel dnde,
+    energies,
+    parent_energies,
+    flavor,
+    out,
+    double weight,
+    bint accumulate,
+)
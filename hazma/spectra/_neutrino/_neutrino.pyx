@@ -1,6 +1,13 @@
+import numpy as np
+
+from hazma._utils.accumulate import check_accumulate, check_out
 from hazma.spectra._neutrino._neutrino cimport NeutrinoSpectrumPoint
 
-cdef NeutrinoSpectrumPoint new_neutrino_spectrum_point():
+# Index of each flavor in the spectra.
+_FLAVORS = {"e": 0, "mu": 1, "tau": 2}
+
+
+cdef NeutrinoSpectrumPoint new_neutrino_spectrum_point() noexcept nogil:
     cdef NeutrinoSpectrumPoint res
     res.electron = 0.0
     res.muon = 0.0
@@ -8,3 +15,64 @@ cdef NeutrinoSpectrumPoint new_neutrino_spectrum_point():
     
     return res
 
+
+cdef object evaluate_neutrino_dnde(
+    neutrino_kernel dnde,
+    energies,
+    parent_energies,
+    flavor,
+    out,
+    double weight,
+    bint accumulate,
+):
+    """
+    Evaluate the neutrino spectra for scalar or 1-dimensional energies and
+    parent energies. The result has shape ``(3,) + np.shape(parent_energies)
+    + np.shape(energies)`` if `flavor` is None and ``np.shape(parent_energies)
+    + np.shape(energies)`` otherwise.
+
+    The weighted spectra are written into `out` if it is given, or added to it
+    if `accumulate` is True, and `out` is returned. Otherwise a new array is
+    returned, or floats if both energies are scalars.
+    """
+    cdef NeutrinoSpectrumPoint res
+    cdef const double[:] es
+    cdef const double[:] ps
+    cdef double[:, :, :] grid
+    cdef int iflavor = -1
+
+    if flavor is not None:
+        if flavor not in _FLAVORS:
+            raise ValueError(f"Invalid flavor {flavor}. Use 'e', 'mu' or 'tau'.")
+        iflavor = _FLAVORS[flavor]
+
+    check_accumulate(out, accumulate)
+    if out is None and np.ndim(energies) == 0 and np.ndim(parent_energies) == 0:
+        res = dnde(energies, parent_energies)
+        if iflavor >= 0:
+            return weight * neutrino_component(res, iflavor)
+        return (weight * res.electron, weight * res.muon, weight * res.tau)
+
+    earr = np.atleast_1d(np.asarray(energies, dtype=np.float64))
+    parr = np.atleast_1d(np.asarray(parent_energies, dtype=np.float64))
+    if earr.ndim != 1 or parr.ndim != 1:
+        raise ValueError("Neutrino energies must be 0 or 1-dimensional.")
+
+    shape = np.shape(parent_energies) + np.shape(energies)
+    if iflavor < 0:
+        shape = (3,) + shape
+    if out is None:
+        out = np.empty(shape, dtype=np.float64)
+    else:
+        check_out(out, shape)
+
+    es = earr
+    ps = parr
+    grid = out[
+        slice(None) if iflavor < 0 else np.newaxis,
+        slice(None) if np.ndim(parent_energies) > 0 else np.newaxis,
+        slice(None) if np.ndim(energies) > 0 else np.newaxis,
+    ]
+    with nogil:
+        neutrino_fill_grid(dnde, es, ps, iflavor, weight, accumulate, grid)
+    return out
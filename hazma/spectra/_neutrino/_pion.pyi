@@ -1 +1 @@
-def dnde_neutrino_charged_pion(egam, epi: float): ...
+def dnde_neutrino_charged_pion(egam, epi: float, flavor=None, out=None, weight=1.0, accumulate=False): ...
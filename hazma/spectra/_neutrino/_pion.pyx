@@ -9,17 +9,30 @@ The charged pion decays through:
 import numpy as np
 cimport numpy as np
 import cython
-from libc.math cimport log, sqrt, fabs, fmax, fmin
+from libc.math cimport exp, log, sqrt, fabs, fmax, fmin, M_LN10
 from libc.float cimport DBL_EPSILON
-from scipy.integrate import quad
 
 from hazma.spectra._neutrino._muon cimport c_muon_decay_spectrum_point 
 from hazma.spectra._neutrino._neutrino cimport NeutrinoSpectrumPoint, new_neutrino_spectrum_point
+from hazma.spectra._neutrino._neutrino cimport neutrino_fill_array
+from hazma.spectra._neutrino._neutrino cimport evaluate_neutrino_dnde
 from hazma._utils.boost cimport boost_delta_function, boost_gamma, boost_beta
 from hazma._utils.kinematics cimport two_body_energy
+from hazma._utils.quadrature cimport gauss_legendre
 
 include "../../_utils/constants.pxd"  
 
+# Energy of the muon in the pion rest frame.
+cdef double EMU_PIRF = two_body_energy(MASS_PI, MASS_MU, 0.0)
+cdef double BETA_MU_PIRF = sqrt(1.0 - (MASS_MU / EMU_PIRF) ** 2)
+# Maximum energy of the neutrinos from the muon in the muon rest frame.
+cdef double ENU_MAX_MURF = 0.5 * MASS_MU * (1.0 - (MASS_E / MASS_MU) ** 2)
+# Maximum energy of the neutrinos from the muon in the pion rest frame, and
+# energy above which the bounds of the boost integral of the muon spectrum
+# start being cut off by the endpoint of the spectrum.
+cdef double ENU_MAX_PIRF = EMU_PIRF / MASS_MU * (1.0 + BETA_MU_PIRF) * ENU_MAX_MURF
+cdef double LOG_ENU_KINK_PIRF = log(EMU_PIRF / MASS_MU * (1.0 - BETA_MU_PIRF) * ENU_MAX_MURF)
+
 
 # ===================================================================
 # ---- Pure Cython API functions ------------------------------------
@@ -28,21 +41,18 @@ include "../../_utils/constants.pxd"
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double c_integrand_dnde_mu_numu(double e1, int gen):
+cdef double c_integrand_dnde_mu_numu(double log_e1, void* args) noexcept nogil:
     """
-    Compute the integrand of boost integral for pi -> mu + numu.
+    Compute the integrand of boost integral for pi -> mu + numu in terms of
+    the logarithm of the neutrino energy.
 
     Parameters
     ----------
-    e1: double
-        Neutrino energy in original frame.
-    e2: double
-        Neutrino energy in boosted frame.
-    epi: double
-        Energy of the pion.
-    gen: int
-        If 1, electron-neutrino contribution is returned. If 2,
-        muon-neutrino contribution is returned.
+    log_e1: double
+        Logarithm of the neutrino energy in original frame.
+    args: void*
+        Pointer to an int. If 1, electron-neutrino contribution is returned.
+        If 2, muon-neutrino contribution is returned.
 
     Returns
     -------
@@ -50,22 +60,21 @@ cdef double c_integrand_dnde_mu_numu(double e1, int gen):
         The integrand for the boost integral.
     """
     cdef:
-        double emu
+        int gen = (<int*>args)[0]
         NeutrinoSpectrumPoint res
 
-    emu = two_body_energy(MASS_PI, MASS_MU, 0.0)
-    res = c_muon_decay_spectrum_point(e1, emu)
+    res = c_muon_decay_spectrum_point(exp(log_e1), EMU_PIRF)
 
     if gen == 1:
-        return res.electron / e1
+        return res.electron
     else:
-        return res.muon / e1
+        return res.muon
 
 
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef NeutrinoSpectrumPoint c_dnde_mu_numu_point(double enu, double epi):
+cdef NeutrinoSpectrumPoint c_dnde_mu_numu_point(double enu, double epi) noexcept nogil:
     """
     Compute the boosted charged pion decay neutrino spectrum from pi -> mu + numu.
 
@@ -88,8 +97,10 @@ cdef NeutrinoSpectrumPoint c_dnde_mu_numu_point(double enu, double epi):
         double gamma
         double delta_e
         double delta_m
-        double muon_contrib
+        double muon_contrib_nue
+        double muon_contrib_numu
         double k
+        int gen
         # double ep, em
         double emin, emax
         double pre
@@ -119,14 +130,21 @@ cdef NeutrinoSpectrumPoint c_dnde_mu_numu_point(double enu, double epi):
 
         # Contribution from pi -> nu_mu + (mu -> nu_mu + nu_e + e)
         emin = fmax(0.0, enu * gamma * (1.0 - beta))
-        emax = enu * gamma * (1.0 + beta)
-
-        muon_contrib_nue = pre * BR_PI_TO_MU_NUMU * quad(
-                c_integrand_dnde_mu_numu, emin, emax, args=(1,)
-        )[0]
-        muon_contrib_numu = pre * BR_PI_TO_MU_NUMU * quad(
-                c_integrand_dnde_mu_numu, emin, emax, args=(2,)
-        )[0]
+        emax = fmin(enu * gamma * (1.0 + beta), ENU_MAX_PIRF)
+
+        muon_contrib_nue = 0.0
+        muon_contrib_numu = 0.0
+        if 0.0 < emin < emax:
+            gen = 1
+            muon_contrib_nue = pre * BR_PI_TO_MU_NUMU * gauss_legendre(
+                c_integrand_dnde_mu_numu, &gen, log(emin), log(emax),
+                &LOG_ENU_KINK_PIRF, 1, M_LN10,
+            )
+            gen = 2
+            muon_contrib_numu = pre * BR_PI_TO_MU_NUMU * gauss_legendre(
+                c_integrand_dnde_mu_numu, &gen, log(emin), log(emax),
+                &LOG_ENU_KINK_PIRF, 1, M_LN10,
+            )
 
         result.electron = delta_e + muon_contrib_nue  # electron-neutrino
         result.muon = delta_m + muon_contrib_numu
@@ -137,7 +155,7 @@ cdef NeutrinoSpectrumPoint c_dnde_mu_numu_point(double enu, double epi):
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef NeutrinoSpectrumPoint c_dnde_e_nue_point(double enu, double epi):
+cdef NeutrinoSpectrumPoint c_dnde_e_nue_point(double enu, double epi) noexcept nogil:
     """
     Compute the boosted charged pion decay neutrino spectrum from pi -> e + nue.
 
@@ -172,7 +190,7 @@ cdef NeutrinoSpectrumPoint c_dnde_e_nue_point(double enu, double epi):
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef NeutrinoSpectrumPoint c_charged_pion_decay_spectrum_point(double enu, double epi):
+cdef NeutrinoSpectrumPoint c_charged_pion_decay_spectrum_point(double enu, double epi) noexcept nogil:
     """
     Compute the boosted charged pion decay spectrum into a single neutrino (either an
     electron or muon neutrino) given the neutrino energy and pion energy.
@@ -205,7 +223,7 @@ cdef NeutrinoSpectrumPoint c_charged_pion_decay_spectrum_point(double enu, doubl
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef np.ndarray[np.float64_t,ndim=2] c_charged_pion_decay_spectrum_array(double[:] energies, double epi):
+cdef np.ndarray c_charged_pion_decay_spectrum_array(const double[:] energies, double epi):
     """
     Compute the boosted charged-pion decay spectrum into electron-,muon- and tau-neutrinos
     given array of neutrino energies and pion energy.
@@ -225,17 +243,10 @@ cdef np.ndarray[np.float64_t,ndim=2] c_charged_pion_decay_spectrum_array(double[
         `dnde[0]`, the muon-neutrino spectrum in `dnde[1]` and tau-neutrino
         spectrum in `dnde[2]`.
     """
-    cdef NeutrinoSpectrumPoint res
-    cdef int npts = energies.shape[0]
-    spec = np.zeros((3,npts), dtype=np.float64)
-    cdef double[:,:] spec_view = spec
-
-    for i in range(npts):
-        res = c_charged_pion_decay_spectrum_point(energies[i], epi)
-        spec_view[0][i] = res.electron
-        spec_view[1][i] = res.muon
-        spec_view[2][i] = res.tau
-
+    spec = np.empty((3, energies.shape[0]), dtype=np.float64)
+    cdef double[:, :] out = spec
+    with nogil:
+        neutrino_fill_array(c_charged_pion_decay_spectrum_point, energies, epi, out)
     return spec
 
 
@@ -243,7 +254,7 @@ cdef np.ndarray[np.float64_t,ndim=2] c_charged_pion_decay_spectrum_array(double[
 # ---- Python API ---------------------------------------------------
 # ===================================================================
 
-def dnde_neutrino_charged_pion(egam, double epi):
+def dnde_neutrino_charged_pion(egam, epi, flavor=None, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the neutrino spectrum dN/dE from the decay of a charged pion into 
     e + nu_e and mu + nu_e.
@@ -252,16 +263,16 @@ def dnde_neutrino_charged_pion(egam, double epi):
     ----------
     egam: float or array-like
         Photon energy.
-    epi: float 
+    epi: float or array-like
         Energy of the charged pion.
+    flavor: str, optional
+        Flavor of the neutrinos, 'e', 'mu' or 'tau'. If None, the spectra of
+        all the flavors are returned.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    cdef NeutrinoSpectrumPoint res
-    if hasattr(egam, '__len__'):
-        energies = np.array(egam)
-        assert len(energies.shape) == 1, "Neutrino energies must be 0 or 1-dimensional."
-        return c_charged_pion_decay_spectrum_array(energies, epi)
-    else:
-        res = c_charged_pion_decay_spectrum_point(egam, epi)
-        return (res.electron, res.muon, res.tau)
-
-
+    return evaluate_neutrino_dnde(c_charged_pion_decay_spectrum_point, egam, epi, flavor, out, weight, accumulate)
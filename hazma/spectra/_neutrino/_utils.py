@@ -5,11 +5,14 @@ import numpy.typing as npt
 import pathlib
 from scipy import interpolate
 
+from hazma._utils.accumulate import store
+from hazma._utils.tables import load_table
+
 RealArray = npt.NDArray[np.float64]
 
 
 def load_interp(fname, k=2):
-    data = np.loadtxt(
+    data = load_table(
         pathlib.Path(__file__).absolute().parent.joinpath("data", fname),
         delimiter=",",
     ).T
@@ -80,38 +83,75 @@ def _dnde_neutrino(
     )
 
 
+def _dnde_neutrino_grid(
+    *,
+    neutrino_energy: RealArray,
+    parent_energy: RealArray,
+    parent_mass: float,
+    interp: interpolate.InterpolatedUnivariateSpline,
+) -> RealArray:
+    """
+    Compute the spectrum for every pair of neutrino and parent energies. The
+    result has shape (len(parent_energy), len(neutrino_energy)).
+    """
+    e = neutrino_energy[np.newaxis, :]
+    ep = parent_energy[:, np.newaxis]
+
+    eps = np.finfo(neutrino_energy.dtype).eps
+    boosted = ep - parent_mass >= eps
+    gamma = np.where(boosted, ep / parent_mass, 2.0)
+    beta = np.sqrt(1.0 - gamma**-2)
+
+    # The spline is integrated as zero outside of its knots.
+    knots = interp.get_knots()
+    antiderivative = interp.antiderivative()
+    lb = np.clip(gamma * (e - beta * e), knots[0], knots[-1])
+    ub = np.clip(gamma * (e + beta * e), knots[0], knots[-1])
+    dnde = (antiderivative(ub) - antiderivative(lb)) / (2 * beta * gamma)
+
+    rest = np.broadcast_to(interp(neutrino_energy) * neutrino_energy, dnde.shape)
+    dnde = np.where(boosted, dnde, rest)
+    return np.where(ep >= parent_mass, dnde, 0.0)
+
+
 def dnde_neutrino(
     *,
     neutrino_energy: Union[RealArray, float],
-    parent_energy: float,
+    parent_energy: Union[RealArray, float],
     parent_mass: float,
     interp_e: interpolate.InterpolatedUnivariateSpline,
     interp_mu: interpolate.InterpolatedUnivariateSpline,
     flavor: Optional[str] = None,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
 
     scalar = np.isscalar(neutrino_energy)
     enu = np.atleast_1d(neutrino_energy).astype(np.float64)
-    dnde = np.zeros((3, *enu.shape), dtype=enu.dtype)
 
-    if flavor == "tau":
-        return dnde[2]
+    if np.ndim(parent_energy) > 0:
+        # Spectra for all the parent energies at once.
+        parent_energy = np.asarray(parent_energy, dtype=np.float64)
+        dnde_fn = _dnde_neutrino_grid
+        dnde = np.zeros((3, len(parent_energy), *enu.shape), dtype=enu.dtype)
+    else:
+        dnde_fn = _dnde_neutrino
+        dnde = np.zeros((3, *enu.shape), dtype=enu.dtype)
 
     for i, flav, inter in [(0, "e", interp_e), (1, "mu", interp_mu)]:
         if not flavor or flavor == flav:
-            dnde_ = _dnde_neutrino(
+            dnde[i] = dnde_fn(
                 neutrino_energy=enu,
                 parent_energy=parent_energy,
                 parent_mass=parent_mass,
                 interp=inter,
             )
 
-            if flavor == flav:
-                return dnde_
-            else:
-                dnde[i] = dnde_
-
     if scalar:
-        return dnde[..., 0]
+        dnde = dnde[..., 0]
+
+    if flavor is not None:
+        dnde = dnde[{"e": 0, "mu": 1, "tau": 2}[flavor]]
 
-    return dnde
+    return store(dnde, out, weight, accumulate)
@@ -1,10 +1,14 @@
 """
 Module for computing decay spectra from a muon and light mesons.
 
+All spectra accept an array of parent energies, in which case the spectra for
+all pairs of parent and photon energies are computed at once and returned with
+shape (len(parent_energies), len(photon_energies)).
+
 @author: Logan Morrison and Adam Coogan
 """
 
-from typing import List, overload
+from typing import List, Optional, overload
 from warnings import warn
 
 import numpy as np
@@ -23,15 +27,34 @@ from hazma.utils import RealArray, RealOrRealArray
 
 
 @overload
-def dnde_photon_muon(photon_energies: float, muon_energy: float) -> float: ...
+def dnde_photon_muon(
+    photon_energies: float,
+    muon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
-def dnde_photon_muon(photon_energies: RealArray, muon_energy: float) -> RealArray: ...
+def dnde_photon_muon(
+    photon_energies: RealArray,
+    muon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> RealArray: ...
 
 
 def dnde_photon_muon(
-    photon_energies: RealOrRealArray, muon_energy: float
+    photon_energies: RealOrRealArray,
+    muon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray decay spectrum from the muon decay
     :math:`\mu^{\pm} \to e^{\pm} \nu_{e} \nu_{\mu}`.
@@ -42,6 +65,14 @@ def dnde_photon_muon(
         Photon energy(ies) in laboratory frame.
     muon_energy : double
         Muon energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -66,21 +97,40 @@ def dnde_photon_muon(
         muon_energy = 1000.
         spectra.dnde_photon_muon(photon_energies, muon_energy)
     """
-    return _muon.dnde_photon(photon_energies, muon_energy)
+    return _muon.dnde_photon(
+        photon_energies, muon_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_neutral_pion(photon_energies: float, pion_energy: float) -> float: ...
+def dnde_photon_neutral_pion(
+    photon_energies: float,
+    pion_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_neutral_pion(
-    photon_energies: RealArray, pion_energy: float
+    photon_energies: RealArray,
+    pion_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_neutral_pion(
-    photon_energies: RealOrRealArray, pion_energy: float
+    photon_energies: RealOrRealArray,
+    pion_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray spectrum from the neutral pion decay
     :math:`\pi^{0} \to \gamma \gamma`.
@@ -89,8 +139,16 @@ def dnde_photon_neutral_pion(
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    pion_energy : float
+    pion_energy : float or numpy.ndarray
         Neutral pion energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -115,21 +173,40 @@ def dnde_photon_neutral_pion(
         pion_energy = 1000.
         spectra.dnde_photon_neutral_pion(photon_energies, pion_energy)
     """
-    return _pion.dnde_photon_neutral_pion(photon_energies, pion_energy)
+    return _pion.dnde_photon_neutral_pion(
+        photon_energies, pion_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_charged_pion(photon_energy: float, pion_energy: float) -> float: ...
+def dnde_photon_charged_pion(
+    photon_energy: float,
+    pion_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_charged_pion(
-    photon_energy: RealArray, pion_energy: float
+    photon_energy: RealArray,
+    pion_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_charged_pion(
-    photon_energy: RealOrRealArray, pion_energy: float
+    photon_energy: RealOrRealArray,
+    pion_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray spectrum from the charged pion decay :math:`\pi^{\pm}
     \to \mu^{\pm} \nu_{\mu} \to e^{\pm} \nu_{e} \nu_{\mu} \gamma`.
@@ -140,6 +217,14 @@ def dnde_photon_charged_pion(
         Photon energy(ies) in laboratory frame.
     pion_energy : double
         Charged pion energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -163,21 +248,40 @@ def dnde_photon_charged_pion(
         pion_energy = 1000.
         spectra.dnde_photon_charged_pion(photon_energies, pion_energy)
     """
-    return _pion.dnde_photon_charged_pion(photon_energy, pion_energy)
+    return _pion.dnde_photon_charged_pion(
+        photon_energy, pion_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_charged_kaon(photon_energy: float, kaon_energy: float) -> float: ...
+def dnde_photon_charged_kaon(
+    photon_energy: float,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_charged_kaon(
-    photon_energy: RealArray, kaon_energy: float
+    photon_energy: RealArray,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_charged_kaon(
-    photon_energy: RealOrRealArray, kaon_energy: float
+    photon_energy: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray spectrum from charged kaon decay into various final states.
 
@@ -185,8 +289,16 @@ def dnde_photon_charged_kaon(
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    kaon_energy : float
+    kaon_energy : float or numpy.ndarray
         Charged kaon energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -227,21 +339,40 @@ def dnde_photon_charged_kaon(
         kaon_energy = 1000.
         spectra.dnde_photon_charged_kaon(photon_energies, kaon_energy)
     """
-    return _kaon.dnde_photon_charged_kaon(photon_energy, kaon_energy)
+    return _kaon.dnde_photon_charged_kaon(
+        photon_energy, kaon_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_short_kaon(photon_energy: float, kaon_energy: float) -> float: ...
+def dnde_photon_short_kaon(
+    photon_energy: float,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_short_kaon(
-    photon_energy: RealArray, kaon_energy: float
+    photon_energy: RealArray,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_short_kaon(
-    photon_energy: RealOrRealArray, kaon_energy: float
+    photon_energy: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray spectrum from short kaon decay into various final states.
 
@@ -249,8 +380,16 @@ def dnde_photon_short_kaon(
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    kaon_energy : float
+    kaon_energy : float or numpy.ndarray
         Charged kaon energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -283,21 +422,40 @@ def dnde_photon_short_kaon(
         kaon_energy = 1000.
         spectra.dnde_photon_short_kaon(photon_energies, kaon_energy)
     """
-    return _kaon.dnde_photon_short_kaon(photon_energy, kaon_energy)
+    return _kaon.dnde_photon_short_kaon(
+        photon_energy, kaon_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_long_kaon(photon_energy: float, kaon_energy: float) -> float: ...
+def dnde_photon_long_kaon(
+    photon_energy: float,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_long_kaon(
-    photon_energy: RealArray, kaon_energy: float
+    photon_energy: RealArray,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_long_kaon(
-    photon_energy: RealOrRealArray, kaon_energy: float
+    photon_energy: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray spectrum from long kaon decay into various final
     states.
@@ -306,8 +464,16 @@ def dnde_photon_long_kaon(
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    kaon_energy : float
+    kaon_energy : float or numpy.ndarray
         Charged kaon energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -344,7 +510,9 @@ def dnde_photon_long_kaon(
     .. math:: K_{L} \to \pi^{+} \pi^{-} \pi^{0}
 
     """
-    return _kaon.dnde_photon_long_kaon(photon_energy, kaon_energy)
+    return _kaon.dnde_photon_long_kaon(
+        photon_energy, kaon_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 def electron(photon_energies, _: float):
@@ -371,17 +539,34 @@ def electron(photon_energies, _: float):
 
 
 @overload
-def dnde_photon_neutral_rho(photon_energies: float, rho_energy: float) -> float: ...
+def dnde_photon_neutral_rho(
+    photon_energies: float,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_neutral_rho(
-    photon_energies: RealArray, rho_energy: float
+    photon_energies: RealArray,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_neutral_rho(
-    photon_energies: RealOrRealArray, rho_energy: float
+    photon_energies: RealOrRealArray,
+    rho_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray decay spectrum from the charged rho decay
     :math:`\rho \to \pi^{\pm} + \pi^{\mp}`.
@@ -392,6 +577,14 @@ def dnde_photon_neutral_rho(
         Photon energy(ies) in laboratory frame.
     rho_energy : double
         Rho energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -399,21 +592,40 @@ def dnde_photon_neutral_rho(
         List of gamma ray spectrum values, dNdE, evaluated at
         ``photon_energies`` given rho energy ``rho_energy``.
     """
-    return _rho.dnde_photon_neutral_rho(photon_energies, rho_energy)
+    return _rho.dnde_photon_neutral_rho(
+        photon_energies, rho_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_charged_rho(photon_energies: float, rho_energy: float) -> float: ...
+def dnde_photon_charged_rho(
+    photon_energies: float,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_charged_rho(
-    photon_energies: RealArray, rho_energy: float
+    photon_energies: RealArray,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_charged_rho(
-    photon_energies: RealOrRealArray, rho_energy: float
+    photon_energies: RealOrRealArray,
+    rho_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray decay spectrum from the rho decay
     :math:`\rho^{\pm} \to \pi^{\pm} + \pi^{0}`.
@@ -424,6 +636,14 @@ def dnde_photon_charged_rho(
         Photon energy(ies) in laboratory frame.
     rho_energy : double
         Rho energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -431,19 +651,40 @@ def dnde_photon_charged_rho(
         List of gamma ray spectrum values, dNdE, evaluated at
         ``photon_energies`` given rho energy ``rho_energy``.
     """
-    return _rho.dnde_photon_charged_rho(photon_energies, rho_energy)
+    return _rho.dnde_photon_charged_rho(
+        photon_energies, rho_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_eta(photon_energy: float, eta_energy: float) -> float: ...
+def dnde_photon_eta(
+    photon_energy: float,
+    eta_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
-def dnde_photon_eta(photon_energy: RealArray, eta_energy: float) -> RealArray: ...
+def dnde_photon_eta(
+    photon_energy: RealArray,
+    eta_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> RealArray: ...
 
 
 def dnde_photon_eta(
-    photon_energy: RealOrRealArray, eta_energy: float
+    photon_energy: RealOrRealArray,
+    eta_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray decay spectrum from the decay of the eta
 
@@ -453,6 +694,14 @@ def dnde_photon_eta(
         Photon energy(ies) in laboratory frame.
     eta_energy : double
         Eta energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -460,19 +709,40 @@ def dnde_photon_eta(
         Array of gamma ray spectrum values, dNdE, evaluated at
         ``photon_energy`` given eta energy ``eta_energy``.
     """
-    return _eta.dnde_photon_eta(photon_energy, eta_energy)
+    return _eta.dnde_photon_eta(
+        photon_energy, eta_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_omega(photon_energy: float, omega_energy: float) -> float: ...
+def dnde_photon_omega(
+    photon_energy: float,
+    omega_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
-def dnde_photon_omega(photon_energy: RealArray, omega_energy: float) -> RealArray: ...
+def dnde_photon_omega(
+    photon_energy: RealArray,
+    omega_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> RealArray: ...
 
 
 def dnde_photon_omega(
-    photon_energy: RealOrRealArray, omega_energy: float
+    photon_energy: RealOrRealArray,
+    omega_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray decay spectrum from the decay of the omega.
 
@@ -482,6 +752,14 @@ def dnde_photon_omega(
         Photon energy(ies) in laboratory frame.
     omega_energy : double
         Omega energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -489,21 +767,40 @@ def dnde_photon_omega(
         Array of gamma ray spectrum values, dNdE, evaluated at
         ``photon_energy`` given omega energy ``omega_energy``.
     """
-    return _omega.dnde_photon_omega(photon_energy, omega_energy)
+    return _omega.dnde_photon_omega(
+        photon_energy, omega_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_eta_prime(photon_energy: float, eta_prime_energy: float) -> float: ...
+def dnde_photon_eta_prime(
+    photon_energy: float,
+    eta_prime_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_photon_eta_prime(
-    photon_energy: RealArray, eta_prime_energy: float
+    photon_energy: RealArray,
+    eta_prime_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_photon_eta_prime(
-    photon_energy: RealOrRealArray, eta_prime_energy: float
+    photon_energy: RealOrRealArray,
+    eta_prime_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray decay spectrum from the decay of the omega.
 
@@ -513,6 +810,14 @@ def dnde_photon_eta_prime(
         Photon energy(ies) in laboratory frame.
     eta_prime_energy : double
         Eta' energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -520,19 +825,40 @@ def dnde_photon_eta_prime(
         Array of gamma ray spectrum values, dNdE, evaluated at
         ``photon_energy`` given eta' energy ``eta_prime_energy``.
     """
-    return _eta_prime.dnde_photon_eta_prime(photon_energy, eta_prime_energy)
+    return _eta_prime.dnde_photon_eta_prime(
+        photon_energy, eta_prime_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
-def dnde_photon_phi(photon_energy: float, phi_energy: float) -> float: ...
+def dnde_photon_phi(
+    photon_energy: float,
+    phi_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
-def dnde_photon_phi(photon_energy: RealArray, phi_energy: float) -> RealArray: ...
+def dnde_photon_phi(
+    photon_energy: RealArray,
+    phi_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> RealArray: ...
 
 
 def dnde_photon_phi(
-    photon_energy: RealOrRealArray, phi_energy: float
+    photon_energy: RealOrRealArray,
+    phi_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     r"""Compute gamma-ray decay spectrum from the decay of the phi(1020).
 
@@ -542,6 +868,14 @@ def dnde_photon_phi(
         Photon energy(ies) in laboratory frame.
     phi_energy : double
         Phi energy in laboratory frame.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -549,4 +883,6 @@ def dnde_photon_phi(
         Array of gamma ray spectrum values, dNdE, evaluated at
         ``photon_energy`` given phi energy ``phi_energy``.
     """
-    return _phi.dnde_photon_phi(photon_energy, phi_energy)
+    return _phi.dnde_photon_phi(
+        photon_energy, phi_energy, out=out, weight=weight, accumulate=accumulate
+    )
@@ -1 +1 @@
-def dnde_photon_eta(photon_energy, eta_energy): ...
+def dnde_photon_eta(photon_energy, eta_energy, out=None, weight=1.0, accumulate=False): ...
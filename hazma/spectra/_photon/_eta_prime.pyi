@@ -1 +1 @@
-def dnde_photon_eta_prime(photon_energy, eta_prime_energy): ...
+def dnde_photon_eta_prime(photon_energy, eta_prime_energy, out=None, weight=1.0, accumulate=False): ...
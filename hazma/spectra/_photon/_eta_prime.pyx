@@ -10,8 +10,11 @@ from libc.math cimport sqrt
 from libc.float cimport DBL_EPSILON
 
 from hazma.spectra._photon.path import DATA_DIR
+from hazma._utils.tables import load_table
 from hazma._utils.boost cimport boost_beta, boost_gamma, boost_delta_function
 from hazma._utils.boost cimport boost_integrate_linear_interp
+from hazma._utils.interp cimport interp_linear
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
 
 include "../../_utils/constants.pxd"
 
@@ -20,14 +23,14 @@ include "../../_utils/constants.pxd"
 # ============================================================================
 
 # Format: energy, pi_pi_eta, rho0_a, pi0_pi0_eta, omega_a, a_a, pi_rho
-eta_prime_data = np.loadtxt(
+eta_prime_data = load_table(
     DATA_DIR.joinpath("eta_prime_photon.csv"),
     delimiter=","
 ).T
-eta_prime_data_energies = eta_prime_data[0]
-eta_prime_data_dnde = np.sum(eta_prime_data[1:], axis=0)
-eta_prime_data_emin = eta_prime_data_energies[0]
-eta_prime_data_emax = eta_prime_data_energies[-1]
+cdef const double[:] eta_prime_data_energies = eta_prime_data[0]
+cdef const double[:] eta_prime_data_dnde = np.sum(eta_prime_data[1:], axis=0)
+cdef double eta_prime_data_emin = eta_prime_data[0, 0]
+cdef double eta_prime_data_emax = eta_prime_data[0, -1]
 
 # ============================================================================
 # ---- Charged Kaon ----------------------------------------------------------
@@ -36,7 +39,7 @@ eta_prime_data_emax = eta_prime_data_energies[-1]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_eta_prime_rest_frame(double photon_energy):
+cdef double dnde_photon_eta_prime_rest_frame(double photon_energy) noexcept nogil:
     cdef double ret = 0.0
 
     if photon_energy > eta_prime_data_emax:
@@ -45,7 +48,7 @@ cdef double dnde_photon_eta_prime_rest_frame(double photon_energy):
     if photon_energy < eta_prime_data_emin:
         return eta_prime_data_dnde[0] * eta_prime_data_emin / photon_energy
     else:
-        return np.interp(photon_energy, eta_prime_data_energies, eta_prime_data_dnde)
+        return interp_linear(photon_energy, eta_prime_data_energies, eta_prime_data_dnde)
 
 
 # @cython.boundscheck(False)
@@ -58,7 +61,7 @@ cdef double dnde_photon_eta_prime_rest_frame(double photon_energy):
 # @cython.boundscheck(False)
 # @cython.wraparound(False)
 # @cython.cdivision(True)
-# cdef double dnde_photon_eta_prime_point(double photon_energy, double eta_prime_energy):
+# cdef double dnde_photon_eta_prime_point(double photon_energy, double eta_prime_energy) noexcept nogil:
 #     cdef double gamma
 #     cdef double beta
 #     cdef double pre
@@ -89,7 +92,7 @@ cdef double dnde_photon_eta_prime_rest_frame(double photon_energy):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_eta_prime_point(double photon_energy, double eta_prime_energy):
+cdef double dnde_photon_eta_prime_point(double photon_energy, double eta_prime_energy) noexcept nogil:
     cdef double gamma
     cdef double beta
     cdef double res
@@ -108,25 +111,16 @@ cdef double dnde_photon_eta_prime_point(double photon_energy, double eta_prime_e
     return res 
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_eta_prime_array(double[:] photon_energy, double eta_prime_energy):
-    cdef int npts = photon_energy.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(photon_energy)
-    for i in range(npts):
-        spec[i] = dnde_photon_eta_prime_point(photon_energy[i], eta_prime_energy)
+cdef np.ndarray dnde_photon_eta_prime_array(const double[:] photon_energy, double eta_prime_energy):
+    spec = np.empty(photon_energy.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_eta_prime_point, photon_energy, eta_prime_energy, out)
     return spec
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_photon_eta_prime(photon_energy, eta_prime_energy):
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_eta_prime_array(energies, eta_prime_energy)
-    else:
-        return dnde_photon_eta_prime_point(photon_energy, eta_prime_energy)
-
+def dnde_photon_eta_prime(photon_energy, eta_prime_energy, out=None, double weight=1.0, bint accumulate=False):
+    return evaluate_dnde(dnde_photon_eta_prime_point, photon_energy, eta_prime_energy, out, weight, accumulate)
@@ -1,3 +1,3 @@
-def dnde_photon_charged_kaon(photon_energy, kaon_energy): ...
-def dnde_photon_long_kaon(photon_energy, kaon_energy): ...
-def dnde_photon_short_kaon(photon_energy, kaon_energy): ...
+def dnde_photon_charged_kaon(photon_energy, kaon_energy, out=None, weight=1.0, accumulate=False): ...
+def dnde_photon_long_kaon(photon_energy, kaon_energy, out=None, weight=1.0, accumulate=False): ...
+def dnde_photon_short_kaon(photon_energy, kaon_energy, out=None, weight=1.0, accumulate=False): ...
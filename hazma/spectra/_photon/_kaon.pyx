@@ -54,8 +54,11 @@ from libc.math cimport sqrt
 from libc.float cimport DBL_EPSILON
 
 from hazma.spectra._photon.path import DATA_DIR
+from hazma._utils.tables import load_table
 from hazma._utils.boost cimport boost_beta, boost_gamma, boost_delta_function
 from hazma._utils.boost cimport boost_integrate_linear_interp
+from hazma._utils.interp cimport interp_linear
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
 
 include "../../_utils/constants.pxd"
 
@@ -65,11 +68,11 @@ include "../../_utils/constants.pxd"
 
 # Format: energy, 1:mu_nu, 2:pi_pi0, 3:pi_pi_pi, 4:pi0_e_nu, 5:pi0_mu_nu, 
 #                 6:pi_pi0_pi0, 7:e_nu
-charged_kaon_data = np.loadtxt(
+charged_kaon_data = load_table(
     DATA_DIR.joinpath("charged_kaon_photon.csv"),
     delimiter=","
 ).T
-charged_kaon_data_energies = charged_kaon_data[0]
+cdef const double[:] charged_kaon_data_energies = charged_kaon_data[0]
 # charged_kaon_data_mu_nu = charged_kaon_data[1]
 # charged_kaon_data_pi_pi0 = charged_kaon_data[2]
 # charged_kaon_data_pi_pi_pi = charged_kaon_data[3]
@@ -77,45 +80,45 @@ charged_kaon_data_energies = charged_kaon_data[0]
 # charged_kaon_data_pi0_mu_nu = charged_kaon_data[5]
 # charged_kaon_data_pi_pi0_pi0 = charged_kaon_data[6]
 # charged_kaon_data_e_nu = charged_kaon_data[7]
-charged_kaon_data_dnde = np.sum(charged_kaon_data[1:], axis=0)
-charged_kaon_data_emin = charged_kaon_data_energies[0]
-charged_kaon_data_emax = charged_kaon_data_energies[-1]
+cdef const double[:] charged_kaon_data_dnde = np.sum(charged_kaon_data[1:], axis=0)
+cdef double charged_kaon_data_emin = charged_kaon_data[0, 0]
+cdef double charged_kaon_data_emax = charged_kaon_data[0, -1]
 
 # format: energy, pi_pi, pi0_pi0
 # missing: a_a
-short_kaon_data = np.loadtxt(
+short_kaon_data = load_table(
     DATA_DIR.joinpath("short_kaon_photon.csv"),
     delimiter=","
 ).T
-short_kaon_data_energies = short_kaon_data[0]
+cdef const double[:] short_kaon_data_energies = short_kaon_data[0]
 # short_kaon_data_pi_pi = short_kaon_data[1]
 # short_kaon_data_pi0_pi0 = short_kaon_data[2]
-short_kaon_data_dnde = np.sum(short_kaon_data[1:], axis=0)
-short_kaon_data_emin = short_kaon_data_energies[0]
-short_kaon_data_emax = short_kaon_data_energies[-1]
+cdef const double[:] short_kaon_data_dnde = np.sum(short_kaon_data[1:], axis=0)
+cdef double short_kaon_data_emin = short_kaon_data[0, 0]
+cdef double short_kaon_data_emax = short_kaon_data[0, -1]
 
 # format: energy, pi0_pi0_pi0, pi_pi_pi0, pi_e_nu, pi_mu_nu, pi_pi, pi0_pi0
 # missing: a_a
-long_kaon_data = np.loadtxt(
+long_kaon_data = load_table(
     DATA_DIR.joinpath("long_kaon_photon.csv"),
     delimiter=","
 ).T
-long_kaon_data_energies = long_kaon_data[0]
+cdef const double[:] long_kaon_data_energies = long_kaon_data[0]
 # long_kaon_data_pi0_pi0_pi0 = long_kaon_data[1]
 # long_kaon_data_pi_pi_pi0 = long_kaon_data[2]
 # long_kaon_data_pi_e_nu = long_kaon_data[3]
 # long_kaon_data_pi_mu_nu = long_kaon_data[4]
 # long_kaon_data_pi_pi = long_kaon_data[5]
 # long_kaon_data_pi0_pi0 = long_kaon_data[6]
-long_kaon_data_dnde = np.sum(long_kaon_data[1:], axis=0)
-long_kaon_data_emin = long_kaon_data_energies[0]
-long_kaon_data_emax = long_kaon_data_energies[-1]
+cdef const double[:] long_kaon_data_dnde = np.sum(long_kaon_data[1:], axis=0)
+cdef double long_kaon_data_emin = long_kaon_data[0, 0]
+cdef double long_kaon_data_emax = long_kaon_data[0, -1]
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double kaon_interp_spec(double photon_energy, double[:] energies, double[:] dnde, double emin, double emax):
+cdef double kaon_interp_spec(double photon_energy, const double[:] energies, const double[:] dnde, double emin, double emax) noexcept nogil:
     cdef double ret = 0.0
 
     if photon_energy > emax:
@@ -124,7 +127,7 @@ cdef double kaon_interp_spec(double photon_energy, double[:] energies, double[:]
     if photon_energy < emin:
         return dnde[0] * emin / photon_energy
     else:
-        return np.interp(photon_energy, energies, dnde)
+        return interp_linear(photon_energy, energies, dnde)
 
 # ============================================================================
 # ---- Charged Kaon ----------------------------------------------------------
@@ -133,7 +136,7 @@ cdef double kaon_interp_spec(double photon_energy, double[:] energies, double[:]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_charged_kaon_rest_frame(double photon_energy):
+cdef double dnde_photon_charged_kaon_rest_frame(double photon_energy) noexcept nogil:
     return kaon_interp_spec(
         photon_energy,
         charged_kaon_data_energies,
@@ -179,7 +182,7 @@ cdef double dnde_photon_charged_kaon_rest_frame(double photon_energy):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_charged_kaon_point(double photon_energy, double kaon_energy):
+cdef double dnde_photon_charged_kaon_point(double photon_energy, double kaon_energy) noexcept nogil:
     cdef double gamma
     cdef double beta
     cdef double res
@@ -196,36 +199,34 @@ cdef double dnde_photon_charged_kaon_point(double photon_energy, double kaon_ene
     return res 
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_charged_kaon_array(double[:] photon_energy, double kaon_energy):
-    cdef int npts = photon_energy.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(photon_energy)
-    for i in range(npts):
-        spec[i] = dnde_photon_charged_kaon_point(photon_energy[i], kaon_energy)
+cdef np.ndarray dnde_photon_charged_kaon_array(const double[:] photon_energy, double kaon_energy):
+    spec = np.empty(photon_energy.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_charged_kaon_point, photon_energy, kaon_energy, out)
     return spec
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_photon_charged_kaon(photon_energy, kaon_energy):
+def dnde_photon_charged_kaon(photon_energy, kaon_energy, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a short kaon.
     Paramaters
     ----------
     egam: float or array-like
         Photon energy.
-    ek: float 
+    ek: float or array-like
         Energy of the kaon.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_charged_kaon_array(energies, kaon_energy)
-    else:
-        return dnde_photon_charged_kaon_point(photon_energy, kaon_energy)
+    return evaluate_dnde(dnde_photon_charged_kaon_point, photon_energy, kaon_energy, out, weight, accumulate)
 
 
 # ============================================================================
@@ -235,7 +236,7 @@ def dnde_photon_charged_kaon(photon_energy, kaon_energy):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_long_kaon_rest_frame(double photon_energy):
+cdef double dnde_photon_long_kaon_rest_frame(double photon_energy) noexcept nogil:
     return kaon_interp_spec(
         photon_energy,
         long_kaon_data_energies,
@@ -283,7 +284,7 @@ cdef double dnde_photon_long_kaon_rest_frame(double photon_energy):
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double dnde_photon_long_kaon_point(double photon_energy, double kaon_energy):
+cdef double dnde_photon_long_kaon_point(double photon_energy, double kaon_energy) noexcept nogil:
     cdef double gamma
     cdef double beta
     cdef double res
@@ -301,38 +302,34 @@ cdef double dnde_photon_long_kaon_point(double photon_energy, double kaon_energy
     return res 
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_long_kaon_array(double[:] photon_energy, double kaon_energy):
-  cdef int npts = photon_energy.shape[0]
-  cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(photon_energy)
-
-  for i in range(npts):
-      spec[i] = dnde_photon_long_kaon_point(photon_energy[i], kaon_energy)
-
-  return spec
+cdef np.ndarray dnde_photon_long_kaon_array(const double[:] photon_energy, double kaon_energy):
+    spec = np.empty(photon_energy.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_long_kaon_point, photon_energy, kaon_energy, out)
+    return spec
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_photon_long_kaon(photon_energy, kaon_energy):
+def dnde_photon_long_kaon(photon_energy, kaon_energy, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a long kaon.
     Paramaters
     ----------
     egam: float or array-like
         Photon energy.
-    ek: float 
+    ek: float or array-like
         Energy of the kaon.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_long_kaon_array(energies, kaon_energy)
-    else:
-        return dnde_photon_long_kaon_point(photon_energy, kaon_energy)
+    return evaluate_dnde(dnde_photon_long_kaon_point, photon_energy, kaon_energy, out, weight, accumulate)
 
 
 # ============================================================================
@@ -342,7 +339,7 @@ def dnde_photon_long_kaon(photon_energy, kaon_energy):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_short_kaon_rest_frame(double photon_energy):
+cdef double dnde_photon_short_kaon_rest_frame(double photon_energy) noexcept nogil:
     return kaon_interp_spec(
         photon_energy,
         short_kaon_data_energies,
@@ -390,7 +387,7 @@ cdef double dnde_photon_short_kaon_rest_frame(double photon_energy):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_short_kaon_point(double photon_energy, double kaon_energy):
+cdef double dnde_photon_short_kaon_point(double photon_energy, double kaon_energy) noexcept nogil:
     cdef double gamma
     cdef double beta
     cdef double res
@@ -408,34 +405,31 @@ cdef double dnde_photon_short_kaon_point(double photon_energy, double kaon_energ
     return res 
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_short_kaon_array(double[:] photon_energy, double kaon_energy):
-    cdef int npts = photon_energy.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(photon_energy)
-    for i in range(npts):
-        spec[i] = dnde_photon_short_kaon_point(photon_energy[i], kaon_energy)
+cdef np.ndarray dnde_photon_short_kaon_array(const double[:] photon_energy, double kaon_energy):
+    spec = np.empty(photon_energy.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_short_kaon_point, photon_energy, kaon_energy, out)
     return spec
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_photon_short_kaon(photon_energy, kaon_energy):
+def dnde_photon_short_kaon(photon_energy, kaon_energy, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a short kaon.
     Paramaters
     ----------
     egam: float or array-like
         Photon energy.
-    ek: float 
+    ek: float or array-like
         Energy of the kaon.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_short_kaon_array(energies, kaon_energy)
-    else:
-        return dnde_photon_short_kaon_point(photon_energy, kaon_energy)
+    return evaluate_dnde(dnde_photon_short_kaon_point, photon_energy, kaon_energy, out, weight, accumulate)
@@ -1 +1 @@
-def dnde_photon(egam, emu): ...
+def dnde_photon(egam, emu, out=None, weight=1.0, accumulate=False): ...
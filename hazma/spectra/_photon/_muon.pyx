@@ -9,9 +9,10 @@ from libc.float cimport DBL_EPSILON
 
 import numpy as np
 cimport numpy as np
-from scipy.integrate import quad
 from scipy.special.cython_special cimport spence
 
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
+
 include "../../_utils/constants.pxd"
 
 
@@ -26,7 +27,7 @@ include "../../_utils/constants.pxd"
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double dnde_photon_muon_rest_frame(double egam):
+cdef double dnde_photon_muon_rest_frame(double egam) noexcept nogil:
     cdef double y
     cdef double r
     cdef double pre
@@ -55,7 +56,7 @@ cdef double dnde_photon_muon_rest_frame(double egam):
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double dnde_photon_muon_point(double egam, double emu):
+cdef double dnde_photon_muon_point(double egam, double emu) noexcept nogil:
     cdef double gamma
     cdef double beta
     cdef double y
@@ -117,16 +118,11 @@ cdef double dnde_photon_muon_point(double egam, double emu):
 
 # Same as the above function but over an array of arguments.
 
-@cython.cdivision(True)
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_muon_array(double[:] energies, double muon_eng):
-    cdef int npts = energies.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(energies)
-
-    for i in range(npts):
-        spec[i] = dnde_photon_muon_point(energies[i], muon_eng)
-
+cdef np.ndarray dnde_photon_muon_array(const double[:] energies, double muon_eng):
+    spec = np.empty(energies.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_muon_point, energies, muon_eng, out)
     return spec
 
 
@@ -134,7 +130,7 @@ cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_muon_array(double[:] energies,
 # ---- Python API ---------------------------------------------------
 # ===================================================================
 
-def dnde_photon(egam, emu):
+def dnde_photon(egam, emu, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a muon into an electron,
     two neutrinos and a photon.
@@ -142,12 +138,13 @@ def dnde_photon(egam, emu):
     ----------
     egam: float or array-like
         Photon energy.
-    emu: float 
+    emu: float or array-like
         Energy of the muon.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(egam, '__len__'):
-        energies = np.array(egam)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_muon_array(energies, emu)
-    else:
-        return dnde_photon_muon_point(egam, emu)
+    return evaluate_dnde(dnde_photon_muon_point, egam, emu, out, weight, accumulate)
@@ -1 +1 @@
-def dnde_photon_omega(photon_energy, omega_energy): ...
+def dnde_photon_omega(photon_energy, omega_energy, out=None, weight=1.0, accumulate=False): ...
@@ -10,8 +10,11 @@ from libc.math cimport sqrt
 from libc.float cimport DBL_EPSILON
 
 from hazma.spectra._photon.path import DATA_DIR
+from hazma._utils.tables import load_table
 from hazma._utils.boost cimport boost_beta, boost_gamma, boost_delta_function
 from hazma._utils.boost cimport boost_integrate_linear_interp
+from hazma._utils.interp cimport interp_linear
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
 
 include "../../_utils/constants.pxd"
 
@@ -20,14 +23,14 @@ include "../../_utils/constants.pxd"
 # ============================================================================
 
 # Format: energy, pi_pi_pi0, pi0_a, pi_pi, eta_a, e_e, mu_mu
-omega_data = np.loadtxt(
+omega_data = load_table(
     DATA_DIR.joinpath("omega_photon.csv"),
     delimiter=","
 ).T
-omega_data_energies = omega_data[0]
-omega_data_dnde = np.sum(omega_data[1:], axis=0)
-omega_data_emin = omega_data_energies[0]
-omega_data_emax = omega_data_energies[-1]
+cdef const double[:] omega_data_energies = omega_data[0]
+cdef const double[:] omega_data_dnde = np.sum(omega_data[1:], axis=0)
+cdef double omega_data_emin = omega_data[0, 0]
+cdef double omega_data_emax = omega_data[0, -1]
 
 # ============================================================================
 # ---- Charged Kaon ----------------------------------------------------------
@@ -36,7 +39,7 @@ omega_data_emax = omega_data_energies[-1]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_omega_rest_frame(double photon_energy):
+cdef double dnde_photon_omega_rest_frame(double photon_energy) noexcept nogil:
     cdef double ret = 0.0
 
     if photon_energy > omega_data_emax:
@@ -45,7 +48,7 @@ cdef double dnde_photon_omega_rest_frame(double photon_energy):
     if photon_energy < omega_data_emin:
         return omega_data_dnde[0] * omega_data_emin / photon_energy
     else:
-        return np.interp(photon_energy, omega_data_energies, omega_data_dnde)
+        return interp_linear(photon_energy, omega_data_energies, omega_data_dnde)
 
 
 # @cython.boundscheck(False)
@@ -58,7 +61,7 @@ cdef double dnde_photon_omega_rest_frame(double photon_energy):
 # @cython.boundscheck(False)
 # @cython.wraparound(False)
 # @cython.cdivision(True)
-# cdef double dnde_photon_omega_point(double photon_energy, double omega_energy):
+# cdef double dnde_photon_omega_point(double photon_energy, double omega_energy) noexcept nogil:
 #     cdef double gamma
 #     cdef double beta
 #     cdef double pre
@@ -92,11 +95,12 @@ cdef double dnde_photon_omega_rest_frame(double photon_energy):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_omega_point(double photon_energy, double omega_energy):
+cdef double dnde_photon_omega_point(double photon_energy, double omega_energy) noexcept nogil:
     cdef double gamma
     cdef double beta
     cdef double res
     cdef double eng_a_w_to_pi0_a
+    cdef double eng_a_w_to_eta_a
 
     if omega_energy < MASS_OMEGA:
         return 0.0
@@ -116,25 +120,16 @@ cdef double dnde_photon_omega_point(double photon_energy, double omega_energy):
     return res 
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_omega_array(double[:] photon_energy, double omega_energy):
-    cdef int npts = photon_energy.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(photon_energy)
-    for i in range(npts):
-        spec[i] = dnde_photon_omega_point(photon_energy[i], omega_energy)
+cdef np.ndarray dnde_photon_omega_array(const double[:] photon_energy, double omega_energy):
+    spec = np.empty(photon_energy.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_omega_point, photon_energy, omega_energy, out)
     return spec
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_photon_omega(photon_energy, omega_energy):
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_omega_array(energies, omega_energy)
-    else:
-        return dnde_photon_omega_point(photon_energy, omega_energy)
-
+def dnde_photon_omega(photon_energy, omega_energy, out=None, double weight=1.0, bint accumulate=False):
+    return evaluate_dnde(dnde_photon_omega_point, photon_energy, omega_energy, out, weight, accumulate)
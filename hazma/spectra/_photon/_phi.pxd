@@ -1,5 +1,5 @@
 import numpy as np
 cimport numpy as np
 
-cdef double dnde_photon_phi_point(double, double)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_phi_array(double[:], double)
\ No newline at end of file
+cdef double dnde_photon_phi_point(double, double) noexcept nogil
+cdef np.ndarray dnde_photon_phi_array(const double[:], double)
\ No newline at end of file
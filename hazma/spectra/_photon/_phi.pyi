@@ -1 +1 @@
-def dnde_photon_phi(photon_energy, phi_energy): ...
+def dnde_photon_phi(photon_energy, phi_energy, out=None, weight=1.0, accumulate=False): ...
@@ -10,8 +10,11 @@ from libc.math cimport sqrt
 from libc.float cimport DBL_EPSILON
 
 from hazma.spectra._photon.path import DATA_DIR
+from hazma._utils.tables import load_table
 from hazma._utils.boost cimport boost_beta, boost_gamma, boost_delta_function
 from hazma._utils.boost cimport boost_integrate_linear_interp
+from hazma._utils.interp cimport interp_linear
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
 
 include "../../_utils/constants.pxd"
 
@@ -19,14 +22,14 @@ include "../../_utils/constants.pxd"
 # ---- Data Loading ----------------------------------------------------------
 # ============================================================================
 
-phi_data = np.loadtxt(
+phi_data = load_table(
     DATA_DIR.joinpath("phi_photon.csv"),
     delimiter=","
 ).T
-phi_data_energies = phi_data[0]
-phi_data_dnde = np.sum(phi_data[1:], axis=0)
-phi_data_emin = phi_data_energies[0]
-phi_data_emax = phi_data_energies[-1]
+cdef const double[:] phi_data_energies = phi_data[0]
+cdef const double[:] phi_data_dnde = np.sum(phi_data[1:], axis=0)
+cdef double phi_data_emin = phi_data[0, 0]
+cdef double phi_data_emax = phi_data[0, -1]
 
 # ============================================================================
 # ---- Charged Kaon ----------------------------------------------------------
@@ -35,7 +38,7 @@ phi_data_emax = phi_data_energies[-1]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_phi_rest_frame(double photon_energy):
+cdef double dnde_photon_phi_rest_frame(double photon_energy) noexcept nogil:
     cdef double ret = 0.0
 
     if photon_energy > phi_data_emax:
@@ -44,7 +47,7 @@ cdef double dnde_photon_phi_rest_frame(double photon_energy):
     if photon_energy < phi_data_emin:
         return phi_data_dnde[0] * phi_data_emin / photon_energy
     else:
-        return np.interp(photon_energy, phi_data_energies, phi_data_dnde)
+        return interp_linear(photon_energy, phi_data_energies, phi_data_dnde)
 
 
 # @cython.boundscheck(False)
@@ -57,7 +60,7 @@ cdef double dnde_photon_phi_rest_frame(double photon_energy):
 # @cython.boundscheck(False)
 # @cython.wraparound(False)
 # @cython.cdivision(True)
-# cdef double dnde_photon_phi_point(double photon_energy, double phi_energy):
+# cdef double dnde_photon_phi_point(double photon_energy, double phi_energy) noexcept nogil:
 #     cdef double gamma
 #     cdef double bphi
 #     cdef double pre
@@ -91,9 +94,9 @@ cdef double dnde_photon_phi_rest_frame(double photon_energy):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_photon_phi_point(double photon_energy, double phi_energy):
+cdef double dnde_photon_phi_point(double photon_energy, double phi_energy) noexcept nogil:
     cdef double gamma
-    cdef double bphi
+    cdef double beta
     cdef double res
     cdef double eng_eta
 
@@ -116,25 +119,16 @@ cdef double dnde_photon_phi_point(double photon_energy, double phi_energy):
     return res 
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_phi_array(double[:] photon_energy, double phi_energy):
-    cdef int npts = photon_energy.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(photon_energy)
-    for i in range(npts):
-        spec[i] = dnde_photon_phi_point(photon_energy[i], phi_energy)
+cdef np.ndarray dnde_photon_phi_array(const double[:] photon_energy, double phi_energy):
+    spec = np.empty(photon_energy.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_phi_point, photon_energy, phi_energy, out)
     return spec
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_photon_phi(photon_energy, phi_energy):
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_phi_array(energies, phi_energy)
-    else:
-        return dnde_photon_phi_point(photon_energy, phi_energy)
-
+def dnde_photon_phi(photon_energy, phi_energy, out=None, double weight=1.0, bint accumulate=False):
+    return evaluate_dnde(dnde_photon_phi_point, photon_energy, phi_energy, out, weight, accumulate)
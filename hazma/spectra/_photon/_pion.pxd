@@ -1,8 +1,9 @@
 import numpy as np
 cimport numpy as np
 
-cdef double dnde_photon_neutral_pion_point(double, double)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_neutral_pion_array(double[:], double)
+cdef double dnde_photon_neutral_pion_point(double, double) noexcept nogil
+cdef np.ndarray dnde_photon_neutral_pion_array(const double[:], double)
 
-cdef double dnde_photon_charged_pion_point(double, double)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_charged_pion_array(double[:], double)
\ No newline at end of file
+cdef double dnde_photon_charged_pion_point(double, double) noexcept nogil
+cdef np.ndarray dnde_photon_charged_pion_array(const double[:], double)
+cdef int dnde_photon_charged_pion_kinks(double, double*) noexcept nogil
@@ -1,2 +1,2 @@
-def dnde_photon_neutral_pion(egams, epi): ...
-def dnde_photon_charged_pion(egams, epi): ...
+def dnde_photon_neutral_pion(egams, epi, out=None, weight=1.0, accumulate=False): ...
+def dnde_photon_charged_pion(egams, epi, out=None, weight=1.0, accumulate=False): ...
@@ -1,13 +1,15 @@
 import numpy as np
 cimport numpy as np
 
-from scipy.integrate import quad
-from libc.math cimport exp, log, M_PI, log10, sqrt, abs, pow, M_SQRT1_2
+from libc.math cimport exp, log, M_PI, M_LN10, log10, sqrt, abs, pow, M_SQRT1_2, ceil, fmin
+from libc.float cimport DBL_EPSILON
 
 import cython
 
 from hazma.spectra._photon._muon cimport dnde_photon_muon_point
 from hazma._utils.boost cimport boost_beta, boost_gamma
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
+from hazma._utils.quadrature cimport gauss_legendre
 
 # include "common.pxd"
 include "../../_utils/constants.pxd"
@@ -23,6 +25,22 @@ DEF MMU = MASS_MU
 DEF BETA_MU_PIRF = 0.27138337509758564
 DEF GAMMA_MU_PIRF = 1.0389919859434902
 
+# Kinks of the charged pion spectrum in its rest frame: the endpoint of
+# pi -> mu nu g, the kink and endpoint of the FSR from the muon and the
+# endpoint of pi -> e nu g.
+DEF N_KINKS = 4
+cdef double KINKS[N_KINKS]
+KINKS[:] = sorted([
+    (MPI**2 - MMU**2) / (2.0 * MPI),
+    ENG_GAM_MAX_MURF / (GAMMA_MU_PIRF * (1.0 + BETA_MU_PIRF)),
+    ENG_GAM_MAX_PIRG,
+    (MPI**2 - ME**2) / (2.0 * MPI),
+])
+cdef double LOG_KINKS[N_KINKS]
+LOG_KINKS[:] = np.log([KINKS[i] for i in range(N_KINKS)])
+# Largest photon energy from a charged pion at rest.
+cdef double ENG_GAM_MAX_PIRF = KINKS[N_KINKS - 1]
+
 
 # ============================================================================
 # ---- Charged Pion ----------------------------------------------------------
@@ -31,7 +49,7 @@ DEF GAMMA_MU_PIRF = 1.0389919859434902
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double dnde_pi_to_lnug(double egam, double ml):
+cdef double dnde_pi_to_lnug(double egam, double ml) noexcept nogil:
     """
     Returns dnde from pi-> l nu g.
     """
@@ -83,64 +101,126 @@ cdef double eng_gam_max(double eng_pi):
 
 
 @cython.cdivision(True)
-cdef double charged_pion_integrand(double cl, double eng_gam, double eng_pi):
+cdef double dnde_photon_charged_pion_rest_frame(double eng_gam) noexcept nogil:
     """
-    Returns the charged_pion_integrand of the differential radiative decay spectrum for
-    the charged pion.
+    Returns the radiative spectrum from a charged pion at rest, including
+    the FSR from the muon.
     Keyword arguments::
-        cl: Angle of photon w.r.t. charged pion in lab frame.
-        engPi: Energy of photon in laboratory frame.
-        engPi: Energy of pion in laboratory frame.
+        eng_gam: Energy of photon in pion rest frame.
     """
-    cdef double beta_pi = boost_beta(eng_pi, MASS_PI)
-    cdef double gamma_pi = boost_gamma(eng_pi, MASS_PI)
+    return (
+        BR_PI_TO_MU_NUMU * dnde_photon_muon_point(eng_gam, ENG_MU_PIRF)
+        + BR_PI_TO_MU_NUMU * dnde_pi_to_lnug(eng_gam, MMU)
+        + BR_PI_TO_E_NUE * dnde_pi_to_lnug(eng_gam, ME)
+    )
 
-    cdef double eng_gam_pi_rF = eng_gam * gamma_pi * (1.0 - beta_pi * cl)
-    cdef double jac = 1. / (2.0 * gamma_pi * abs(1.0 - beta_pi * cl))
 
-    cdef double result = 0.0
+cdef double rest_frame_integrand(double log_eng_gam, void* args) noexcept nogil:
+    return dnde_photon_charged_pion_rest_frame(exp(log_eng_gam))
 
-    result += BR_PI_TO_MU_NUMU * jac * dnde_photon_muon_point(eng_gam_pi_rF, ENG_MU_PIRF)
-    result += BR_PI_TO_MU_NUMU * jac * dnde_pi_to_lnug(eng_gam_pi_rF, MMU)
-    result += BR_PI_TO_E_NUE * jac * dnde_pi_to_lnug(eng_gam_pi_rF, ME)
 
-    return result
+cdef double integrate_rest_frame(double emin, double emax) noexcept nogil:
+    """
+    Returns the integral of the rest-frame spectrum divided by the photon
+    energy between emin and emax.
+    More details:
+        The integral is performed with Gauss-Legendre quadrature in log(E)
+        on panels spanning at most a decade, split at the kinks of the
+        rest-frame spectrum so that the integrand is smooth on each panel.
+    """
+    return gauss_legendre(
+        rest_frame_integrand, NULL, log(emin), log(emax), LOG_KINKS, N_KINKS, M_LN10
+    )
 
 
-cdef double dnde_photon_charged_pion_point(double eng_gam, double eng_pi):
+@cython.cdivision(True)
+cdef int dnde_photon_charged_pion_kinks(double eng_pi, double* kinks) noexcept nogil:
+    """
+    Writes the sorted photon energies where the spectrum from a charged pion
+    with energy `eng_pi` is not smooth into `kinks`, which must hold at least
+    2 * N_KINKS values, and returns their number.
+    More details:
+        The boosted spectrum has kinks where either bound of the boost
+        integral crosses a kink of the rest-frame spectrum.
+    """
+    cdef double gamma
+    cdef double beta
+    cdef double k
+    cdef int i
+    cdef int j
+
+    if eng_pi <= MASS_PI:
+        for i in range(N_KINKS):
+            kinks[i] = KINKS[i]
+        return N_KINKS
+
+    gamma = eng_pi / MASS_PI
+    beta = sqrt(1.0 - (MASS_PI / eng_pi) ** 2)
+    for i in range(N_KINKS):
+        kinks[i] = KINKS[i] / (gamma * (1.0 + beta))
+        kinks[N_KINKS + i] = KINKS[i] / (gamma * (1.0 - beta))
+
+    # Insertion sort: both halves are sorted but may interleave.
+    for i in range(1, 2 * N_KINKS):
+        k = kinks[i]
+        j = i - 1
+        while j >= 0 and kinks[j] > k:
+            kinks[j + 1] = kinks[j]
+            j -= 1
+        kinks[j + 1] = k
+    return 2 * N_KINKS
+
+
+@cython.cdivision(True)
+cdef double dnde_photon_charged_pion_point(double eng_gam, double eng_pi) noexcept nogil:
     """
     Returns the radiative spectrum value from charged pion given a gamma
-    ray energy eng_gam and charged pion energy eng_pi. When the
-    ChargedPion object is instatiated, an interplating function for the
-    mu spectrum is computed.
+    ray energy eng_gam and charged pion energy eng_pi.
     Keyword arguments::
         eng_gam: Energy of photon is laboratory frame.
         eng_pi: Energy of charged pion in laboratory frame.
+    More details:
+        Boosting the rest-frame spectrum f gives
+            dN/dE = 1 / (2 gamma beta) int_{E-}^{E+} f(E') / E' dE'
+        with E+- = gamma * (1 +- beta) * eng_gam, which is integrated
+        without calling back into Python.
     """
-    if eng_pi < MASS_PI:
+    cdef double gamma
+    cdef double beta
+    cdef double emin
+    cdef double emax
+
+    if eng_pi < MASS_PI or eng_gam <= 0.0:
         return 0.0
 
-    return quad(charged_pion_integrand, -1.0, 1.0, points=[-1.0, 1.0], \
-                   args=(eng_gam, eng_pi), epsabs=1e-10, \
-                   epsrel=1e-5)[0]
+    # If we are sufficiently close to the pion rest-frame, use the
+    # rest-frame result.
+    if eng_pi - MASS_PI < DBL_EPSILON:
+        return dnde_photon_charged_pion_rest_frame(eng_gam)
 
+    gamma = eng_pi / MASS_PI
+    beta = sqrt(1.0 - (MASS_PI / eng_pi) ** 2)
 
+    emin = eng_gam * gamma * (1.0 - beta)
+    emax = fmin(eng_gam * gamma * (1.0 + beta), ENG_GAM_MAX_PIRF)
+    if emin >= emax:
+        return 0.0
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_charged_pion_array(double[:] egams, double epi):
-    cdef int npts = egams.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(egams)
+    return integrate_rest_frame(emin, emax) / (2.0 * gamma * beta)
 
-    for i in range(npts):
-        spec[i] = dnde_photon_charged_pion_point(egams[i], epi)
-    return spec
 
 
+cdef np.ndarray dnde_photon_charged_pion_array(const double[:] egams, double epi):
+    spec = np.empty(egams.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_charged_pion_point, egams, epi, out)
+    return spec
+
 
-@cython.boundscheck(True)
+@cython.boundscheck(False)
 @cython.wraparound(False)
-def dnde_photon_charged_pion(photon_energy, pion_energy):
+def dnde_photon_charged_pion(photon_energy, pion_energy, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a charged pion.
 
@@ -148,15 +228,16 @@ def dnde_photon_charged_pion(photon_energy, pion_energy):
     ----------
     photon_energy: float or array-like
         Photon energy.
-    pion_energy: float 
+    pion_energy: float or array-like
         Energy of the pion.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_charged_pion_array(energies, pion_energy)
-    else:
-        return dnde_photon_charged_pion_point(photon_energy, pion_energy)
+    return evaluate_dnde(dnde_photon_charged_pion_point, photon_energy, pion_energy, out, weight, accumulate)
 
 
 # ============================================================================
@@ -165,7 +246,7 @@ def dnde_photon_charged_pion(photon_energy, pion_energy):
 
 
 @cython.cdivision(True)
-cdef double dnde_photon_neutral_pion_point(double eng_gam, double eng_pi):
+cdef double dnde_photon_neutral_pion_point(double eng_gam, double eng_pi) noexcept nogil:
     """
     Returns decay spectrum for pi0 -> g g.
     """
@@ -180,34 +261,34 @@ cdef double dnde_photon_neutral_pion_point(double eng_gam, double eng_pi):
 
     return ret_val
 
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_neutral_pion_array(double[:] egams, double epi):
+cdef np.ndarray dnde_photon_neutral_pion_array(const double[:] egams, double epi):
     """
     Returns decay spectrum for pi0 -> g g.
     """
-    cdef int npts = egams.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(egams)
-    for i in range(npts):
-        spec[i] = dnde_photon_neutral_pion_point(egams[i], epi)
+    spec = np.empty(egams.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_neutral_pion_point, egams, epi, out)
     return spec
 
 
 @cython.cdivision(True)
-@cython.boundscheck(True)
+@cython.boundscheck(False)
 @cython.wraparound(False)
-def dnde_photon_neutral_pion(photon_energy, pion_energy):
+def dnde_photon_neutral_pion(photon_energy, pion_energy, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a neutral pion.
     Paramaters
     ----------
     photon_energy: float or array-like
         Photon energy.
-    pion_energy: float 
+    pion_energy: float or array-like
         Energy of the pion.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_neutral_pion_array(energies, pion_energy)
-    else:
-        return dnde_photon_neutral_pion_point(photon_energy, pion_energy)
\ No newline at end of file
+    return evaluate_dnde(dnde_photon_neutral_pion_point, photon_energy, pion_energy, out, weight, accumulate)
@@ -0,0 +1,46 @@
+"""Tests for the photon spectra of the pions."""
+
+import numpy as np
+import pytest
+from scipy.integrate import quad
+
+from hazma.parameters import charged_pion_mass as MPI
+from hazma.spectra._photon._pion import dnde_photon_charged_pion
+
+
+def dnde_boosted(photon_energy, pion_energy):
+    """
+    Boost the rest-frame spectrum by integrating over the photon energy in the
+    pion rest frame with scipy.
+    """
+    gamma = pion_energy / MPI
+    beta = np.sqrt(1.0 - gamma**-2)
+    emin = photon_energy * gamma * (1.0 - beta)
+    emax = photon_energy * gamma * (1.0 + beta)
+
+    def integrand(e):
+        return dnde_photon_charged_pion(e, MPI) / e
+
+    # The rest-frame spectrum has kinks at the endpoints of the radiative
+    # decays and of the FSR from the muon.
+    points = [p for p in [29.79, 39.99, 69.78] if emin < p < emax]
+    return quad(integrand, emin, emax, points=points or None, epsrel=1e-8, limit=200)[
+        0
+    ] / (2.0 * gamma * beta)
+
+
+@pytest.mark.parametrize("pion_energy", [150.0, 400.0, 2000.0])
+def test_charged_pion_boost(pion_energy):
+    energies = np.geomspace(1e-2, 0.5 * pion_energy, 13)
+    expected = [dnde_boosted(e, pion_energy) for e in energies]
+    actual = dnde_photon_charged_pion(energies, pion_energy)
+    assert actual == pytest.approx(expected, rel=1e-3)
+
+
+def test_charged_pion_scalar_and_array():
+    energies = np.array([1.0, 10.0, 50.0])
+    array = dnde_photon_charged_pion(energies, 300.0)
+    assert [dnde_photon_charged_pion(e, 300.0) for e in energies] == pytest.approx(
+        array
+    )
+    assert dnde_photon_charged_pion(1.0, 100.0) == 0.0
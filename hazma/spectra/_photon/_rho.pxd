@@ -1,8 +1,8 @@
 import numpy as np
 cimport numpy as np
 
-cdef double dnde_photon_charged_rho_point(double, double)
-cdef double dnde_photon_neutral_rho_point(double, double)
+cdef double dnde_photon_charged_rho_point(double, double) noexcept nogil
+cdef double dnde_photon_neutral_rho_point(double, double) noexcept nogil
 
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_charged_rho_array(double[:], double)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_neutral_rho_array(double[:], double)
\ No newline at end of file
+cdef np.ndarray dnde_photon_charged_rho_array(const double[:], double)
+cdef np.ndarray dnde_photon_neutral_rho_array(const double[:], double)
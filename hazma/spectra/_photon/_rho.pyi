@@ -1,2 +1,2 @@
-def dnde_photon_charged_rho(photon_energy, rho_energy): ...
-def dnde_photon_neutral_rho(photon_energy, rho_energy): ...
+def dnde_photon_charged_rho(photon_energy, rho_energy, out=None, weight=1.0, accumulate=False): ...
+def dnde_photon_neutral_rho(photon_energy, rho_energy, out=None, weight=1.0, accumulate=False): ...
@@ -1,14 +1,17 @@
 from libc.float cimport DBL_EPSILON
+from libc.math cimport exp, log, sqrt, M_LN10
 import cython
 
 import numpy as np
 cimport numpy as np
-from scipy.integrate import quad
 
 from hazma._utils.boost cimport boost_beta, boost_gamma
 from hazma._utils.kinematics cimport two_body_energy
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
+from hazma._utils.quadrature cimport gauss_legendre
 from hazma.spectra._photon._pion cimport dnde_photon_neutral_pion_point
 from hazma.spectra._photon._pion cimport dnde_photon_charged_pion_point
+from hazma.spectra._photon._pion cimport dnde_photon_charged_pion_kinks
 
 include "../../_utils/constants.pxd"
 
@@ -16,26 +19,69 @@ DEF MPI = MASS_PI
 DEF MPI0 = MASS_PI0
 DEF MRHO = MASS_RHO
 
+# Energies of the pions in the rho rest frame.
+DEF EPI_RHO0 = MRHO / 2.0
+cdef double EPI_RHO = two_body_energy(MRHO, MPI, MPI0)
+cdef double EPI0_RHO = two_body_energy(MRHO, MPI0, MPI)
+
+# Logarithms of the photon energies where the rest-frame spectra of the rho
+# mesons are not smooth, at which the boost integrals are split: the kinks
+# of the boosted charged pion spectra and the edges of the box spectrum of
+# the neutral pion.
+DEF MAX_BREAKS = 10
+cdef double NEUTRAL_RHO_BREAKS[MAX_BREAKS]
+cdef double CHARGED_RHO_BREAKS[MAX_BREAKS]
+cdef int N_NEUTRAL_RHO_BREAKS
+cdef int N_CHARGED_RHO_BREAKS
+
+
+cdef int _init_breaks():
+    global N_NEUTRAL_RHO_BREAKS
+    global N_CHARGED_RHO_BREAKS
+    cdef double kinks[MAX_BREAKS]
+    cdef double beta0 = sqrt(1.0 - (MPI0 / EPI0_RHO) ** 2)
+    cdef int n
+    cdef int i
+
+    n = dnde_photon_charged_pion_kinks(EPI_RHO0, kinks)
+    for i in range(n):
+        NEUTRAL_RHO_BREAKS[i] = log(kinks[i])
+    N_NEUTRAL_RHO_BREAKS = n
+
+    n = dnde_photon_charged_pion_kinks(EPI_RHO, kinks)
+    breaks = [kinks[i] for i in range(n)]
+    breaks += [EPI0_RHO * (1.0 - beta0) / 2.0, EPI0_RHO * (1.0 + beta0) / 2.0]
+    for i, b in enumerate(sorted(breaks)):
+        CHARGED_RHO_BREAKS[i] = log(b)
+    N_CHARGED_RHO_BREAKS = len(breaks)
+    return 0
+
+
+_init_breaks()
+
 # ============================================================================
 # ---- Neutral Rho -----------------------------------------------------------
 # ============================================================================
 
 @cython.cdivision(True)
-cdef double integrand_neutral_rho(double e):
-    cdef epi = MRHO / 2.0
-    return 2 * dnde_photon_charged_pion_point(e, epi) / e
+cdef double integrand_neutral_rho(double e) noexcept nogil:
+    return 2 * dnde_photon_charged_pion_point(e, EPI_RHO0) / e
+
+
+cdef double log_integrand_neutral_rho(double log_e, void* args) noexcept nogil:
+    return 2 * dnde_photon_charged_pion_point(exp(log_e), EPI_RHO0)
 
 
 @cython.cdivision(True)
-cdef double dnde_photon_neutral_rho_point(double e, double erho):
+cdef double dnde_photon_neutral_rho_point(double e, double erho) noexcept nogil:
     cdef:
-        beta
-        gamma
-        emin
-        emax
-        pre
+        double beta
+        double gamma
+        double emin
+        double emax
+        double pre
 
-    if erho < MRHO:
+    if erho < MRHO or e <= 0.0:
         return 0.0
 
     # If we are sufficiently close to the rho rest-frame, use the 
@@ -49,38 +95,44 @@ cdef double dnde_photon_neutral_rho_point(double e, double erho):
     emax = gamma * e * (1 + beta)
     pre = 0.5 / (beta * gamma)
 
-    return pre * quad(integrand_neutral_rho, emin, emax, epsabs=1e-10, epsrel=1e-5)[0]
-
-
-@cython.boundscheck(True)
-@cython.wraparound(False)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_neutral_rho_array(double[:] egams, double erho):
-    cdef int npts = egams.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(egams)
-
-    for i in range(npts):
-        spec[i] = dnde_photon_neutral_rho_point(egams[i], erho)
+    return pre * gauss_legendre(
+        log_integrand_neutral_rho,
+        NULL,
+        log(emin),
+        log(emax),
+        NEUTRAL_RHO_BREAKS,
+        N_NEUTRAL_RHO_BREAKS,
+        M_LN10,
+    )
+
+
+cdef np.ndarray dnde_photon_neutral_rho_array(const double[:] egams, double erho):
+    spec = np.empty(egams.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_neutral_rho_point, egams, erho, out)
     return spec
 
 
-@cython.boundscheck(True)
+@cython.boundscheck(False)
 @cython.wraparound(False)
-def dnde_photon_neutral_rho(photon_energy, rho_energy):
+def dnde_photon_neutral_rho(photon_energy, rho_energy, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a neutral rho meson.
     Paramaters
     ----------
     photon_energy: float or array-like
         Photon energy.
-    rho_energy: float 
+    rho_energy: float or array-like
         Energy of the neutral rho meson.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_neutral_rho_array(energies, rho_energy)
-    else:
-        return dnde_photon_neutral_rho_point(photon_energy, rho_energy)
+    return evaluate_dnde(dnde_photon_neutral_rho_point, photon_energy, rho_energy, out, weight, accumulate)
 
 
 # ============================================================================
@@ -88,25 +140,31 @@ def dnde_photon_neutral_rho(photon_energy, rho_energy):
 # ============================================================================
 
 @cython.cdivision(True)
-cdef double integrand_charged_rho(double e):
-    cdef epi = two_body_energy(MRHO, MPI, MPI0)
-    cdef epi0 = two_body_energy(MRHO, MPI0, MPI)
+cdef double integrand_charged_rho(double e) noexcept nogil:
     return (
-        dnde_photon_charged_pion_point(e, epi) 
-        + dnde_photon_neutral_pion_point(e, epi0)
+        dnde_photon_charged_pion_point(e, EPI_RHO) 
+        + dnde_photon_neutral_pion_point(e, EPI0_RHO)
     ) / e
 
 
+cdef double log_integrand_charged_rho(double log_e, void* args) noexcept nogil:
+    cdef double e = exp(log_e)
+    return (
+        dnde_photon_charged_pion_point(e, EPI_RHO)
+        + dnde_photon_neutral_pion_point(e, EPI0_RHO)
+    )
+
+
 @cython.cdivision(True)
-cdef double dnde_photon_charged_rho_point(double e, double erho):
+cdef double dnde_photon_charged_rho_point(double e, double erho) noexcept nogil:
     cdef:
-        beta
-        gamma
-        emin
-        emax
-        pre
+        double beta
+        double gamma
+        double emin
+        double emax
+        double pre
 
-    if erho < MRHO:
+    if erho < MRHO or e <= 0.0:
         return 0.0
 
     # If we are sufficiently close to the rho rest-frame, use the 
@@ -120,35 +178,41 @@ cdef double dnde_photon_charged_rho_point(double e, double erho):
     emax = gamma * e * (1 + beta)
     pre = 0.5 / (beta * gamma)
 
-    return pre * quad(integrand_charged_rho, emin, emax, epsabs=1e-10, epsrel=1e-5)[0]
-
-
-@cython.boundscheck(True)
-@cython.wraparound(False)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_photon_charged_rho_array(double[:] egams, double erho):
-    cdef int npts = egams.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(egams)
-
-    for i in range(npts):
-        spec[i] = dnde_photon_charged_rho_point(egams[i], erho)
+    return pre * gauss_legendre(
+        log_integrand_charged_rho,
+        NULL,
+        log(emin),
+        log(emax),
+        CHARGED_RHO_BREAKS,
+        N_CHARGED_RHO_BREAKS,
+        M_LN10,
+    )
+
+
+cdef np.ndarray dnde_photon_charged_rho_array(const double[:] egams, double erho):
+    spec = np.empty(egams.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_photon_charged_rho_point, egams, erho, out)
     return spec
 
 
-@cython.boundscheck(True)
+@cython.boundscheck(False)
 @cython.wraparound(False)
-def dnde_photon_charged_rho(photon_energy, rho_energy):
+def dnde_photon_charged_rho(photon_energy, rho_energy, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the photon spectrum dN/dE from the decay of a charged rho meson.
     Paramaters
     ----------
     photon_energy: float or array-like
         Photon energy.
-    rho_energy: float 
+    rho_energy: float or array-like
         Energy of the neutral rho meson.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(photon_energy, '__len__'):
-        energies = np.array(photon_energy)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return dnde_photon_charged_rho_array(energies, rho_energy)
-    else:
-        return dnde_photon_charged_rho_point(photon_energy, rho_energy)
\ No newline at end of file
+    return evaluate_dnde(dnde_photon_charged_rho_point, photon_energy, rho_energy, out, weight, accumulate)
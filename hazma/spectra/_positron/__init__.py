@@ -1,5 +1,10 @@
 """
 Module for computing positron spectra.
+
+All spectra accept an array of parent energies, in which case the spectra for
+all pairs of parent and positron energies are computed at once and returned
+with shape (len(parent_energies), len(positron_energies)).
+
 @author: Logan Morrison and Adam Coogan
 """
 
@@ -33,17 +38,34 @@ def __flat_squared_matrix_element(_: RealArray) -> float:
 
 
 @overload
-def dnde_positron_muon(positron_energies: float, muon_energy: float) -> float: ...
+def dnde_positron_muon(
+    positron_energies: float,
+    muon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_positron_muon(
-    positron_energies: RealArray, muon_energy: float
+    positron_energies: RealArray,
+    muon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_muon(
-    positron_energies: RealOrRealArray, muon_energy: float
+    positron_energies: RealOrRealArray,
+    muon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the positron spectrum from muon decay.
@@ -54,6 +76,14 @@ def dnde_positron_muon(
         Energy(ies) of the positron/electron.
     muon_energy : float or array-like
         Energy of the muon.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -61,23 +91,40 @@ def dnde_positron_muon(
         The value of the spectrum given a positron energy(ies)
         ``positron_energies`` and muon energy ``muon_energy``.
     """
-    return _muon.dnde_positron_muon(positron_energies, muon_energy)
+    return _muon.dnde_positron_muon(
+        positron_energies, muon_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
 def dnde_positron_charged_pion(
-    positron_energies: float, pion_energy: float
+    positron_energies: float,
+    pion_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_positron_charged_pion(
-    positron_energies: RealArray, pion_energy: float
+    positron_energies: RealArray,
+    pion_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_charged_pion(
-    positron_energies: RealOrRealArray, pion_energy: float
+    positron_energies: RealOrRealArray,
+    pion_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the positron spectrum from the decay of a charged pion.
@@ -88,6 +135,14 @@ def dnde_positron_charged_pion(
         Energy(ies) of the positron/electron.
     pion_energy : float or numpy.array
         Energy of the charged pion.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -95,23 +150,40 @@ def dnde_positron_charged_pion(
         The value of the spectrum given a positron energy(ies)
         ``positron_energies`` and charged pion energy ``pion_energy``.
     """
-    return _pion.dnde_positron_charged_pion(positron_energies, pion_energy)
+    return _pion.dnde_positron_charged_pion(
+        positron_energies, pion_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
 def dnde_positron_charged_kaon(
-    positron_energies: float, kaon_energy: float
+    positron_energies: float,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_positron_charged_kaon(
-    positron_energies: RealArray, kaon_energy: float
+    positron_energies: RealArray,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_charged_kaon(
-    positron_energies: RealOrRealArray, kaon_energy: float
+    positron_energies: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the positron spectrum from the decay of a charged kaon.
@@ -122,6 +194,14 @@ def dnde_positron_charged_kaon(
         Energy(ies) of the positron/electron.
     kaon_energy : float or numpy.array
         Energy of the charged kaon.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -138,21 +218,41 @@ def dnde_positron_charged_kaon(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
-def dnde_positron_long_kaon(positron_energies: float, kaon_energy: float) -> float: ...
+def dnde_positron_long_kaon(
+    positron_energies: float,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_positron_long_kaon(
-    positron_energies: RealArray, kaon_energy: float
+    positron_energies: RealArray,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_long_kaon(
-    positron_energies: RealOrRealArray, kaon_energy: float
+    positron_energies: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the positron spectrum from the decay of a long kaon.
@@ -163,6 +263,14 @@ def dnde_positron_long_kaon(
         Energy(ies) of the positron/electron.
     kaon_energy : float or numpy.array
         Energy of the long kaon.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -179,21 +287,41 @@ def dnde_positron_long_kaon(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
-def dnde_positron_short_kaon(positron_energies: float, kaon_energy: float) -> float: ...
+def dnde_positron_short_kaon(
+    positron_energies: float,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_positron_short_kaon(
-    positron_energies: RealArray, kaon_energy: float
+    positron_energies: RealArray,
+    kaon_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_short_kaon(
-    positron_energies: RealOrRealArray, kaon_energy: float
+    positron_energies: RealOrRealArray,
+    kaon_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> RealOrRealArray:
     """
     Returns the positron spectrum from the decay of a short kaon.
@@ -204,6 +332,14 @@ def dnde_positron_short_kaon(
         Energy(ies) of the positron/electron.
     kaon_energy : float or numpy.array
         Energy of the short kaon.
+    out : numpy.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result. If None, a new array is returned.
+    weight : float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate : bool, optional
+        If True, the weighted spectrum is added to `out` instead of
+        overwriting it. Default is False.
 
     Returns
     -------
@@ -220,19 +356,41 @@ def dnde_positron_short_kaon(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
-def dnde_positron_eta(positron_energy: float, eta_energy: float) -> float: ...
+def dnde_positron_eta(
+    positron_energy: float,
+    eta_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
-def dnde_positron_eta(positron_energy: RealArray, eta_energy: float) -> RealArray: ...
+def dnde_positron_eta(
+    positron_energy: RealArray,
+    eta_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> RealArray: ...
 
 
 def dnde_positron_eta(
-    positron_energy: Union[RealArray, float], eta_energy: float
+    positron_energy: Union[RealArray, float],
+    eta_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp = _eta_interp
     parent_mass = parameters.eta_mass
@@ -243,21 +401,41 @@ def dnde_positron_eta(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
-def dnde_positron_omega(positron_energy: float, omega_energy: float) -> float: ...
+def dnde_positron_omega(
+    positron_energy: float,
+    omega_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_positron_omega(
-    positron_energy: RealArray, omega_energy: float
+    positron_energy: RealArray,
+    omega_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_omega(
-    positron_energy: Union[RealArray, float], omega_energy: float
+    positron_energy: Union[RealArray, float],
+    omega_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp = _omega_integrand_interp
     parent_mass = parameters.omega_mass
@@ -268,21 +446,41 @@ def dnde_positron_omega(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
-def dnde_positron_neutral_rho(positron_energy: float, rho_energy: float) -> float: ...
+def dnde_positron_neutral_rho(
+    positron_energy: float,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_positron_neutral_rho(
-    positron_energy: RealArray, rho_energy: float
+    positron_energy: RealArray,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_neutral_rho(
-    positron_energy: Union[RealArray, float], rho_energy: float
+    positron_energy: Union[RealArray, float],
+    rho_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp = _rho_integrand_interp
     parent_mass = parameters.rho_mass
@@ -293,39 +491,76 @@ def dnde_positron_neutral_rho(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
-def dnde_positron_charged_rho(positron_energy: float, rho_energy: float) -> float: ...
+def dnde_positron_charged_rho(
+    positron_energy: float,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
 def dnde_positron_charged_rho(
-    positron_energy: RealArray, rho_energy: float
+    positron_energy: RealArray,
+    rho_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_charged_rho(
-    positron_energy: Union[RealArray, float], rho_energy: float
+    positron_energy: Union[RealArray, float],
+    rho_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
-    return dnde_positron_neutral_rho(positron_energy, rho_energy)
+    return dnde_positron_neutral_rho(
+        positron_energy, rho_energy, out=out, weight=weight, accumulate=accumulate
+    )
 
 
 @overload
 def dnde_positron_eta_prime(
-    positron_energy: float, eta_prime_energy: float
+    positron_energy: float,
+    eta_prime_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> float: ...
 
 
 @overload
 def dnde_positron_eta_prime(
-    positron_energy: RealArray, eta_prime_energy: float
+    positron_energy: RealArray,
+    eta_prime_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
 ) -> RealArray: ...
 
 
 def dnde_positron_eta_prime(
-    positron_energy: Union[RealArray, float], eta_prime_energy: float
+    positron_energy: Union[RealArray, float],
+    eta_prime_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp = _eta_prime_integrand_interp
     parent_mass = parameters.eta_prime_mass
@@ -336,19 +571,41 @@ def dnde_positron_eta_prime(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
 @overload
-def dnde_positron_phi(positron_energy: float, phi_energy: float) -> float: ...
+def dnde_positron_phi(
+    positron_energy: float,
+    phi_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> float: ...
 
 
 @overload
-def dnde_positron_phi(positron_energy: RealArray, phi_energy: float) -> RealArray: ...
+def dnde_positron_phi(
+    positron_energy: RealArray,
+    phi_energy: float,
+    *,
+    out: Optional[RealArray] = ...,
+    weight: float = ...,
+    accumulate: bool = ...,
+) -> RealArray: ...
 
 
 def dnde_positron_phi(
-    positron_energy: Union[RealArray, float], phi_energy: float
+    positron_energy: Union[RealArray, float],
+    phi_energy: RealOrRealArray,
+    *,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
     interp = _phi_integrand_interp
     parent_mass = parameters.phi_mass
@@ -359,6 +616,9 @@ def dnde_positron_phi(
         parent_energy=parent_energy,
         parent_mass=parent_mass,
         interp=interp,
+        out=out,
+        weight=weight,
+        accumulate=accumulate,
     )
 
 
@@ -5,6 +5,7 @@ import numpy.typing as npt
 import pathlib
 from scipy import interpolate
 
+from hazma._utils.tables import load_table
 from hazma.parameters import electron_mass as me
 from hazma import parameters
 
@@ -12,7 +13,7 @@ RealArray = npt.NDArray[np.float64]
 
 
 def _load_interp(fname):
-    data = np.loadtxt(
+    data = load_table(
         pathlib.Path(__file__).absolute().parent.joinpath("data", fname),
         delimiter=",",
     ).T
@@ -10,6 +10,7 @@ from libc.math cimport sqrt
 from libc.float cimport DBL_EPSILON
 
 from hazma.spectra._photon.path import DATA_DIR
+from hazma._utils.tables import load_table
 from hazma._utils.boost cimport boost_beta, boost_gamma, boost_delta_function
 
 include "../../_utils/constants.pxd"
@@ -18,31 +19,33 @@ include "../../_utils/constants.pxd"
 # ---- Data Loading ----------------------------------------------------------
 # ============================================================================
 
-charged_kaon_data = np.loadtxt(
+charged_kaon_data = load_table(
     DATA_DIR.joinpath("charged_kaon_positron.csv"),
     delimiter=","
 ).T
-charged_kaon_data_energies = charged_kaon_data[0]
+# The cached tables are read-only, while the buffers of the boost integrals
+# must be writable.
+charged_kaon_data_energies = np.array(charged_kaon_data[0])
 charged_kaon_data_dnde = np.sum(charged_kaon_data[1:], axis=0)
 charged_kaon_data_emin = charged_kaon_data_energies[0]
 charged_kaon_data_emax = charged_kaon_data_energies[-1]
 
 
-short_kaon_data = np.loadtxt(
+short_kaon_data = load_table(
     DATA_DIR.joinpath("short_kaon_positron.csv"),
     delimiter=","
 ).T
-short_kaon_data_energies = short_kaon_data[0]
+short_kaon_data_energies = np.array(short_kaon_data[0])
 short_kaon_data_dnde = np.sum(short_data[1:], axis=0)
 short_kaon_data_emin = short_kaon_data_energies[0]
 short_kaon_data_emax = short_kaon_data_energies[-1]
 
 
-long_kaon_data = np.loadtxt(
+long_kaon_data = load_table(
     DATA_DIR.joinpath("long_kaon_positron.csv"),
     delimiter=","
 ).T
-long_kaon_data_energies = long_kaon_data[0]
+long_kaon_data_energies = np.array(long_kaon_data[0])
 long_kaon_data_dnde = np.sum(long_data[1:], axis=0)
 long_kaon_data_emin = long_kaon_data_energies[0]
 long_kaon_data_emax = long_kaon_data_energies[-1]
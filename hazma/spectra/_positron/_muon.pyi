@@ -1 +1 @@
-def dnde_positron_muon(epos, emu): ...
+def dnde_positron_muon(epos, emu, out=None, weight=1.0, accumulate=False): ...
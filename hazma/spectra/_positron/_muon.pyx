@@ -4,8 +4,8 @@ import numpy as np
 cimport numpy as np
 from libc.math cimport sqrt, fmin, fmax
 from libc.float cimport DBL_EPSILON
-from scipy.integrate import quad
 from hazma._utils.boost cimport boost_beta, boost_gamma
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
 
 include "../../_utils/constants.pxd"
 
@@ -19,19 +19,15 @@ DEF R_FACTOR = 1.0001870858234163
 # ===================================================================
 
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dndx_positron_muon_rest_frame(double x):
+cdef double dndx_positron_muon_rest_frame(double x) noexcept nogil:
     if x <= 2 * R or x >= 1.0 + R2:
         return 0.0
     return -2.0 * sqrt(x**2 - 4.0 * R2) * (4.0 * R2 + x * (-3.0 - 3.0 * R2 + 2.0 * x)) / R_FACTOR
 
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dndx_positron_muon(double x, double beta):
+cdef double dndx_positron_muon(double x, double beta) noexcept nogil:
     cdef double gamma2
     cdef double r22
     cdef double xm
@@ -57,10 +53,8 @@ cdef double dndx_positron_muon(double x, double beta):
     )) / (2 * beta * R_FACTOR)
 
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_positron_muon_point(double e, double emu):
+cdef double dnde_positron_muon_point(double e, double emu) noexcept nogil:
     cdef double beta
     cdef double pre
     cdef double dndx
@@ -79,18 +73,14 @@ cdef double dnde_positron_muon_point(double e, double emu):
     return pre * dndx
 
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_positron_muon_array(double[:] engs_p, double eng_mu):
-    cdef int npts = engs_p.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(engs_p)
-    for i in range(npts):
-        spec[i] = dnde_positron_muon_point(engs_p[i], eng_mu)
+cdef np.ndarray dnde_positron_muon_array(const double[:] engs_p, double eng_mu):
+    spec = np.empty(engs_p.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_positron_muon_point, engs_p, eng_mu, out)
     return spec
 
 
-
 # @cython.boundscheck(True)
 # @cython.wraparound(False)
 # @cython.cdivision(True)
@@ -150,19 +140,20 @@ cdef np.ndarray[np.float64_t,ndim=1] dnde_positron_muon_array(double[:] engs_p,
 # ---- Python API ---------------------------------------------------
 # ===================================================================
 
-def dnde_positron_muon(epos, emu):
+def dnde_positron_muon(epos, emu, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the positron spectrum dN/dE from the decay of a muon.
     Paramaters
     ----------
     epos: float or array-like
         Positron energy.
-    emu: float 
+    emu: float or array-like
         Energy of the muon.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(epos, '__len__'):
-        energies = np.array(epos)
-        assert len(energies.shape) == 1, "Positron energies must be 0 or 1-dimensional."
-        return dnde_positron_muon_array(energies, emu)
-    else:
-        return dnde_positron_muon_point(epos, emu)
+    return evaluate_dnde(dnde_positron_muon_point, epos, emu, out, weight, accumulate)
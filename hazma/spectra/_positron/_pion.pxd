@@ -1,5 +1,5 @@
 import numpy as np
 cimport numpy as np
 
-cdef double dnde_positron_charged_pion_point(double, double)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_positron_charged_pion_array(double[:], double)
\ No newline at end of file
+cdef double dnde_positron_charged_pion_point(double, double) noexcept nogil
+cdef np.ndarray dnde_positron_charged_pion_array(const double[:], double)
@@ -1 +1 @@
-def dnde_positron_charged_pion(epos, epi): ...
+def dnde_positron_charged_pion(epos, epi, out=None, weight=1.0, accumulate=False): ...
@@ -1,13 +1,14 @@
-from libc.math cimport sqrt, pow, log10, fmin, fmax, fabs
+from libc.math cimport sqrt, pow, log10, fmin, fmax, fabs, acosh, cosh
 from libc.float cimport DBL_EPSILON
 import cython
 
-from scipy.integrate import quad
 import numpy as np
 cimport numpy as np
 
 from hazma.spectra._positron._muon cimport dnde_positron_muon_point
 from hazma._utils.boost cimport boost_beta, boost_gamma, boost_delta_function
+from hazma._utils.kernels cimport dnde_fill_array, evaluate_dnde
+from hazma._utils.quadrature cimport gauss_legendre
 
 include "../../_utils/constants.pxd"
 
@@ -24,18 +25,29 @@ cdef double beta_mu = sqrt(1.0 - pow(mmu / eng_mu_pi_rf, 2))
 cdef double emax_mu_rf = (me * me + mmu * mmu) / (2.0 * mmu)
 cdef double emax_pi_rf = gamma_mu * emax_mu_rf * (1.0 + beta_mu * sqrt(1.0 - (me / emax_mu_rf)**2))
 
+# Rapidities of the positron where the spectrum of the muon in the pion rest
+# frame is not smooth: the boosted minimum and maximum energies of the
+# positron in the muon rest frame.
+DEF N_BREAKS = 2
+cdef double RAPIDITY_BREAKS[N_BREAKS]
+RAPIDITY_BREAKS[:] = sorted([
+    np.arccosh(gamma_mu),
+    np.arccosh(gamma_mu * emax_mu_rf * (1.0 - beta_mu * sqrt(1.0 - (me / emax_mu_rf)**2)) / me),
+])
+
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_positron_charged_pion_integrand(double e):
-    return dnde_positron_muon_point(e, eng_mu_pi_rf) / sqrt(e**2 - me**2)
+cdef double dnde_positron_charged_pion_integrand(double rapidity, void* args) noexcept nogil:
+    """
+    Returns the integrand of the boost integral of the spectrum from the muon
+    in terms of the rapidity of the positron. Using the rapidity removes the
+    1 / p singularity of the integrand at the positron mass.
+    """
+    return dnde_positron_muon_point(me * cosh(rapidity), eng_mu_pi_rf)
 
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
 @cython.cdivision(True)
-cdef double dnde_positron_charged_pion_point(double e, double epi):
+cdef double dnde_positron_charged_pion_point(double e, double epi) noexcept nogil:
     cdef double gamma
     cdef double beta
     cdef double emin
@@ -55,24 +67,27 @@ cdef double dnde_positron_charged_pion_point(double e, double epi):
     emin = fmax(gamma * (e - beta * sqrt(e**2 - me**2)), me) 
     emax = fmin(gamma * (e + beta * sqrt(e**2 - me**2)), emax_pi_rf)
 
-    dnde_mu = BR_PI_TO_MU_NUMU * quad(
-        dnde_positron_charged_pion_integrand, emin, emax, epsabs=1e-10, epsrel=1e-4
-    )[0]
+    dnde_mu = BR_PI_TO_MU_NUMU * gauss_legendre(
+        dnde_positron_charged_pion_integrand,
+        NULL,
+        acosh(emin / me),
+        acosh(fmax(emax, emin) / me),
+        RAPIDITY_BREAKS,
+        N_BREAKS,
+        1.0,
+    )
     dnde_mu = dnde_mu / (2 * beta * gamma)
 
     dnde_e = BR_PI_TO_E_NUE * boost_delta_function(eng_e_pi_rf, e, me, beta)
 
     return dnde_mu + dnde_e
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] dnde_positron_charged_pion_array(double[:] eng_ps, double eng_pi):
+cdef np.ndarray dnde_positron_charged_pion_array(const double[:] eng_ps, double eng_pi):
     """Returns the positron spectrum from a charged pion for many positron energies."""
-    cdef int npts = eng_ps.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(eng_ps)
-    for i in range(npts):
-        spec[i] = dnde_positron_charged_pion_point(eng_ps[i], eng_pi)
+    spec = np.empty(eng_ps.shape[0], dtype=np.float64)
+    cdef double[:] out = spec
+    with nogil:
+        dnde_fill_array(dnde_positron_charged_pion_point, eng_ps, eng_pi, out)
     return spec
 
 
@@ -80,19 +95,20 @@ cdef np.ndarray[np.float64_t,ndim=1] dnde_positron_charged_pion_array(double[:]
 # ---- Python API ---------------------------------------------------
 # ===================================================================
 
-def dnde_positron_charged_pion(epos, epi):
+def dnde_positron_charged_pion(epos, epi, out=None, double weight=1.0, bint accumulate=False):
     """
     Compute the positron spectrum dN/dE from the decay of a charged pion.
     Paramaters
     ----------
     epos: float or array-like
         Positron energy.
-    epi: float 
+    epi: float or array-like
         Energy of the pion.
+    out: np.ndarray, optional
+        Array the spectrum is written into.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    if hasattr(epos, '__len__'):
-        energies = np.array(epos)
-        assert len(energies.shape) == 1, "Positron energies must be 0 or 1-dimensional."
-        return dnde_positron_charged_pion_array(energies, epi)
-    else:
-        return dnde_positron_charged_pion_point(epos, epi)
+    return evaluate_dnde(dnde_positron_charged_pion_point, epos, epi, out, weight, accumulate)
@@ -1,17 +1,19 @@
-from typing import Union, overload
+from typing import Optional, Union, overload
 
 import numpy as np
 import numpy.typing as npt
 import pathlib
 from scipy import interpolate
 
+from hazma._utils.accumulate import store
+from hazma._utils.tables import load_table
 from hazma.parameters import electron_mass as me
 
 RealArray = npt.NDArray[np.float64]
 
 
 def load_interp(fname):
-    data = np.loadtxt(
+    data = load_table(
         pathlib.Path(__file__).absolute().parent.joinpath("data", fname),
         delimiter=",",
     ).T
@@ -80,32 +82,75 @@ def _dnde_positron_array(
     )
 
 
+def _dnde_positron_grid(
+    *,
+    positron_energy: RealArray,
+    parent_energy: RealArray,
+    parent_mass: float,
+    interp: interpolate.InterpolatedUnivariateSpline,
+) -> RealArray:
+    """
+    Compute the spectrum for every pair of positron and parent energies. The
+    result has shape (len(parent_energy), len(positron_energy)).
+    """
+    e = positron_energy[np.newaxis, :]
+    ep = parent_energy[:, np.newaxis]
+    k = np.sqrt(np.clip(e**2 - me**2, 0.0, None))
+
+    eps = np.finfo(positron_energy.dtype).eps
+    boosted = ep - parent_mass >= eps
+    gamma = np.where(boosted, ep / parent_mass, 2.0)
+    beta = np.sqrt(1.0 - gamma**-2)
+
+    # The spline is integrated as zero outside of its knots.
+    knots = interp.get_knots()
+    antiderivative = interp.antiderivative()
+    lb = np.clip(gamma * (e - beta * k), knots[0], knots[-1])
+    ub = np.clip(gamma * (e + beta * k), knots[0], knots[-1])
+    dnde = (antiderivative(ub) - antiderivative(lb)) / (2 * beta * gamma)
+
+    rest = np.broadcast_to(interp(positron_energy) * k, dnde.shape)
+    dnde = np.where(boosted, dnde, rest)
+    return np.where((ep >= parent_mass) & (e >= me), dnde, 0.0)
+
+
 def dnde_positron(
     *,
     positron_energy: Union[RealArray, float],
-    parent_energy: float,
+    parent_energy: Union[RealArray, float],
     parent_mass: float,
     interp: interpolate.InterpolatedUnivariateSpline,
+    out: Optional[RealArray] = None,
+    weight: float = 1.0,
+    accumulate: bool = False,
 ) -> Union[RealArray, float]:
-    if parent_energy < parent_mass:
-        return np.zeros_like(positron_energy)
-
-    if isinstance(positron_energy, float):
-        return _dnde_positron_point(
+    if np.ndim(parent_energy) > 0:
+        dnde = _dnde_positron_grid(
+            positron_energy=np.atleast_1d(positron_energy).astype(np.float64),
+            parent_energy=np.asarray(parent_energy, dtype=np.float64),
+            parent_mass=parent_mass,
+            interp=interp,
+        )
+        dnde = dnde if np.ndim(positron_energy) > 0 else dnde[:, 0]
+    elif parent_energy < parent_mass:
+        dnde = np.zeros_like(positron_energy)
+    elif isinstance(positron_energy, float):
+        dnde = _dnde_positron_point(
+            positron_energy=positron_energy,
+            parent_energy=parent_energy,
+            parent_mass=parent_mass,
+            interp=interp,
+        )
+    else:
+        assert hasattr(positron_energy, "__len__"), (
+            "Invalid type for positron_energy."
+            + f"Expected float or numpy array, got: {type(positron_energy)}"
+        )
+        dnde = _dnde_positron_array(
             positron_energy=positron_energy,
             parent_energy=parent_energy,
             parent_mass=parent_mass,
             interp=interp,
         )
 
-    assert hasattr(positron_energy, "__len__"), (
-        "Invalid type for positron_energy."
-        + f"Expected float or numpy array, got: {type(positron_energy)}"
-    )
-
-    return _dnde_positron_array(
-        positron_energy=positron_energy,
-        parent_energy=parent_energy,
-        parent_mass=parent_mass,
-        interp=interp,
-    )
+    return store(dnde, out, weight, accumulate)
@@ -0,0 +1,27 @@
+"""Tests for evaluating the compiled decay spectra from many threads."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from hazma.spectra import _nbody
+
+PARENTS = ["mu", "pi", "pi0", "k", "kl", "ks", "eta", "etap", "rho", "omega", "phi"]
+
+
+@pytest.mark.parametrize("product", ["photon", "positron", "neutrino"])
+def test_thread_pool(product):
+    energies = np.geomspace(1.0, 800.0, 40)
+    tasks = []
+    for state in PARENTS:
+        mass = _nbody.sm_masses[state]
+        for parent in mass * np.array([1.0, 1.5, 4.0]):
+            tasks.append((_nbody._spectra_dict[product][state], parent))
+
+    expected = [dnde(energies, parent) for dnde, parent in tasks]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        actual = list(pool.map(lambda task: task[0](energies, task[1]), tasks))
+
+    for exp, act in zip(expected, actual):
+        np.testing.assert_array_equal(act, exp)
@@ -3,6 +3,7 @@ from typing import Any, Callable
 import numpy as np
 
 from hazma import parameters
+from hazma._utils.accumulate import store
 
 
 def _scalar_splitting(x):
@@ -15,11 +16,12 @@ def _fermion_splitting(x):
 
 def _dndx_photon_fsr(x, s: float, m: float, split: Callable[[Any], Any], q=1.0):
     pre = q**2 * parameters.alpha_em / (2.0 * np.pi)
+    x, s = np.broadcast_arrays(x, s)
     xm = 1.0 - x
-    kernel = np.zeros_like(x)
+    kernel = np.zeros(x.shape, dtype=np.float64)
 
     mask = s * xm / m**2 > np.e
-    kernel[mask] = split(x[mask]) * (np.log(s * xm[mask] / m**2) - 1.0)
+    kernel[mask] = split(x[mask]) * (np.log(s[mask] * xm[mask] / m**2) - 1.0)
 
     return pre * kernel
 
@@ -39,9 +41,10 @@ def dndx_photon_ap_fermion(x, s: float, mass: float, charge=1.0):
     ----------
     x: array_like
         Scaled energies of the fermion, x = 2E/sqrt(s).
-    s: float
+    s: float or array_like
         Squared center-of-mass energy flowing through of the radiating
-        fermion and Y in the process X -> (f + Y) + Z.
+        fermion and Y in the process X -> (f + Y) + Z. Must broadcast
+        against `e`.
     mass: float
         Mass of the radiating fermion.
     charge: float
@@ -59,9 +62,10 @@ def dndx_photon_ap_scalar(x, s, mass, charge=1.0):
     ----------
     x: array_like
         Scaled energies of the fermion, x = 2E/sqrt(s).
-    s: float
+    s: float or array_like
         Squared center-of-mass energy flowing through of the radiating
-        scalar and Y in the process X -> (f + Y) + Z.
+        scalar and Y in the process X -> (f + Y) + Z. Must broadcast
+        against `e`.
     mass: float
         Mass of the radiating scalar.
     charge: float
@@ -70,7 +74,9 @@ def dndx_photon_ap_scalar(x, s, mass, charge=1.0):
     return _dndx_photon_fsr(x, s, mass, _scalar_splitting, q=charge)
 
 
-def dnde_photon_ap_fermion(e, s, mass, charge=1.0):
+def dnde_photon_ap_fermion(
+    e, s, mass, charge=1.0, *, out=None, weight: float = 1.0, accumulate: bool = False
+):
     """
     Compute dN/dE from the FSR off a charged fermion f from a
     process of the form X -> (f + Y + gamma) + Z.
@@ -79,18 +85,29 @@ def dnde_photon_ap_fermion(e, s, mass, charge=1.0):
     ----------
     e: array_like
         Photon energies.
-    s: float
+    s: float or array_like
         Squared center-of-mass energy flowing through of the radiating
-        fermion and Y in the process X -> (f + Y) + Z.
+        fermion and Y in the process X -> (f + Y) + Z. Must broadcast
+        against `e`.
     mass: float
         Mass of the radiating fermion.
     charge: float
         Charge of the radiating fermion. Default is 1.
+    out: np.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    return _dnde_photon_fsr(e, s, mass, _fermion_splitting, q=charge)
+    dnde = _dnde_photon_fsr(e, s, mass, _fermion_splitting, q=charge)
+    return store(dnde, out, weight, accumulate)
 
 
-def dnde_photon_ap_scalar(e, s, mass, charge=1.0):
+def dnde_photon_ap_scalar(
+    e, s, mass, charge=1.0, *, out=None, weight: float = 1.0, accumulate: bool = False
+):
     """
     Compute dN/dE from the FSR off a charged scalar f from a
     process of the form X -> (f + Y + gamma) + Z.
@@ -99,12 +116,21 @@ def dnde_photon_ap_scalar(e, s, mass, charge=1.0):
     ----------
     e: array_like
         Photon energy.
-    s: float
+    s: float or array_like
         Squared center-of-mass energy flowing through of the radiating
-        scalar and Y in the process X -> (f + Y) + Z.
+        scalar and Y in the process X -> (f + Y) + Z. Must broadcast
+        against `e`.
     mass: float
         Mass of the radiating scalar.
     charge: float
         Charge of the radiating scalar. Default is 1.
+    out: np.ndarray, optional
+        Array the spectrum is written into. It must have the shape of the
+        result.
+    weight: float, optional
+        Factor multiplying the spectrum. Default is 1.
+    accumulate: bool, optional
+        If True, the weighted spectrum is added to `out`. Default is False.
     """
-    return _dnde_photon_fsr(e, s, mass, _scalar_splitting, q=charge)
+    dnde = _dnde_photon_fsr(e, s, mass, _scalar_splitting, q=charge)
+    return store(dnde, out, weight, accumulate)
@@ -13,7 +13,6 @@ import inspect
 import warnings
 
 import numpy as np
-from scipy import interpolate
 from scipy import integrate
 
 from hazma.utils import RealArray
@@ -182,17 +181,186 @@ def double_boost_delta_function(
     return dnde
 
 
-def dnde_boost_array(dnde, energies, beta: float, mass: float = 0.0):
+class SpectrumBooster:
+    """
+    Boost spectra dN/dE given as arrays to any number of frames.
+
+    The boost integral of a spectrum over the window [emin, emax] is the
+    integral of dN/dE / k, with k the momentum of the product. This class
+    tabulates the cumulative integral of the linearly interpolated dN/dE / k
+    once, so that evaluating the boost integral for any number of windows
+    only requires a lookup into the table.
+
+    Parameters
+    ----------
+    dnde: array
+        Spectra to boost with shape (..., n). The last axis corresponds to
+        `energies` and the leading axes to a batch of spectra.
+    energies: array
+        Increasing energies of shape (n,) where the spectra are given.
+    mass: float, optional
+        Mass of the product of the spectrum (i.e. 0 for photon, electron-mass
+        for positron). Default is 0.
+
+    Examples
+    --------
+    Boost the photon spectrum of a muon at rest to many boost velocities at
+    once:
+
+    >>> import numpy as np
+    >>> from hazma import spectra
+    >>> from hazma.parameters import muon_mass
+    >>> es = np.geomspace(1e-4, 1.0, 100) * muon_mass
+    >>> booster = spectra.SpectrumBooster(spectra.dnde_photon_muon(es, muon_mass), es)
+    >>> booster(np.array([0.1, 0.3, 0.5])).shape
+    (3, 100)
+    """
+
+    def __init__(self, dnde, energies, mass: float = 0.0):
+        energies = np.asarray(energies, dtype=np.float64)
+        dnde = np.asarray(dnde, dtype=np.float64)
+        if energies.ndim != 1:
+            raise ValueError("Energies must be 1-dimensional.")
+        if dnde.ndim == 0 or dnde.shape[-1] != energies.shape[0]:
+            raise ValueError(
+                f"Expected spectra with last axis of length {energies.shape[0]}."
+                f" Found shape {dnde.shape}."
+            )
+
+        self.energies = energies
+        self.dnde = dnde
+        self.mass = mass
+
+        mask = energies > mass
+        self._knots = energies[mask]
+        self._integrand = dnde[..., mask] / np.sqrt(self._knots**2 - mass**2)
+
+        # Integral of the interpolated integrand from the first knot to each
+        # of the knots.
+        areas = (
+            0.5
+            * np.diff(self._knots)
+            * (self._integrand[..., 1:] + self._integrand[..., :-1])
+        )
+        self._cumulative = np.zeros_like(self._integrand)
+        np.cumsum(areas, axis=-1, out=self._cumulative[..., 1:])
+
+    @property
+    def batch_shape(self) -> Tuple[int, ...]:
+        """Shape of the batch of spectra."""
+        return self.dnde.shape[:-1]
+
+    def _cumulative_integral(self, x):
+        """
+        Integral of the interpolated dN/dE / k from the first knot to `x`.
+        The interpolant vanishes outside of the knots.
+        """
+        knots = self._knots
+        x = np.clip(x, knots[0], knots[-1])
+        idx = np.searchsorted(knots, x, side="right") - 1
+        idx = np.clip(idx, 0, len(knots) - 2)
+
+        y0 = self._integrand[..., idx]
+        y1 = self._integrand[..., idx + 1]
+        t = x - knots[idx]
+        slope = (y1 - y0) / (knots[idx + 1] - knots[idx])
+        return self._cumulative[..., idx] + t * (y0 + 0.5 * slope * t)
+
+    def integral(self, emin, emax):
+        """
+        Integrate the linear interpolation of dN/dE / k over the windows
+        [emin, emax].
+
+        Parameters
+        ----------
+        emin, emax: array
+            Lower and upper integration limits. Must be broadcastable.
+
+        Returns
+        -------
+        integral: array
+            The integrals with shape ``batch_shape + np.broadcast(emin,
+            emax).shape``.
+        """
+        emin, emax = np.broadcast_arrays(
+            np.asarray(emin, dtype=np.float64), np.asarray(emax, dtype=np.float64)
+        )
+        if len(self._knots) < 2:
+            return np.zeros(self.batch_shape + emin.shape)
+        return self._cumulative_integral(emax) - self._cumulative_integral(emin)
+
+    def __call__(self, beta, energies=None):
+        """
+        Compute the boosted spectra.
+
+        Parameters
+        ----------
+        beta: float or array
+            Boost velocities. The spectra are returned unchanged for `beta`
+            close to zero and zeros are returned for `beta` outside [0, 1).
+        energies: float or array, optional
+            Energies where the boosted spectra are evaluated. Default is the
+            energies the spectra are given at.
+
+        Returns
+        -------
+        dnde_boosted: array
+            The boosted spectra with shape ``batch_shape + np.shape(beta) +
+            np.shape(energies)``.
+        """
+        es = self.energies if energies is None else np.asarray(energies, float)
+        betas = np.asarray(beta, dtype=np.float64)
+        e = np.atleast_1d(es).ravel()
+        b = np.atleast_1d(betas).ravel()
+
+        boosted = np.zeros(self.batch_shape + (len(b), len(e)))
+
+        rest = b < np.finfo(float).eps
+        if np.any(rest):
+            boosted[..., rest, :] = self._interp_dnde(e)[..., np.newaxis, :]
+
+        moving = ~rest & (b < 1.0)
+        mask = e > self.mass
+        if np.any(moving) and np.any(mask):
+            bm = b[moving, np.newaxis]
+            gamma = 1.0 / np.sqrt(1.0 - bm**2)
+            k = np.sqrt(e[mask] ** 2 - self.mass**2)
+            emin = gamma * (e[mask] - bm * k)
+            emax = gamma * (e[mask] + bm * k)
+
+            values = np.zeros(self.batch_shape + (len(bm), len(e)))
+            values[..., mask] = self.integral(emin, emax) / (2.0 * bm * gamma)
+            boosted[..., moving, :] = values
+
+        return boosted.reshape(self.batch_shape + betas.shape + np.shape(es))
+
+    def _interp_dnde(self, e):
+        """Linearly interpolate the unboosted spectra, vanishing outside."""
+        if len(self.energies) < 2:
+            return np.where(e == self.energies, self.dnde, 0.0)
+        knots = self.energies
+        inside = (knots[0] <= e) & (e <= knots[-1])
+        x = np.clip(e, knots[0], knots[-1])
+        idx = np.clip(np.searchsorted(knots, x, side="right") - 1, 0, len(knots) - 2)
+        t = (x - knots[idx]) / (knots[idx + 1] - knots[idx])
+        y0 = self.dnde[..., idx]
+        y1 = self.dnde[..., idx + 1]
+        return np.where(inside, y0 + t * (y1 - y0), 0.0)
+
+
+def dnde_boost_array(dnde, energies, beta, mass: float = 0.0):
     """Boost a spectrum dN/dE given as a numeric array.
 
     Parameters
     ----------
     dnde: array
-        Spectrum to boost.
+        Spectrum to boost. A batch of spectra can be boosted at once by
+        passing an array of shape (..., len(energies)).
     energies: array
         Energies corresponding to `dnde`.
-    beta: float
-        Boost velocity. If `beta` is outside [0,1), zeros are returned.
+    beta: float or array
+        Boost velocity. If `beta` is outside [0,1), zeros are returned. If an
+        array is given, the spectrum is boosted to each of the velocities.
     mass: float
         Mass of the product of the spectrum (i.e. 0 for photon, electron-mass
         for positron).
@@ -200,35 +368,16 @@ def dnde_boost_array(dnde, energies, beta: float, mass: float = 0.0):
     Notes
     -----
     The boosted spectrum is computed by creating a linear interpolating
-    function from the data and using it to compute the integral.
+    function from the data and using it to compute the integral. See
+    `SpectrumBooster` to boost the same spectra repeatedly.
 
     Returns
     -------
     dnde_boosted: array
-        The boosted spectrum.
+        The boosted spectrum with shape ``np.shape(dnde)[:-1] + np.shape(beta)
+        + np.shape(energies)``.
     """
-    if beta < np.finfo(float).eps:
-        return dnde
-
-    if beta < 0 or beta > 1.0:
-        return np.zeros_like(energies)
-
-    gamma = 1.0 / np.sqrt(1 - beta**2)
-
-    boosted = np.zeros_like(energies)
-    mask = energies > mass
-    es = energies[mask]
-    k = np.sqrt(es**2 - mass**2)
-    emax = gamma * (es + beta * k)
-    emin = gamma * (es - beta * k)
-
-    integrand = dnde[mask] / k
-    pre = 1.0 / (2 * beta * gamma)
-
-    spline = interpolate.InterpolatedUnivariateSpline(es, integrand, ext=1, k=1)
-    boosted[mask] = np.array([spline.integral(a, b) for a, b in zip(emin, emax)])
-
-    return pre * boosted
+    return SpectrumBooster(dnde, energies, mass=mass)(beta)
 
 
 def make_boost_function(fn: Callable, mass: float, vectorized: bool = True):
@@ -268,14 +417,17 @@ def make_boost_function(fn: Callable, mass: float, vectorized: bool = True):
                 * 'quad': for adaptive quadrature using `scipy.integrate.quad`,
                 * 'quadrature': for adaptive quadrature using `scipy.integrate.quadrature`,
                 * 'trapz': trapizoid rule using `scipy.integrate.trapz`,
-                * 'simps': Simpson's rule using `scipy.integrate.simps`.
+                * 'simps': Simpson's rule using `scipy.integrate.simps`,
+                * 'interp': sample the spectrum once on a grid spanning all
+                  the integration windows and integrate its linear
+                  interpolation using `SpectrumBooster`.
 
             * `kwargs`: Keyword arguments to pass to underlying method. See
-              SciPy's quad available arguments. For `trapizoid` or `simpson`,
-              the number of points to sample from integrand can be specified
-              through `npts`.
+              SciPy's quad available arguments. For `trapizoid`, `simpson` or
+              `interp`, the number of points to sample from integrand can be
+              specified through `npts`.
     """
-    methods = ["quad", "trapz", "simps", "quadrature"]
+    methods = ["quad", "trapz", "simps", "quadrature", "interp"]
 
     def kinematic_early_return(energies: RealArray, beta: float):
         # The function will return something if we should return early due to
@@ -311,6 +463,16 @@ def make_boost_function(fn: Callable, mass: float, vectorized: bool = True):
 
         return integrand
 
+    def boost_sampled(energies, emin, emax, beta, args, npts: int = 1000, **_):
+        # Sample the spectrum once on a logarithmic grid covering all of the
+        # integration windows and boost the samples.
+        if len(emin) == 0:
+            return np.zeros_like(energies)
+        grid = np.geomspace(np.min(emin), np.max(emax), npts)
+        ff = fn if vectorized else np.vectorize(fn)
+        booster = SpectrumBooster(ff(grid, *args), grid, mass=mass)
+        return booster(beta, energies)
+
     def fn_boosted(
         energies,
         beta: float,
@@ -327,8 +489,8 @@ def make_boost_function(fn: Callable, mass: float, vectorized: bool = True):
         beta: float
             Boost velocity. If beta < 0 or beta > 1, zeros are returned.
         method: str, optional
-            Method to use to integrate. Can be 'quad', 'trapizoid' or
-            'simpson'. Default is 'quadrature'.
+            Method to use to integrate. Can be 'quad', 'trapizoid',
+            'simpson' or 'interp'. Default is 'quadrature'.
         args: tuple, optional
             Additional arguments to pass to function.
 
@@ -346,6 +508,9 @@ def make_boost_function(fn: Callable, mass: float, vectorized: bool = True):
             Number of points to use in trapizoidal or simpson integration.
             Default is 100.
 
+        If `method` = 'interp', `npts` is the number of points the spectrum
+        is sampled at. Default is 1000.
+
         If method = 'quad' or 'quadrature, any keyword arguments compatible with
         quad/quadrature can be specified.
         """
@@ -357,6 +522,8 @@ def make_boost_function(fn: Callable, mass: float, vectorized: bool = True):
         gamma = 1.0 / np.sqrt(1.0 - beta**2)
         boosted = np.zeros_like(energies)
         emin, emax, mask = bounds_and_mask(energies=energies, gamma=gamma, beta=beta)
+        if method == "interp":
+            return boost_sampled(energies, emin, emax, beta, args, **kwargs)
 
         integrand = make_integrand(*args)
         integrator = _make_integrator(method, vectorized, **kwargs)
@@ -388,8 +555,8 @@ def dnde_boost(
     mass: float, optional
         Mass of the product. Default is zero (i.e. for a photon.)
     method: str, optional
-        Method to use to integrate. Can be 'quad', 'trapizoid' or
-        'simpson'. Default is 'quadrature'.
+        Method to use to integrate. Can be 'quad', 'trapizoid', 'simpson' or
+        'interp'. Default is 'quadrature'.
     vectorized: bool, optional
        If True, `fn` is assumed to be vectorized. Default is True.
     args: tuple, optional
@@ -0,0 +1,87 @@
+"""Tests for boosting spectra given as arrays."""
+
+import numpy as np
+import pytest
+from scipy import integrate
+
+from hazma import spectra
+from hazma.parameters import electron_mass, muon_mass
+
+ENERGIES = np.geomspace(1e-4, 1.0, 200) * muon_mass
+
+
+def _boost_reference(dnde, energies, beta, mass):
+    # Boost integral of the linear interpolation of dnde / k computed one
+    # energy at a time.
+    gamma = 1.0 / np.sqrt(1.0 - beta**2)
+    mask = energies > mass
+    es = energies[mask]
+    k = np.sqrt(es**2 - mass**2)
+    ys = dnde[mask] / k
+    boosted = np.zeros_like(energies)
+    for i, (e, p) in enumerate(zip(es, k)):
+        # The interpolant vanishes outside of the knots.
+        a = np.clip(gamma * (e - beta * p), es[0], es[-1])
+        b = np.clip(gamma * (e + beta * p), es[0], es[-1])
+        xs = np.concatenate([[a], es[(es > a) & (es < b)], [b]])
+        fs = np.interp(xs, es, ys, left=0.0, right=0.0)
+        boosted[np.flatnonzero(mask)[i]] = integrate.trapezoid(fs, xs)
+    return boosted / (2.0 * beta * gamma)
+
+
+@pytest.mark.parametrize(
+    "dnde_fn,mass",
+    [
+        (spectra.dnde_photon_muon, 0.0),
+        (spectra.dnde_positron_muon, electron_mass),
+    ],
+)
+@pytest.mark.parametrize("beta", [0.01, 0.3, 0.95])
+def test_dnde_boost_array(dnde_fn, mass, beta):
+    dnde = dnde_fn(ENERGIES, muon_mass)
+    expected = _boost_reference(dnde, ENERGIES, beta, mass)
+    actual = spectra.dnde_boost_array(dnde, ENERGIES, beta, mass=mass)
+    np.testing.assert_allclose(actual, expected, rtol=1e-8, atol=1e-12)
+
+
+def test_dnde_boost_array_limits():
+    dnde = spectra.dnde_photon_muon(ENERGIES, muon_mass)
+    np.testing.assert_array_equal(spectra.dnde_boost_array(dnde, ENERGIES, 0.0), dnde)
+    assert np.all(spectra.dnde_boost_array(dnde, ENERGIES, 1.5) == 0.0)
+
+
+def test_spectrum_booster_batch():
+    photon = spectra.dnde_photon_muon(ENERGIES, muon_mass)
+    dnde = np.stack([photon, 3.0 * photon])
+    betas = np.array([0.0, 0.2, 0.7, 1.2])
+
+    booster = spectra.SpectrumBooster(dnde, ENERGIES)
+    boosted = booster(betas)
+    assert boosted.shape == (2, 4, len(ENERGIES))
+
+    for i, beta in enumerate(betas):
+        expected = spectra.dnde_boost_array(photon, ENERGIES, beta)
+        np.testing.assert_allclose(boosted[0, i], expected, rtol=1e-12, atol=1e-14)
+        np.testing.assert_allclose(
+            boosted[1, i], 3.0 * expected, rtol=1e-12, atol=1e-14
+        )
+
+    # Evaluating at other energies only changes the last axis.
+    assert booster(0.5, ENERGIES[10]).shape == (2,)
+    np.testing.assert_allclose(
+        booster(0.5, ENERGIES[10:20]), booster(0.5)[:, 10:20], rtol=1e-12
+    )
+
+
+def test_make_boost_function_interp():
+    def dnde(e):
+        return spectra.dnde_photon_muon(e, muon_mass)
+
+    beta = 0.4
+    gamma = 1.0 / np.sqrt(1.0 - beta**2)
+    es = np.geomspace(1e-2, 0.9, 20) * muon_mass
+    boosted = spectra.make_boost_function(dnde, mass=0.0)
+    # The exact boosted spectrum is the spectrum of a moving muon.
+    expected = spectra.dnde_photon_muon(es, gamma * muon_mass)
+    actual = boosted(es, beta, method="interp", npts=2000)
+    np.testing.assert_allclose(actual, expected, rtol=1e-3)
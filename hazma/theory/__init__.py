@@ -5,6 +5,11 @@ import numpy as np
 import numpy.typing as npt
 
 from hazma.parameters import convolved_spectrum_fn
+from hazma.theory._annihilation_context import (
+    CACHE_ATTR,
+    AnnihilationCache,
+    AnnihilationContext,
+)
 from hazma.theory._theory_cmb import TheoryCMB
 from hazma.theory._theory_constrain import TheoryConstrain
 from hazma.theory._theory_gamma_ray_limits import TheoryGammaRayLimits
@@ -19,6 +24,55 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
 
     kind = "ann"
 
+    #: Set to True by subclasses whose annihilation cross section functions
+    #: accept arrays of center of mass energies.
+    _vectorized_cross_sections = False
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Any change to the model invalidates the cached cross sections and
+        # widths.
+        if name != CACHE_ATTR:
+            self.__dict__.pop(CACHE_ATTR, None)
+
+    def _annihilation_cache(self) -> AnnihilationCache:
+        """Return the store of quantities cached until the model changes."""
+        cache = self.__dict__.get(CACHE_ATTR)
+        if cache is None:
+            cache = AnnihilationCache()
+            setattr(self, CACHE_ATTR, cache)
+        return cache
+
+    def _annihilation_context(self, e_cm) -> AnnihilationContext:
+        r"""
+        Returns the cross sections and branching fractions at a center of mass
+        energy. They are computed once and shared by the spectra, lines and
+        f_eff until a parameter of the model changes.
+
+        Parameters
+        ----------
+        e_cm : float
+            Center of mass energy for the annihilation in MeV.
+
+        Returns
+        -------
+        ctx : AnnihilationContext
+            Context holding the cross sections and branching fractions.
+        """
+        if np.ndim(e_cm) != 0:
+            return AnnihilationContext(e_cm, self.annihilation_cross_sections(e_cm))
+        return self._annihilation_cache().context(self, float(e_cm))
+
+    def _cached_partial_widths(self) -> Dict[str, float]:
+        """
+        Returns the mediator partial widths, computing them only once until a
+        parameter of the model changes.
+        """
+        cache = self._annihilation_cache()
+        if cache.partial_widths is None:
+            cache.partial_widths = self.partial_widths()
+        return cache.partial_widths
+
     @staticmethod
     @abstractmethod
     def list_annihilation_final_states() -> List[str]:
@@ -72,6 +126,44 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
         sigmas["total"] = sum(sigmas.values())
         return sigmas
 
+    def annihilation_cross_sections_array(
+        self, e_cms: npt.ArrayLike
+    ) -> Dict[str, npt.NDArray[np.float64]]:
+        r"""
+        Computes annihilation cross sections for many center of mass
+        energies.
+
+        If the cross section functions of the model accept arrays, each
+        final state is computed in a single call. Otherwise, the cross
+        sections are computed one energy at a time.
+
+        Parameters
+        ---------
+        e_cms : array-like
+            Center of mass energies for the annihilation in MeV.
+
+        Returns
+        -------
+        sigmas : dict(str, np.ndarray)
+            Annihilation cross sections into each final state in
+            :math:`\mathrm{MeV}^{-2}` as well as the total cross section.
+            Each array has the same shape as `e_cms`.
+        """
+        e_cms = np.asarray(e_cms, dtype=np.float64)
+        flat = np.atleast_1d(e_cms).ravel()
+
+        sigmas = {}
+        for fs, sigma_fn in self.annihilation_cross_section_funcs().items():
+            if self._vectorized_cross_sections:
+                sigma = np.asarray(sigma_fn(flat), dtype=np.float64)
+                sigma = np.broadcast_to(sigma, flat.shape)
+            else:
+                sigma = np.array([sigma_fn(e_cm) for e_cm in flat], dtype=np.float64)
+            sigmas[fs] = sigma.reshape(e_cms.shape)
+
+        sigmas["total"] = sum(sigmas.values(), np.zeros(e_cms.shape))
+        return sigmas
+
     def annihilation_branching_fractions(self, e_cm: float) -> Dict[str, float]:
         r"""
         Computes annihilation branching fractions.
@@ -86,14 +178,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
         bfs : dict(str, float)
             Annihilation branching fractions into each final state.
         """
-        cs = self.annihilation_cross_sections(e_cm)
-
-        if cs["total"] == 0:
-            return {fs: 0.0 for fs in cs if fs != "total"}
-        else:
-            return {
-                fs: sigma / cs["total"] for fs, sigma in cs.items() if fs != "total"
-            }
+        return dict(self._annihilation_context(e_cm).branching_fractions)
 
     @abstractmethod
     def partial_widths(self) -> Dict[str, float]:
@@ -140,7 +225,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
 
         def make_dnde_wrapped(fs):
             def dnde_wrapped(e_gams, e_cm):
-                if sigma_ann_fns[fs](e_cm) > 0:
+                if self._annihilation_context(e_cm).cross_sections[fs] > 0:
                     return spectrum_funcs[fs](e_gams, e_cm)
                 else:
                     return np.zeros_like(e_gams)
@@ -170,7 +255,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
             channel rescaled by the corresponding branching fraction into that
             channel.
         """
-        bfs = self.annihilation_branching_fractions(e_cm)
+        bfs = self._annihilation_context(e_cm).branching_fractions
         specs = {}
 
         for fs, dnde_func in self.spectrum_funcs().items():
@@ -236,7 +321,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
             For each final state containing a monochromatic photon, gives the
             energy of the photon and branching fraction into that final state.
         """
-        bfs = self.annihilation_branching_fractions(e_cm)
+        bfs = self._annihilation_context(e_cm).branching_fractions
         lines = {}
 
         for fs, e in self._gamma_ray_line_energies(e_cm).items():
@@ -311,7 +396,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
 
         def make_dnde_wrapped(fs):
             def dnde_wrapped(e_gams, e_cm):
-                if sigma_ann_fns[fs](e_cm) > 0:
+                if self._annihilation_context(e_cm).cross_sections[fs] > 0:
                     return spectrum_funcs[fs](e_gams, e_cm)
                 else:
                     return np.zeros_like(e_gams)
@@ -341,7 +426,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
             channel rescaled by the corresponding branching fraction into that
             channel.
         """
-        bfs = self.annihilation_branching_fractions(e_cm)
+        bfs = self._annihilation_context(e_cm).branching_fractions
         specs = {}
 
         for fs, dnde_pos_func in self.positron_spectrum_funcs().items():
@@ -400,7 +485,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
             For each final state containing a monochromatic photon, gives the
             energy of the photon and branching fraction into that final state.
         """
-        bfs = self.annihilation_branching_fractions(e_cm)
+        bfs = self._annihilation_context(e_cm).branching_fractions
         lines = {}
 
         for fs, e in self._positron_line_energies(e_cm).items():
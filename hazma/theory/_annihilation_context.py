@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Dict
+
+# Name of the attribute holding the cached quantities of a model. Assigning
+# any other attribute of the model discards the cache.
+CACHE_ATTR = "_annihilation_cache_data"
+
+# Number of center of mass energies for which contexts are kept.
+MAX_CONTEXTS = 16
+
+
+class AnnihilationContext:
+    r"""
+    Annihilation cross sections and branching fractions of a model at a fixed
+    center of mass energy.
+
+    Computing the spectra, the lines and f_eff of a model all require the
+    cross sections into every final state at the same center of mass energy.
+    Contexts are created through ``TheoryAnn._annihilation_context``, which
+    reuses them until a parameter of the model changes.
+
+    Attributes
+    ----------
+    e_cm : float
+        Center of mass energy in MeV.
+    cross_sections : dict(str, float)
+        Annihilation cross section into each final state in
+        :math:`\mathrm{MeV}^{-2}` as well as the total cross section.
+    branching_fractions : dict(str, float)
+        Annihilation branching fraction into each final state.
+    """
+
+    def __init__(self, e_cm: float, cross_sections: Dict[str, float]):
+        self.e_cm = e_cm
+        self.cross_sections = cross_sections
+
+        total = cross_sections["total"]
+        if total == 0:
+            self.branching_fractions = {
+                fs: 0.0 for fs in cross_sections if fs != "total"
+            }
+        else:
+            self.branching_fractions = {
+                fs: sigma / total
+                for fs, sigma in cross_sections.items()
+                if fs != "total"
+            }
+
+    def __repr__(self):
+        return f"AnnihilationContext(e_cm={self.e_cm})"
+
+
+class AnnihilationCache:
+    """
+    Quantities of a model computed once and shared until one of its
+    parameters changes: the mediator partial widths and the annihilation
+    contexts of the most recently used center of mass energies.
+    """
+
+    def __init__(self):
+        self.partial_widths = None
+        self.contexts = OrderedDict()
+
+    def context(self, model, e_cm: float) -> AnnihilationContext:
+        """Return the context of `model` at `e_cm`, creating it if needed."""
+        ctx = self.contexts.get(e_cm)
+        if ctx is None:
+            ctx = AnnihilationContext(e_cm, model.annihilation_cross_sections(e_cm))
+            self.contexts[e_cm] = ctx
+            if len(self.contexts) > MAX_CONTEXTS:
+                self.contexts.popitem(last=False)
+        else:
+            self.contexts.move_to_end(e_cm)
+        return ctx
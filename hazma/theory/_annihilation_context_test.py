@@ -0,0 +1,51 @@
+"""Tests for the cached annihilation contexts of TheoryAnn."""
+
+import numpy as np
+import pytest
+
+from hazma.scalar_mediator import HiggsPortal
+
+
+@pytest.fixture
+def model(monkeypatch):
+    model = HiggsPortal(mx=150.0, ms=100.0, gsxx=1.0, stheta=1e-3)
+    calls = []
+    sigmas = HiggsPortal.annihilation_cross_sections
+
+    def counted(self, e_cm):
+        calls.append(e_cm)
+        return sigmas(self, e_cm)
+
+    monkeypatch.setattr(HiggsPortal, "annihilation_cross_sections", counted)
+    model.calls = calls
+    return model
+
+
+def test_cross_sections_shared(model):
+    e_cm = 310.0
+    es = np.geomspace(1.0, 150.0, 10)
+    model.calls.clear()
+
+    model.spectra(es, e_cm)
+    model.gamma_ray_lines(e_cm)
+    model.positron_spectra(es, e_cm)
+    model.positron_lines(e_cm)
+    for e in es:
+        model.total_spectrum(e, e_cm)
+
+    assert model.calls == [e_cm]
+
+
+def test_setter_invalidates(model):
+    e_cm = 310.0
+    bfs = model.annihilation_branching_fractions(e_cm)
+    model.calls.clear()
+
+    model.stheta = 1e-1
+    new_bfs = model.annihilation_branching_fractions(e_cm)
+
+    assert model.calls == [e_cm]
+    assert new_bfs != bfs
+    assert new_bfs == HiggsPortal(
+        mx=150.0, ms=100.0, gsxx=1.0, stheta=1e-1
+    ).annihilation_branching_fractions(e_cm)
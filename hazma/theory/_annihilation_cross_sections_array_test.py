@@ -0,0 +1,69 @@
+"""Tests for the cross sections of TheoryAnn on arrays of energies."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma.scalar_mediator import HiggsPortal
+from hazma.single_channel import SingleChannelAnn
+from hazma.vector_mediator import KineticMixing, KineticMixingGeV
+
+# Center-of-mass energies in units of mx: below the DM threshold, just below
+# and above it, and across the mediator resonances.
+E_CMS = np.array([[0.5, 1.9999, 2.0001, 2.5], [4.0, 8.0, 15.0, 20.0]])
+
+# Channels integrated over phase space with Monte-Carlo
+MC_CHANNELS = {"pi pi pi0", "pi pi pi pi", "pi pi pi0 pi0"}
+
+
+def loop_cross_sections(model, e_cms):
+    """Cross sections from `annihilation_cross_sections`, one energy at a time."""
+    sigmas = [model.annihilation_cross_sections(e_cm) for e_cm in e_cms.ravel()]
+    return {
+        fs: np.array([sigma[fs] for sigma in sigmas]).reshape(e_cms.shape)
+        for fs in sigmas[0]
+    }
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        HiggsPortal(mx=150.0, ms=1e3, gsxx=1.0, stheta=1e-3),
+        KineticMixing(mx=150.0, mv=1e3, gvxx=1.0, eps=1e-3),
+        SingleChannelAnn(150.0, "e e", 1e-26),
+    ],
+)
+def test_matches_loop(model):
+    e_cms = model.mx * E_CMS
+    sigmas = model.annihilation_cross_sections_array(e_cms)
+    expected = loop_cross_sections(model, e_cms)
+
+    assert set(sigmas) == set(expected)
+    for fs, sigma in sigmas.items():
+        assert sigma.shape == e_cms.shape
+        assert_allclose(sigma, expected[fs], rtol=1e-12, atol=0.0, err_msg=fs)
+    assert np.all(sigmas["total"][0, :2] == 0.0)
+
+
+def test_matches_loop_form_factors():
+    model = KineticMixingGeV(mx=300.0, mv=1e3, gvxx=1.0, eps=1e-3)
+    # The second energy is above the four-pion threshold but below 2 mx
+    e_cms = np.array([400.0, 599.9, 700.0])
+    sigmas = model.annihilation_cross_sections_array(e_cms)
+    expected = loop_cross_sections(model, e_cms)
+
+    assert set(sigmas) == set(expected)
+    for fs, sigma in sigmas.items():
+        assert np.all(sigma[:2] == 0.0), fs
+        rtol = 0.1 if fs in MC_CHANNELS or fs == "total" else 1e-12
+        assert_allclose(sigma, expected[fs], rtol=rtol, atol=0.0, err_msg=fs)
+
+
+def test_scalar_energy():
+    model = HiggsPortal(mx=150.0, ms=1e3, gsxx=1.0, stheta=1e-3)
+    sigmas = model.annihilation_cross_sections_array(400.0)
+    expected = model.annihilation_cross_sections(400.0)
+
+    for fs, sigma in sigmas.items():
+        assert np.shape(sigma) == ()
+        assert_allclose(sigma, expected[fs], rtol=1e-12)
@@ -1,6 +1,7 @@
 from scipy.interpolate import interp1d
 from scipy.integrate import quad
-from hazma.cmb import vx_cmb, f_eff_g, f_eff_ep, p_ann_planck_temp_pol
+from hazma import cmb
+from hazma.cmb import vx_cmb, p_ann_planck_temp_pol
 
 import numpy as np
 
@@ -68,11 +69,11 @@ class TheoryCMB:
         e_cm = 2.0 * mx * (1.0 + 0.5 * vx_cmb(mx, x_kd) ** 2)
 
         if fs == "g g":
-            f_eff_base = f_eff_g
+            f_eff_base = cmb.f_eff_g
             lines = self.gamma_ray_lines(e_cm)  # type: ignore
             spec_fn = self.total_spectrum  # type: ignore
         elif fs == "e e":
-            f_eff_base = f_eff_ep
+            f_eff_base = cmb.f_eff_ep
             lines = self.positron_lines(e_cm)  # type: ignore
 
             def spec_fn(es, e_cm):
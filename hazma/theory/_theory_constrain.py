@@ -1,11 +1,212 @@
 from abc import abstractmethod
+import functools
+import multiprocessing as mp
+import os
+import time
+import warnings
+
 from skimage import measure
 
 import numpy as np
 
 
+def _scan_evaluate_points(model, idxs, points, update_dict=False):
+    """Evaluate every constraint of a model at a list of parameter points.
+
+    Parameters
+    ----------
+    model : TheoryConstrain
+        Model used to evaluate the constraints. It is mutated in place.
+    idxs : np.array
+        Flat indices of the points into the constraint images.
+    points : list(dict)
+        Parameter values at each point.
+    update_dict : bool
+        If True, the model's ``__dict__`` is updated with each point. Otherwise
+        each parameter is set with ``setattr``.
+
+    Returns
+    -------
+    idxs : np.array
+        The input flat indices.
+    values : dict(str, np.array)
+        Value of each constraint at each point.
+    """
+    constraints = model.constraints()
+    values = {cn: np.zeros(len(points)) for cn in constraints.keys()}
+
+    for k, params in enumerate(points):
+        if update_dict:
+            model.__dict__.update(params)
+        else:
+            for name, val in params.items():
+                setattr(model, name, val)
+
+        for cn, fn in constraints.items():
+            values[cn][k] = fn()
+
+    return idxs, values
+
+
+def _scan_evaluate_task(model, task):
+    """Evaluate a chunk of the scan. Used by the worker processes."""
+    return _scan_evaluate_points(model, *task)
+
+
+def _load_scan_checkpoint(checkpoint, names, grid):
+    """Load images and completed points from a scan checkpoint, if present.
+
+    Raises a ValueError if the checkpoint was written by a different scan.
+    """
+    if checkpoint is None or not os.path.exists(checkpoint):
+        return None
+
+    with np.load(checkpoint) as data:
+        stored = {
+            key[len("grid_") :]: data[key] for key in data if key.startswith("grid_")
+        }
+        matches = (
+            list(data["names"]) == list(names)
+            and stored.keys() == grid.keys()
+            and all(np.array_equal(stored[key], grid[key]) for key in grid)
+        )
+        if not matches:
+            raise ValueError(
+                f"Checkpoint {checkpoint} does not match the requested scan."
+            )
+        imgs = {cn: img for cn, img in zip(names, data["images"])}
+        done = data["done"]
+
+    return imgs, done
+
+
+def _save_scan_checkpoint(checkpoint, grid, imgs, done):
+    """Atomically write the current state of a scan to disk."""
+    tmp = f"{checkpoint}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            names=np.array(list(imgs.keys())),
+            images=np.array(list(imgs.values())),
+            done=done,
+            **{f"grid_{key}": val for key, val in grid.items()},
+        )
+    os.replace(tmp, checkpoint)
+
+
+def _scan(
+    model,
+    shape,
+    tasks,
+    num_cpus=1,
+    checkpoint=None,
+    checkpoint_interval=60.0,
+    grid=None,
+    callback=None,
+    update_dict=False,
+):
+    """Evaluate a model's constraints over a grid of parameter points.
+
+    Parameters
+    ----------
+    model : TheoryConstrain
+        Model to constrain.
+    shape : tuple(int, int)
+        Shape of the constraint images.
+    tasks : list((np.array, list(dict)))
+        Chunks of work. Each chunk contains the flat indices into the images and
+        the parameter values at those indices.
+    num_cpus : int
+        Number of worker processes. If 1, the constraints are evaluated in this
+        process using `model` itself.
+    checkpoint : str, optional
+        Path to a ``.npz`` file used to store the partial images. If the file
+        exists, the scan is resumed from it.
+    checkpoint_interval : float
+        Minimum number of seconds between two writes of the checkpoint. The
+        checkpoint is always written once the scan finishes.
+    grid : dict(str, np.array), optional
+        Arrays identifying the scanned grid. They are stored in the checkpoint
+        and a checkpoint is only resumed if they match.
+    callback : callable, optional
+        Function called as ``callback(imgs, done)`` each time a chunk finishes,
+        where ``done`` is a boolean image flagging the computed points.
+    update_dict : bool
+        If True, the model's ``__dict__`` is updated with each point rather
+        than setting each parameter with ``setattr``.
+
+    Returns
+    -------
+    imgs : dict(str, np.array)
+        The constraint images.
+    """
+    names = list(model.constraints().keys())
+    grid = {} if grid is None else grid
+
+    state = _load_scan_checkpoint(checkpoint, names, grid)
+    if state is None:
+        imgs = {cn: np.zeros(shape) for cn in names}
+        done = np.zeros(shape, dtype=bool)
+    else:
+        imgs, done = state
+
+    tasks = [
+        (idxs, points, update_dict)
+        for idxs, points in tasks
+        if not np.all(done.flat[idxs])
+    ]
+
+    last_save = time.monotonic()
+
+    def update(idxs, values):
+        nonlocal last_save
+        for cn in names:
+            imgs[cn].flat[idxs] = values[cn]
+        done.flat[idxs] = True
+
+        if checkpoint is not None:
+            now = time.monotonic()
+            if now - last_save >= checkpoint_interval:
+                _save_scan_checkpoint(checkpoint, grid, imgs, done)
+                last_save = now
+        if callback is not None:
+            callback(imgs, done)
+
+    try:
+        if num_cpus == 1:
+            for task in tasks:
+                update(*_scan_evaluate_points(model, *task))
+        else:
+            if num_cpus > mp.cpu_count():
+                warnings.warn(
+                    f"You only have {mp.cpu_count()} cpus. "
+                    f"Using {mp.cpu_count()} cpus instead."
+                )
+                num_cpus = mp.cpu_count()
+
+            # Each task is sent with its own copy of the model.
+            evaluate = functools.partial(_scan_evaluate_task, model)
+            with mp.Pool(num_cpus) as pool:
+                for idxs, values in pool.imap_unordered(evaluate, tasks):
+                    update(idxs, values)
+    finally:
+        # Keep the completed points if the scan is interrupted.
+        if checkpoint is not None and len(tasks) > 0:
+            _save_scan_checkpoint(checkpoint, grid, imgs, done)
+
+    return imgs
+
+
 class TheoryConstrain:
-    def custom_constrain(self, param_grid, ls_or_img="image"):
+    def custom_constrain(
+        self,
+        param_grid,
+        ls_or_img="image",
+        num_cpus=1,
+        checkpoint=None,
+        checkpoint_interval=60.0,
+        callback=None,
+    ):
         """Computes constraints over grid of parameter values.
 
         Parameters
@@ -14,6 +215,24 @@ class TheoryConstrain:
             Parameter values at which to compute constraints.
         ls_or_img : "image" or "ls"
             Controls whether this function returns level sets or images.
+        num_cpus : int
+            Number of worker processes used to evaluate the constraints. Each
+            row of the grid is evaluated by one worker on its own copy of this
+            theory. The default, 1, evaluates the constraints serially using
+            this theory.
+        checkpoint : str, optional
+            Path to a ``.npz`` file where the partial images and the parameter
+            values of the grid are stored. If the file already exists, the
+            points it contains are not recomputed. A ValueError is raised if
+            it was written for a different grid.
+        checkpoint_interval : float, optional
+            Minimum number of seconds between two writes of the checkpoint.
+            The checkpoint is also written when the scan finishes or is
+            interrupted. Default is 60.
+        callback : callable, optional
+            Function called as ``callback(imgs, done)`` after each row is
+            computed, where ``imgs`` are the partial images and ``done`` is a
+            boolean array flagging which points have been computed.
 
         Returns
         -------
@@ -30,28 +249,58 @@ class TheoryConstrain:
             is excluded by the constraint.
         """
         n_rows, n_cols = param_grid.shape
-        constraints = self.constraints()
 
-        # Store the constraint images. Note that p1 and p2 must be swapped
-        # so we can use Cartesian rather than matrix indexing.
-        imgs = {cn: np.zeros([n_rows, n_rows]) for cn in constraints.keys()}
-
-        # Loop over the parameter grid
-        for i in range(n_rows):
-            for j in range(n_cols):
-                # Set this theory's parameters to the values at this point
-                self.__dict__.update(param_grid[i, j].__dict__)
-
-                # Compute all constraints at this point in parameter space
-                for cn, fn in constraints.items():
-                    imgs[cn][i, j] = fn()
+        # Values of each parameter over the grid, used to identify the grid in
+        # the checkpoint.
+        param_names = sorted({name for p in param_grid.flat for name in p.__dict__})
+        grid = {"params": np.array(param_names)}
+        for name in param_names:
+            vals = np.array(
+                [[getattr(p, name, np.nan) for p in row] for row in param_grid]
+            )
+            if vals.dtype.kind not in "biufcU":
+                vals = np.vectorize(repr, otypes=[str])(vals)
+            grid[f"param_{name}"] = vals
+
+        # Each task sets this theory's parameters to the values of a row of
+        # the grid
+        tasks = [
+            (
+                np.arange(i * n_cols, (i + 1) * n_cols),
+                [param_grid[i, j].__dict__ for j in range(n_cols)],
+            )
+            for i in range(n_rows)
+        ]
+
+        imgs = _scan(
+            self,
+            (n_rows, n_cols),
+            tasks,
+            num_cpus=num_cpus,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            grid=grid,
+            callback=callback,
+            update_dict=True,
+        )
 
         if ls_or_img == "image":
             return imgs
         elif ls_or_img == "ls":
             raise NotImplementedError("currently does not work")
 
-    def constrain(self, p1, p1_vals, p2, p2_vals, ls_or_img="image"):
+    def constrain(
+        self,
+        p1,
+        p1_vals,
+        p2,
+        p2_vals,
+        ls_or_img="image",
+        num_cpus=1,
+        checkpoint=None,
+        checkpoint_interval=60.0,
+        callback=None,
+    ):
         """Computes constraints over 2D slice of parameter space.
 
         Parameters
@@ -67,6 +316,24 @@ class TheoryConstrain:
             Values of p2 at which to compute constraints. Must be sorted.
         ls_or_img : "image" or "ls"
             Controls whether this function returns level sets or images.
+        num_cpus : int
+            Number of worker processes used to evaluate the constraints. Each
+            value of p1 is handled by one worker on its own copy of this
+            theory. The default, 1, evaluates the constraints serially using
+            this theory.
+        checkpoint : str, optional
+            Path to a ``.npz`` file where the partial images, p1, p2 and their
+            values are stored. If the file already exists, the scan is resumed
+            from it. A ValueError is raised if it was written for different
+            parameters or values.
+        checkpoint_interval : float, optional
+            Minimum number of seconds between two writes of the checkpoint.
+            The checkpoint is also written when the scan finishes or is
+            interrupted. Default is 60.
+        callback : callable, optional
+            Function called as ``callback(imgs, done)`` after each value of p1
+            is computed, where ``imgs`` are the partial images and ``done`` is
+            a boolean array flagging which points have been computed.
 
         Returns
         -------
@@ -89,21 +356,35 @@ class TheoryConstrain:
             )
 
         n_p1s, n_p2s = len(p1_vals), len(p2_vals)
-        constraints = self.constraints()
 
         # Store the constraint images. Note that p1 and p2 must be swapped
-        # so we can use Cartesian rather than matrix indexing.
-        imgs = {cn: np.zeros([n_p2s, n_p1s]) for cn in constraints.keys()}
-
-        # Loop over the parameter values
-        for idx_p1, p1_val in np.ndenumerate(p1_vals):
-            for idx_p2, p2_val in np.ndenumerate(p2_vals):
-                setattr(self, p1, p1_val)
-                setattr(self, p2, p2_val)
-
-                # Compute all constraints at this point in parameter space
-                for cn, fn in constraints.items():
-                    imgs[cn][idx_p2[0], idx_p1[0]] = fn()
+        # so we can use Cartesian rather than matrix indexing. Each task
+        # computes one column of the images.
+        tasks = [
+            (
+                np.arange(n_p2s) * n_p1s + idx_p1,
+                [{p1: p1_val, p2: p2_val} for p2_val in p2_vals],
+            )
+            for idx_p1, p1_val in enumerate(p1_vals)
+        ]
+
+        grid = {
+            "p1": np.array(p1),
+            "p2": np.array(p2),
+            "p1_vals": np.asarray(p1_vals),
+            "p2_vals": np.asarray(p2_vals),
+        }
+
+        imgs = _scan(
+            self,
+            (n_p2s, n_p1s),
+            tasks,
+            num_cpus=num_cpus,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            grid=grid,
+            callback=callback,
+        )
 
         if ls_or_img == "image":
             return imgs
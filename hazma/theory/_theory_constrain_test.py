@@ -0,0 +1,103 @@
+"""Tests for the parameter scans of TheoryConstrain."""
+
+import types
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from hazma.theory._theory_constrain import TheoryConstrain
+
+P1_VALS = np.linspace(0.0, 1.0, 4)
+P2_VALS = np.linspace(-1.0, 1.0, 5)
+
+
+class ToyTheory(TheoryConstrain):
+    """Theory with two parameters counting the evaluated points."""
+
+    def __init__(self):
+        self.a = 0.0
+        self.b = 0.0
+        self.n_calls = 0
+
+    def _constraint(self):
+        self.n_calls += 1
+        return self.a - self.b
+
+    def constraints(self):
+        return {"diff": self._constraint, "sum": lambda: self.a + self.b}
+
+
+def expected_images():
+    a, b = np.meshgrid(P1_VALS, P2_VALS)
+    return {"diff": a - b, "sum": a + b}
+
+
+@pytest.mark.filterwarnings("ignore:You only have")
+@pytest.mark.parametrize("num_cpus", [1, 2])
+def test_constrain(num_cpus):
+    imgs = ToyTheory().constrain("a", P1_VALS, "b", P2_VALS, num_cpus=num_cpus)
+    for cn, img in expected_images().items():
+        assert_allclose(imgs[cn], img)
+
+
+def test_custom_constrain():
+    param_grid = np.empty((len(P2_VALS), len(P1_VALS)), dtype=object)
+    for i, b in enumerate(P2_VALS):
+        for j, a in enumerate(P1_VALS):
+            param_grid[i, j] = types.SimpleNamespace(a=a, b=b)
+
+    imgs = ToyTheory().custom_constrain(param_grid)
+    for cn, img in expected_images().items():
+        assert_allclose(imgs[cn], img)
+
+
+def test_checkpoint_resume(tmp_path):
+    checkpoint = str(tmp_path.joinpath("scan.npz"))
+    n_p1s = 2
+
+    # Interrupt the scan after the first values of p1.
+    def interrupt(_, done):
+        if np.count_nonzero(done.all(axis=0)) == n_p1s:
+            raise KeyboardInterrupt
+
+    theory = ToyTheory()
+    with pytest.raises(KeyboardInterrupt):
+        theory.constrain(
+            "a",
+            P1_VALS,
+            "b",
+            P2_VALS,
+            checkpoint=checkpoint,
+            checkpoint_interval=np.inf,
+            callback=interrupt,
+        )
+    assert theory.n_calls == n_p1s * len(P2_VALS)
+
+    theory = ToyTheory()
+    imgs = theory.constrain("a", P1_VALS, "b", P2_VALS, checkpoint=checkpoint)
+    assert theory.n_calls == (len(P1_VALS) - n_p1s) * len(P2_VALS)
+    for cn, img in expected_images().items():
+        assert_allclose(imgs[cn], img)
+
+    # Nothing is recomputed once the scan is complete.
+    theory = ToyTheory()
+    theory.constrain("a", P1_VALS, "b", P2_VALS, checkpoint=checkpoint)
+    assert theory.n_calls == 0
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("a", P1_VALS + 1.0, "b", P2_VALS),
+        ("a", P1_VALS, "b", P2_VALS[::-1]),
+        ("b", P1_VALS, "a", P2_VALS),
+        ("a", P1_VALS[:-1], "b", P2_VALS),
+    ],
+)
+def test_checkpoint_mismatch(tmp_path, args):
+    checkpoint = str(tmp_path.joinpath("scan.npz"))
+    ToyTheory().constrain("a", P1_VALS, "b", P2_VALS, checkpoint=checkpoint)
+
+    with pytest.raises(ValueError):
+        ToyTheory().constrain(*args, checkpoint=checkpoint)
@@ -1,22 +1,43 @@
-from typing import Callable, Any, Optional, List, NamedTuple
+from typing import Callable, Any, Optional, List, NamedTuple, Union
 from collections import OrderedDict
 from math import pi, sqrt
 import logging
-import functools
+import numbers
 
 import numpy as np
 import numpy.typing as npt
-from scipy.interpolate import InterpolatedUnivariateSpline
+from scipy.interpolate import BSpline, InterpolatedUnivariateSpline
+from scipy.optimize import minimize
+from scipy.sparse.linalg import spsolve
 from scipy.stats import chi2, norm
 
 from hazma.flux_measurement import FluxMeasurement
 from hazma.background_model import ParametricBackgroundModel, BackgroundModel
+from hazma.detector_response import DetectorResponse
 from hazma.target_params import TargetParams
 
 EnergyResolution = Callable[[Any], Any]
 EffectiveArea = Callable[[Any], Any]
 
 
+def _unpack_detector_response(effective_area, energy_res):
+    """
+    Return the effective area and energy resolution to use. If
+    `effective_area` is a `DetectorResponse`, its effective area is used and
+    the response itself serves as the energy resolution (unless `energy_res`
+    is given), so its memoized resolution matrices are reused.
+    """
+    if isinstance(effective_area, DetectorResponse):
+        if energy_res is None:
+            energy_res = effective_area
+        effective_area = effective_area.effective_area
+    if energy_res is None:
+        raise ValueError(
+            "`energy_res` is required unless a DetectorResponse is passed."
+        )
+    return effective_area, energy_res
+
+
 def _get_product_spline(f1, f2, grid, k=1, ext="raise"):
     """Returns a spline representing the product of two functions.
 
@@ -191,10 +212,12 @@ def _differential_signal_flux(
         Dark matter model.
     energies: array
         Array of energies used to construct the interpolating function.
-    effective_area: Callable
-        Effective area of the observing telescope.
+    effective_area: Callable or DetectorResponse
+        Effective area of the observing telescope. If a `DetectorResponse` is
+        given, its energy resolution and resolution matrices are used.
     energy_res: Callable
-        Energy resolution of the telescope.
+        Energy resolution of the telescope. May be None if `effective_area` is
+        a `DetectorResponse`.
     target: TargetParams
         Target the telescope is observing.
     tobs: float
@@ -257,10 +280,129 @@ class FisherResults(NamedTuple):
         return norm.ppf(norm.cdf(sigma)) * np.sqrt(inv[idx, idx])
 
 
+def _fisher_signal_scale(model) -> float:
+    """Natural scale of the rate used to build the signal template."""
+    if model.kind == "ann":
+        return 1.0  # 3e-26
+    elif model.kind == "dec":
+        return 1.0  # 1e-24
+    raise ValueError(f"Encountered model with invalid `kind`: {model.kind}")
+
+
+def _fisher_energies(effective_area, n_grid: int, e_grid=None):
+    """Return the integration bounds and energy grid used for the Fisher matrix."""
+    e_min, e_max = effective_area.x[[0, -1]]
+    if e_grid is not None:
+        energies = e_grid
+    else:
+        energies = np.geomspace(e_min, e_max, n_grid)
+    return e_min, e_max, energies
+
+
+def _spline_integral_weights(energies, e_min, e_max, k: int = 1, ext="raise"):
+    """
+    Compute the weights `w` such that the integral over [e_min, e_max] of the
+    degree-k interpolating spline through (energies, ys) is `w @ ys`.
+
+    As with `InterpolatedUnivariateSpline.integral`, the spline is taken to
+    vanish outside of the interval spanned by `energies`.
+    """
+    energies = np.asarray(energies, dtype=np.float64)
+    a = np.clip(e_min, energies[0], energies[-1])
+    b = np.clip(e_max, energies[0], energies[-1])
+
+    if k == 1:
+        # Trapezoid rule restricted to [a, b]: integrate the two hat functions
+        # supported on each interval over its overlap with [a, b].
+        xl, xr = energies[:-1], energies[1:]
+        lo = np.clip(a, xl, xr)
+        hi = np.clip(b, xl, xr)
+        h = xr - xl
+        weights = np.zeros_like(energies)
+        weights[:-1] += ((xr - lo) ** 2 - (xr - hi) ** 2) / (2.0 * h)
+        weights[1:] += ((hi - xl) ** 2 - (lo - xl) ** 2) / (2.0 * h)
+        return weights
+
+    # The interpolating spline is linear in the data: its B-spline coefficients
+    # solve B c = ys, where B is the (banded) collocation matrix. Hence the
+    # integral is I @ c = (B^-T I) @ ys, where I holds the integrals of the
+    # basis splines over [a, b].
+    knots = InterpolatedUnivariateSpline(
+        energies, np.zeros_like(energies), k=k, ext=ext
+    ).get_knots()
+    t = np.concatenate([np.repeat(knots[0], k), knots, np.repeat(knots[-1], k)])
+    n = len(t) - k - 1
+
+    # The antiderivative of the j-th degree-k basis spline is
+    # (t[j+k+1] - t[j]) / (k+1) times the sum of the degree-(k+1) basis splines
+    # i > j on the knots t extended by one knot at each end.
+    t_anti = np.concatenate([t[:1], t, t[-1:]])
+    rows = BSpline.design_matrix(np.array([a, b]), t_anti, k + 1).toarray()
+    tails = np.cumsum(rows[:, ::-1], axis=1)[:, ::-1]
+    integrals = (t[k + 1 :] - t[:n]) / (k + 1) * (tails[1, 1:] - tails[0, 1:])
+
+    collocation = BSpline.design_matrix(energies, t, k)
+    return spsolve(collocation.T.tocsc(), integrals)
+
+
+def _fisher_matrices(
+    signals,
+    energies,
+    e_min: float,
+    e_max: float,
+    effective_area: EffectiveArea,
+    target: TargetParams,
+    background_model: ParametricBackgroundModel,
+    tobs: float,
+    k: int = 1,
+    ext: str = "raise",
+):
+    """
+    Compute the Fisher matrices for a stack of signal templates.
+
+    Parameters
+    ----------
+    signals: array
+        Differential signal fluxes evaluated on `energies`, with shape
+        (n_models, len(energies)).
+
+    Returns
+    -------
+    params: OrderedDict
+        Fiducial parameters, ordered as the rows of the Fisher matrices.
+    fishers: array
+        Fisher matrices with shape (n_models, n_params, n_params).
+    """
+    params = OrderedDict(background_model.params.copy())
+    params["rate"] = 0.0
+    params.move_to_end("rate", last=False)
+
+    assert target.dOmega is not None
+    dOmega: float = target.dOmega
+
+    # Everything that does not depend on the signal is evaluated once
+    phib = background_model.dPhi_dEdOmega(energies) * dOmega
+    aeff = effective_area(energies)
+    weights = _spline_integral_weights(energies, e_min, e_max, k=k, ext=ext)
+    weights = weights * aeff * tobs / phib
+
+    dphi_b = background_model.derivatives(energies)
+    signals = np.atleast_2d(signals)
+    dphi = np.empty((signals.shape[0], len(params), len(energies)))
+    dphi[:, 0] = signals
+    for i, key in enumerate(params.keys()):
+        if key != "rate":
+            dphi[:, i] = dphi_b[key]
+
+    fishers = np.einsum("mie,mje,e->mij", dphi, dphi, weights)
+
+    return params, fishers
+
+
 def fisher(
     model,
-    effective_area: EffectiveArea,
-    energy_res: EnergyResolution,
+    effective_area: Union[EffectiveArea, DetectorResponse],
+    energy_res: Optional[EnergyResolution],
     target: TargetParams,
     background_model: ParametricBackgroundModel,
     tobs: float,
@@ -276,10 +418,12 @@ def fisher(
     ----------
     model: Theory
         Dark matter model.
-    effective_area: Callable
-        Effective area of the observing telescope.
+    effective_area: Callable or DetectorResponse
+        Effective area of the observing telescope. If a `DetectorResponse` is
+        given, its energy resolution and resolution matrices are used.
     energy_res: Callable
-        Energy resolution of the telescope.
+        Energy resolution of the telescope. May be None if `effective_area` is
+        a `DetectorResponse`.
     target: TargetParams
         Target the telescope is observing.
     background_model: BackgroundModel
@@ -313,19 +457,10 @@ def fisher(
         params: Dict[str, float]
             Dictionary of the fiducial parameters.
     """
-    if model.kind == "ann":
-        scale = 1.0  # 3e-26
-    elif model.kind == "dec":
-        # TODO: Come up with a better natural scale for decaying DM.
-        scale = 1.0  # 1e-24
-    else:
-        raise ValueError(f"Encountered model with invalid `kind`: {model.kind}")
+    scale = _fisher_signal_scale(model)
 
-    e_min, e_max = effective_area.x[[0, -1]]
-    if e_grid is not None:
-        energies = e_grid
-    else:
-        energies = np.geomspace(e_min, e_max, n_grid)
+    effective_area, energy_res = _unpack_detector_response(effective_area, energy_res)
+    e_min, e_max, energies = _fisher_energies(effective_area, n_grid, e_grid)
 
     phi_s = _differential_signal_flux(
         model=model,
@@ -338,42 +473,88 @@ def fisher(
         ext=ext,
     )
 
-    params = OrderedDict(background_model.params.copy())
-    params["rate"] = 0.0
-    params.move_to_end("rate", last=False)
+    params, fishers = _fisher_matrices(
+        phi_s(energies),
+        energies,
+        e_min,
+        e_max,
+        effective_area,
+        target,
+        background_model,
+        tobs,
+        k=k,
+        ext=ext,
+    )
 
-    assert target.dOmega is not None
-    dOmega: float = target.dOmega
+    return FisherResults(fisher_matrix=np.matrix(fishers[0]), params=params)
 
-    def phi_b(energy):
-        return background_model.dPhi_dEdOmega(energy) * dOmega
 
-    def dphi_b(energy, key):
-        return background_model.derivatives(energy)[key]
+def _optimal_energy_window(integrand_S, integrand_B, e_grid, refine: bool = False):
+    """
+    Find the energy window maximizing N_S / sqrt(N_B).
 
-    dphi = {key: functools.partial(dphi_b, key=key) for key in background_model.params}
-    dphi["rate"] = lambda e: phi_s(e)  # type: ignore
+    The signal and background integrals are accumulated once over `e_grid`,
+    so that the integrals over all windows with edges on the grid are
+    differences of cumulative integrals.
 
-    def fisher_matrix_element(k1, k2):
-        dphi1 = dphi[k1](energies)
-        dphi2 = dphi[k2](energies)
-        phib = phi_b(energies)
-        aeff = effective_area(energies)
+    Parameters
+    ----------
+    integrand_S, integrand_B : InterpolatedUnivariateSpline
+        Splines whose integrals give the number of signal and background
+        photons, up to normalization.
+    e_grid : array
+        Increasing grid of candidate window edges.
+    refine : bool, optional
+        If True, the edges of the best window on the grid are further
+        optimized continuously within the bounds of `e_grid`.
 
-        integrand = dphi1 * dphi2 / phib * aeff * tobs
-        interp = InterpolatedUnivariateSpline(energies, integrand, ext=ext, k=k)
-        return interp.integral(e_min, e_max)
+    Returns
+    -------
+    e_low, e_high, snr : float
+        Edges of the best window and the corresponding value of
+        N_S / sqrt(N_B) (up to normalization). If N_S / sqrt(N_B) is NaN for
+        every window, for example because both the signal and background
+        vanish, all three are NaN.
+    """
+    e_grid = np.asarray(e_grid)
+    assert np.all(np.diff(e_grid) > 0), "e_grid must be strictly increasing"
 
-    fisher = np.matrix(
-        np.array(
-            [
-                [fisher_matrix_element(k1, k2) for k1 in params.keys()]
-                for k2 in params.keys()
-            ]
+    cum_S = np.array([integrand_S.integral(e_grid[0], e) for e in e_grid])
+    cum_B = np.array([integrand_B.integral(e_grid[0], e) for e in e_grid])
+
+    # Windows (e_grid[i], e_grid[j]) with i < j
+    i_lows, i_highs = np.triu_indices(len(e_grid), k=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        snrs = (cum_S[i_highs] - cum_S[i_lows]) / np.sqrt(
+            cum_B[i_highs] - cum_B[i_lows]
         )
-    )
 
-    return FisherResults(fisher_matrix=fisher, params=params)
+    if np.all(np.isnan(snrs)):
+        return np.nan, np.nan, np.nan
+
+    idx = np.nanargmax(snrs)
+    e_low, e_high, snr = e_grid[i_lows[idx]], e_grid[i_highs[idx]], snrs[idx]
+
+    if refine:
+        log_e_min, log_e_max = np.log(e_grid[0]), np.log(e_grid[-1])
+
+        def neg_snr(log_es):
+            log_es = np.clip(log_es, log_e_min, log_e_max)
+            el, eh = np.exp(log_es)
+            if el >= eh:
+                return 0.0
+            i_b = integrand_B.integral(el, eh)
+            if not i_b > 0:
+                return 0.0
+            return -integrand_S.integral(el, eh) / np.sqrt(i_b)
+
+        res = minimize(neg_snr, np.log([e_low, e_high]), method="Nelder-Mead")
+        if -res.fun > snr:
+            log_es = np.clip(res.x, log_e_min, log_e_max)
+            e_low, e_high = np.exp(log_es)
+            snr = -res.fun
+
+    return e_low, e_high, snr
 
 
 class TheoryGammaRayLimits:
@@ -401,8 +582,14 @@ class TheoryGammaRayLimits:
         """
         return _get_product_spline(f1, f2, grid, k=k, ext=ext)
 
-    def _compute_fluxes(self, measurement: FluxMeasurement):
-        """Compute the predicted fluxes given the current measurement."""
+    def _compute_fluxes(
+        self, measurement: FluxMeasurement, conv_spectrum_fn: Optional[Callable] = None
+    ):
+        """Compute the predicted fluxes given the current measurement.
+
+        If `conv_spectrum_fn` is given, it is used in place of
+        `total_conv_spectrum_fn` to compute the convolved spectrum.
+        """
         e_min, e_max = measurement.e_lows[0], measurement.e_highs[-1]
         args = (e_min, e_max)
         mx = self.mx  # type: ignore
@@ -425,7 +612,9 @@ class TheoryGammaRayLimits:
             )
 
         args += (measurement.energy_res,)
-        dnde_conv = self.total_conv_spectrum_fn(*args)  # type: ignore
+        if conv_spectrum_fn is None:
+            conv_spectrum_fn = self.total_conv_spectrum_fn  # type: ignore
+        dnde_conv = conv_spectrum_fn(*args)
 
         # Integrated flux (excluding <sigma v>) from DM processes in each bin
         bounds = zip(measurement.e_lows, measurement.e_highs)
@@ -433,7 +622,9 @@ class TheoryGammaRayLimits:
             [dm_flux_factor * dnde_conv.integral(el, eh) for el, eh in bounds]
         )
 
-    def binned_limit(self, measurement, n_sigma=2.0, method="1bin"):
+    def binned_limit(
+        self, measurement, n_sigma=2.0, method="1bin", conv_spectrum_fn=None
+    ):
         r"""
         Determines the limit on :math:`<sigma v>` from gamma-ray data.
 
@@ -457,6 +648,10 @@ class TheoryGammaRayLimits:
             Information about the flux measurement and target.
         n_sigma : float
             See the notes for this function.
+        conv_spectrum_fn : callable, optional
+            Function with the same signature as `total_conv_spectrum_fn` used
+            to compute the convolved spectrum. This allows a previously
+            computed spectrum to be reused.
 
         Returns
         -------
@@ -464,7 +659,7 @@ class TheoryGammaRayLimits:
             Largest allowed thermally averaged total cross section in cm^3 / s
 
         """
-        phi = self._compute_fluxes(measurement)
+        phi = self._compute_fluxes(measurement, conv_spectrum_fn)
 
         if method == "1bin":
             constrainer = constrain_one_bin
@@ -478,8 +673,8 @@ class TheoryGammaRayLimits:
 
     def unbinned_limit(
         self,
-        A_eff: EffectiveArea,
-        energy_res: EnergyResolution,
+        A_eff: Union[EffectiveArea, DetectorResponse],
+        energy_res: Optional[EnergyResolution],
         T_obs: float,
         target: TargetParams,
         bg_model: BackgroundModel,
@@ -487,6 +682,7 @@ class TheoryGammaRayLimits:
         n_grid: int = 20,
         n_sigma: float = 5.0,
         _: bool = False,  # debug_msgs
+        refine_window: bool = False,
     ):
         r"""
         Computes smallest-detectable value of <sigma v> for given target and
@@ -509,12 +705,14 @@ class TheoryGammaRayLimits:
 
         Parameters
         ----------
-        A_eff : float -> float
+        A_eff : float -> float or DetectorResponse
             Effective area of experiment in cm^2 as a function of photon
-            energy.
+            energy. If a `DetectorResponse` is given, its energy resolution
+            and resolution matrices are used.
         energy_res : float -> float
             The detector's energy resolution (:math:`\Delta E / E`) as a
-            function of photon energy in MeV.
+            function of photon energy in MeV. May be None if `A_eff` is a
+            `DetectorResponse`.
         T_obs : float
             Experiment's observation time in s
         target : TargetParams
@@ -526,15 +724,20 @@ class TheoryGammaRayLimits:
             background to be considered detectable
         debug_msgs : bool
             If True, the energy window found by the optimizer will be printed.
+        refine_window : bool, optional
+            If True, the edges of the best energy window on `e_grid` are
+            further optimized continuously. Default is False.
 
         Returns
         -------
         <sigma v> : float
             Smallest-detectable thermally averaged total cross section in units
-            of cm^3 / s.
+            of cm^3 / s. This is infinite if N_S / sqrt(N_B) is undefined in
+            every energy window.
         """
 
         # Convolve the spectrum with the detector's spectral resolution
+        A_eff, energy_res = _unpack_detector_response(A_eff, energy_res)
         e_min, e_max = A_eff.x[[0, -1]]
 
         if self.kind == "ann":  # type: ignore
@@ -581,29 +784,23 @@ class TheoryGammaRayLimits:
         if e_grid is None:
             e_grid = np.geomspace(e_min, e_max, n_grid)
 
-        snrs = []
-        for i, e_low in enumerate(e_grid[:-1]):
-            j = i + 1
-            for e_high in e_grid[j:]:
-                assert e_low < e_high, (e_low, ", ", e_high)
-                I_S_val = integrand_S.integral(e_low, e_high)
-                I_B_val = integrand_B.integral(e_low, e_high)
-                snrs.append([e_low, e_high, I_S_val / np.sqrt(I_B_val)])
-
-        snrs = np.stack(snrs)
-
         # Find best energy window
-        try:
-            bound = prefactor * n_sigma / np.nanmax(snrs[:, 2])
-            return bound
-        except Exception as e:
-            print(f"Error in unbinned_limit: {repr(e)}")
+        _, _, snr = _optimal_energy_window(
+            integrand_S, integrand_B, e_grid, refine=refine_window
+        )
+        if np.isnan(snr):
+            logging.warning(
+                "N_S / sqrt(N_B) is NaN in every energy window; "
+                "returning an infinite limit."
+            )
             return np.inf
 
+        return prefactor * n_sigma / snr
+
     def fisher_limit(
         self,
-        effective_area: EffectiveArea,
-        energy_res: EnergyResolution,
+        effective_area: Union[EffectiveArea, DetectorResponse],
+        energy_res: Optional[EnergyResolution],
         target: TargetParams,
         background_model: ParametricBackgroundModel,
         tobs: float,
@@ -672,3 +869,123 @@ class TheoryGammaRayLimits:
         )
 
         return [result.limit(sigma, key="rate") for sigma in sigma_levels]
+
+    def fisher_limits(
+        self,
+        models_or_masses,
+        effective_area: Union[EffectiveArea, DetectorResponse],
+        energy_res: Optional[EnergyResolution],
+        target: TargetParams,
+        background_model: ParametricBackgroundModel,
+        tobs: float,
+        vx: float = 1e-3,
+        sigma_levels: List[float] = [5.0],
+        n_grid: int = 2000,
+        e_grid: Optional[npt.NDArray[np.float64]] = None,
+        k: int = 1,
+        ext: str = "raise",
+    ) -> npt.NDArray[np.float64]:
+        """Compute prospective constraints on many models using the Fisher
+        information matrix.
+
+        This is equivalent to calling `fisher_limit` on each model, but the
+        background fluxes, background derivatives and integration weights are
+        only computed once and the Fisher matrices of all models are computed
+        together.
+
+        Parameters
+        ----------
+        models_or_masses: iterable
+            Dark matter models or dark matter masses (in MeV). If masses are
+            given, the limits are computed for this model with `mx` set to
+            each mass. The mass of the model is restored afterwards.
+        effective_area: Callable or DetectorResponse
+            Effective area of the observing telescope. If a `DetectorResponse`
+            is given, its energy resolution and resolution matrices are used.
+        energy_res: Callable
+            Energy resolution of the telescope. May be None if
+            `effective_area` is a `DetectorResponse`.
+        target: TargetParams
+            Target the telescope is observing.
+        background_model: BackgroundModel
+            Model for the background flux.
+        tobs: float
+            Observing time in seconds.
+        vx: float, optional
+            Dark matter velocity. Default is 1e-3.
+        sigma_levels: List[float], optional
+            List of the desired number of standard deviations to compute limits
+            at. Default is [5.0].
+        n_grid: int, optional
+            Number of grid points used for generation of interpolating splines.
+            Default is 2000. Ignored if `e_grid` is not None.
+        e_grid: array, optional
+            Energy grid used for generation of interpolating splines. Default
+            is None.
+        k: int, optional
+            Order of the underlying interpolating function. Default is 1
+            (linear).
+        ext: str, optional
+            String specifying how the interpolating function should handle
+            energies outside the interval of the input energies. Default is
+            'raise'.
+
+        Returns
+        -------
+        limits: array
+            Array with shape (len(models_or_masses), len(sigma_levels))
+            containing the limits on the rate for each model at each sigma
+            level.
+        """
+        effective_area, energy_res = _unpack_detector_response(
+            effective_area, energy_res
+        )
+        e_min, e_max, energies = _fisher_energies(effective_area, n_grid, e_grid)
+
+        def signal(model):
+            return _differential_signal_flux(
+                model=model,
+                energies=energies,
+                energy_res=energy_res,
+                target=target,
+                vx=vx,
+                scale=_fisher_signal_scale(model),
+                k=k,
+                ext=ext,
+            )(energies)
+
+        mx = self.mx  # type: ignore
+        try:
+            signals = []
+            for model in models_or_masses:
+                if isinstance(model, numbers.Real):
+                    self.mx = model  # type: ignore
+                    model = self
+                signals.append(signal(model))
+        finally:
+            self.mx = mx  # type: ignore
+
+        if len(signals) == 0:
+            return np.zeros((0, len(sigma_levels)))
+
+        params, fishers = _fisher_matrices(
+            np.array(signals),
+            energies,
+            e_min,
+            e_max,
+            effective_area,
+            target,
+            background_model,
+            tobs,
+            k=k,
+            ext=ext,
+        )
+
+        limits = np.zeros((len(fishers), len(sigma_levels)))
+        for i, fisher_matrix in enumerate(fishers):
+            result = FisherResults(
+                fisher_matrix=np.matrix(fisher_matrix), params=params
+            )
+            limits[i] = [result.limit(sigma, key="rate") for sigma in sigma_levels]
+
+        return limits
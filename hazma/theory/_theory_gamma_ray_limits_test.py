@@ -0,0 +1,168 @@
+"""Tests for the gamma-ray limits of the theory classes."""
+
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+from scipy.interpolate import InterpolatedUnivariateSpline
+
+from hazma import gamma_ray_parameters as grp
+from hazma.background_model import BackgroundModel
+from hazma.scalar_mediator import HiggsPortal
+from hazma.theory._theory_gamma_ray_limits import (
+    FisherResults,
+    _differential_signal_flux,
+    _optimal_energy_window,
+    _spline_integral_weights,
+    fisher,
+)
+
+EFFECTIVE_AREA = grp.effective_area_gecco
+ENERGY_RES = grp.energy_res_gecco
+TARGET = grp.gc_targets["nfw"]["10x10 deg box"]
+BACKGROUND = grp.GalacticCenterBackgroundModel()
+TOBS = 1e6
+N_GRID = 200
+
+
+def reference_fisher(model, n_grid=N_GRID, k=1):
+    """Fisher matrix with one spline integral per matrix element."""
+    e_min, e_max = EFFECTIVE_AREA.x[[0, -1]]
+    energies = np.geomspace(e_min, e_max, n_grid)
+    phi_s = _differential_signal_flux(
+        model=model,
+        energies=energies,
+        energy_res=ENERGY_RES,
+        target=TARGET,
+        vx=1e-3,
+        scale=1.0,
+        k=k,
+        ext="raise",
+    )
+
+    params = OrderedDict(BACKGROUND.params.copy())
+    params["rate"] = 0.0
+    params.move_to_end("rate", last=False)
+
+    dphi = {key: BACKGROUND.derivatives(energies)[key] for key in BACKGROUND.params}
+    dphi["rate"] = phi_s(energies)
+    phib = BACKGROUND.dPhi_dEdOmega(energies) * TARGET.dOmega
+    aeff = EFFECTIVE_AREA(energies)
+
+    def element(k1, k2):
+        integrand = dphi[k1] * dphi[k2] / phib * aeff * TOBS
+        spline = InterpolatedUnivariateSpline(energies, integrand, k=k)
+        return spline.integral(e_min, e_max)
+
+    matrix = np.array([[element(k1, k2) for k1 in params] for k2 in params])
+    return FisherResults(fisher_matrix=np.matrix(matrix), params=params)
+
+
+@pytest.fixture
+def model():
+    return HiggsPortal(mx=150.0, ms=1e3, gsxx=1.0, stheta=1e-3)
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 5])
+@pytest.mark.parametrize("bounds", [(0.2, 8.0), (1.0, 3.0), (0.1, 10.0)])
+def test_spline_integral_weights(k, bounds):
+    energies = np.geomspace(0.2, 8.0, 50)
+    ys = np.zeros_like(energies)
+    expected = np.zeros_like(energies)
+    for i in range(len(energies)):
+        ys[i] = 1.0
+        spline = InterpolatedUnivariateSpline(energies, ys, k=k)
+        expected[i] = spline.integral(*bounds)
+        ys[i] = 0.0
+
+    weights = _spline_integral_weights(energies, *bounds, k=k)
+    np.testing.assert_allclose(weights, expected, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize("k", [1, 3])
+def test_fisher(model, k):
+    expected = reference_fisher(model, k=k)
+    result = fisher(
+        model, EFFECTIVE_AREA, ENERGY_RES, TARGET, BACKGROUND, TOBS, n_grid=N_GRID, k=k
+    )
+    assert list(result.params) == list(expected.params)
+    np.testing.assert_allclose(result.fisher_matrix, expected.fisher_matrix, rtol=1e-12)
+
+
+def test_fisher_limit(model):
+    sigmas = [2.0, 5.0]
+    expected = [reference_fisher(model).limit(s) for s in sigmas]
+    limits = model.fisher_limit(
+        EFFECTIVE_AREA,
+        ENERGY_RES,
+        TARGET,
+        BACKGROUND,
+        TOBS,
+        sigma_levels=sigmas,
+        n_grid=N_GRID,
+    )
+    np.testing.assert_allclose(limits, expected, rtol=1e-10)
+
+
+def test_fisher_limits(model):
+    masses = [50.0, 150.0, 300.0]
+    sigmas = [2.0, 5.0]
+    expected = [
+        [
+            reference_fisher(HiggsPortal(mx=mx, ms=1e3, gsxx=1.0, stheta=1e-3)).limit(s)
+            for s in sigmas
+        ]
+        for mx in masses
+    ]
+    args = (EFFECTIVE_AREA, ENERGY_RES, TARGET, BACKGROUND, TOBS)
+    kwargs = dict(sigma_levels=sigmas, n_grid=N_GRID)
+
+    limits = model.fisher_limits(masses, *args, **kwargs)
+    assert limits.shape == (len(masses), len(sigmas))
+    np.testing.assert_allclose(limits, expected, rtol=1e-10)
+    assert model.mx == 150.0
+
+    models = [HiggsPortal(mx=mx, ms=1e3, gsxx=1.0, stheta=1e-3) for mx in masses]
+    np.testing.assert_allclose(
+        model.fisher_limits(models, *args, **kwargs), expected, rtol=1e-10
+    )
+
+
+def test_optimal_energy_window():
+    energies = np.geomspace(1.0, 100.0, 50)
+    signal = InterpolatedUnivariateSpline(
+        energies, np.exp(-(((energies - 10.0) / 2.0) ** 2)), k=1
+    )
+    background = InterpolatedUnivariateSpline(energies, 1.0 / energies, k=1)
+    e_grid = np.geomspace(1.0, 100.0, 30)
+
+    e_low, e_high, snr = _optimal_energy_window(signal, background, e_grid)
+    assert e_low < 10.0 < e_high
+    assert snr == pytest.approx(
+        signal.integral(e_low, e_high) / np.sqrt(background.integral(e_low, e_high))
+    )
+
+
+@pytest.mark.parametrize("refine", [False, True])
+def test_optimal_energy_window_all_nan(refine):
+    energies = np.geomspace(1.0, 100.0, 50)
+    zero = InterpolatedUnivariateSpline(energies, np.zeros_like(energies), k=1)
+    e_grid = np.geomspace(1.0, 100.0, 30)
+
+    result = _optimal_energy_window(zero, zero, e_grid, refine=refine)
+    assert np.all(np.isnan(result))
+
+
+def test_unbinned_limit_all_nan(caplog):
+    # Without signal or background, N_S / sqrt(N_B) is NaN in every window
+    model = HiggsPortal(mx=150.0, ms=1e3, gsxx=0.0, stheta=0.0)
+    background = BackgroundModel(EFFECTIVE_AREA.x[[0, -1]], np.zeros_like)
+
+    limit = model.unbinned_limit(EFFECTIVE_AREA, ENERGY_RES, TOBS, TARGET, background)
+    assert limit == np.inf
+    assert "NaN in every energy window" in caplog.text
+
+
+def test_unbinned_limit(model):
+    limit = model.unbinned_limit(EFFECTIVE_AREA, ENERGY_RES, TOBS, TARGET, BACKGROUND)
+    assert np.isfinite(limit) and limit > 0.0
@@ -49,6 +49,8 @@ class VectorMediator(
         Coupling of vector mediator to the muon.
     """
 
+    _vectorized_cross_sections = True
+
     def __init__(
         self,
         mx: float,
@@ -19,7 +19,17 @@ MPHI = parameters.phi_mass
 MOMEGA = parameters.omega_mass
 
 
-def _sigma_xx_to_call_wrapper(self, q, form_factor, **kwargs):
+def _sigma_xx_to_call_wrapper(self, q, form_factor, *, channel=None, **kwargs):
+    table = None if channel is None else self._width_table(channel)
+    if table is not None and table.covers(q):
+        return table.cross_section(
+            q=q,
+            mx=self.mx,
+            mv=self.mv,
+            gvxx=self.gvxx,
+            wv=self.width_v(),
+            couplings=self._couplings,
+        )
     return form_factor.cross_section(
         q=q,
         mx=self.mx,
@@ -381,7 +391,7 @@ def sigma_xx_to_pi_pi_pi0(self, e_cm, *, npts=10_000):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPiPiPi0 = self._ff_pi_pi_pi0
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts, channel="pi pi pi0")
 
 
 def sigma_xx_to_pi_pi_eta(self, e_cm):
@@ -395,7 +405,7 @@ def sigma_xx_to_pi_pi_eta(self, e_cm):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPiPiEta = self._ff_pi_pi_eta
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, channel="pi pi eta")
 
 
 def sigma_xx_to_pi_pi_etap(self, e_cm):
@@ -409,7 +419,7 @@ def sigma_xx_to_pi_pi_etap(self, e_cm):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPiPiEtaPrime = self._ff_pi_pi_etap
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, channel="pi pi etap")
 
 
 def sigma_xx_to_pi_pi_omega(self, e_cm):
@@ -423,7 +433,7 @@ def sigma_xx_to_pi_pi_omega(self, e_cm):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPiPiOmega = self._ff_pi_pi_omega
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, channel="pi pi omega")
 
 
 def sigma_xx_to_pi0_pi0_omega(self, e_cm):
@@ -437,7 +447,7 @@ def sigma_xx_to_pi0_pi0_omega(self, e_cm):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPi0Pi0Omega = self._ff_pi0_pi0_omega
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, channel="pi0 pi0 omega")
 
 
 def sigma_xx_to_pi0_k0_k0(self, e_cm, *, npts: int = 50_000):
@@ -451,7 +461,7 @@ def sigma_xx_to_pi0_k0_k0(self, e_cm, *, npts: int = 50_000):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPi0K0K0 = self._ff_pi0_k0_k0
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts, channel="pi0 k0 k0")
 
 
 def sigma_xx_to_pi0_k_k(self, e_cm, *, npts: int = 50_000):
@@ -465,7 +475,7 @@ def sigma_xx_to_pi0_k_k(self, e_cm, *, npts: int = 50_000):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPi0KpKm = self._ff_pi0_k_k
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts, channel="pi0 k k")
 
 
 def sigma_xx_to_pi_k_k0(self, e_cm, *, npts: int = 50_000):
@@ -479,7 +489,7 @@ def sigma_xx_to_pi_k_k0(self, e_cm, *, npts: int = 50_000):
         Center of mass energy.
     """
     ff: vff.VectorFormFactorPiKK0 = self._ff_pi_k_k0
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts, channel="pi k k0")
 
 
 def sigma_xx_to_pi_pi_pi_pi(self, e_cm, *, npts=1 << 14):
@@ -495,7 +505,7 @@ def sigma_xx_to_pi_pi_pi_pi(self, e_cm, *, npts=1 << 14):
         is 1<<14 ~ 16_000.
     """
     ff: vff.VectorFormFactorPiPiPiPi = self._ff_pi_pi_pi_pi
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts, channel="pi pi pi pi")
 
 
 def sigma_xx_to_pi_pi_pi0_pi0(self, e_cm, *, npts: int = 1 << 14):
@@ -512,7 +522,7 @@ def sigma_xx_to_pi_pi_pi0_pi0(self, e_cm, *, npts: int = 1 << 14):
         is 1<<14 ~ 16_000.
     """
     ff: vff.VectorFormFactorPiPiPi0Pi0 = self._ff_pi_pi_pi0_pi0
-    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts)
+    return _sigma_xx_to_call_wrapper(self, e_cm, ff, npts=npts, channel="pi pi pi0 pi0")
 
 
 def annihilation_cross_section_funcs(
@@ -6,7 +6,8 @@ Py
 # pyright: basic, reportUnusedImport=false
 
 import functools as ft
-from typing import Callable, Dict, List, TypeVar, Union
+import inspect
+from typing import Callable, Dict, List, Optional, TypeVar, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -28,6 +29,16 @@ from . import neutrino as gev_neutrino_spectra
 from . import positron as gev_positron_spectra
 from . import spectra as gev_spectra
 from . import types as gev_types
+from . import width_table
+from .width_cache import PersistentWidthCache
+from .spectrum_table import (
+    FORM_FACTOR_ATTRS,
+    TABULATED_CHANNELS,
+    SpectrumTable,
+    default_cache_dir,
+    normalized_couplings,
+)
+from .utils import STR_TO_MASS
 
 T = TypeVar("T", float, npt.NDArray[np.float64])
 
@@ -64,6 +75,67 @@ def with_cache(*, cache_name: str, name: str):
     return decorator
 
 
+def with_width_table(channel: str):
+    """Decorator computing a partial width from its factorized table when one
+    is available (see `VectorMediatorGeV.factorize_widths`).
+
+    Parameters
+    ----------
+    channel: str
+        Name of the final state.
+    """
+
+    def decorator(f):
+        @ft.wraps(f)
+        def wrapper(self, *args, **kwargs):
+            table = self._width_table(channel)
+            if table is not None and table.covers(self.mv):
+                return table.width(self.mv, self._couplings)
+            return f(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def with_persistent_cache(channel: str):
+    """Decorator storing a partial width in the persistent cache of the model
+    when one is enabled (see `VectorMediatorGeV.persist_widths`).
+
+    Parameters
+    ----------
+    channel: str
+        Name of the final state.
+    """
+
+    def decorator(f):
+        signature = inspect.signature(f)
+
+        @ft.wraps(f)
+        def wrapper(self, *args, **kwargs):
+            cache = self._persistent_width_cache
+            if cache is None or channel not in cache.channels:
+                return f(self, *args, **kwargs)
+
+            # Explicit defaults and omitted arguments share an entry.
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments["self"]
+
+            form_factor = getattr(self, FORM_FACTOR_ATTRS[channel])
+            key = cache.key(channel, self.mv, self._couplings, arguments, form_factor)
+            val = cache.get(key)
+            if val is None:
+                val = f(self, *args, **kwargs)
+                cache.put(key, val)
+            return val
+
+        return wrapper
+
+    return decorator
+
+
 class VectorMediatorGeV(TheoryAnn):
     """
     A generic dark matter model where interactions with the SM are mediated via
@@ -71,6 +143,8 @@ class VectorMediatorGeV(TheoryAnn):
     up to 1 GeV.
     """
 
+    _vectorized_cross_sections = True
+
     from .cross_sections import (
         annihilation_cross_section_funcs,
         sigma_xx_to_e_e,
@@ -187,6 +261,14 @@ class VectorMediatorGeV(TheoryAnn):
         }
         self._width_cache["x x"] = {"value": 0.0, "valid": False, "kwargs": {}}
 
+        self._spectrum_table_config = None
+        self._spectrum_tables = {}
+
+        self._width_table_config = None
+        self._width_tables = {}
+
+        self._persistent_width_cache = None
+
     # ========================================================================
     # ---- Cache Control -----------------------------------------------------
     # ========================================================================
@@ -772,6 +854,8 @@ class VectorMediatorGeV(TheoryAnn):
         return br_omega_to_pi0_gamma * pi0_omega
 
     @with_cache(cache_name="_width_cache", name="pi pi pi0")
+    @with_width_table("pi pi pi0")
+    @with_persistent_cache("pi pi pi0")
     def width_v_to_pi_pi_pi0(self, *, npts=10_000) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -782,6 +866,8 @@ class VectorMediatorGeV(TheoryAnn):
         )
 
     @with_cache(cache_name="_width_cache", name="pi pi eta")
+    @with_width_table("pi pi eta")
+    @with_persistent_cache("pi pi eta")
     def width_v_to_pi_pi_eta(self) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -791,6 +877,8 @@ class VectorMediatorGeV(TheoryAnn):
         return self._ff_pi_pi_eta.width(mv=mv, couplings=self._couplings)
 
     @with_cache(cache_name="_width_cache", name="pi pi etap")
+    @with_width_table("pi pi etap")
+    @with_persistent_cache("pi pi etap")
     def width_v_to_pi_pi_etap(self) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -799,6 +887,8 @@ class VectorMediatorGeV(TheoryAnn):
         return self._ff_pi_pi_etap.width(mv=self.mv, couplings=self._couplings)
 
     @with_cache(cache_name="_width_cache", name="pi pi omega")
+    @with_width_table("pi pi omega")
+    @with_persistent_cache("pi pi omega")
     def width_v_to_pi_pi_omega(self) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -807,6 +897,8 @@ class VectorMediatorGeV(TheoryAnn):
         return self._ff_pi_pi_omega.width(mv=self.mv, couplings=self._couplings)
 
     @with_cache(cache_name="_width_cache", name="pi0 pi0 omega")
+    @with_width_table("pi0 pi0 omega")
+    @with_persistent_cache("pi0 pi0 omega")
     def width_v_to_pi0_pi0_omega(self) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -815,6 +907,8 @@ class VectorMediatorGeV(TheoryAnn):
         return self._ff_pi0_pi0_omega.width(mv=self.mv, couplings=self._couplings)
 
     @with_cache(cache_name="_width_cache", name="pi0 k0 k0")
+    @with_width_table("pi0 k0 k0")
+    @with_persistent_cache("pi0 k0 k0")
     def width_v_to_pi0_k0_k0(self, *, npts: int = 50_000) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -825,6 +919,8 @@ class VectorMediatorGeV(TheoryAnn):
         )
 
     @with_cache(cache_name="_width_cache", name="pi0 k k")
+    @with_width_table("pi0 k k")
+    @with_persistent_cache("pi0 k k")
     def width_v_to_pi0_k_k(self, *, npts: int = 50_000) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -833,6 +929,8 @@ class VectorMediatorGeV(TheoryAnn):
         return self._ff_pi0_k_k.width(mv=self.mv, couplings=self._couplings, npts=npts)
 
     @with_cache(cache_name="_width_cache", name="pi k k0")
+    @with_width_table("pi k k0")
+    @with_persistent_cache("pi k k0")
     def width_v_to_pi_k_k0(self, *, npts: int = 50_000) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -841,6 +939,8 @@ class VectorMediatorGeV(TheoryAnn):
         return self._ff_pi_k_k0.width(mv=self.mv, couplings=self._couplings, npts=npts)
 
     @with_cache(cache_name="_width_cache", name="pi pi pi pi")
+    @with_width_table("pi pi pi pi")
+    @with_persistent_cache("pi pi pi pi")
     def width_v_to_pi_pi_pi_pi(self, *, npts=1 << 14) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -859,6 +959,8 @@ class VectorMediatorGeV(TheoryAnn):
         )
 
     @with_cache(cache_name="_width_cache", name="pi pi pi0 pi0")
+    @with_width_table("pi pi pi0 pi0")
+    @with_persistent_cache("pi pi pi0 pi0")
     def width_v_to_pi_pi_pi0_pi0(self, *, npts: int = 1 << 14) -> float:
         """
         Compute the partial width for the decay of the vector mediator
@@ -962,6 +1064,247 @@ class VectorMediatorGeV(TheoryAnn):
     ) -> Dict[str, Callable[[Union[float, npt.NDArray[np.float64]], float], float]]:
         return gev_spectra.dnde_photon_spectrum_fns(self)
 
+    def tabulate_spectra(
+        self,
+        channels: Optional[List[str]] = None,
+        *,
+        cme_max: float = 2500.0,
+        n_cme: int = 64,
+        x_min: float = 1e-5,
+        n_x: int = 256,
+        cache_dir=None,
+        persist: bool = True,
+    ) -> None:
+        r"""
+        Interpolate the photon spectra of the multi-body final states from
+        tables instead of recomputing their phase-space distributions for
+        every spectrum.
+
+        The spectra normalized to one annihilation only depend on the ratios
+        of the quark couplings, so the tables are computed once for a given
+        set of couplings and reused for any dark matter or mediator mass.
+        Tables are built the first time they are needed. When the quark
+        couplings are changed, the tables for the new couplings are loaded or
+        built on the next evaluation of the spectra.
+
+        Parameters
+        ----------
+        channels: list[str], optional
+            Final states to tabulate. By default, all the three- and four-body
+            hadronic final states are tabulated.
+        cme_max: float, optional
+            Largest center-of-mass energy of the tables. Spectra for larger
+            center-of-mass energies are computed directly. Default is 2.5 GeV.
+        n_cme: int, optional
+            Number of center-of-mass energies of the tables. Default is 64.
+        x_min: float, optional
+            Smallest value of :math:`x = 2E_{\gamma}/Q` of the tables. Spectra
+            below this value are computed directly. Default is 1e-5.
+        n_x: int, optional
+            Number of values of :math:`x` of the tables. Default is 256.
+        cache_dir: str, optional
+            Directory where the tables are stored. Default is
+            ``~/.cache/hazma/vector_mediator_gev``.
+        persist: bool, optional
+            If `False`, tables are kept in memory only. Default is `True`.
+        """
+        if channels is None:
+            channels = TABULATED_CHANNELS
+        for channel in channels:
+            if channel not in TABULATED_CHANNELS:
+                raise ValueError(
+                    f"Invalid channel {channel}. Use one of {TABULATED_CHANNELS}."
+                )
+
+        if persist and cache_dir is None:
+            cache_dir = default_cache_dir()
+
+        self._spectrum_table_config = {
+            "channels": list(channels),
+            "cme_max": cme_max,
+            "n_cme": n_cme,
+            "xs": np.geomspace(x_min, 1.0, n_x),
+            "cache_dir": cache_dir if persist else None,
+        }
+        self._spectrum_tables = {}
+
+    def clear_spectrum_tables(self) -> None:
+        """Stop using tabulated spectra (see `tabulate_spectra`)."""
+        self._spectrum_table_config = None
+        self._spectrum_tables = {}
+
+    def _spectrum_table(self, channel: str) -> Optional[SpectrumTable]:
+        """
+        Return the spectrum table of a final state for the current quark
+        couplings, building it if needed. Returns None if the final state is
+        not tabulated.
+        """
+        config = self._spectrum_table_config
+        if config is None or channel not in config["channels"]:
+            return None
+
+        table = self._spectrum_tables.get(channel)
+        couplings = normalized_couplings(*self._couplings)
+        if table is not None and table.couplings == couplings:
+            return table
+
+        threshold = sum(STR_TO_MASS[p] for p in channel.split(" "))
+        if threshold >= config["cme_max"]:
+            return None
+        # The spectra change fastest just above threshold.
+        ts = np.linspace(0.0, 1.0, config["n_cme"]) ** 2
+        cmes = threshold + (config["cme_max"] - threshold) * ts
+
+        table = SpectrumTable.load_or_compute(
+            self, channel, cmes, config["xs"], cache_dir=config["cache_dir"]
+        )
+        self._spectrum_tables[channel] = table
+        return table
+
+    def factorize_widths(
+        self,
+        channels: Optional[List[str]] = None,
+        *,
+        mv_max: float = 2500.0,
+        n_mv: int = 256,
+        npts: int = 1 << 14,
+        cache_dir=None,
+        persist: bool = True,
+    ) -> None:
+        r"""
+        Compute the partial widths and annihilation cross sections of the
+        multi-body final states from tables of their dependence on the quark
+        couplings instead of integrating over phase space.
+
+        The partial widths are quadratic forms in the quark couplings whose
+        matrices only depend on the mass of the vector (see
+        `hazma.form_factors.vector.FactorizedWidth`). The matrices are
+        tabulated once, the first time they are needed, and are then reused
+        for any couplings, so that scanning over couplings or switching
+        between `KineticMixingGeV`, `BLGeV` and custom couplings only costs an
+        interpolation. The annihilation cross sections are obtained from the
+        width of an off-shell mediator with mass equal to the center-of-mass
+        energy.
+
+        Parameters
+        ----------
+        channels: list[str], optional
+            Final states to factorize. By default, all the three- and
+            four-body hadronic final states are factorized.
+        mv_max: float, optional
+            Largest mass of the tables. Widths and cross sections at larger
+            masses and center-of-mass energies are computed directly. Default
+            is 2.5 GeV.
+        n_mv: int, optional
+            Number of masses of the tables, in addition to the masses added
+            just above threshold and to resolve the :math:`\omega` and
+            :math:`\phi` resonances. Default is 256.
+        npts: int, optional
+            Number of Monte-Carlo points used to tabulate the four-body
+            final states. The three-body final states are integrated using
+            quadrature. Default is 1<<14 ~ 16_000.
+        cache_dir: str, optional
+            Directory where the tables are stored. Default is
+            ``~/.cache/hazma/vector_mediator_gev``.
+        persist: bool, optional
+            If `False`, tables are kept in memory only. Default is `True`.
+        """
+        if channels is None:
+            channels = width_table.FACTORIZED_CHANNELS
+        for channel in channels:
+            if channel not in width_table.FACTORIZED_CHANNELS:
+                raise ValueError(
+                    f"Invalid channel {channel}. "
+                    + f"Use one of {width_table.FACTORIZED_CHANNELS}."
+                )
+
+        if persist and cache_dir is None:
+            cache_dir = default_cache_dir()
+
+        self._width_table_config = {
+            "channels": list(channels),
+            "mv_max": mv_max,
+            "n_mv": n_mv,
+            "npts": npts,
+            "cache_dir": cache_dir if persist else None,
+        }
+        self._width_tables = {}
+        self._invalidate_width_cache()
+
+    def clear_width_tables(self) -> None:
+        """Stop using factorized widths (see `factorize_widths`)."""
+        self._width_table_config = None
+        self._width_tables = {}
+        self._invalidate_width_cache()
+
+    def _width_table(self, channel: str) -> Optional[vff.FactorizedWidth]:
+        """
+        Return the factorized width of a final state, building it if needed.
+        Returns None if the final state is not factorized.
+        """
+        config = self._width_table_config
+        if config is None or channel not in config["channels"]:
+            return None
+
+        table = self._width_tables.get(channel)
+        if table is not None:
+            return table
+
+        if width_table.threshold(channel) >= config["mv_max"]:
+            return None
+        masses = width_table.masses(channel, config["mv_max"], config["n_mv"])
+
+        table = width_table.load_or_compute(
+            self, channel, masses, config["npts"], cache_dir=config["cache_dir"]
+        )
+        self._width_tables[channel] = table
+        return table
+
+    def persist_widths(
+        self,
+        cache_dir=None,
+        *,
+        channels: Optional[List[str]] = None,
+        max_entries: int = 1 << 16,
+    ) -> None:
+        r"""
+        Store the partial widths of the multi-body final states on disk and
+        reuse them in later evaluations and other processes.
+
+        The widths are keyed by the final state, the mediator mass, the quark
+        couplings, the keyword arguments of the width (e.g. the number of
+        Monte-Carlo points) and the version of `hazma`. The cache can be
+        shared by many processes on one machine. Widths computed from
+        factorized tables (see `factorize_widths`) are not stored.
+
+        Parameters
+        ----------
+        cache_dir: str, optional
+            Directory where the widths are stored. Default is
+            ``~/.cache/hazma/vector_mediator_gev/widths``.
+        channels: list[str], optional
+            Final states whose widths are stored. By default, all the three-
+            and four-body hadronic final states are stored.
+        max_entries: int, optional
+            Maximum number of stored widths. The least recently used widths
+            are removed when the cache is full. Default is 1<<16.
+        """
+        if channels is not None:
+            for channel in channels:
+                if channel not in width_table.FACTORIZED_CHANNELS:
+                    raise ValueError(
+                        f"Invalid channel {channel}. "
+                        + f"Use one of {width_table.FACTORIZED_CHANNELS}."
+                    )
+
+        self._persistent_width_cache = PersistentWidthCache(
+            cache_dir, max_entries=max_entries, channels=channels
+        )
+
+    def disable_persistent_widths(self) -> None:
+        """Stop storing widths on disk (see `persist_widths`)."""
+        self._persistent_width_cache = None
+
     def _gamma_ray_line_energies(self, e_cm) -> Dict[str, float]:
         def photon_energy(mass):
             return 0.5 * (e_cm - mass * (mass / e_cm))
@@ -9,6 +9,7 @@ from typing import Any, Callable, Protocol, TypedDict
 import numpy as np
 
 from hazma import spectra
+from hazma._utils.accumulate import trapezoid_weights
 from hazma.form_factors import vector as vff
 from hazma.form_factors.vector import (
     VectorFormFactorPi0K0K0,
@@ -82,8 +83,9 @@ def _make_spectrum_n_body_decay(
     for i, dist in enumerate(energy_distributions):
         bins = dist.bin_centers
         probs = dist.probabilities
-        dec = np.array([dnde_decays[i](neutrino_energies, e, flavor) for e in bins])
-        dnde += np.trapz(np.expand_dims(probs, 1) * dec, x=bins, axis=0)
+        # Spectra for all the energies of the parent with shape (m, n).
+        dec = dnde_decays[i](neutrino_energies, bins, flavor)
+        dnde += (probs * trapezoid_weights(bins)) @ dec
 
     return dnde
 
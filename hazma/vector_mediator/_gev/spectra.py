@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Protocol
 import numpy as np
 
 from hazma import spectra
+from hazma._utils.accumulate import trapezoid_weights
 from hazma.form_factors import vector as vff
 from hazma.parameters import charged_kaon_mass as mk
 from hazma.parameters import charged_pion_mass as mpi
@@ -70,6 +71,8 @@ class _DecayDndePhoton(Protocol):
 
     def partial_widths(self) -> dict[str, float]: ...
 
+    def _cached_partial_widths(self) -> dict[str, float]: ...
+
 
 def _make_spectrum_n_body_decay(
     photon_energies: RealArray,
@@ -80,10 +83,10 @@ def _make_spectrum_n_body_decay(
     dnde = np.zeros_like(photon_energies)
 
     for i, dist in enumerate(energy_distributions):
-        dec = np.array([dnde_decays[i](photon_energies, e) for e in dist.bin_centers])
-        dnde += np.trapz(
-            np.expand_dims(dist.probabilities, 1) * dec, x=dist.bin_centers, axis=0
-        )
+        # Spectra for all the energies of the parent with shape (m, n).
+        dec = dnde_decays[i](photon_energies, dist.bin_centers)
+        weights = dist.probabilities * trapezoid_weights(dist.bin_centers)
+        dnde += weights @ dec
 
     return dnde
 
@@ -747,7 +750,7 @@ def _dnde_photon_v_v_rest_frame(
     if self.mv < 2 * me:
         return np.zeros_like(photon_energies)
 
-    pws = self.partial_widths()
+    pws = self._cached_partial_widths()
     pw = sum(pws.values())
     pws = {key: val / pw for key, val in pws.items()}
 
@@ -834,11 +837,19 @@ def dnde_photon_v_v(
 
 def dnde_photon_spectrum_fns(
     self,
+    tabulated: bool = True,
 ) -> dict[
     str, Callable[[float | np.ndarray[tuple[int], np.dtype[np.float64]], float], float]
 ]:
     """Return a dictionary containing functions to generate photon spectra.
 
+    Parameters
+    ----------
+    tabulated: bool, optional
+        If `True` (default) and spectrum tables were enabled on the model (see
+        `VectorMediatorGeV.tabulate_spectra`), the spectra of the tabulated
+        final states are interpolated from the tables whenever the
+        center-of-mass and photon energies are covered by them.
 
     Returns
     -------
@@ -856,7 +867,18 @@ def dnde_photon_spectrum_fns(
 
         return fnew
 
-    return {
+    def wrap_tabulated(f, channel):
+        @functools.wraps(f)
+        def fnew(photon_energies, cme, **kwargs):
+            if not kwargs:
+                table = self._spectrum_table(channel)
+                if table is not None and table.covers(photon_energies, cme):
+                    return table(photon_energies, cme)
+            return f(self, photon_energies, cme, **kwargs)
+
+        return fnew
+
+    fns = {
         "e e": wrap(dnde_photon_e_e),
         "mu mu": wrap(dnde_photon_mu_mu),
         "ve ve": dnde_zero,
@@ -883,3 +905,9 @@ def dnde_photon_spectrum_fns(
         "pi pi pi0 pi0": wrap(dnde_photon_pi_pi_pi0_pi0),
         "v v": wrap(dnde_photon_v_v),
     }
+
+    if tabulated and getattr(self, "_spectrum_table_config", None) is not None:
+        for channel in self._spectrum_table_config["channels"]:
+            fns[channel] = wrap_tabulated(fns[channel].__wrapped__, channel)
+
+    return fns
@@ -0,0 +1,269 @@
+"""Tabulated photon spectra for the multi-body final states of the GeV vector
+mediator model."""
+
+# pylint: disable=invalid-name,protected-access
+
+import dataclasses
+import hashlib
+import os
+import pathlib
+from typing import Optional, Tuple
+
+import numpy as np
+
+from hazma import VERSION
+from hazma._utils.tables import cache_dir
+from hazma.utils import RealArray
+
+# Final states whose spectra are built from phase-space distributions and are
+# therefore expensive to evaluate.
+TABULATED_CHANNELS = [
+    "pi pi pi0",
+    "pi pi eta",
+    "pi pi etap",
+    "pi pi omega",
+    "pi0 pi0 omega",
+    "pi0 k0 k0",
+    "pi0 k k",
+    "pi k k0",
+    "pi pi pi pi",
+    "pi pi pi0 pi0",
+]
+
+# Name of the model attribute holding the form factor of each final state.
+FORM_FACTOR_ATTRS = {
+    "pi pi pi0": "_ff_pi_pi_pi0",
+    "pi pi eta": "_ff_pi_pi_eta",
+    "pi pi etap": "_ff_pi_pi_etap",
+    "pi pi omega": "_ff_pi_pi_omega",
+    "pi0 pi0 omega": "_ff_pi0_pi0_omega",
+    "pi0 k0 k0": "_ff_pi0_k0_k0",
+    "pi0 k k": "_ff_pi0_k_k",
+    "pi k k0": "_ff_pi_k_k0",
+    "pi pi pi pi": "_ff_pi_pi_pi_pi",
+    "pi pi pi0 pi0": "_ff_pi_pi_pi0_pi0",
+}
+
+
+def default_cache_dir() -> pathlib.Path:
+    """Return the directory used to store tables on disk by default."""
+    return cache_dir().joinpath("vector_mediator_gev")
+
+
+def update_hash(h, obj) -> None:
+    """
+    Update the hash `h` with the parameters of `obj`, recursing into
+    dataclasses (e.g. form factors and their fit data) and containers.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        h.update(type(obj).__name__.encode())
+        for f in dataclasses.fields(obj):
+            h.update(f.name.encode())
+            update_hash(h, getattr(obj, f.name, None))
+    elif isinstance(obj, np.ndarray):
+        h.update(repr((obj.dtype.str, obj.shape)).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            update_hash(h, item)
+    elif isinstance(obj, dict):
+        for k, v in sorted(obj.items(), key=lambda kv: repr(kv[0])):
+            h.update(repr(k).encode())
+            update_hash(h, v)
+    else:
+        h.update(repr(obj).encode())
+
+
+def normalized_couplings(gvuu: float, gvdd: float, gvss: float) -> Tuple[float, ...]:
+    """
+    Return the quark couplings scaled so that the largest has unit magnitude.
+
+    The normalized spectra only depend on the ratios of the couplings, so
+    tables computed for couplings differing by an overall factor are shared.
+    """
+    gs = np.array([gvuu, gvdd, gvss], dtype=np.float64)
+    gmax = np.max(np.abs(gs))
+    if gmax > 0.0:
+        gs = gs / gmax
+    return tuple(float(g) for g in np.round(gs, 12))
+
+
+class SpectrumTable:
+    r"""
+    Photon spectrum of a single final state tabulated on a grid of
+    center-of-mass energies and photon energies.
+
+    The spectrum is stored as :math:`dN/dx` with :math:`x = 2E_{\gamma}/Q`,
+    which varies much less with the center-of-mass energy :math:`Q` than
+    :math:`dN/dE_{\gamma}`. Spectra are interpolated linearly in :math:`Q`
+    and :math:`\log x`.
+
+    Attributes
+    ----------
+    channel: str
+        Name of the final state.
+    couplings: tuple
+        Normalized quark couplings (see ``normalized_couplings``) the table
+        was computed for.
+    cmes: array
+        Center-of-mass energies of the grid.
+    xs: array
+        Values of :math:`x = 2E_{\gamma}/Q` of the grid.
+    dndx: array
+        Spectrum :math:`dN/dx` with shape ``(len(cmes), len(xs))``.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        couplings: Tuple[float, ...],
+        cmes: RealArray,
+        xs: RealArray,
+        dndx: RealArray,
+    ):
+        self.channel = channel
+        self.couplings = tuple(couplings)
+        self.cmes = np.asarray(cmes, dtype=np.float64)
+        self.xs = np.asarray(xs, dtype=np.float64)
+        self.dndx = np.asarray(dndx, dtype=np.float64)
+        self._logxs = np.log(self.xs)
+
+    def __repr__(self) -> str:
+        return (
+            f"SpectrumTable(channel={self.channel!r}, couplings={self.couplings}, "
+            f"cme=[{self.cmes[0]}, {self.cmes[-1]}], n_cme={len(self.cmes)}, "
+            f"n_x={len(self.xs)})"
+        )
+
+    @staticmethod
+    def key(
+        channel: str, couplings, cmes: RealArray, xs: RealArray, form_factor=None
+    ) -> str:
+        """
+        Return a string identifying a table, used as its file name. The key
+        depends on the parameters of the form factor of the final state and
+        the version of `hazma`.
+        """
+        h = hashlib.sha1()
+        h.update(repr((channel, tuple(couplings), VERSION)).encode())
+        update_hash(h, form_factor)
+        h.update(np.ascontiguousarray(cmes, dtype=np.float64).tobytes())
+        h.update(np.ascontiguousarray(xs, dtype=np.float64).tobytes())
+        return f"{channel.replace(' ', '_')}-{h.hexdigest()[:16]}"
+
+    @classmethod
+    def compute(cls, model, channel: str, cmes: RealArray, xs: RealArray):
+        r"""
+        Tabulate the spectrum of a final state of a model.
+
+        Parameters
+        ----------
+        model: VectorMediatorGeV
+            Model used to compute the spectrum.
+        channel: str
+            Name of the final state.
+        cmes: array
+            Center-of-mass energies of the grid.
+        xs: array
+            Values of :math:`x = 2E_{\gamma}/Q` of the grid. Must be in
+            :math:`(0, 1]` and increasing.
+        """
+        from .spectra import dnde_photon_spectrum_fns
+
+        cmes = np.asarray(cmes, dtype=np.float64)
+        xs = np.asarray(xs, dtype=np.float64)
+        dnde = dnde_photon_spectrum_fns(model, tabulated=False)[channel]
+
+        dndx = np.zeros((len(cmes), len(xs)), dtype=np.float64)
+        for i, cme in enumerate(cmes):
+            dndx[i] = 0.5 * cme * dnde(0.5 * cme * xs, cme)
+
+        couplings = normalized_couplings(*model._couplings)
+        return cls(channel, couplings, cmes, xs, np.nan_to_num(dndx))
+
+    @classmethod
+    def load(cls, path):
+        """Load a table saved with `save`."""
+        with np.load(path) as data:
+            return cls(
+                str(data["channel"]),
+                tuple(data["couplings"]),
+                data["cmes"],
+                data["xs"],
+                data["dndx"],
+            )
+
+    def save(self, path):
+        """Atomically write the table to `path`."""
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                channel=np.array(self.channel),
+                couplings=np.array(self.couplings),
+                cmes=self.cmes,
+                xs=self.xs,
+                dndx=self.dndx,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load_or_compute(
+        cls,
+        model,
+        channel: str,
+        cmes: RealArray,
+        xs: RealArray,
+        cache_dir: Optional[os.PathLike] = None,
+    ):
+        """
+        Load the table for the current couplings of the model from
+        `cache_dir` or compute and store it if it is not available.
+        """
+        couplings = normalized_couplings(*model._couplings)
+        if cache_dir is None:
+            return cls.compute(model, channel, cmes, xs)
+
+        form_factor = getattr(model, FORM_FACTOR_ATTRS[channel])
+        path = pathlib.Path(cache_dir).joinpath(
+            cls.key(channel, couplings, cmes, xs, form_factor) + ".npz"
+        )
+        if path.exists():
+            return cls.load(path)
+
+        table = cls.compute(model, channel, cmes, xs)
+        table.save(path)
+        return table
+
+    def covers(self, photon_energies, cme: float) -> bool:
+        """
+        Return True if the spectrum at `cme` can be interpolated from the
+        table for all the photon energies.
+        """
+        if not self.cmes[0] <= cme <= self.cmes[-1]:
+            return False
+        emin = np.min(photon_energies, initial=np.inf)
+        return bool(emin >= 0.5 * cme * self.xs[0])
+
+    def __call__(self, photon_energies, cme: float):
+        r"""
+        Interpolate the spectrum :math:`dN/dE_{\gamma}` at the photon
+        energies and center-of-mass energy.
+        """
+        scalar = np.ndim(photon_energies) == 0
+        es = np.atleast_1d(np.asarray(photon_energies, dtype=np.float64))
+
+        i = int(np.clip(np.searchsorted(self.cmes, cme) - 1, 0, len(self.cmes) - 2))
+        w = (cme - self.cmes[i]) / (self.cmes[i + 1] - self.cmes[i])
+
+        logx = np.log(np.maximum(2.0 * es / cme, np.finfo(np.float64).tiny))
+        lo = np.interp(logx, self._logxs, self.dndx[i], right=0.0)
+        hi = np.interp(logx, self._logxs, self.dndx[i + 1], right=0.0)
+        dnde = (2.0 / cme) * ((1.0 - w) * lo + w * hi)
+
+        if scalar:
+            return dnde[0]
+        return dnde
@@ -0,0 +1,94 @@
+"""Tests for the tabulated spectra of the GeV vector mediator model."""
+
+# pylint: disable=protected-access
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from hazma.vector_mediator import VectorMediatorGeV
+from hazma.vector_mediator._gev import spectrum_table
+from hazma.vector_mediator._gev.spectra import dnde_photon_spectrum_fns
+
+CHANNEL = "pi0 pi0 omega"
+
+
+def make_model():
+    return VectorMediatorGeV(
+        mx=800.0,
+        mv=2000.0,
+        gvxx=1.0,
+        gvuu=1.0,
+        gvdd=-1.0,
+        gvss=0.3,
+        gvee=0.0,
+        gvmumu=0.0,
+        gvveve=0.0,
+        gvvmvm=0.0,
+        gvvtvt=0.0,
+    )
+
+
+def test_table_matches_direct_on_grid(tmp_path):
+    model = make_model()
+    model.tabulate_spectra([CHANNEL], n_cme=8, n_x=64, cache_dir=tmp_path)
+
+    table = model._spectrum_table(CHANNEL)
+    cme = table.cmes[5]
+    es = 0.5 * cme * table.xs[10:-1]
+
+    direct = dnde_photon_spectrum_fns(model, tabulated=False)[CHANNEL](es, cme)
+    tabulated = model._spectrum_funcs()[CHANNEL](es, cme)
+    assert_allclose(tabulated, direct, rtol=1e-10)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+
+def test_tables_follow_couplings(tmp_path):
+    model = make_model()
+    model.tabulate_spectra([CHANNEL], n_cme=8, n_x=64, cache_dir=tmp_path)
+    table = model._spectrum_table(CHANNEL)
+
+    # Overall rescaling of the couplings leaves the spectra unchanged.
+    model.gvuu, model.gvdd, model.gvss = 2.0, -2.0, 0.6
+    assert model._spectrum_table(CHANNEL) is table
+
+    model.gvss = 0.0
+    new_table = model._spectrum_table(CHANNEL)
+    assert new_table is not table
+    assert new_table.couplings == (1.0, -1.0, 0.0)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+    # A second model with the same couplings loads the table from disk.
+    other = make_model()
+    other.gvss = 0.0
+    other.tabulate_spectra([CHANNEL], n_cme=8, n_x=64, cache_dir=tmp_path)
+    assert_allclose(other._spectrum_table(CHANNEL).dndx, new_table.dndx)
+
+
+def test_outside_table_uses_direct(tmp_path):
+    model = make_model()
+    model.tabulate_spectra([CHANNEL], cme_max=1800.0, n_cme=8, persist=False)
+    es = np.geomspace(1.0, 900.0, 20)
+    cme = 1900.0
+
+    direct = dnde_photon_spectrum_fns(model, tabulated=False)[CHANNEL](es, cme)
+    assert_allclose(model._spectrum_funcs()[CHANNEL](es, cme), direct)
+    assert not list(tmp_path.glob("*.npz"))
+
+
+def test_key_depends_on_parameters_and_version(monkeypatch):
+    model = make_model()
+    ff = model._ff_pi0_pi0_omega
+    args = (CHANNEL, (1.0, -1.0, 0.3), np.linspace(1.0, 2.0, 4), np.ones(3))
+    key = spectrum_table.SpectrumTable.key(*args, ff)
+    assert (
+        spectrum_table.SpectrumTable.key(*args, make_model()._ff_pi0_pi0_omega) == key
+    )
+
+    # Changing a fitted parameter of the form factor gives a new key.
+    ff.fit_data.amps = ff.fit_data.amps * 1.1
+    assert spectrum_table.SpectrumTable.key(*args, ff) != key
+
+    # So does upgrading hazma.
+    ff = make_model()._ff_pi0_pi0_omega
+    monkeypatch.setattr(spectrum_table, "VERSION", "0.0.0")
+    assert spectrum_table.SpectrumTable.key(*args, ff) != key
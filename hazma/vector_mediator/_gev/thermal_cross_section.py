@@ -4,6 +4,7 @@ from scipy import special
 from scipy import integrate
 
 from hazma.relic_density import relic_density as rd
+from hazma.relic_density import ThermalCrossSectionTable
 
 TWO_BODY = [
     "e e",
@@ -64,6 +65,7 @@ def relic_density(
     method: str = "Radau",
     rtol: float = 1e-5,
     atol: float = 1e-3,
+    tabulate: bool = False,
 ) -> float:
     """
     Solves the Boltzmann equation and returns the relic density
@@ -111,6 +113,11 @@ def relic_density(
         Absolute tolerance used to solve the Boltzmann equation.
         Default is `1e-6`.
         Ignored if 'semi_analytic' is True.
+    tabulate: bool, optional
+        If `True`, the annihilation cross section is sampled once and the
+        thermally averaged cross section is tabulated (see
+        `ThermalCrossSectionTable`) instead of being integrated at each step.
+        Default is `False`.
 
     Returns
     -------
@@ -140,11 +147,22 @@ def relic_density(
             return 0.0
 
         pf = x / (2.0 * special.kn(2, x)) ** 2
-        return pf * integrate.quad(integrand, 2.0, 50.0 / x, points=[2.0], args=(x,))[0]
-
-    model = VectorMediatorGeVRelicDensity(
-        mx=self.mx, thermal_cross_section=thermal_cross_section
-    )
+        return (
+            pf
+            * integrate.quad(integrand, 2.0, 2.0 + 50.0 / x, points=[2.0], args=(x,))[0]
+        )
+
+    if tabulate:
+        model = ThermalCrossSectionTable(
+            self.mx,
+            cross_section=acs,
+            vectorized=True,
+            points=[self.mv / self.mx],
+        )
+    else:
+        model = VectorMediatorGeVRelicDensity(
+            mx=self.mx, thermal_cross_section=thermal_cross_section
+        )
 
     return rd(
         model=model,
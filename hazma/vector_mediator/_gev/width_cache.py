@@ -0,0 +1,182 @@
+"""Persistent cache of the expensive partial widths of the GeV vector mediator
+model, shared between processes."""
+
+# pylint: disable=invalid-name
+
+import hashlib
+import os
+import pathlib
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from hazma import VERSION
+
+from .spectrum_table import default_cache_dir, update_hash
+from .width_table import FACTORIZED_CHANNELS
+
+# Fraction of the maximum number of entries kept after an eviction. Evicting
+# more than the excess amortizes the cost of scanning the directory.
+_EVICTION_FRACTION = 0.9
+# The entries are counted by scanning the directory at most once every
+# `max_entries * _RESCAN_FRACTION` writes, which bounds how far the running
+# count can drift when other processes share the cache.
+_RESCAN_FRACTION = 0.1
+
+
+class PersistentWidthCache:
+    """
+    Content-addressed cache of partial widths stored on disk.
+
+    Each width is stored in its own file, named after a hash of the final
+    state, the mediator mass, the quark couplings, the arguments of the width
+    (e.g. the number of Monte-Carlo points), the parameters of the form factor
+    and the version of `hazma`.
+    Files are written atomically, so the cache can be shared by many processes
+    on one machine. The modification time of a file is updated when it is
+    read and the least recently used entries are removed when the cache holds
+    more than `max_entries` widths. Each instance keeps a running count of the
+    entries, so that writes do not scan the directory. The count is refreshed
+    periodically, so entries written by other processes are eventually taken
+    into account.
+
+    Attributes
+    ----------
+    directory: pathlib.Path
+        Directory holding the cached widths.
+    max_entries: int
+        Maximum number of cached widths.
+    channels: list[str]
+        Final states whose widths are cached.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[os.PathLike] = None,
+        *,
+        max_entries: int = 1 << 16,
+        channels: Optional[Sequence[str]] = None,
+    ):
+        if directory is None:
+            directory = default_cache_dir().joinpath("widths")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, found {max_entries}.")
+
+        self.directory = pathlib.Path(directory)
+        self.max_entries = max_entries
+        self.channels: List[str] = list(
+            FACTORIZED_CHANNELS if channels is None else channels
+        )
+        self._count: Optional[int] = None
+        self._writes_since_scan = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"PersistentWidthCache(directory={str(self.directory)!r}, "
+            f"max_entries={self.max_entries})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    @staticmethod
+    def key(
+        channel: str,
+        mv: float,
+        couplings: Sequence[float],
+        kwargs: Dict,
+        form_factor=None,
+    ) -> str:
+        """
+        Return the string identifying a width, used as its file name. `kwargs`
+        should hold every argument of the width, including the defaults.
+        """
+        h = hashlib.sha1()
+        h.update(
+            repr(
+                (
+                    channel,
+                    float(mv),
+                    tuple(float(g) for g in couplings),
+                    sorted(kwargs.items()),
+                    VERSION,
+                )
+            ).encode()
+        )
+        update_hash(h, form_factor)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory.joinpath(f"{key}.npy")
+
+    def _entries(self) -> List[os.DirEntry]:
+        if not self.directory.exists():
+            return []
+        with os.scandir(self.directory) as it:
+            return [entry for entry in it if entry.name.endswith(".npy")]
+
+    def get(self, key: str) -> Optional[float]:
+        """Return the cached width or None if it is not available."""
+        path = self._path(key)
+        try:
+            value = float(np.load(path))
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, unreadable or concurrently evicted entry.
+            return None
+        return value
+
+    def put(self, key: str, value: float) -> None:
+        """Atomically store a width and evict old entries if needed."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        new = not path.exists()
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.float64(value))
+        os.replace(tmp, path)
+
+        self._writes_since_scan += 1
+        rescan = self._writes_since_scan > _RESCAN_FRACTION * self.max_entries
+        if self._count is None or rescan:
+            self._count = len(self._entries())
+            self._writes_since_scan = 0
+        elif new:
+            self._count += 1
+
+        if self._count > self.max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries if the cache is full."""
+        entries = self._entries()
+        self._count = len(entries)
+        self._writes_since_scan = 0
+        if len(entries) <= self.max_entries:
+            return
+
+        def mtime(entry):
+            try:
+                return entry.stat().st_mtime
+            except OSError:
+                return -np.inf
+
+        entries.sort(key=mtime)
+        nkeep = max(1, int(_EVICTION_FRACTION * self.max_entries))
+        for entry in entries[: len(entries) - nkeep]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                # Already removed by another process.
+                pass
+        self._count = nkeep
+
+    def clear(self) -> None:
+        """Remove all the cached widths."""
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        self._count = 0
+        self._writes_since_scan = 0
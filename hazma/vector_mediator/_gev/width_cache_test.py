@@ -0,0 +1,126 @@
+"""Tests for the persistent width cache of the GeV vector mediator model."""
+
+# pylint: disable=protected-access
+
+import os
+import time
+
+import pytest
+
+from hazma.vector_mediator import VectorMediatorGeV
+from hazma.vector_mediator._gev.width_cache import PersistentWidthCache
+
+
+def make_model():
+    return VectorMediatorGeV(
+        mx=400.0,
+        mv=1500.0,
+        gvxx=1.0,
+        gvuu=1.0,
+        gvdd=-1.0,
+        gvss=0.3,
+        gvee=0.0,
+        gvmumu=0.0,
+        gvveve=0.0,
+        gvvmvm=0.0,
+        gvvtvt=0.0,
+    )
+
+
+def test_widths_shared_between_models(tmp_path, monkeypatch):
+    model = make_model()
+    model.persist_widths(tmp_path, channels=["pi pi pi pi"])
+    width = model.width_v_to_pi_pi_pi_pi(npts=1000)
+    assert len(model._persistent_width_cache) == 1
+
+    # A new model reads the width from disk instead of integrating again.
+    other = make_model()
+    other.persist_widths(tmp_path, channels=["pi pi pi pi"])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("width should be read from the cache")
+
+    monkeypatch.setattr(other._ff_pi_pi_pi_pi, "width", fail)
+    assert other.width_v_to_pi_pi_pi_pi(npts=1000) == width
+
+    # Changing the couplings or the number of points gives new entries.
+    model.gvss = 0.5
+    model.width_v_to_pi_pi_pi_pi(npts=1000)
+    model.width_v_to_pi_pi_pi_pi(npts=500)
+    assert len(model._persistent_width_cache) == 3
+
+
+def test_least_recently_used_evicted(tmp_path):
+    cache = PersistentWidthCache(tmp_path, max_entries=2)
+    keys = [cache.key("pi pi pi pi", mv, (1.0, -1.0, 0.0), {}) for mv in [1, 2, 3]]
+
+    cache.put(keys[0], 1.0)
+    cache.put(keys[1], 2.0)
+    # Make the first entry the most recently used.
+    past = time.time() - 10.0
+    os.utime(cache._path(keys[1]), (past, past))
+    assert cache.get(keys[0]) == 1.0
+
+    cache.put(keys[2], 3.0)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == 3.0
+    assert len(cache) <= 2
+
+
+def test_writes_do_not_scan_directory(tmp_path, monkeypatch):
+    cache = PersistentWidthCache(tmp_path, max_entries=1000)
+    scans = []
+    entries = cache._entries
+
+    def counted():
+        scans.append(1)
+        return entries()
+
+    monkeypatch.setattr(cache, "_entries", counted)
+
+    for mv in range(100):
+        cache.put(cache.key("pi pi pi pi", mv, (1.0, -1.0, 0.0), {}), 1.0)
+    assert len(scans) == 1
+
+    # Filling the cache triggers an eviction down to a fraction of the limit.
+    for mv in range(100, 1001):
+        cache.put(cache.key("pi pi pi pi", mv, (1.0, -1.0, 0.0), {}), 1.0)
+    assert len(scans) < 20
+    assert len(cache) < 1000
+
+
+def test_invalid_channel():
+    with pytest.raises(ValueError):
+        make_model().persist_widths(channels=["e e"])
+
+
+def test_default_arguments_share_entry(tmp_path, monkeypatch):
+    model = make_model()
+    model.persist_widths(tmp_path, channels=["pi pi pi pi"])
+    calls = []
+
+    def width(*args, **kwargs):
+        calls.append(kwargs)
+        return 1.0
+
+    monkeypatch.setattr(model._ff_pi_pi_pi_pi, "width", width)
+    model.width_v_to_pi_pi_pi_pi()
+    model.width_v_to_pi_pi_pi_pi(npts=1 << 14)
+    assert len(calls) == 1
+    assert len(model._persistent_width_cache) == 1
+
+
+def test_form_factor_parameters_in_key(tmp_path, monkeypatch):
+    model = make_model()
+    model.persist_widths(tmp_path, channels=["pi pi eta"])
+    monkeypatch.setattr(model._ff_pi_pi_eta, "width", lambda *_, **__: 1.0)
+    model.width_v_to_pi_pi_eta()
+
+    # A width computed with other form-factor parameters is not reused.
+    other = make_model()
+    other.persist_widths(tmp_path, channels=["pi pi eta"])
+    ff = other._ff_pi_pi_eta
+    ff.fit_data.amps = ff.fit_data.amps * 1.1
+    monkeypatch.setattr(ff, "width", lambda *_, **__: 2.0)
+    assert other.width_v_to_pi_pi_eta() == 2.0
+    assert len(other._persistent_width_cache) == 2
@@ -0,0 +1,106 @@
+"""Partial widths of the multi-body final states of the GeV vector mediator
+model factorized into quadratic forms in the quark couplings."""
+
+# pylint: disable=invalid-name
+
+import hashlib
+import os
+import pathlib
+from typing import Optional
+
+import numpy as np
+
+from hazma import VERSION
+from hazma.form_factors.vector import FactorizedWidth
+from hazma.parameters import SM_WIDTHS, omega_mass, phi_mass
+from hazma.utils import RealArray
+
+from .spectrum_table import FORM_FACTOR_ATTRS, TABULATED_CHANNELS, update_hash
+from .utils import STR_TO_MASS
+
+# Final states whose partial widths are integrated over phase space.
+FACTORIZED_CHANNELS = TABULATED_CHANNELS
+
+# Final states integrated over the Dalitz plane, which are tabulated using
+# Gauss-Legendre quadrature rather than Monte-Carlo.
+_DALITZ_CHANNELS = ["pi pi pi0", "pi0 k0 k0", "pi0 k k", "pi k k0"]
+_FOUR_BODY_CHANNELS = ["pi pi pi pi", "pi pi pi0 pi0"]
+
+# Narrow resonances whose peaks are resolved by adding masses to the grids.
+_NARROW_RESONANCES = [
+    (omega_mass, SM_WIDTHS["omega"]),
+    (phi_mass, SM_WIDTHS["phi"]),
+]
+
+
+def threshold(channel: str) -> float:
+    """Return the sum of the masses of the final state particles."""
+    return sum(STR_TO_MASS[p] for p in channel.split(" "))
+
+
+def masses(channel: str, mv_max: float, n_mv: int) -> RealArray:
+    """
+    Return the masses of the vector used to tabulate the width of a channel:
+    `n_mv` masses between threshold and `mv_max`, concentrated near threshold,
+    supplemented with masses logarithmically spaced just above threshold and
+    masses spaced by an eighth of the width around the narrow resonances.
+    """
+    mmin = threshold(channel)
+    # The widths change fastest just above threshold, where they are
+    # interpolated in log(mv - threshold).
+    ts = np.linspace(0.0, 1.0, n_mv) ** 2
+    ts_log = np.geomspace(1e-7, 1e-2, max(n_mv // 8, 2))
+    ms = [mmin + (mv_max - mmin) * np.concatenate([ts, ts_log])]
+    for mass, width in _NARROW_RESONANCES:
+        window = mass + width * np.linspace(-6.0, 6.0, 97)
+        ms.append(window[(window > mmin) & (window < mv_max)])
+    return np.unique(np.concatenate(ms))
+
+
+def width_kwargs(channel: str, npts: int) -> dict:
+    """Return the keyword arguments used to tabulate the width of a channel."""
+    if channel in _DALITZ_CHANNELS:
+        return {"method": "gauss"}
+    if channel in _FOUR_BODY_CHANNELS:
+        return {"npts": npts}
+    return {}
+
+
+def key(channel: str, masses: RealArray, npts: int, form_factor=None) -> str:
+    """
+    Return a string identifying a table, used as its file name. The key
+    depends on the parameters of the form factor of the final state and the
+    version of `hazma`.
+    """
+    h = hashlib.sha1()
+    h.update(repr((channel, width_kwargs(channel, npts), VERSION)).encode())
+    update_hash(h, form_factor)
+    h.update(np.ascontiguousarray(masses, dtype=np.float64).tobytes())
+    return f"width-{channel.replace(' ', '_')}-{h.hexdigest()[:16]}"
+
+
+def load_or_compute(
+    model,
+    channel: str,
+    masses: RealArray,
+    npts: int,
+    cache_dir: Optional[os.PathLike] = None,
+) -> FactorizedWidth:
+    """
+    Load the factorized width of a final state from `cache_dir` or compute
+    and store it if it is not available.
+    """
+    form_factor = getattr(model, FORM_FACTOR_ATTRS[channel])
+    kwargs = width_kwargs(channel, npts)
+    if cache_dir is None:
+        return FactorizedWidth.compute(form_factor, masses, **kwargs)
+
+    path = pathlib.Path(cache_dir).joinpath(
+        key(channel, masses, npts, form_factor) + ".npz"
+    )
+    if path.exists():
+        return FactorizedWidth.load(path)
+
+    table = FactorizedWidth.compute(form_factor, masses, **kwargs)
+    table.save(path)
+    return table
@@ -0,0 +1,91 @@
+"""Tests for the factorized widths of the GeV vector mediator model."""
+
+# pylint: disable=protected-access
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from hazma.vector_mediator import VectorMediatorGeV
+from hazma.vector_mediator._gev import width_table
+
+CHANNEL = "pi pi eta"
+
+
+def make_model():
+    return VectorMediatorGeV(
+        mx=400.0,
+        mv=1500.0,
+        gvxx=1.0,
+        gvuu=1.0,
+        gvdd=-1.0,
+        gvss=0.3,
+        gvee=0.0,
+        gvmumu=0.0,
+        gvveve=0.0,
+        gvvmvm=0.0,
+        gvvtvt=0.0,
+    )
+
+
+def test_widths_follow_couplings(tmp_path):
+    model = make_model()
+    model.factorize_widths([CHANNEL], n_mv=16, cache_dir=tmp_path)
+    table = model._width_table(CHANNEL)
+    model.mv = table.masses[9]
+
+    for couplings in [(1.0, -1.0, 0.3), (0.2, 0.7, -0.4)]:
+        model.gvuu, model.gvdd, model.gvss = couplings
+        direct = model._ff_pi_pi_eta.width(mv=model.mv, couplings=couplings)
+        assert_allclose(model.width_v_to_pi_pi_eta(), direct, rtol=1e-8)
+        assert model._width_table(CHANNEL) is table
+
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    # Cross sections at the masses of the grid are exact.
+    e_cm = table.masses[12]
+    direct = model._ff_pi_pi_eta.cross_section(
+        q=e_cm,
+        mx=model.mx,
+        mv=model.mv,
+        gvxx=model.gvxx,
+        wv=model.width_v(),
+        couplings=model._couplings,
+    )
+    assert_allclose(model.sigma_xx_to_pi_pi_eta(e_cm), direct, rtol=1e-8)
+
+
+def test_outside_table_uses_direct():
+    model = make_model()
+    model.factorize_widths([CHANNEL], mv_max=1200.0, n_mv=8, persist=False)
+    model.mv = 1300.0
+    direct = model._ff_pi_pi_eta.width(mv=model.mv, couplings=model._couplings)
+    assert_allclose(model.width_v_to_pi_pi_eta(), direct)
+
+
+def test_widths_off_grid():
+    model = make_model()
+    model.factorize_widths([CHANNEL], mv_max=1400.0, n_mv=48, persist=False)
+    table = model._width_table(CHANNEL)
+
+    for dm in [1e-3, 0.05, 0.5, 3.0, 10.0, 40.0, 150.0, 300.0]:
+        model.mv = table.threshold + dm
+        assert model.mv not in table.masses
+        direct = model._ff_pi_pi_eta.width(mv=model.mv, couplings=model._couplings)
+        assert_allclose(model.width_v_to_pi_pi_eta(), direct, rtol=1e-4)
+
+
+def test_key_depends_on_parameters_and_version(monkeypatch):
+    model = make_model()
+    ff = model._ff_pi_pi_eta
+    args = (CHANNEL, np.linspace(700.0, 1400.0, 8), 1000)
+    key = width_table.key(*args, ff)
+    assert width_table.key(*args, make_model()._ff_pi_pi_eta) == key
+
+    # Changing a fitted parameter of the form factor gives a new key.
+    ff.fit_data.amps = ff.fit_data.amps * 1.1
+    assert width_table.key(*args, ff) != key
+
+    # So does upgrading hazma.
+    ff = make_model()._ff_pi_pi_eta
+    monkeypatch.setattr(width_table, "VERSION", "0.0.0")
+    assert width_table.key(*args, ff) != key
@@ -15,7 +15,7 @@ class VectorMediatorPositronSpectra:
     def dnde_pos_vv(self, e_ps, e_cm, fs="total"):
         # Each scalar gets half the COM energy
         e_v = e_cm / 2.0
-        pws = self.partial_widths()  # type: ignore
+        pws = self._cached_partial_widths()  # type: ignore
 
         if pws["total"] != 0:
             # dnde_decay_v relies on this ordering of the partial widths
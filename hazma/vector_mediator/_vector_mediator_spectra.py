@@ -82,7 +82,7 @@ class VectorMediatorSpectra:
         arbitrary boost.
         """
         mv = self.mv  # type: ignore
-        pws = self.partial_widths()  # type: ignore
+        pws = self._cached_partial_widths()  # type: ignore
         pw_array = np.zeros(5, dtype=float)
 
         # Check is the decay width of the vector is zero.